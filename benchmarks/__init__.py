@@ -0,0 +1,7 @@
+"""
+Offline performance benchmarks for Langbridge hot paths.
+
+Run `python -m benchmarks --help` from the repository root. Fixtures are
+generated deterministically on first use, so no network or external database
+is required.
+"""
@@ -0,0 +1,146 @@
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from benchmarks.compare import DEFAULT_ALPHA, DEFAULT_THRESHOLD, compare_reports, format_comparisons
+from benchmarks.fixtures import DEFAULT_SEED, build_fixtures
+from benchmarks.harness import (
+    BenchmarkContext,
+    BenchmarkResult,
+    build_report,
+    registered_benchmarks,
+    run_benchmarks,
+    select_benchmarks,
+)
+
+DEFAULT_FIXTURE_DIR = Path(".cache") / "benchmarks" / "fixtures"
+DEFAULT_OUTPUT = Path(".cache") / "benchmarks" / "latest.json"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    handler = getattr(args, "handler", None)
+    if handler is None:
+        parser.print_help()
+        return 1
+    return int(handler(args) or 0)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Langbridge benchmark suite")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run = subparsers.add_parser("run", help="Run benchmarks and write a JSON report.")
+    run.add_argument("--kind", choices=["micro", "macro", "all"], default="all", help="Benchmark kind to run")
+    run.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        default=[],
+        help="Glob over benchmark names, e.g. 'federation.*' (repeatable)",
+    )
+    run.add_argument("--scale", type=float, default=0.1, help="Fixture scale factor (1.0 = 15k orders)")
+    run.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Fixture generator seed")
+    run.add_argument("--repeat", type=int, default=10, help="Timed samples per benchmark")
+    run.add_argument("--warmup", type=int, default=2, help="Untimed warmup iterations per benchmark")
+    run.add_argument("--fixture-dir", type=Path, default=DEFAULT_FIXTURE_DIR, help="Fixture cache directory")
+    run.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Report path")
+    run.set_defaults(handler=_handle_run)
+
+    compare = subparsers.add_parser(
+        "compare",
+        help="Compare a report against a baseline; exits 1 when a regression is detected.",
+    )
+    compare.add_argument("baseline", type=Path, help="Baseline report JSON")
+    compare.add_argument("current", type=Path, help="Current report JSON")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Minimum median slowdown treated as a regression (fraction, default 0.05)",
+    )
+    compare.add_argument(
+        "--alpha",
+        type=float,
+        default=DEFAULT_ALPHA,
+        help="Significance level of the Mann-Whitney U test (default 0.01)",
+    )
+    compare.set_defaults(handler=_handle_compare)
+
+    list_command = subparsers.add_parser("list", help="List registered benchmarks.")
+    list_command.set_defaults(handler=_handle_list)
+
+    fixtures = subparsers.add_parser("fixtures", help="Generate fixtures without running benchmarks.")
+    fixtures.add_argument("--scale", type=float, default=0.1, help="Fixture scale factor")
+    fixtures.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Fixture generator seed")
+    fixtures.add_argument("--fixture-dir", type=Path, default=DEFAULT_FIXTURE_DIR, help="Fixture cache directory")
+    fixtures.set_defaults(handler=_handle_fixtures)
+    return parser
+
+
+def _handle_run(args: argparse.Namespace) -> int:
+    selected = select_benchmarks(kind=args.kind, patterns=list(args.filter or []))
+    if not selected:
+        print("No benchmarks matched the selection.", file=sys.stderr)
+        return 1
+
+    fixtures = build_fixtures(args.fixture_dir, scale=args.scale, seed=args.seed)
+    with tempfile.TemporaryDirectory(prefix="langbridge-bench-") as work_dir:
+        results = run_benchmarks(
+            selected,
+            context=BenchmarkContext(fixtures=fixtures, work_dir=Path(work_dir)),
+            repeat=args.repeat,
+            warmup=args.warmup,
+            progress=_print_result,
+        )
+
+    report = build_report(results, fixtures=fixtures, repeat=args.repeat, warmup=args.warmup)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    print(f"Wrote {len(results)} benchmark results to {args.output}")
+    return 0
+
+
+def _handle_compare(args: argparse.Namespace) -> int:
+    baseline = _load_report(args.baseline)
+    current = _load_report(args.current)
+    if baseline.get("fixtures", {}).get("fingerprint") != current.get("fixtures", {}).get("fingerprint"):
+        print("warning: reports were produced from different fixtures", file=sys.stderr)
+
+    comparisons = compare_reports(baseline, current, threshold=args.threshold, alpha=args.alpha)
+    print(format_comparisons(comparisons))
+    regressions = [item.name for item in comparisons if item.is_regression]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _handle_list(args: argparse.Namespace) -> int:
+    for item in registered_benchmarks().values():
+        print(f"{item.name:<40} {item.kind:<6} {item.description.splitlines()[0] if item.description else ''}")
+    return 0
+
+
+def _handle_fixtures(args: argparse.Namespace) -> int:
+    fixtures = build_fixtures(args.fixture_dir, scale=args.scale, seed=args.seed)
+    print(json.dumps({"root": str(fixtures.root), "fingerprint": fixtures.fingerprint, **fixtures.row_counts}))
+    return 0
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    median_ms = result.stats["median"] * 1e3
+    iqr_ms = result.stats["iqr"] * 1e3
+    print(f"{result.name:<40} median {median_ms:10.3f} ms  iqr {iqr_ms:8.3f} ms  n={len(result.samples_s)}")
+
+
+def _load_report(path: Path) -> dict[str, Any]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or "benchmarks" not in payload:
+        raise SystemExit(f"{path} is not a benchmark report.")
+    return payload
@@ -0,0 +1,201 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+DEFAULT_THRESHOLD = 0.05
+DEFAULT_ALPHA = 0.01
+_EXACT_MAX_SAMPLES = 30
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkComparison:
+    name: str
+    baseline_median_s: float | None
+    current_median_s: float | None
+    ratio: float | None
+    p_value: float | None
+    status: str
+
+    @property
+    def is_regression(self) -> bool:
+        return self.status == "regression"
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+) -> list[BenchmarkComparison]:
+    """
+    Compare two benchmark reports produced by `build_report`.
+
+    A benchmark regresses when its median slows down by more than `threshold`
+    (a fraction, 0.05 = 5%) and a one-sided Mann-Whitney U test rejects "no
+    slowdown" at level `alpha`. Requiring both keeps noisy but unchanged
+    benchmarks, and tiny but real shifts, from failing the gate.
+    """
+    baseline_benchmarks = dict(baseline.get("benchmarks") or {})
+    current_benchmarks = dict(current.get("benchmarks") or {})
+    comparisons = []
+    for name in sorted(set(baseline_benchmarks) | set(current_benchmarks)):
+        before = baseline_benchmarks.get(name)
+        after = current_benchmarks.get(name)
+        if before is None or after is None:
+            comparisons.append(
+                BenchmarkComparison(
+                    name=name,
+                    baseline_median_s=_median(before),
+                    current_median_s=_median(after),
+                    ratio=None,
+                    p_value=None,
+                    status="added" if before is None else "missing",
+                )
+            )
+            continue
+        comparisons.append(
+            compare_samples(
+                name,
+                list(before.get("samples") or []),
+                list(after.get("samples") or []),
+                threshold=threshold,
+                alpha=alpha,
+            )
+        )
+    return comparisons
+
+
+def compare_samples(
+    name: str,
+    baseline_samples: list[float],
+    current_samples: list[float],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+) -> BenchmarkComparison:
+    baseline_median = _sample_median(baseline_samples)
+    current_median = _sample_median(current_samples)
+    ratio = current_median / baseline_median if baseline_median > 0 else math.inf
+    slower_p = mann_whitney_greater(current_samples, baseline_samples)
+    faster_p = mann_whitney_greater(baseline_samples, current_samples)
+
+    status = "unchanged"
+    if ratio > 1.0 + threshold and slower_p < alpha:
+        status = "regression"
+    elif ratio < 1.0 - threshold and faster_p < alpha:
+        status = "improvement"
+    return BenchmarkComparison(
+        name=name,
+        baseline_median_s=baseline_median,
+        current_median_s=current_median,
+        ratio=ratio,
+        p_value=slower_p if ratio >= 1.0 else faster_p,
+        status=status,
+    )
+
+
+def mann_whitney_greater(first: list[float], second: list[float]) -> float:
+    """
+    One-sided p-value for "values in `first` tend to be larger than in `second`".
+
+    Uses the exact U distribution for small tie-free samples and the
+    tie-corrected normal approximation otherwise.
+    """
+    n1, n2 = len(first), len(second)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    ranks = _ranks(list(first) + list(second))
+    u_statistic = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+
+    has_ties = len(set(first) | set(second)) < n1 + n2
+    if not has_ties and n1 + n2 <= _EXACT_MAX_SAMPLES:
+        total = math.comb(n1 + n2, n1)
+        at_least = sum(
+            _u_count(n1, n2, value)
+            for value in range(math.ceil(u_statistic), n1 * n2 + 1)
+        )
+        return at_least / total
+
+    mean = n1 * n2 / 2
+    tie_term = _tie_correction(first + second)
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u_statistic - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def format_comparisons(comparisons: list[BenchmarkComparison]) -> str:
+    header = f"{'benchmark':<48} {'baseline':>12} {'current':>12} {'change':>9} {'p':>8}  status"
+    lines = [header, "-" * len(header)]
+    for item in comparisons:
+        change = "-" if item.ratio is None or math.isinf(item.ratio) else f"{(item.ratio - 1.0) * 100:+.1f}%"
+        p_value = "-" if item.p_value is None else f"{item.p_value:.4f}"
+        lines.append(
+            f"{item.name:<48} {_format_duration(item.baseline_median_s):>12} "
+            f"{_format_duration(item.current_median_s):>12} {change:>9} {p_value:>8}  {item.status}"
+        )
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _u_count(n1: int, n2: int, u: int) -> int:
+    """Number of orderings of n1 + n2 distinct values that produce statistic `u`."""
+    if u < 0 or u > n1 * n2:
+        return 0
+    if n1 == 0 or n2 == 0:
+        return 1 if u == 0 else 0
+    return _u_count(n1 - 1, n2, u - n2) + _u_count(n1, n2 - 1, u)
+
+
+def _ranks(values: list[float]) -> list[float]:
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    index = 0
+    while index < len(order):
+        end = index
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[index]]:
+            end += 1
+        average_rank = (index + end) / 2 + 1
+        for position in range(index, end + 1):
+            ranks[order[position]] = average_rank
+        index = end + 1
+    return ranks
+
+
+def _tie_correction(values: list[float]) -> float:
+    counts: dict[float, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return float(sum(count**3 - count for count in counts.values()))
+
+
+def _sample_median(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def _median(entry: dict[str, Any] | None) -> float | None:
+    if entry is None:
+        return None
+    if entry.get("median") is not None:
+        return float(entry["median"])
+    return _sample_median(list(entry.get("samples") or []))
+
+
+def _format_duration(value: float | None) -> str:
+    if value is None:
+        return "-"
+    if value >= 1.0:
+        return f"{value:.3f} s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.3f} ms"
+    return f"{value * 1e6:.1f} us"
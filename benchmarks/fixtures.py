@@ -0,0 +1,278 @@
+import csv
+import hashlib
+import json
+import random
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+FIXTURE_VERSION = 1
+DEFAULT_SEED = 20240611
+
+_NATIONS = (
+    ("ALGERIA", 0), ("ARGENTINA", 1), ("BRAZIL", 1), ("CANADA", 1), ("EGYPT", 4),
+    ("ETHIOPIA", 0), ("FRANCE", 3), ("GERMANY", 3), ("INDIA", 2), ("INDONESIA", 2),
+    ("IRAN", 4), ("IRAQ", 4), ("JAPAN", 2), ("JORDAN", 4), ("KENYA", 0),
+    ("MOROCCO", 0), ("MOZAMBIQUE", 0), ("PERU", 1), ("CHINA", 2), ("ROMANIA", 3),
+    ("SAUDI ARABIA", 4), ("VIETNAM", 2), ("RUSSIA", 3), ("UNITED KINGDOM", 3), ("UNITED STATES", 1),
+)
+_SEGMENTS = ("AUTOMOBILE", "BUILDING", "FURNITURE", "HOUSEHOLD", "MACHINERY")
+_ORDER_STATUSES = ("F", "O", "P")
+_PRIORITIES = ("1-URGENT", "2-HIGH", "3-MEDIUM", "4-NOT SPECIFIED", "5-LOW")
+_SHIP_MODES = ("AIR", "FOB", "MAIL", "RAIL", "REG AIR", "SHIP", "TRUCK")
+_START_DATE = date(2023, 1, 1)
+_DATE_SPAN_DAYS = 730
+
+
+@dataclass(frozen=True, slots=True)
+class FixtureScale:
+    """Row counts for one fixture size; `scale=1` is small enough for a laptop run."""
+
+    customers: int
+    orders: int
+    lineitems_per_order: int
+    store_sales: int
+
+    @classmethod
+    def from_factor(cls, scale: float) -> "FixtureScale":
+        factor = max(float(scale), 0.01)
+        return cls(
+            customers=max(10, int(1_500 * factor)),
+            orders=max(20, int(15_000 * factor)),
+            lineitems_per_order=4,
+            store_sales=max(50, int(50_000 * factor)),
+        )
+
+
+@dataclass(slots=True)
+class FixtureSet:
+    root: Path
+    scale: float
+    seed: int
+    sqlite_path: Path
+    duckdb_path: Path
+    parquet_dir: Path
+    csv_dir: Path
+    row_counts: dict[str, int] = field(default_factory=dict)
+    fingerprint: str = ""
+
+    def parquet_path(self, table_name: str) -> Path:
+        return self.parquet_dir / f"{table_name}.parquet"
+
+    def csv_path(self, table_name: str) -> Path:
+        return self.csv_dir / f"{table_name}.csv"
+
+    def load_table(self, table_name: str) -> pa.Table:
+        return pq.read_table(self.parquet_path(table_name))
+
+
+def generate_tables(*, scale: float = 1.0, seed: int = DEFAULT_SEED) -> dict[str, pa.Table]:
+    """
+    Generate the TPC-H style (nation, customer, orders, lineitem) and TPC-DS style
+    (date_dim, store_sales) tables. Output depends only on `scale` and `seed`.
+    """
+    sizes = FixtureScale.from_factor(scale)
+    rng = random.Random(seed)
+
+    nation = pa.table(
+        {
+            "n_nationkey": list(range(len(_NATIONS))),
+            "n_name": [name for name, _ in _NATIONS],
+            "n_regionkey": [region for _, region in _NATIONS],
+        }
+    )
+
+    customer_keys = list(range(1, sizes.customers + 1))
+    customer = pa.table(
+        {
+            "c_custkey": customer_keys,
+            "c_name": [f"Customer#{key:09d}" for key in customer_keys],
+            "c_nationkey": [rng.randrange(len(_NATIONS)) for _ in customer_keys],
+            "c_mktsegment": [rng.choice(_SEGMENTS) for _ in customer_keys],
+            "c_acctbal": [round(rng.uniform(-999.99, 9999.99), 2) for _ in customer_keys],
+        }
+    )
+
+    order_keys = list(range(1, sizes.orders + 1))
+    order_dates = [_START_DATE + timedelta(days=rng.randrange(_DATE_SPAN_DAYS)) for _ in order_keys]
+    orders = pa.table(
+        {
+            "o_orderkey": order_keys,
+            "o_custkey": [rng.choice(customer_keys) for _ in order_keys],
+            "o_orderstatus": [rng.choice(_ORDER_STATUSES) for _ in order_keys],
+            "o_totalprice": [round(rng.uniform(850.0, 550_000.0), 2) for _ in order_keys],
+            "o_orderdate": order_dates,
+            "o_orderpriority": [rng.choice(_PRIORITIES) for _ in order_keys],
+            "o_updated_at": [
+                datetime.combine(order_date, datetime.min.time(), tzinfo=timezone.utc)
+                + timedelta(seconds=rng.randrange(86_400))
+                for order_date in order_dates
+            ],
+        }
+    )
+
+    lineitem_columns: dict[str, list] = {
+        "l_orderkey": [],
+        "l_linenumber": [],
+        "l_quantity": [],
+        "l_extendedprice": [],
+        "l_discount": [],
+        "l_shipmode": [],
+        "l_shipdate": [],
+    }
+    for order_key, order_date in zip(order_keys, order_dates):
+        for line_number in range(1, rng.randint(1, sizes.lineitems_per_order * 2 - 1) + 1):
+            quantity = rng.randint(1, 50)
+            lineitem_columns["l_orderkey"].append(order_key)
+            lineitem_columns["l_linenumber"].append(line_number)
+            lineitem_columns["l_quantity"].append(quantity)
+            lineitem_columns["l_extendedprice"].append(round(quantity * rng.uniform(900.0, 2_000.0), 2))
+            lineitem_columns["l_discount"].append(round(rng.uniform(0.0, 0.1), 2))
+            lineitem_columns["l_shipmode"].append(rng.choice(_SHIP_MODES))
+            lineitem_columns["l_shipdate"].append(order_date + timedelta(days=rng.randint(1, 120)))
+    lineitem = pa.table(lineitem_columns)
+
+    calendar = [_START_DATE + timedelta(days=offset) for offset in range(_DATE_SPAN_DAYS)]
+    date_dim = pa.table(
+        {
+            "d_date_sk": list(range(1, len(calendar) + 1)),
+            "d_date": calendar,
+            "d_year": [day.year for day in calendar],
+            "d_moy": [day.month for day in calendar],
+            "d_dow": [day.isoweekday() for day in calendar],
+        }
+    )
+    store_sales = pa.table(
+        {
+            "ss_ticket_number": list(range(1, sizes.store_sales + 1)),
+            "ss_sold_date_sk": [rng.randint(1, len(calendar)) for _ in range(sizes.store_sales)],
+            "ss_customer_sk": [rng.choice(customer_keys) for _ in range(sizes.store_sales)],
+            "ss_quantity": [rng.randint(1, 100) for _ in range(sizes.store_sales)],
+            "ss_net_paid": [round(rng.uniform(1.0, 20_000.0), 2) for _ in range(sizes.store_sales)],
+        }
+    )
+
+    return {
+        "nation": nation,
+        "customer": customer,
+        "orders": orders,
+        "lineitem": lineitem,
+        "date_dim": date_dim,
+        "store_sales": store_sales,
+    }
+
+
+def fingerprint_tables(tables: dict[str, pa.Table]) -> str:
+    digest = hashlib.sha256()
+    for name in sorted(tables):
+        digest.update(name.encode("utf-8"))
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, tables[name].schema) as writer:
+            writer.write_table(tables[name])
+        digest.update(sink.getvalue().to_pybytes())
+    return digest.hexdigest()
+
+
+def build_fixtures(root: Path | str, *, scale: float = 1.0, seed: int = DEFAULT_SEED) -> FixtureSet:
+    """
+    Materialize the generated tables into SQLite, DuckDB, Parquet and CSV under `root`.
+
+    A manifest records the scale, seed and content fingerprint, so repeated calls
+    with the same arguments reuse the files already on disk.
+    """
+    fixture_root = Path(root) / f"scale-{scale:g}-seed-{seed}"
+    fixtures = FixtureSet(
+        root=fixture_root,
+        scale=scale,
+        seed=seed,
+        sqlite_path=fixture_root / "tpch.sqlite",
+        duckdb_path=fixture_root / "tpch.duckdb",
+        parquet_dir=fixture_root / "parquet",
+        csv_dir=fixture_root / "csv",
+    )
+    manifest_path = fixture_root / "manifest.json"
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("version") == FIXTURE_VERSION:
+            fixtures.row_counts = dict(manifest.get("row_counts") or {})
+            fixtures.fingerprint = str(manifest.get("fingerprint") or "")
+            return fixtures
+
+    tables = generate_tables(scale=scale, seed=seed)
+    fixture_root.mkdir(parents=True, exist_ok=True)
+    fixtures.parquet_dir.mkdir(exist_ok=True)
+    fixtures.csv_dir.mkdir(exist_ok=True)
+    _write_sqlite(fixtures.sqlite_path, tables)
+    _write_duckdb(fixtures.duckdb_path, tables)
+    for name, table in tables.items():
+        pq.write_table(table, fixtures.parquet_path(name))
+        _write_csv(fixtures.csv_path(name), table)
+
+    fixtures.row_counts = {name: table.num_rows for name, table in tables.items()}
+    fixtures.fingerprint = fingerprint_tables(tables)
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "version": FIXTURE_VERSION,
+                "scale": scale,
+                "seed": seed,
+                "row_counts": fixtures.row_counts,
+                "fingerprint": fixtures.fingerprint,
+            },
+            indent=2,
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+    return fixtures
+
+
+def _sqlite_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat().replace("+00:00", "Z")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _write_sqlite(path: Path, tables: dict[str, pa.Table]) -> None:
+    path.unlink(missing_ok=True)
+    connection = sqlite3.connect(path)
+    try:
+        for name, table in tables.items():
+            columns = ", ".join(f'"{column}"' for column in table.column_names)
+            placeholders = ", ".join("?" for _ in table.column_names)
+            connection.execute(f'CREATE TABLE "{name}" ({columns})')
+            rows = (
+                tuple(_sqlite_value(value) for value in row.values())
+                for row in table.to_pylist()
+            )
+            connection.executemany(f'INSERT INTO "{name}" VALUES ({placeholders})', rows)
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _write_duckdb(path: Path, tables: dict[str, pa.Table]) -> None:
+    path.unlink(missing_ok=True)
+    connection = duckdb.connect(database=str(path))
+    try:
+        for name, table in tables.items():
+            connection.register("fixture_table", table)
+            connection.execute(f'CREATE TABLE "{name}" AS SELECT * FROM fixture_table')
+            connection.unregister("fixture_table")
+    finally:
+        connection.close()
+
+
+def _write_csv(path: Path, table: pa.Table) -> None:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(table.column_names)
+        for row in table.to_pylist():
+            writer.writerow(_sqlite_value(value) for value in row.values())
@@ -0,0 +1,257 @@
+import asyncio
+import fnmatch
+import gc
+import inspect
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from benchmarks.fixtures import FixtureSet
+
+REPORT_SCHEMA_VERSION = 1
+
+BenchmarkCallable = Callable[[], Any | Awaitable[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkContext:
+    fixtures: FixtureSet
+    work_dir: Path
+
+
+@dataclass(slots=True)
+class BenchmarkCase:
+    """A prepared benchmark: `run` is timed, `teardown` runs once after the last sample."""
+
+    run: BenchmarkCallable
+    teardown: Callable[[], Any | Awaitable[Any]] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    name: str
+    kind: str
+    description: str
+    setup: Callable[[BenchmarkContext], BenchmarkCase | Awaitable[BenchmarkCase]]
+    inner_loops: int = 1
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    name: str
+    kind: str
+    samples_s: list[float]
+    inner_loops: int
+    description: str = ""
+    stats: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "description": self.description,
+            "unit": "s",
+            "inner_loops": self.inner_loops,
+            "samples": self.samples_s,
+            **self.stats,
+        }
+
+
+_REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    *,
+    kind: str = "micro",
+    inner_loops: int = 1,
+) -> Callable[[Callable[[BenchmarkContext], Any]], Callable[[BenchmarkContext], Any]]:
+    """
+    Register a benchmark setup function.
+
+    The decorated function receives a `BenchmarkContext` and returns a
+    `BenchmarkCase`; everything it does before returning is excluded from timing.
+    Micro benchmarks should set `inner_loops` so one sample lasts at least a few
+    milliseconds.
+    """
+    if kind not in {"micro", "macro"}:
+        raise ValueError(f"Unsupported benchmark kind '{kind}'.")
+
+    def _register(setup: Callable[[BenchmarkContext], Any]) -> Callable[[BenchmarkContext], Any]:
+        if name in _REGISTRY:
+            raise ValueError(f"Benchmark '{name}' is already registered.")
+        _REGISTRY[name] = Benchmark(
+            name=name,
+            kind=kind,
+            description=inspect.getdoc(setup) or "",
+            setup=setup,
+            inner_loops=max(1, int(inner_loops)),
+        )
+        return setup
+
+    return _register
+
+
+def registered_benchmarks() -> dict[str, Benchmark]:
+    import benchmarks.suites  # noqa: F401 - registers the built-in suites
+
+    return dict(sorted(_REGISTRY.items()))
+
+
+def select_benchmarks(
+    *,
+    kind: str | None = None,
+    patterns: list[str] | None = None,
+) -> list[Benchmark]:
+    selected = []
+    for item in registered_benchmarks().values():
+        if kind not in {None, "all"} and item.kind != kind:
+            continue
+        if patterns and not any(fnmatch.fnmatchcase(item.name, pattern) for pattern in patterns):
+            continue
+        selected.append(item)
+    return selected
+
+
+def summarize_samples(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    quartiles = statistics.quantiles(ordered, n=4) if len(ordered) >= 2 else [ordered[0]] * 3
+    return {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) >= 2 else 0.0,
+        "iqr": quartiles[2] - quartiles[0],
+    }
+
+
+def run_benchmarks(
+    selected: list[Benchmark],
+    *,
+    context: BenchmarkContext,
+    repeat: int = 10,
+    warmup: int = 2,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """
+    Time every benchmark on one event loop.
+
+    Each sample runs `inner_loops` calls with the garbage collector paused, the
+    same trade-off `timeit` makes, and is reported as seconds per call.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        results = []
+        for item in selected:
+            result = _run_one(item, context=context, loop=loop, repeat=repeat, warmup=warmup)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+        return results
+    finally:
+        loop.close()
+
+
+def build_report(
+    results: list[BenchmarkResult],
+    *,
+    fixtures: FixtureSet,
+    repeat: int,
+    warmup: int,
+) -> dict[str, Any]:
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": _environment(),
+        "settings": {"repeat": repeat, "warmup": warmup},
+        "fixtures": {
+            "scale": fixtures.scale,
+            "seed": fixtures.seed,
+            "fingerprint": fixtures.fingerprint,
+            "row_counts": fixtures.row_counts,
+        },
+        "benchmarks": {result.name: result.to_dict() for result in results},
+    }
+
+
+def _run_one(
+    item: Benchmark,
+    *,
+    context: BenchmarkContext,
+    loop: asyncio.AbstractEventLoop,
+    repeat: int,
+    warmup: int,
+) -> BenchmarkResult:
+    case = _resolve(item.setup(context), loop=loop)
+    try:
+        for _ in range(max(0, warmup)):
+            for _ in range(item.inner_loops):
+                _resolve(case.run(), loop=loop)
+
+        samples: list[float] = []
+        for _ in range(max(1, repeat)):
+            gc.collect()
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                started = time.perf_counter()
+                for _ in range(item.inner_loops):
+                    _resolve(case.run(), loop=loop)
+                elapsed = time.perf_counter() - started
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            samples.append(elapsed / item.inner_loops)
+    finally:
+        if case.teardown is not None:
+            _resolve(case.teardown(), loop=loop)
+
+    return BenchmarkResult(
+        name=item.name,
+        kind=item.kind,
+        description=item.description,
+        samples_s=samples,
+        inner_loops=item.inner_loops,
+        stats=summarize_samples(samples),
+    )
+
+
+def _resolve(value: Any, *, loop: asyncio.AbstractEventLoop) -> Any:
+    if inspect.isawaitable(value):
+        return loop.run_until_complete(value)
+    return value
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "git_revision": _git_revision(),
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    revision = completed.stdout.strip()
+    return revision or None
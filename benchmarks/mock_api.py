@@ -0,0 +1,182 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pyarrow as pa
+
+from langbridge.connectors.base.config import BaseConnectorConfig, ConnectorRuntimeType
+from langbridge.connectors.saas.declarative import DeclarativeHttpApiConnector
+from langbridge.connectors.saas.declarative.manifest import DeclarativeConnectorManifest
+
+MOCK_API_TOKEN = "bench-token"
+
+MOCK_API_MANIFEST = DeclarativeConnectorManifest.model_validate(
+    {
+        "schema_version": "0.1.0",
+        "kind": "declarative_http_connector",
+        "id": "bench_api",
+        "display_name": "Benchmark API",
+        "connector_type": "STRIPE",
+        "connector_family": "API",
+        "description": "Local mock API used by the benchmark suite.",
+        "base_url": "http://127.0.0.1",
+        "test_connection_path": "/v1/account",
+        "auth": {
+            "strategy": "bearer_token",
+            "token_field": "api_key",
+            "token_label": "API Key",
+            "header_name": "Authorization",
+            "header_template": "Bearer {api_key}",
+        },
+        "pagination": {
+            "strategy": "cursor",
+            "response_items_field": "data",
+            "limit_param": "limit",
+            "cursor_param": "starting_after",
+            "response_has_more_field": "has_more",
+            "next_cursor_field": "id",
+            "default_page_size": 100,
+            "max_page_size": 1000,
+        },
+        "incremental": {
+            "strategy": "request_param",
+            "request_param": "created[gte]",
+            "cursor_field": "created",
+            "cursor_type": "unix_timestamp",
+        },
+        "resources": [
+            {
+                "key": "orders",
+                "label": "Orders",
+                "path": "/v1/orders",
+                "primary_key": "id",
+                "supports_incremental": True,
+                "default_sync_mode": "INCREMENTAL",
+            }
+        ],
+    }
+)
+
+
+class MockApiConnectorConfig(BaseConnectorConfig):
+    api_key: str = MOCK_API_TOKEN
+    api_base_url: str
+
+
+class MockApiConnector(DeclarativeHttpApiConnector):
+    """Stripe-shaped declarative connector pointed at a running `MockApiServer`."""
+
+    RUNTIME_TYPE = ConnectorRuntimeType.STRIPE
+    MANIFEST = MOCK_API_MANIFEST
+    config: MockApiConnectorConfig
+
+
+class MockApiServer:
+    """
+    Serves fixture rows as a cursor-paginated JSON API on 127.0.0.1.
+
+    Records are exposed Stripe style: `GET /v1/<resource>?limit=&starting_after=`
+    returns `{"data": [...], "has_more": bool}` ordered by `id`.
+    """
+
+    def __init__(self, resources: dict[str, list[dict[str, Any]]]) -> None:
+        self._resources = {
+            name: sorted(records, key=lambda record: record["id"])
+            for name, records in resources.items()
+        }
+        self._positions = {
+            name: {record["id"]: index for index, record in enumerate(records)}
+            for name, records in self._resources.items()
+        }
+        self.request_count = 0
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_orders(cls, orders: pa.Table) -> "MockApiServer":
+        records = [
+            {
+                "id": f"ord_{row['o_orderkey']:08d}",
+                "customer": row["o_custkey"],
+                "status": row["o_orderstatus"],
+                "amount": row["o_totalprice"],
+                "created": int(row["o_updated_at"].timestamp()),
+                "metadata": {"priority": row["o_orderpriority"]},
+            }
+            for row in orders.to_pylist()
+        ]
+        return cls({"orders": records})
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Mock API server is not running.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockApiServer":
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                server.request_count += 1
+                status, payload = server._handle(self.path, self.headers.get("Authorization"))
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="bench-mock-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "MockApiServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _handle(self, raw_path: str, authorization: str | None) -> tuple[int, dict[str, Any]]:
+        if authorization != f"Bearer {MOCK_API_TOKEN}":
+            return 401, {"error": {"message": "Invalid API key."}}
+        parsed = urlparse(raw_path)
+        if parsed.path == "/v1/account":
+            return 200, {"id": "acct_bench"}
+        resource = parsed.path.removeprefix("/v1/")
+        records = self._resources.get(resource)
+        if records is None:
+            return 404, {"error": {"message": f"Unknown resource '{resource}'."}}
+
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        limit = max(1, min(int(params.get("limit") or 100), 1000))
+        start = 0
+        if params.get("starting_after"):
+            start = self._positions[resource].get(params["starting_after"], len(records) - 1) + 1
+        created_gte = params.get("created[gte]")
+        if created_gte:
+            threshold = int(created_gte)
+            window = [record for record in records[start:] if record["created"] >= threshold]
+        else:
+            window = records[start:]
+        page = window[:limit]
+        return 200, {"object": "list", "data": page, "has_more": len(window) > limit}
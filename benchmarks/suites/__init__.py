@@ -0,0 +1,5 @@
+"""Built-in benchmark suites; importing this package registers them."""
+
+from benchmarks.suites import federation, odbc, semantic, sync
+
+__all__ = ["federation", "odbc", "semantic", "sync"]
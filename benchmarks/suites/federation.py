@@ -0,0 +1,226 @@
+import uuid
+
+import duckdb
+
+from benchmarks.harness import BenchmarkCase, BenchmarkContext, benchmark
+from benchmarks.mock_api import MockApiConnector, MockApiConnectorConfig, MockApiServer
+from langbridge.connectors.builtin.sqlite.config import SqliteConnectorConfig
+from langbridge.connectors.builtin.sqlite.connector import SqliteConnector
+from langbridge.federation.connectors import (
+    ApiConnectorRemoteSource,
+    DuckDbFileRemoteSource,
+    DuckDbParquetRemoteSource,
+    SqlConnectorRemoteSource,
+)
+from langbridge.federation.executor import ArtifactStore
+from langbridge.federation.models import FederationWorkflow, VirtualDataset, VirtualTableBinding
+from langbridge.federation.models.plans import SourceSubplan
+from langbridge.federation.models.virtual_dataset import TableStatistics
+from langbridge.federation.planner import FederatedPlanner
+from langbridge.federation.service import FederatedQueryService
+
+# TPC-H Q3 (shipping priority) over customer (CSV), orders (SQLite) and lineitem (Parquet).
+TPCH_Q3 = """
+SELECT
+    l.l_orderkey,
+    SUM(l.l_extendedprice * (1 - l.l_discount)) AS revenue,
+    o.o_orderdate
+FROM customer c
+JOIN orders o ON c.c_custkey = o.o_custkey
+JOIN lineitem l ON l.l_orderkey = o.o_orderkey
+WHERE c.c_mktsegment = 'BUILDING'
+  AND o.o_orderdate < '2024-03-15'
+GROUP BY l.l_orderkey, o.o_orderdate
+ORDER BY revenue DESC, o.o_orderdate
+LIMIT 10
+"""
+
+# Selective two-way join whose filter and projection push down to SQLite.
+FILTERED_JOIN = """
+SELECT o.o_orderkey, o.o_totalprice, c.c_name
+FROM orders o
+JOIN customer c ON o.o_custkey = c.c_custkey
+WHERE o.o_orderstatus = 'F' AND o.o_totalprice > 500000
+"""
+
+_BYTES_PER_ROW = {"customer": 64.0, "orders": 72.0, "lineitem": 56.0}
+
+
+def _workflow(context: BenchmarkContext, *, with_stats: bool) -> FederationWorkflow:
+    fixtures = context.fixtures
+    workspace_id = str(uuid.uuid4())
+
+    def _stats(table: str) -> TableStatistics | None:
+        if not with_stats:
+            return None
+        return TableStatistics(
+            row_count_estimate=float(fixtures.row_counts.get(table, 0)),
+            bytes_per_row=_BYTES_PER_ROW[table],
+        )
+
+    return FederationWorkflow(
+        id="wf-bench-tpch",
+        workspace_id=workspace_id,
+        dataset=VirtualDataset(
+            id="ds-bench-tpch",
+            name="tpch",
+            workspace_id=workspace_id,
+            tables={
+                "customer": VirtualTableBinding(
+                    table_key="customer",
+                    source_id="csv_customer",
+                    table="customer",
+                    stats=_stats("customer"),
+                    metadata={
+                        "source_kind": "file",
+                        "file_format": "csv",
+                        "storage_uri": str(fixtures.csv_path("customer")),
+                    },
+                ),
+                "orders": VirtualTableBinding(
+                    table_key="orders",
+                    source_id="sqlite_orders",
+                    table="orders",
+                    stats=_stats("orders"),
+                ),
+                "lineitem": VirtualTableBinding(
+                    table_key="lineitem",
+                    source_id="parquet_lineitem",
+                    table="lineitem",
+                    stats=_stats("lineitem"),
+                    metadata={
+                        "source_kind": "file",
+                        "storage_kind": "parquet",
+                        "file_format": "parquet",
+                        "storage_uri": fixtures.parquet_path("lineitem").resolve().as_uri(),
+                    },
+                ),
+            },
+        ),
+    )
+
+
+def _service(context: BenchmarkContext, workflow: FederationWorkflow) -> FederatedQueryService:
+    bindings = workflow.dataset.tables
+    sqlite_source = SqlConnectorRemoteSource(
+        source_id="sqlite_orders",
+        connector=SqliteConnector(SqliteConnectorConfig(location=str(context.fixtures.sqlite_path))),
+        dialect="sqlite",
+    )
+    service = FederatedQueryService(
+        artifact_store=ArtifactStore(base_dir=str(context.work_dir / f"artifacts-{uuid.uuid4().hex}")),
+    )
+    service.register_workspace(
+        workspace_id=workflow.workspace_id,
+        workflow=workflow,
+        sources={
+            "csv_customer": DuckDbFileRemoteSource(source_id="csv_customer", bindings=[bindings["customer"]]),
+            "sqlite_orders": sqlite_source,
+            "parquet_lineitem": DuckDbParquetRemoteSource(
+                source_id="parquet_lineitem",
+                bindings=[bindings["lineitem"]],
+            ),
+        },
+    )
+    return service
+
+
+def _source_dialects() -> dict[str, str]:
+    return {"csv_customer": "duckdb", "sqlite_orders": "sqlite", "parquet_lineitem": "duckdb"}
+
+
+@benchmark("federation.plan_sql.tpch_q3", kind="micro", inner_loops=20)
+def plan_tpch_q3(context: BenchmarkContext) -> BenchmarkCase:
+    """FederatedPlanner.plan_sql for a three-source TPC-H Q3 with known table stats."""
+    planner = FederatedPlanner()
+    workflow = _workflow(context, with_stats=True)
+    source_dialects = _source_dialects()
+    return BenchmarkCase(
+        run=lambda: planner.plan_sql(
+            sql=TPCH_Q3,
+            dialect="postgres",
+            workflow=workflow,
+            source_dialects=source_dialects,
+        )
+    )
+
+
+@benchmark("federation.plan_sql.filtered_join", kind="micro", inner_loops=50)
+def plan_filtered_join(context: BenchmarkContext) -> BenchmarkCase:
+    """FederatedPlanner.plan_sql for a two-way join with pushed-down filters."""
+    planner = FederatedPlanner()
+    workflow = _workflow(context, with_stats=True)
+    source_dialects = _source_dialects()
+    return BenchmarkCase(
+        run=lambda: planner.plan_sql(
+            sql=FILTERED_JOIN,
+            dialect="postgres",
+            workflow=workflow,
+            source_dialects=source_dialects,
+        )
+    )
+
+
+@benchmark("federation.execute.tpch_q3", kind="macro")
+def execute_tpch_q3(context: BenchmarkContext) -> BenchmarkCase:
+    """End-to-end FederatedQueryService.execute (planner, scheduler, StageExecutor) for TPC-H Q3."""
+    workflow = _workflow(context, with_stats=True)
+    service = _service(context, workflow)
+
+    async def _run() -> None:
+        handle = await service.execute(query=TPCH_Q3, dialect="postgres", workspace_id=workflow.workspace_id)
+        await service.fetch_arrow(handle)
+
+    return BenchmarkCase(run=_run)
+
+
+@benchmark("federation.execute.filtered_join", kind="macro")
+def execute_filtered_join(context: BenchmarkContext) -> BenchmarkCase:
+    """End-to-end FederatedQueryService.execute for a selective SQLite + CSV join."""
+    workflow = _workflow(context, with_stats=True)
+    service = _service(context, workflow)
+
+    async def _run() -> None:
+        handle = await service.execute(query=FILTERED_JOIN, dialect="postgres", workspace_id=workflow.workspace_id)
+        await service.fetch_arrow(handle)
+
+    return BenchmarkCase(run=_run)
+
+
+@benchmark("federation.api_source.scan", kind="macro")
+def api_source_scan(context: BenchmarkContext) -> BenchmarkCase:
+    """ApiConnectorRemoteSource fetch + DuckDB scan against the local mock HTTP API."""
+    server = MockApiServer.from_orders(context.fixtures.load_table("orders")).start()
+    binding = VirtualTableBinding(
+        table_key="orders",
+        source_id="api_orders",
+        table="orders",
+        metadata={"api_resource": "orders"},
+    )
+    source = ApiConnectorRemoteSource(
+        source_id="api_orders",
+        connector=MockApiConnector(MockApiConnectorConfig(api_base_url=server.base_url)),
+        bindings=[binding],
+    )
+    subplan = SourceSubplan(
+        stage_id="scan_orders",
+        source_id="api_orders",
+        alias="o",
+        table_key="orders",
+        sql='SELECT status, COUNT(*) AS order_count, SUM(amount) AS revenue FROM "orders" GROUP BY status',
+    )
+
+    async def _run() -> None:
+        await source.execute(subplan)
+
+    return BenchmarkCase(run=_run, teardown=server.stop)
+
+
+@benchmark("duckdb.tpch_q3_reference", kind="macro")
+def duckdb_reference(context: BenchmarkContext) -> BenchmarkCase:
+    """TPC-H Q3 run directly in the DuckDB fixture; calibrates machine speed between reports."""
+    connection = duckdb.connect(database=str(context.fixtures.duckdb_path), read_only=True)
+    return BenchmarkCase(
+        run=lambda: connection.execute(TPCH_Q3).fetch_arrow_table(),
+        teardown=connection.close,
+    )
@@ -0,0 +1,26 @@
+from benchmarks.harness import BenchmarkCase, BenchmarkContext, benchmark
+from langbridge.runtime.hosting.odbc import (
+    RuntimeOdbcQueryGateway,
+    _encode_data_row,
+    _encode_row_description,
+)
+
+_RESULT_ROWS = 5_000
+
+
+@benchmark("odbc.encode_result_set", kind="micro", inner_loops=5)
+def encode_result_set(context: BenchmarkContext) -> BenchmarkCase:
+    """Normalize a 5k-row runtime payload and encode RowDescription + DataRow wire messages."""
+    orders = context.fixtures.load_table("orders").slice(0, _RESULT_ROWS)
+    raw_columns = [{"name": name} for name in orders.column_names]
+    raw_rows = orders.to_pylist()
+
+    def _run() -> int:
+        columns = RuntimeOdbcQueryGateway._normalize_columns(raw_columns, raw_rows)
+        rows = RuntimeOdbcQueryGateway._normalize_rows(columns=columns, rows=raw_rows)
+        encoded = len(_encode_row_description(columns))
+        for row in rows:
+            encoded += len(_encode_data_row(row))
+        return encoded
+
+    return BenchmarkCase(run=_run)
@@ -0,0 +1,135 @@
+from benchmarks.harness import BenchmarkCase, BenchmarkContext, benchmark
+from langbridge.semantic.loader import load_semantic_model
+from langbridge.semantic.query import SemanticQuery, SemanticQueryEngine
+
+TPCH_SEMANTIC_MODEL = {
+    "version": "1.0",
+    "name": "TPC-H",
+    "datasets": {
+        "orders": {
+            "relation_name": "orders",
+            "schema_name": "tpch",
+            "dimensions": [
+                {"name": "o_orderkey", "type": "integer", "primary_key": True},
+                {"name": "o_custkey", "type": "integer"},
+                {"name": "o_orderstatus", "type": "string"},
+                {"name": "o_orderpriority", "type": "string"},
+                {"name": "o_orderdate", "type": "date"},
+            ],
+            "measures": [
+                {"name": "order_count", "expression": "o_orderkey", "type": "integer", "aggregation": "count"},
+                {"name": "total_price", "expression": "o_totalprice", "type": "number", "aggregation": "sum"},
+            ],
+            "filters": {"finished": {"condition": "orders.o_orderstatus = 'F'"}},
+        },
+        "lineitem": {
+            "relation_name": "lineitem",
+            "schema_name": "tpch",
+            "dimensions": [
+                {"name": "l_orderkey", "type": "integer"},
+                {"name": "l_shipmode", "type": "string"},
+                {"name": "l_shipdate", "type": "date"},
+            ],
+            "measures": [
+                {
+                    "name": "revenue",
+                    "expression": "l_extendedprice * (1 - l_discount)",
+                    "type": "number",
+                    "aggregation": "sum",
+                },
+                {"name": "quantity", "expression": "l_quantity", "type": "integer", "aggregation": "sum"},
+            ],
+        },
+        "customer": {
+            "relation_name": "customer",
+            "schema_name": "tpch",
+            "dimensions": [
+                {"name": "c_custkey", "type": "integer", "primary_key": True},
+                {"name": "c_nationkey", "type": "integer"},
+                {"name": "c_mktsegment", "type": "string"},
+            ],
+        },
+        "nation": {
+            "relation_name": "nation",
+            "schema_name": "tpch",
+            "dimensions": [
+                {"name": "n_nationkey", "type": "integer", "primary_key": True},
+                {"name": "n_name", "type": "string"},
+            ],
+        },
+    },
+    "relationships": [
+        {
+            "name": "lineitem_to_orders",
+            "source_dataset": "lineitem",
+            "source_field": "l_orderkey",
+            "target_dataset": "orders",
+            "target_field": "o_orderkey",
+            "type": "inner",
+        },
+        {
+            "name": "orders_to_customer",
+            "source_dataset": "orders",
+            "source_field": "o_custkey",
+            "target_dataset": "customer",
+            "target_field": "c_custkey",
+            "type": "inner",
+        },
+        {
+            "name": "customer_to_nation",
+            "source_dataset": "customer",
+            "source_field": "c_nationkey",
+            "target_dataset": "nation",
+            "target_field": "n_nationkey",
+            "type": "left",
+        },
+    ],
+    "metrics": {
+        "revenue_per_order": {
+            "description": "Net revenue divided by distinct orders.",
+            "expression": "SUM(lineitem.l_extendedprice * (1 - lineitem.l_discount)) / NULLIF(COUNT(DISTINCT orders.o_orderkey), 0)",
+        }
+    },
+}
+
+REVENUE_BY_NATION_QUERY = {
+    "dimensions": ["nation.n_name", "customer.c_mktsegment"],
+    "measures": ["lineitem.revenue", "orders.order_count"],
+    "timeDimensions": [
+        {
+            "dimension": "orders.o_orderdate",
+            "granularity": "month",
+            "dateRange": ["2023-01-01", "2023-12-31"],
+        }
+    ],
+    "filters": [
+        {"member": "lineitem.l_shipmode", "operator": "equals", "values": ["AIR", "RAIL"]},
+        {"measure": "lineitem.revenue", "operator": "gt", "values": ["1000"]},
+    ],
+    "order": [{"lineitem.revenue": "desc"}],
+    "limit": 100,
+}
+
+SINGLE_TABLE_QUERY = {
+    "dimensions": ["orders.o_orderpriority"],
+    "measures": ["orders.total_price"],
+    "order": [{"orders.total_price": "desc"}],
+}
+
+
+@benchmark("semantic.compile.star_join", kind="micro", inner_loops=20)
+def compile_star_join(context: BenchmarkContext) -> BenchmarkCase:
+    """SemanticQueryEngine.compile across a four-dataset join with time, member and measure filters."""
+    engine = SemanticQueryEngine()
+    model = load_semantic_model(TPCH_SEMANTIC_MODEL)
+    query = SemanticQuery.model_validate(REVENUE_BY_NATION_QUERY)
+    return BenchmarkCase(run=lambda: engine.compile(query, model, dialect="postgres"))
+
+
+@benchmark("semantic.compile.single_table", kind="micro", inner_loops=50)
+def compile_single_table(context: BenchmarkContext) -> BenchmarkCase:
+    """SemanticQueryEngine.compile for a single-dataset grouped aggregate."""
+    engine = SemanticQueryEngine()
+    model = load_semantic_model(TPCH_SEMANTIC_MODEL)
+    query = SemanticQuery.model_validate(SINGLE_TABLE_QUERY)
+    return BenchmarkCase(run=lambda: engine.compile(query, model, dialect="duckdb"))
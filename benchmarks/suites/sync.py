@@ -0,0 +1,165 @@
+import uuid
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from benchmarks.harness import BenchmarkCase, BenchmarkContext, benchmark
+from langbridge.connectors.base.config import ConnectorRuntimeType
+from langbridge.runtime.models import ConnectorMetadata, DatasetMetadata
+from langbridge.runtime.models.metadata import (
+    DatasetMaterializationMode,
+    DatasetSourceKind,
+    DatasetStatus,
+    DatasetStorageKind,
+    DatasetType,
+    LifecycleState,
+    ManagementMode,
+)
+from langbridge.runtime.models.state import ConnectorSyncMode
+from langbridge.runtime.persistence.in_memory import (
+    _InMemoryConnectorSyncStateRepository,
+    _InMemoryDatasetColumnRepository,
+    _InMemoryDatasetPolicyRepository,
+    _InMemoryDatasetRepository,
+    _InMemoryDatasetRevisionRepository,
+    _InMemoryLineageEdgeRepository,
+)
+from langbridge.runtime.services.dataset_sync_service import ConnectorSyncRuntime
+from langbridge.runtime.settings import runtime_settings
+from langbridge.storage.dataset_table import DatasetTable
+from langbridge.storage.parquet_stream import StreamingParquetWriter
+
+
+def _synced_dataset(*, workspace_id: uuid.UUID, actor_id: uuid.UUID, connection_id: uuid.UUID) -> DatasetMetadata:
+    now = datetime.now(timezone.utc)
+    return DatasetMetadata(
+        id=uuid.uuid4(),
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        created_by=actor_id,
+        updated_by=actor_id,
+        name="orders_snapshot",
+        sql_alias="orders_snapshot",
+        description="Benchmark snapshot of the SQLite orders fixture.",
+        tags=[],
+        dataset_type=DatasetType.FILE,
+        materialization_mode=DatasetMaterializationMode.SYNCED,
+        source_kind=DatasetSourceKind.DATABASE,
+        connector_kind=ConnectorRuntimeType.SQLITE.value.lower(),
+        storage_kind=DatasetStorageKind.PARQUET,
+        dialect="duckdb",
+        catalog_name=None,
+        schema_name=None,
+        table_name="orders_snapshot",
+        storage_uri=None,
+        sql_text=None,
+        source=None,
+        sync={"source": {"table": "orders"}, "strategy": "FULL_REFRESH", "cursor_field": "o_updated_at"},
+        relation_identity=None,
+        execution_capabilities=None,
+        referenced_dataset_ids=[],
+        federated_plan=None,
+        file_config={"format": "parquet", "managed_dataset": True},
+        status=DatasetStatus.PENDING_SYNC,
+        revision_id=None,
+        row_count_estimate=None,
+        bytes_estimate=None,
+        last_profiled_at=None,
+        columns=[],
+        policy=None,
+        created_at=now,
+        updated_at=now,
+        management_mode=ManagementMode.CONFIG_MANAGED,
+        lifecycle_state=LifecycleState.ACTIVE,
+    )
+
+
+@benchmark("sync.sqlite_table.full_refresh", kind="macro")
+def sync_sqlite_full_refresh(context: BenchmarkContext) -> BenchmarkCase:
+    """ConnectorSyncRuntime.sync_dataset materializing the SQLite orders table to Parquet."""
+    original_dataset_dir = runtime_settings.DATASET_FILE_LOCAL_DIR
+    object.__setattr__(
+        runtime_settings,
+        "DATASET_FILE_LOCAL_DIR",
+        str((context.work_dir / f"datasets-{uuid.uuid4().hex}").resolve()),
+    )
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    dataset = _synced_dataset(workspace_id=workspace_id, actor_id=actor_id, connection_id=connection_id)
+    connector_record = ConnectorMetadata(
+        id=connection_id,
+        workspace_id=workspace_id,
+        name="bench_sqlite",
+        connector_type=ConnectorRuntimeType.SQLITE,
+        config={"config": {"location": str(context.fixtures.sqlite_path)}},
+        management_mode=ManagementMode.CONFIG_MANAGED,
+        lifecycle_state=LifecycleState.ACTIVE,
+    )
+    runtime = ConnectorSyncRuntime(
+        connector_sync_state_repository=_InMemoryConnectorSyncStateRepository(),
+        dataset_repository=_InMemoryDatasetRepository({dataset.id: dataset}),
+        dataset_column_repository=_InMemoryDatasetColumnRepository({}),
+        dataset_policy_repository=_InMemoryDatasetPolicyRepository(),
+        dataset_revision_repository=_InMemoryDatasetRevisionRepository(),
+        lineage_edge_repository=_InMemoryLineageEdgeRepository(),
+    )
+
+    async def _run() -> None:
+        await runtime.sync_dataset(
+            workspace_id=workspace_id,
+            actor_id=actor_id,
+            connector_record=connector_record,
+            dataset=dataset,
+            sync_mode=ConnectorSyncMode.FULL_REFRESH,
+        )
+
+    def _restore_settings() -> None:
+        object.__setattr__(runtime_settings, "DATASET_FILE_LOCAL_DIR", original_dataset_dir)
+
+    return BenchmarkCase(run=_run, teardown=_restore_settings)
+
+
+@benchmark("sync.incremental_merge.small_delta", kind="macro")
+def sync_incremental_merge_small_delta(context: BenchmarkContext) -> BenchmarkCase:
+    """Upsert a 500-row delta into a 200k-row synced dataset table."""
+    work_dir = context.work_dir / f"merge-{uuid.uuid4().hex}"
+    existing_rows = 200_000
+    table = DatasetTable(work_dir / "orders")
+    seed_path = table.staging_path()
+    seed_path.parent.mkdir(parents=True)
+    pq.write_table(
+        pa.table(
+            {
+                "amount": pa.array([float(index % 997) for index in range(existing_rows)]),
+                "id": pa.array(range(existing_rows), type=pa.int64()),
+                "status": pa.array(["open" if index % 3 else "closed" for index in range(existing_rows)]),
+            }
+        ),
+        seed_path,
+    )
+    table.overwrite(seed_path, schema=pq.read_schema(seed_path), primary_key="id")
+    delta_rows = [
+        {"id": index * 400, "amount": 1.5, "status": "refunded"}
+        for index in range(500)
+    ]
+    runtime = ConnectorSyncRuntime(
+        connector_sync_state_repository=_InMemoryConnectorSyncStateRepository(),
+        dataset_repository=_InMemoryDatasetRepository({}),
+        dataset_column_repository=_InMemoryDatasetColumnRepository({}),
+        dataset_policy_repository=_InMemoryDatasetPolicyRepository(),
+    )
+
+    def _run() -> None:
+        with StreamingParquetWriter(table.staging_path()) as writer:
+            writer.write_rows(delta_rows)
+            staged = writer.close()
+        runtime._append_to_dataset_table(
+            table=table,
+            staged=staged,
+            existing_schema=table.current_snapshot().schema,
+            primary_key="id",
+        )
+
+    return BenchmarkCase(run=_run)
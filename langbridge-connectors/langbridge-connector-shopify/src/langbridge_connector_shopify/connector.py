@@ -1,7 +1,7 @@
 import re
 from typing import Any
 
-from langbridge.connectors.base import ApiResource, ApiResourceDefinition
+from langbridge.connectors.base import ApiResource, ApiResourceDefinition, ApiResourceQuery
 from langbridge.connectors.base.config import ConnectorRuntimeType
 from langbridge.connectors.base.errors import AuthError, ConnectorError
 from langbridge.connectors.saas.declarative import DeclarativeHttpApiConnector
@@ -48,6 +48,7 @@ class ShopifyApiConnector(DeclarativeHttpApiConnector):
         since: str | None = None,
         cursor: str | None = None,
         limit: int | None = None,
+        query: ApiResourceQuery | None = None,
     ):
         await self._ensure_access_token()
         return await super().extract_resource(
@@ -55,6 +56,7 @@ class ShopifyApiConnector(DeclarativeHttpApiConnector):
             since=since,
             cursor=cursor,
             limit=limit,
+            query=query,
         )
 
     async def _ensure_access_token(self) -> str:
@@ -37,6 +37,7 @@ from langbridge.runtime.hosting.api_models import (
     RuntimeSyncResourceListResponse,
     RuntimeSyncResponse,
     RuntimeSyncStateListResponse,
+    query_profile_from_payload,
 )
 
 
@@ -227,6 +228,7 @@ class SqlQueryResult(_AwaitableModel):
     error: dict[str, Any] | None = None
     query: str | None = None
     generated_sql: str | None = None
+    query_profile: dict[str, Any] | None = None
 
 
 class ConnectorSummary(_AwaitableModel):
@@ -392,6 +394,7 @@ class _SdkAdapter(Protocol):
         requested_limit: int | None,
         requested_timeout_seconds: int | None,
         explain: bool,
+        analyze: bool,
         timeout_s: float,
         poll_interval_s: float,
     ) -> SqlQueryResult: ...
@@ -676,6 +679,7 @@ class RuntimeHostApiAdapter(_BaseHttpApiAdapter, _SdkAdapter):
         requested_limit: int | None,
         requested_timeout_seconds: int | None,
         explain: bool,
+        analyze: bool,
         timeout_s: float,
         poll_interval_s: float,
     ) -> SqlQueryResult:
@@ -694,6 +698,7 @@ class RuntimeHostApiAdapter(_BaseHttpApiAdapter, _SdkAdapter):
                 else {}
             ),
             "explain": explain,
+            **({"analyze": True} if analyze else {}),
         }
         return SqlQueryResult.model_validate(
             self._request(
@@ -915,6 +920,7 @@ class RemoteApiAdapter(_BaseHttpApiAdapter, _SdkAdapter):
         requested_limit: int | None,
         requested_timeout_seconds: int | None,
         explain: bool,
+        analyze: bool,
         timeout_s: float,
         poll_interval_s: float,
     ) -> SqlQueryResult:
@@ -932,6 +938,7 @@ class RemoteApiAdapter(_BaseHttpApiAdapter, _SdkAdapter):
             requested_limit=requested_limit,
             requested_timeout_seconds=requested_timeout_seconds,
             explain=explain,
+            analyze=analyze,
             selected_datasets=normalized_datasets,
         )
         initial = self._request(
@@ -1249,6 +1256,7 @@ class LocalRuntimeAdapter(_SdkAdapter):
         requested_limit: int | None,
         requested_timeout_seconds: int | None,
         explain: bool,
+        analyze: bool,
         timeout_s: float,
         poll_interval_s: float,
     ) -> SqlQueryResult:
@@ -1310,6 +1318,7 @@ class LocalRuntimeAdapter(_SdkAdapter):
             allow_federation=not is_direct,
             selected_datasets=normalized_datasets,
             explain=explain,
+            analyze=analyze,
             correlation_id=getattr(getattr(self._runtime_host, "context", None), "request_id", None),
         )
         try:
@@ -1333,6 +1342,7 @@ class LocalRuntimeAdapter(_SdkAdapter):
             redaction_applied=bool(payload.get("redaction_applied")),
             query=query,
             generated_sql=payload.get("generated_sql"),
+            query_profile=query_profile_from_payload(payload),
         )
 
     def ask_agent(
@@ -1620,6 +1630,7 @@ class _SqlClient:
         requested_limit: int | None = None,
         requested_timeout_seconds: int | None = None,
         explain: bool = False,
+        analyze: bool = False,
         timeout_s: float = 30.0,
         poll_interval_s: float = 0.2,
     ) -> SqlQueryResult:
@@ -1635,6 +1646,7 @@ class _SqlClient:
             requested_limit=requested_limit,
             requested_timeout_seconds=requested_timeout_seconds,
             explain=explain,
+            analyze=analyze,
             timeout_s=timeout_s,
             poll_interval_s=poll_interval_s,
         )
@@ -15,6 +15,13 @@ _EXPORTS = {
         "ConnectorRuntimeType",
         "ConnectorSyncStrategy",
     ),
+    "langbridge.connectors.base.change_capture": (
+        "ChangeBatch",
+        "ChangeCaptureTable",
+        "ChangeDataCaptureConnector",
+        "ChangeEvent",
+        "ChangeOperation",
+    ),
     "langbridge.connectors.base.metadata": (
         "ColumnMetadata",
         "ForeignKeyMetadata",
@@ -24,8 +31,10 @@ _EXPORTS = {
         "ApiConnector",
         "ApiChildResource",
         "ApiExtractResult",
+        "ApiFilterPredicate",
         "ApiResource",
         "ApiResourceCardinality",
+        "ApiResourceQuery",
         "ApiSyncResult",
         "AuthError",
         "Connector",
@@ -63,6 +72,18 @@ _EXPORTS = {
         "HttpApiConnector",
         "parse_link_header_cursor",
     ),
+    "langbridge.connectors.base.http_cache": (
+        "HttpCacheStats",
+        "HttpResponseCache",
+        "configure_http_response_cache",
+        "get_http_response_cache",
+    ),
+    "langbridge.connectors.base.http_pool": (
+        "HttpClientPool",
+        "RateLimitPolicy",
+        "RetryPolicy",
+        "get_http_client_pool",
+    ),
     "langbridge.connectors.base.resource_paths": (
         "ApiMaterializedRows",
         "api_parent_resource_path",
@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+
+
+class ChangeOperation(str, Enum):
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+    # Every row of the table was removed; readers re-snapshot the table.
+    TRUNCATE = "truncate"
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeCaptureTable:
+    schema: Optional[str]
+    name: str
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.schema}.{self.name}" if self.schema else self.name
+
+
+@dataclass(slots=True)
+class ChangeEvent:
+    operation: ChangeOperation
+    table: ChangeCaptureTable
+    # The row after the change; for deletes, at least the key columns of the removed row.
+    row: Dict[str, Any]
+    position: str
+    committed_at: Optional[datetime] = None
+    # Columns left out of `row` because the source did not send them and they did not
+    # change (Postgres' unchanged TOASTed values); they keep the key's previous value.
+    unchanged: FrozenSet[str] = frozenset()
+
+
+@dataclass(slots=True)
+class ChangeBatch:
+    events: List[ChangeEvent] = field(default_factory=list)
+    # Where the next read continues once `events` are applied and acknowledged.
+    position: str = ""
+    has_more: bool = False
+    lag_seconds: Optional[float] = None
+    lag_bytes: Optional[int] = None
+
+
+class ChangeDataCaptureConnector(ABC):
+    """
+    Mixin for SQL connectors that stream row changes from the server's change log.
+
+    Positions are opaque strings (a Postgres LSN, a MySQL binlog `file:offset`) that
+    only the connector producing them interprets. `slot` names the server-side
+    capture state so several datasets can follow the same source independently.
+    """
+
+    @abstractmethod
+    async def start_change_capture(self, *, slot: str, tables: Sequence[ChangeCaptureTable]) -> str:
+        """Create or reuse the capture for `tables` and return the position changes are read from."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_changes(
+        self,
+        *,
+        slot: str,
+        tables: Sequence[ChangeCaptureTable],
+        position: str,
+        max_events: int,
+    ) -> ChangeBatch:
+        """Read up to about `max_events` changes after `position`, in commit order."""
+        raise NotImplementedError
+
+    async def acknowledge_changes(self, *, slot: str, position: str) -> None:
+        """Let the source discard changes up to `position`; a no-op when it keeps no reader state."""
+        return None
@@ -55,12 +55,14 @@ class ConnectorSyncStrategy(str, Enum):
     INCREMENTAL = "INCREMENTAL"
     WINDOWED_INCREMENTAL = "WINDOWED_INCREMENTAL"
     MANUAL = "MANUAL"
+    CDC = "CDC"
 
 
 class ConnectorCapabilities(_Base):
     supports_live_datasets: bool = False
     supports_synced_datasets: bool = False
     supports_incremental_sync: bool = False
+    supports_change_data_capture: bool = False
     supports_query_pushdown: bool = False
     supports_preview: bool = False
     supports_federated_execution: bool = False
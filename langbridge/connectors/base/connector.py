@@ -91,6 +91,34 @@ class ApiExtractResult:
     next_cursor: str | None = None
     checkpoint_cursor: str | None = None
     child_resources: List[ApiChildResource] | None = None
+    # Cursors of every later page, when the API lets them be requested independently
+    # (e.g. offset pagination with a known total). Readers may fetch these concurrently.
+    remaining_cursors: List[str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ApiFilterPredicate:
+    field: str
+    # One of "eq", "in", "gt", "gte", "lt", "lte". `value` is a list for "in".
+    operator: str
+    value: Any
+
+
+@dataclass(slots=True)
+class ApiResourceQuery:
+    """
+    Server-side hints for extracting one resource.
+
+    Hints only narrow what the API returns: callers still evaluate the full query over
+    the extracted records, so a connector may apply any subset of them, and may widen a
+    filter (e.g. send `gte` for a strict `gt`) when the API offers nothing tighter.
+    """
+
+    filters: List[ApiFilterPredicate] = field(default_factory=list)
+    fields: List[str] | None = None
+    order_by: str | None = None
+    descending: bool = False
+    limit: int | None = None
 
 
 @dataclass(slots=True)
@@ -244,6 +272,18 @@ class ApiConnector(Connector):
         """
         raise NotImplementedError
 
+    def plan_resource_query(
+        self,
+        resource_name: str,
+        query: ApiResourceQuery,
+    ) -> ApiResourceQuery | None:
+        """
+        Return the part of `query` this connector can push to the API, or None when it
+        cannot push anything. Connectors that return a query accept it through the
+        `query` keyword of `extract_resource`.
+        """
+        return None
+
 
 class NoSqlConnector(Connector):
     """
@@ -567,6 +607,19 @@ class ManagedVectorDB(VecotorDBConnector):
     async def delete_index(self) -> None:
         """Delete the vector index."""
         raise NotImplementedError
+
+    async def list_vectors(self) -> Dict[int, Any]:
+        """
+        Return the metadata of every stored vector, keyed by vector id.
+
+        Optional: callers fall back to rebuilding the index when a connector
+        does not implement it.
+        """
+        raise NotImplementedError
+
+    async def delete_vectors(self, ids: Sequence[int]) -> None:
+        """Remove the given vectors from the index."""
+        raise NotImplementedError
     
 
 class StorageConnector(Connector):
@@ -8,6 +8,8 @@ from .errors import (
     AuthError,
     ConnectorError,
 )
+from .http_cache import HttpResponseCache, get_http_response_cache
+from .http_pool import HttpClientPool, RateLimitPolicy, RetryPolicy, get_http_client_pool
 
 from .connector import ApiConnector, ApiExtractResult, ApiResource, ApiSyncResult
 
@@ -21,7 +23,19 @@ class ApiResourceDefinition:
 
 
 class HttpApiConnector(ApiConnector):
+    """
+    Base class for REST connectors.
+
+    Requests go through the process-wide `HttpClientPool`, so connections are kept
+    alive across calls and connectors, transient failures are retried with backoff,
+    and `RATE_LIMIT` is enforced per host for every connector talking to it. When an
+    `HttpResponseCache` is configured, GET responses are revalidated with
+    `If-None-Match` / `If-Modified-Since` and unchanged bodies are served from disk.
+    """
+
     RESOURCE_DEFINITIONS: Mapping[str, ApiResourceDefinition] = {}
+    RATE_LIMIT: RateLimitPolicy | None = None
+    RETRY_POLICY: RetryPolicy = RetryPolicy()
 
     def __init__(
         self,
@@ -30,10 +44,18 @@ class HttpApiConnector(ApiConnector):
         *,
         transport: Any | None = None,
         timeout_s: float = 30.0,
+        rate_limit: RateLimitPolicy | None = None,
+        retry_policy: RetryPolicy | None = None,
+        client_pool: HttpClientPool | None = None,
+        response_cache: HttpResponseCache | None = None,
     ) -> None:
         super().__init__(config=config, logger=logger)
         self._transport = transport
         self._timeout_s = timeout_s
+        self._rate_limit = rate_limit or self.RATE_LIMIT
+        self._retry_policy = retry_policy or self.RETRY_POLICY
+        self._client_pool = client_pool or get_http_client_pool()
+        self._response_cache = response_cache or get_http_response_cache()
 
     async def discover_resources(self) -> list[ApiResource]:
         return [definition.resource for definition in self.RESOURCE_DEFINITIONS.values()]
@@ -87,23 +109,40 @@ class HttpApiConnector(ApiConnector):
             **self._default_headers(),
             **dict(headers or {}),
         }
+        cache = self._response_cache if method.upper() == "GET" else None
+        cached = None
+        if cache is not None:
+            fingerprint = cache.fingerprint(method, url, params=params, headers=request_headers)
+            cached = await cache.lookup(fingerprint)
+            if cached is not None and cached.is_fresh():
+                cache.record("hit", bytes_saved=len(cached.content))
+                return cached.to_response()
+            if cached is not None:
+                request_headers.update(cached.conditional_headers())
         try:
-            async with httpx.AsyncClient(
+            response = await self._client_pool.request(
+                method,
+                url,
+                rate_limit=self._rate_limit,
+                retry=self._retry_policy,
                 transport=self._transport,
                 timeout=httpx.Timeout(self._timeout_s),
-                follow_redirects=True
-            ) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=request_headers,
-                    params=params,
-                    json=json_payload,
-                    data=data,
-                )
+                headers=request_headers,
+                params=params,
+                json=json_payload,
+                data=data,
+            )
         except httpx.RequestError as exc:
             raise ConnectorError(f"Request to {url} failed: {exc}") from exc
 
+        if cache is not None:
+            if cached is not None and response.status_code == 304:
+                cached = await cache.refresh(cached, response)
+                cache.record("revalidated", bytes_saved=len(cached.content))
+                return cached.to_response()
+            cache.record("miss")
+            if response.status_code == 200:
+                await cache.store(fingerprint, response)
         if response.status_code in {401, 403}:
             raise AuthError(self._error_message(response, fallback=f"Authentication failed for {url}."))
         if response.status_code >= 400:
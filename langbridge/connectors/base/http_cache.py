@@ -0,0 +1,328 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+import httpx
+
+from langbridge import telemetry
+
+# Hop-by-hop and encoding headers describe the original transfer, not the stored (decoded) body.
+_UNCACHED_RESPONSE_HEADERS = frozenset(
+    {"connection", "content-encoding", "content-length", "keep-alive", "transfer-encoding", "set-cookie"}
+)
+
+
+@dataclass(slots=True)
+class HttpCacheStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CachedHttpResponse:
+    """A stored response plus the validators used to revalidate it."""
+
+    fingerprint: str
+    url: str
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    content: bytes
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    def is_fresh(self, *, now: float | None = None) -> bool:
+        return self.expires_at > (time.time() if now is None else now)
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=list(self.headers),
+            content=self.content,
+            request=httpx.Request("GET", self.url),
+        )
+
+
+class HttpResponseCache:
+    """
+    On-disk cache of GET responses for API connectors.
+
+    Entries are keyed by a fingerprint of the method, URL (including query string)
+    and request headers, so credentials never share entries. Responses carrying an
+    `ETag` or `Last-Modified` validator are revalidated with a conditional request
+    and served from disk on `304 Not Modified`; responses without validators are
+    only cached when a freshness lifetime applies (`Cache-Control: max-age` or
+    `default_ttl_s`). `no-store` responses are never written.
+
+    With `max_bytes`, the directory is swept when a write takes it over the cap
+    (and on the first write after opening): expired entries without validators are
+    dropped, then the least recently used entries until the cache fits. Entries
+    keyed on credentials that are no longer sent (e.g. a rotated token) age out
+    this way.
+    """
+
+    def __init__(self, base_dir: str | Path, *, default_ttl_s: float = 0.0, max_bytes: int | None = None) -> None:
+        self._base_dir = Path(base_dir)
+        self._default_ttl_s = max(0.0, float(default_ttl_s))
+        self._max_bytes = None if max_bytes is None else max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        # Upper bound on the bytes on disk; `None` until the first sweep measures it.
+        self._size_bytes: int | None = None
+        self.stats = HttpCacheStats()
+
+    @property
+    def base_dir(self) -> Path:
+        return self._base_dir
+
+    @property
+    def default_ttl_s(self) -> float:
+        return self._default_ttl_s
+
+    @property
+    def max_bytes(self) -> int | None:
+        return self._max_bytes
+
+    @staticmethod
+    def fingerprint(
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> str:
+        request = httpx.Request(method.upper(), url, params=params, headers=headers)
+        payload = {
+            "method": request.method,
+            "url": str(request.url),
+            "headers": sorted((key.lower(), value) for key, value in request.headers.items()),
+        }
+        return hashlib.sha256(json.dumps(payload, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+    async def lookup(self, fingerprint: str) -> CachedHttpResponse | None:
+        return await asyncio.to_thread(self._read, fingerprint)
+
+    async def store(self, fingerprint: str, response: httpx.Response) -> CachedHttpResponse | None:
+        """Persist a successful response if it is cacheable. Returns the stored entry, if any."""
+        entry = self._entry_from_response(fingerprint, response)
+        if entry is None:
+            return None
+        await asyncio.to_thread(self._write, entry)
+        with self._lock:
+            self.stats.stores += 1
+        return entry
+
+    async def refresh(self, entry: CachedHttpResponse, not_modified: httpx.Response) -> CachedHttpResponse:
+        """Extend a revalidated entry with the validators and lifetime sent on the `304` response."""
+        refreshed = CachedHttpResponse(
+            fingerprint=entry.fingerprint,
+            url=entry.url,
+            status_code=entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            etag=not_modified.headers.get("ETag") or entry.etag,
+            last_modified=not_modified.headers.get("Last-Modified") or entry.last_modified,
+            expires_at=time.time() + self._freshness_lifetime(not_modified.headers),
+        )
+        await asyncio.to_thread(self._write, refreshed)
+        return refreshed
+
+    def record(self, result: str, *, bytes_saved: int = 0) -> None:
+        with self._lock:
+            if result == "hit":
+                self.stats.hits += 1
+            elif result == "revalidated":
+                self.stats.revalidated += 1
+            else:
+                self.stats.misses += 1
+            self.stats.bytes_saved += bytes_saved
+        telemetry.increment(telemetry.CACHE_LOOKUPS, labels={"cache": "http", "result": result})
+        if bytes_saved:
+            telemetry.increment(telemetry.HTTP_CACHE_BYTES_SAVED, bytes_saved)
+
+    def _entry_from_response(self, fingerprint: str, response: httpx.Response) -> CachedHttpResponse | None:
+        if response.request.method != "GET" or response.status_code != 200:
+            return None
+        directives = _cache_control(response.headers)
+        if "no-store" in directives:
+            return None
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        lifetime = self._freshness_lifetime(response.headers)
+        if not etag and not last_modified and lifetime <= 0:
+            return None
+        return CachedHttpResponse(
+            fingerprint=fingerprint,
+            url=str(response.request.url),
+            status_code=response.status_code,
+            headers=tuple(
+                (key, value)
+                for key, value in response.headers.multi_items()
+                if key.lower() not in _UNCACHED_RESPONSE_HEADERS
+            ),
+            content=response.content,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=time.time() + lifetime,
+        )
+
+    def _freshness_lifetime(self, headers: httpx.Headers) -> float:
+        directives = _cache_control(headers)
+        if "no-cache" in directives:
+            return 0.0
+        max_age = directives.get("max-age")
+        if max_age is not None:
+            try:
+                return max(0.0, float(max_age))
+            except ValueError:
+                return 0.0
+        return self._default_ttl_s
+
+    def _paths(self, fingerprint: str) -> tuple[Path, Path]:
+        directory = self._base_dir / fingerprint[:2]
+        return directory / f"{fingerprint}.json", directory / f"{fingerprint}.body"
+
+    def _read(self, fingerprint: str) -> CachedHttpResponse | None:
+        meta_path, body_path = self._paths(fingerprint)
+        try:
+            metadata = json.loads(meta_path.read_text(encoding="utf-8"))
+            content = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if len(content) != metadata.get("content_length"):
+            return None
+        try:
+            # The metadata file's mtime is the entry's last use, for LRU eviction.
+            os.utime(meta_path)
+        except OSError:
+            pass
+        return CachedHttpResponse(
+            fingerprint=fingerprint,
+            url=metadata["url"],
+            status_code=int(metadata["status_code"]),
+            headers=tuple((str(key), str(value)) for key, value in metadata["headers"]),
+            content=content,
+            etag=metadata.get("etag"),
+            last_modified=metadata.get("last_modified"),
+            expires_at=float(metadata.get("expires_at") or 0.0),
+        )
+
+    def _write(self, entry: CachedHttpResponse) -> None:
+        meta_path, body_path = self._paths(entry.fingerprint)
+        # Owner-only, like the files mkstemp creates: bodies may hold authenticated responses.
+        meta_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        metadata = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": [list(item) for item in entry.headers],
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "expires_at": entry.expires_at,
+            "content_length": len(entry.content),
+        }
+        payload = json.dumps(metadata).encode("utf-8")
+        # Body first, metadata last: a reader only trusts a body whose length matches its metadata.
+        _atomic_write(body_path, entry.content)
+        _atomic_write(meta_path, payload)
+        if self._max_bytes is None:
+            return
+        with self._lock:
+            if self._size_bytes is not None:
+                # Overwrites are counted twice; that only brings the next sweep forward.
+                self._size_bytes += len(entry.content) + len(payload)
+            if self._size_bytes is None or self._size_bytes > self._max_bytes:
+                self._sweep(self._max_bytes)
+
+    def _sweep(self, max_bytes: int) -> None:
+        """Drop expired entries without validators, then least recently used ones until under `max_bytes`."""
+        now = time.time()
+        entries: list[tuple[float, int, Path, Path]] = []
+        evicted = 0
+        for meta_path in self._base_dir.glob("*/*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                stat = meta_path.stat()
+                size = stat.st_size + body_path.stat().st_size
+                metadata = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            expired = float(metadata.get("expires_at") or 0.0) <= now
+            if expired and not metadata.get("etag") and not metadata.get("last_modified"):
+                # Neither fresh nor revalidatable: it can never be served again.
+                evicted += _remove_entry(meta_path, body_path)
+                continue
+            entries.append((stat.st_mtime, size, meta_path, body_path))
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, meta_path, body_path in sorted(entries, key=lambda item: item[0]):
+            if total <= max_bytes:
+                break
+            evicted += _remove_entry(meta_path, body_path)
+            total -= size
+        self._size_bytes = total
+        self.stats.evictions += evicted
+
+
+def _remove_entry(meta_path: Path, body_path: Path) -> int:
+    # Metadata first, so readers stop trusting the body before it disappears.
+    try:
+        meta_path.unlink()
+    except OSError:
+        return 0
+    body_path.unlink(missing_ok=True)
+    return 1
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _cache_control(headers: httpx.Headers) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for raw in headers.get_list("Cache-Control", split_commas=True):
+        name, _, value = raw.strip().partition("=")
+        if name:
+            directives[name.strip().lower()] = value.strip().strip('"') or None
+    return directives
+
+
+_cache: HttpResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def configure_http_response_cache(cache: HttpResponseCache | None) -> None:
+    """Install (or remove, with `None`) the response cache used by API connectors by default."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def get_http_response_cache() -> HttpResponseCache | None:
+    return _cache
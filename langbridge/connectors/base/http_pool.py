@@ -0,0 +1,387 @@
+import asyncio
+import email.utils
+import importlib.util
+import random
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator
+from urllib.parse import urlsplit
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitPolicy:
+    """Client-side limits for one host: a token bucket plus a cap on in-flight requests."""
+
+    requests_per_second: float | None = None
+    burst: int | None = None
+    max_concurrency: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """
+    Jittered exponential backoff for transient failures.
+
+    429 responses are retried for every method (the server did not process them);
+    5xx responses and transport errors only for idempotent methods. A `Retry-After`
+    header, capped at `max_retry_after_s`, takes precedence over the computed delay.
+    """
+
+    max_attempts: int = 4
+    backoff_base_s: float = 0.5
+    backoff_max_s: float = 30.0
+    max_retry_after_s: float = 120.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def should_retry_status(self, *, method: str, status_code: int) -> bool:
+        if status_code not in self.retry_statuses:
+            return False
+        return status_code == 429 or method.upper() in IDEMPOTENT_METHODS
+
+    def backoff_s(self, attempt: int) -> float:
+        ceiling = min(self.backoff_max_s, self.backoff_base_s * (2 ** max(0, attempt - 1)))
+        return random.uniform(0.0, ceiling)
+
+    def delay_s(self, *, attempt: int, response: httpx.Response | None) -> float:
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after_s)
+        return self.backoff_s(attempt)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every event loop in the process.
+
+    `reserve` hands out the wait a caller must sleep before its token is available,
+    so callers queue in arrival order without holding a lock while they sleep.
+    `pause` pushes every future reservation back, e.g. after a 429 with `Retry-After`.
+    """
+
+    def __init__(self, *, rate: float, burst: int) -> None:
+        self._rate = max(rate, 1e-9)
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class HttpClientPool:
+    """
+    Shared, pooled HTTP clients keyed by origin.
+
+    Async clients are bound to the event loop that created them, so each loop gets
+    its own keep-alive pool per origin (HTTP/2 when `h2` is installed). They are
+    closed when their loop shuts down its async generators (`asyncio.run` does this
+    before closing the loop) or on `aclose`. Rate limits and concurrency caps are
+    tracked per host and shared by every caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+    ) -> None:
+        self._limits = limits or httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+        self._http2 = _h2_available() if http2 is None else http2
+        self._lock = threading.Lock()
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loop_closers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator[None, None]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_clients: dict[tuple, httpx.Client] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._policies: dict[str, RateLimitPolicy] = {}
+
+    def async_client(self, url: str, *, transport: Any | None = None) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        key = (_origin(url), transport)
+        with self._lock:
+            clients = self._async_clients.get(loop)
+            if clients is None:
+                self._forget_closed_loops()
+                clients = self._async_clients[loop] = {}
+                self._loop_closers[loop] = self._watch_loop_shutdown(clients)
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    transport=transport,
+                    limits=self._limits,
+                    http2=self._http2 and transport is None,
+                    follow_redirects=True,
+                )
+                clients[key] = client
+            return client
+
+    def sync_client(self, url: str, *, transport: Any | None = None) -> httpx.Client:
+        key = (_origin(url), transport)
+        with self._lock:
+            client = self._sync_clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(transport=transport, limits=self._limits, follow_redirects=True)
+                self._sync_clients[key] = client
+            return client
+
+    def configure_host(self, host: str, policy: RateLimitPolicy | None) -> None:
+        """Register the rate limit for `host`. The strictest limits seen for a host win."""
+        if policy is None:
+            return
+        normalized = host.lower()
+        with self._lock:
+            merged = _strictest(self._policies.get(normalized), policy)
+            if merged == self._policies.get(normalized):
+                return
+            self._policies[normalized] = merged
+            if merged.requests_per_second:
+                self._buckets[normalized] = TokenBucket(
+                    rate=merged.requests_per_second,
+                    burst=merged.burst or max(1, int(merged.requests_per_second)),
+                )
+            for semaphores in self._semaphores.values():
+                semaphores.pop(normalized, None)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        rate_limit: RateLimitPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        transport: Any | None = None,
+        timeout: httpx.Timeout | float | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request through the pooled client, honoring host limits and retrying transient failures."""
+        host = _host(url)
+        self.configure_host(host, rate_limit)
+        retry = retry or RetryPolicy()
+        client = self.async_client(url, transport=transport)
+        attempt = 0
+        while True:
+            attempt += 1
+            await self._acquire_token(host)
+            semaphore = self._semaphore(host)
+            try:
+                if semaphore is None:
+                    response = await client.request(method, url, timeout=timeout, **kwargs)
+                else:
+                    async with semaphore:
+                        response = await client.request(method, url, timeout=timeout, **kwargs)
+            except httpx.TransportError:
+                if attempt >= retry.max_attempts or method.upper() not in IDEMPOTENT_METHODS:
+                    raise
+                await asyncio.sleep(retry.backoff_s(attempt))
+                continue
+            if attempt >= retry.max_attempts or not retry.should_retry_status(
+                method=method,
+                status_code=response.status_code,
+            ):
+                return response
+            delay = retry.delay_s(attempt=attempt, response=response)
+            if response.status_code == 429:
+                self._pause_host(host, delay)
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    def request_sync(
+        self,
+        method: str,
+        url: str,
+        *,
+        rate_limit: RateLimitPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        transport: Any | None = None,
+        timeout: httpx.Timeout | float | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Blocking counterpart of `request` for synchronous callers. Concurrency caps apply to async callers only."""
+        host = _host(url)
+        self.configure_host(host, rate_limit)
+        retry = retry or RetryPolicy()
+        client = self.sync_client(url, transport=transport)
+        attempt = 0
+        while True:
+            attempt += 1
+            bucket = self._buckets.get(host)
+            if bucket is not None:
+                wait = bucket.reserve()
+                if wait > 0:
+                    time.sleep(wait)
+            try:
+                response = client.request(method, url, timeout=timeout, **kwargs)
+            except httpx.TransportError:
+                if attempt >= retry.max_attempts or method.upper() not in IDEMPOTENT_METHODS:
+                    raise
+                time.sleep(retry.backoff_s(attempt))
+                continue
+            if attempt >= retry.max_attempts or not retry.should_retry_status(
+                method=method,
+                status_code=response.status_code,
+            ):
+                return response
+            delay = retry.delay_s(attempt=attempt, response=response)
+            if response.status_code == 429:
+                self._pause_host(host, delay)
+            response.close()
+            time.sleep(delay)
+
+    async def aclose(self) -> None:
+        """Close the clients owned by the running event loop and every synchronous client."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            closer = self._loop_closers.pop(loop, None)
+            sync_clients = list(self._sync_clients.values())
+            self._sync_clients.clear()
+        if closer is not None:
+            await closer.aclose()
+        for sync_client in sync_clients:
+            sync_client.close()
+
+    def _watch_loop_shutdown(self, clients: dict[tuple, httpx.AsyncClient]) -> AsyncGenerator[None, None]:
+        # An async generator started on the loop is registered with its asyncgen
+        # hooks, so `loop.shutdown_asyncgens()` runs its `finally` on that loop.
+        # Holding it keeps it from being finalized early. Its finalizer hook refers
+        # to the loop, so the entries are dropped explicitly once it has run.
+        async def _close_with_loop() -> AsyncGenerator[None, None]:
+            try:
+                yield
+            finally:
+                with self._lock:
+                    for loop, owned in list(self._async_clients.items()):
+                        if owned is clients:
+                            del self._async_clients[loop]
+                            self._loop_closers.pop(loop, None)
+                for client in list(clients.values()):
+                    await client.aclose()
+                clients.clear()
+
+        closer = _close_with_loop()
+        try:
+            closer.asend(None).send(None)
+        except StopIteration:
+            pass
+        return closer
+
+    def _forget_closed_loops(self) -> None:
+        # Loops closed without shutting down their async generators; their clients
+        # cannot be closed any more, so just drop them.
+        for loop in [loop for loop in list(self._async_clients.keys()) if loop.is_closed()]:
+            self._async_clients.pop(loop, None)
+            self._loop_closers.pop(loop, None)
+
+    async def _acquire_token(self, host: str) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            return
+        wait = bucket.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore | None:
+        policy = self._policies.get(host)
+        if policy is None or not policy.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(host)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(policy.max_concurrency)
+                semaphores[host] = semaphore
+            return semaphore
+
+    def _pause_host(self, host: str, seconds: float) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(host, TokenBucket(rate=1e9, burst=1_000_000))
+        bucket.pause(seconds)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given either as delta-seconds or as an HTTP date."""
+    normalized = str(value or "").strip()
+    if not normalized:
+        return None
+    try:
+        return max(0.0, float(normalized))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(normalized)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+_pool: HttpClientPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_http_client_pool() -> HttpClientPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HttpClientPool()
+    return _pool
+
+
+def _strictest(current: RateLimitPolicy | None, incoming: RateLimitPolicy) -> RateLimitPolicy:
+    if current is None:
+        return incoming
+
+    def _min(left: Any, right: Any) -> Any:
+        values = [value for value in (left, right) if value]
+        return min(values) if values else None
+
+    return RateLimitPolicy(
+        requests_per_second=_min(current.requests_per_second, incoming.requests_per_second),
+        burst=_min(current.burst, incoming.burst),
+        max_concurrency=_min(current.max_concurrency, incoming.max_concurrency),
+    )
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
@@ -21,6 +21,8 @@ register_connector_plugin(
         connector_family=ConnectorFamily.DATABASE,
         capabilities=ConnectorCapabilities(
             supports_live_datasets=True,
+            supports_synced_datasets=True,
+            supports_change_data_capture=True,
             supports_query_pushdown=True,
             supports_preview=True,
             supports_federated_execution=True,
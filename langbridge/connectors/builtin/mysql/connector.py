@@ -1,11 +1,23 @@
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
+from langbridge.connectors.base.change_capture import (
+    ChangeBatch,
+    ChangeCaptureTable,
+    ChangeDataCaptureConnector,
+)
 from langbridge.connectors.base.config import ConnectorRuntimeType
 from langbridge.connectors.base.connector import SqlConnector
 from langbridge.connectors.base.metadata import ColumnMetadata, ForeignKeyMetadata, TableMetadata
 from langbridge.connectors.base.errors import ConnectorError
 
+from .binlog import (
+    binlog_server_id,
+    check_binlog_settings,
+    format_binlog_position,
+    read_binlog_changes,
+)
 from .config import MySQLConnectorConfig
 
 try:  # pragma: no cover - optional dependency
@@ -23,9 +35,14 @@ except ImportError:  # pragma: no cover - optional dependency
     PyMySqlError = Exception  # type: ignore
 
 
-class MySqlConnector(SqlConnector):
+class MySqlConnector(SqlConnector, ChangeDataCaptureConnector):
     """
     MySQL connector implementation.
+
+    Change data capture reads the row-based binlog as a replica (`mysql-replication`);
+    the server needs `binlog_format=ROW`, `binlog_row_image=FULL`,
+    `binlog_row_metadata=FULL` (MySQL 8.0.14+) and a user with REPLICATION SLAVE and
+    REPLICATION CLIENT. Starting a capture checks the binlog settings first.
     """
 
     RUNTIME_TYPE = ConnectorRuntimeType.MYSQL
@@ -215,3 +232,62 @@ class MySqlConnector(SqlConnector):
         except (MySqlError, PyMySqlError, Exception) as exc:
             self.logger.error("SQL execution failed: %s", exc)
             raise ConnectorError(f"SQL execution failed on MySQL: {exc}") from exc
+
+    async def start_change_capture(self, *, slot: str, tables: Sequence[ChangeCaptureTable]) -> str:
+        # The binlog keeps no per-reader state, so the capture starts at the current end of the log.
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            cursor.execute(
+                "SHOW GLOBAL VARIABLES WHERE Variable_name IN "
+                "('binlog_format', 'binlog_row_image', 'binlog_row_metadata')"
+            )
+            variables = dict(cursor.fetchall())
+            try:
+                cursor.execute("SHOW BINARY LOG STATUS")
+            except (MySqlError, PyMySqlError, Exception):
+                # Servers before 8.2 only know the older statement.
+                cursor.execute("SHOW MASTER STATUS")
+            row = cursor.fetchone()
+            cursor.close()
+            conn.close()
+        except (MySqlError, PyMySqlError, Exception) as exc:
+            self.logger.error("Failed to read binlog position: %s", exc)
+            raise ConnectorError(f"Unable to start change capture on MySQL: {exc}") from exc
+        if not row:
+            raise ConnectorError("MySQL binary logging is disabled; enable log_bin for change data capture.")
+        check_binlog_settings(variables)
+        return format_binlog_position(row[0], row[1])
+
+    async def read_changes(
+        self,
+        *,
+        slot: str,
+        tables: Sequence[ChangeCaptureTable],
+        position: str,
+        max_events: int,
+    ) -> ChangeBatch:
+        connection_settings = {
+            "host": self._config.host,
+            "port": self._config.port,
+            "user": self._config.user,
+            "passwd": self._config.password,
+        }
+        scoped_tables = [
+            ChangeCaptureTable(schema=table.schema or self._config.database, name=table.name)
+            for table in tables
+        ]
+        try:
+            return await asyncio.to_thread(
+                read_binlog_changes,
+                connection_settings=connection_settings,
+                server_id=binlog_server_id(slot),
+                tables=scoped_tables,
+                position=position,
+                max_events=max_events,
+            )
+        except ConnectorError:
+            raise
+        except Exception as exc:
+            self.logger.error("Failed to read binlog changes: %s", exc)
+            raise ConnectorError(f"Unable to read changes from MySQL: {exc}") from exc
@@ -1,12 +1,20 @@
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence
 
+from langbridge.connectors.base.change_capture import (
+    ChangeBatch,
+    ChangeCaptureTable,
+    ChangeDataCaptureConnector,
+)
 from langbridge.connectors.base.config import ConnectorRuntimeType
 from langbridge.connectors.base.connector import SqlConnector
 from langbridge.connectors.base.metadata import ColumnMetadata, ForeignKeyMetadata, TableMetadata
 from langbridge.connectors.base.errors import ConnectorError
 
 from .config import PostgresConnectorConfig
+from .pgoutput import PgOutputDecoder, format_lsn
 
 from sqlglot import exp
 
@@ -16,9 +24,13 @@ except ImportError:  # pragma: no cover - optional dependency
     psycopg = None  # type: ignore
 
 
-class PostgresConnector(SqlConnector):
+class PostgresConnector(SqlConnector, ChangeDataCaptureConnector):
     """
     PostgreSQL connector implementation.
+
+    Change data capture uses a `pgoutput` logical replication slot plus a
+    publication of the same name, decoded through the SQL slot functions; the
+    server needs `wal_level=logical` and a user allowed to create both.
     """
 
     RUNTIME_TYPE = ConnectorRuntimeType.POSTGRES
@@ -176,6 +188,104 @@ class PostgresConnector(SqlConnector):
             self.logger.error("Failed to fetch foreign keys: %s", exc)
             raise ConnectorError(f"Unable to fetch foreign keys from PostgreSQL: {exc}") from exc
 
+    async def start_change_capture(self, *, slot: str, tables: Sequence[ChangeCaptureTable]) -> str:
+        if psycopg is None:
+            raise ConnectorError("psycopg is required for PostgreSQL support.")
+        from psycopg import sql as pg_sql  # type: ignore
+
+        try:
+            async with await self._connect() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT 1 FROM pg_publication WHERE pubname = %s", (slot,))
+                    if await cursor.fetchone() is None:
+                        await cursor.execute(
+                            pg_sql.SQL("CREATE PUBLICATION {} FOR TABLE {}").format(
+                                pg_sql.Identifier(slot),
+                                pg_sql.SQL(", ").join(
+                                    pg_sql.Identifier(table.schema or "public", table.name) for table in tables
+                                ),
+                            )
+                        )
+                    await cursor.execute(
+                        "SELECT confirmed_flush_lsn::text FROM pg_replication_slots WHERE slot_name = %s",
+                        (slot,),
+                    )
+                    row = await cursor.fetchone()
+                    if row is None:
+                        await cursor.execute(
+                            "SELECT lsn::text FROM pg_create_logical_replication_slot(%s, 'pgoutput')",
+                            (slot,),
+                        )
+                        row = await cursor.fetchone()
+                    return str(row[0])
+        except Exception as exc:
+            self.logger.error("Failed to start change capture: %s", exc)
+            raise ConnectorError(f"Unable to start change capture on PostgreSQL: {exc}") from exc
+
+    async def read_changes(
+        self,
+        *,
+        slot: str,
+        tables: Sequence[ChangeCaptureTable],
+        position: str,
+        max_events: int,
+    ) -> ChangeBatch:
+        # Peeking leaves the slot untouched until `acknowledge_changes` advances it, so a
+        # failed sync re-reads the same transactions. Decoding stops at a transaction end.
+        sql = """
+            SELECT lsn::text, data
+            FROM pg_logical_slot_peek_binary_changes(
+                %s, NULL, %s, 'proto_version', '1', 'publication_names', %s
+            )
+        """
+        wanted = {(table.schema or "public", table.name) for table in tables}
+        decoder = PgOutputDecoder()
+        events = []
+        try:
+            async with await self._connect() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(sql, (slot, max(1, int(max_events)), slot))
+                    rows = await cursor.fetchall()
+                    for lsn, data in rows:
+                        for event in decoder.decode(bytes(data), lsn=str(lsn)):
+                            if (event.table.schema or "public", event.table.name) in wanted:
+                                events.append(event)
+                    next_position = (
+                        format_lsn(decoder.commit_end_lsn) if decoder.commit_end_lsn is not None else position
+                    )
+                    await cursor.execute(
+                        "SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s::pg_lsn)::bigint",
+                        (next_position,),
+                    )
+                    lag_row = await cursor.fetchone()
+        except Exception as exc:
+            self.logger.error("Failed to read changes: %s", exc)
+            raise ConnectorError(f"Unable to read changes from PostgreSQL: {exc}") from exc
+
+        has_more = len(rows) >= max_events
+        lag_seconds = 0.0
+        if has_more and events and events[-1].committed_at is not None:
+            lag_seconds = max(0.0, (datetime.now(timezone.utc) - events[-1].committed_at).total_seconds())
+        return ChangeBatch(
+            events=events,
+            position=next_position,
+            has_more=has_more,
+            lag_seconds=lag_seconds,
+            lag_bytes=max(0, int(lag_row[0])) if lag_row and lag_row[0] is not None else None,
+        )
+
+    async def acknowledge_changes(self, *, slot: str, position: str) -> None:
+        try:
+            async with await self._connect() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(
+                        "SELECT pg_replication_slot_advance(%s, %s::pg_lsn)",
+                        (slot, position),
+                    )
+        except Exception as exc:
+            self.logger.error("Failed to acknowledge changes: %s", exc)
+            raise ConnectorError(f"Unable to advance replication slot on PostgreSQL: {exc}") from exc
+
     async def _execute_select(
         self,
         sql: str,
@@ -186,9 +296,14 @@ class PostgresConnector(SqlConnector):
         try:
             async with await self._connect(timeout_s) as conn:
                 async with conn.cursor() as cursor:
-                    await cursor.execute(sql, params or None)
-                    columns = [description[0] for description in cursor.description or []]
-                    rows = await cursor.fetchall()
+                    try:
+                        await cursor.execute(sql, params or None)
+                        columns = [description[0] for description in cursor.description or []]
+                        rows = await cursor.fetchall()
+                    except asyncio.CancelledError:
+                        # Ask the server to abandon the statement before the connection is torn down.
+                        await conn.cancel_safe(timeout=5.0)
+                        raise
                     return columns, rows
         except Exception as exc:
             self.logger.error("SQL execution failed: %s", exc)
@@ -19,8 +19,13 @@ from .manifest import (
     DeclarativeAuthHeader,
     DeclarativeConnectorManifest,
     DeclarativeConnectorResource,
+    DeclarativeFieldSelection,
+    DeclarativeFilterParam,
     DeclarativeIncrementalConfig,
     DeclarativePaginationConfig,
+    DeclarativePushdownConfig,
+    DeclarativeRateLimitConfig,
+    DeclarativeSortOption,
     load_declarative_connector_manifest,
 )
 from .runtime import DeclarativeHttpApiConnector
@@ -33,8 +38,13 @@ __all__ = [
     "DeclarativeDatasetConnectorReference",
     "DeclarativeDatasetExample",
     "DeclarativeDatasetExampleSet",
+    "DeclarativeFieldSelection",
+    "DeclarativeFilterParam",
     "DeclarativeIncrementalConfig",
     "DeclarativePaginationConfig",
+    "DeclarativePushdownConfig",
+    "DeclarativeRateLimitConfig",
+    "DeclarativeSortOption",
     "CustomDatasetResource",
     "DatasetSyncSelection",
     "build_declarative_auth_schema",
@@ -1,6 +1,7 @@
 
 from functools import lru_cache
 from importlib.resources import files
+from typing import Literal
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field
@@ -43,10 +44,46 @@ class DeclarativePaginationConfig(_Base):
     response_is_last_field: str | None = None
     response_total_field: str | None = None
     link_header_param: str | None = None
+    # Cursors that already encode the original query (e.g. Shopify `page_info`) reject
+    # repeated filter params, so only field selection is resent with them.
+    cursor_preserves_query: bool = False
     default_page_size: int
     max_page_size: int
 
 
+class DeclarativeRateLimitConfig(_Base):
+    requests_per_second: float | None = Field(default=None, gt=0)
+    burst: int | None = Field(default=None, ge=1)
+    max_concurrency: int | None = Field(default=None, ge=1)
+
+
+class DeclarativeFilterParam(_Base):
+    field: str
+    operator: Literal["eq", "in", "gt", "gte", "lt", "lte"]
+    param: str
+    value_type: str = "string"
+    # Joins "in" values into one param; when unset the param is repeated per value.
+    separator: str | None = ","
+
+
+class DeclarativeFieldSelection(_Base):
+    param: str
+    separator: str = ","
+    always_include: list[str] = Field(default_factory=list)
+
+
+class DeclarativeSortOption(_Base):
+    field: str
+    descending: bool = False
+    request_params: dict[str, object] = Field(default_factory=dict)
+
+
+class DeclarativePushdownConfig(_Base):
+    filters: list[DeclarativeFilterParam] = Field(default_factory=list)
+    field_selection: DeclarativeFieldSelection | None = None
+    sorts: list[DeclarativeSortOption] = Field(default_factory=list)
+
+
 class DeclarativeIncrementalConfig(_Base):
     strategy: str
     request_param: str
@@ -64,6 +101,7 @@ class DeclarativeConnectorResource(_Base):
     description: str | None = None
     response_items_field: str | None = None
     request_params: dict[str, object] = Field(default_factory=dict)
+    pushdown: DeclarativePushdownConfig | None = None
 
 
 class DeclarativeConnectorManifest(_Base):
@@ -80,6 +118,8 @@ class DeclarativeConnectorManifest(_Base):
     pagination: DeclarativePaginationConfig
     incremental: DeclarativeIncrementalConfig
     resources: list[DeclarativeConnectorResource]
+    rate_limit: DeclarativeRateLimitConfig | None = None
+    pushdown: DeclarativePushdownConfig | None = None
 
     @property
     def resource_keys(self) -> tuple[str, ...]:
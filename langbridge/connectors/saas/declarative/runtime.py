@@ -3,18 +3,41 @@ from datetime import datetime, timezone
 from typing import Any, Mapping
 
 from langbridge.connectors.base.config import BaseConnectorConfig
-from langbridge.connectors.base.connector import ApiExtractResult, ApiResource
+from langbridge.connectors.base.connector import (
+    ApiExtractResult,
+    ApiFilterPredicate,
+    ApiResource,
+    ApiResourceQuery,
+)
 from langbridge.connectors.base.errors import ConnectorError
 from langbridge.connectors.base.http import (
     ApiResourceDefinition,
     HttpApiConnector,
     parse_link_header_cursor,
 )
+from langbridge.connectors.base.http_pool import RateLimitPolicy
 from langbridge.connectors.base.resource_paths import (
     describe_api_child_resources,
 )
 
-from .manifest import DeclarativeConnectorManifest, DeclarativeConnectorResource
+from .manifest import (
+    DeclarativeConnectorManifest,
+    DeclarativeConnectorResource,
+    DeclarativeFilterParam,
+    DeclarativePushdownConfig,
+    DeclarativeSortOption,
+)
+
+# Filter operators an API parameter can stand in for, tightest first. A wider
+# parameter (e.g. `gte` for a strict `gt`) still returns every matching record.
+_FILTER_FALLBACKS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "eq": (("eq",), ("in",), ("gte", "lte")),
+    "in": (("in",),),
+    "gt": (("gt",), ("gte",)),
+    "gte": (("gte",),),
+    "lt": (("lt",), ("lte",)),
+    "lte": (("lte",),),
+}
 
 
 class DeclarativeHttpApiConnector(HttpApiConnector):
@@ -28,12 +51,26 @@ class DeclarativeHttpApiConnector(HttpApiConnector):
         logger=None,
         **kwargs: Any,
     ) -> None:
+        manifest = self._require_manifest()
+        if manifest.rate_limit is not None:
+            kwargs.setdefault(
+                "rate_limit",
+                RateLimitPolicy(
+                    requests_per_second=manifest.rate_limit.requests_per_second,
+                    burst=manifest.rate_limit.burst,
+                    max_concurrency=manifest.rate_limit.max_concurrency,
+                ),
+            )
         super().__init__(config=config, logger=logger, **kwargs)
-        self._manifest = self._require_manifest()
+        self._manifest = manifest
         self._resource_definitions = {
             resource.key: _build_resource_definition(resource, manifest=self._manifest)
             for resource in self._manifest.resources
         }
+        self._resource_pushdown = {
+            resource.key: _merge_pushdown(self._manifest.pushdown, resource.pushdown)
+            for resource in self._manifest.resources
+        }
 
     async def discover_resources(self) -> list[ApiResource]:
         return [definition.resource for definition in self._resource_definitions.values()]
@@ -57,13 +94,16 @@ class DeclarativeHttpApiConnector(HttpApiConnector):
         since: str | None = None,
         cursor: str | None = None,
         limit: int | None = None,
+        query: ApiResourceQuery | None = None,
     ) -> ApiExtractResult:
         definition = self._require_resource(resource_name)
+        query = self._with_incremental_filter(definition=definition, query=query, since=since)
         params = self._build_request_params(
             definition=definition,
             since=since,
             cursor=cursor,
             limit=limit,
+            query=query,
         )
         page_size = int(params.get(self._manifest.pagination.limit_param, 0) or 0)
         payload, response = await self._request_json("GET", definition.path, params=params)
@@ -74,18 +114,19 @@ class DeclarativeHttpApiConnector(HttpApiConnector):
             since=since,
         )
         structured_records = [record for record in records if isinstance(record, dict)]
+        next_cursor = self._next_cursor(
+            payload=payload,
+            response=response,
+            records=records,
+            definition=definition,
+            current_cursor=cursor,
+            page_size=page_size,
+        )
         return ApiExtractResult(
             resource=definition.resource.name,
             status="success",
             records=structured_records,
-            next_cursor=self._next_cursor(
-                payload=payload,
-                response=response,
-                records=records,
-                definition=definition,
-                current_cursor=cursor,
-                page_size=page_size,
-            ),
+            next_cursor=next_cursor,
             checkpoint_cursor=self._checkpoint_cursor(records=records),
             child_resources=list(
                 describe_api_child_resources(
@@ -93,8 +134,44 @@ class DeclarativeHttpApiConnector(HttpApiConnector):
                     records=structured_records,
                 )
             ),
+            remaining_cursors=self._remaining_cursors(
+                payload=payload,
+                records=records,
+                current_cursor=cursor,
+                next_cursor=next_cursor,
+            ),
+        )
+
+    def plan_resource_query(
+        self,
+        resource_name: str,
+        query: ApiResourceQuery,
+    ) -> ApiResourceQuery | None:
+        try:
+            definition = self._require_resource(resource_name)
+        except ConnectorError:
+            return None
+        pushdown = self._pushdown_config(definition.resource.name)
+        sort = _find_sort(pushdown, field=query.order_by, descending=query.descending)
+        return ApiResourceQuery(
+            filters=[
+                predicate
+                for predicate in query.filters
+                if _filter_params(pushdown, predicate) is not None
+            ],
+            fields=list(query.fields) if query.fields is not None and pushdown.field_selection else None,
+            order_by=sort.field if sort is not None else None,
+            descending=sort.descending if sort is not None else False,
+            limit=query.limit,
         )
 
+    def _pushdown_config(self, resource_name: str) -> DeclarativePushdownConfig:
+        # Resources resolved at runtime (e.g. custom objects) only inherit the manifest-level pushdown.
+        pushdown = self._resource_pushdown.get(resource_name)
+        if pushdown is None:
+            pushdown = _merge_pushdown(self._manifest.pushdown, None)
+        return pushdown
+
     def _require_manifest(self) -> DeclarativeConnectorManifest:
         if self.MANIFEST is None:
             raise ConnectorError(
@@ -137,16 +214,21 @@ class DeclarativeHttpApiConnector(HttpApiConnector):
         since: str | None,
         cursor: str | None,
         limit: int | None,
+        query: ApiResourceQuery | None = None,
     ) -> dict[str, Any]:
         page_size = self._clamp_limit(
             limit,
             default=self._manifest.pagination.default_page_size,
             maximum=self._manifest.pagination.max_page_size,
         )
+        if query is not None and query.limit is not None:
+            page_size = max(1, min(page_size, query.limit))
         params: dict[str, Any] = {
             self._manifest.pagination.limit_param: page_size,
             **dict(definition.request_params or {}),
         }
+        if query is not None:
+            params.update(self._query_params(definition=definition, query=query, cursor=cursor))
         if cursor:
             params[self._manifest.pagination.cursor_param] = cursor
             return params
@@ -158,6 +240,66 @@ class DeclarativeHttpApiConnector(HttpApiConnector):
                 )
         return params
 
+    def _query_params(
+        self,
+        *,
+        definition: ApiResourceDefinition,
+        query: ApiResourceQuery,
+        cursor: str | None,
+    ) -> dict[str, Any]:
+        pushdown = self._pushdown_config(definition.resource.name)
+        params: dict[str, Any] = {}
+        selection = pushdown.field_selection
+        if selection is not None and query.fields is not None:
+            pagination = self._manifest.pagination
+            required = [
+                *selection.always_include,
+                definition.resource.primary_key or "id",
+                self._manifest.incremental.cursor_field,
+            ]
+            if pagination.strategy != "offset" and pagination.next_cursor_source == "record":
+                required.append(pagination.next_cursor_field or "")
+            fields = dict.fromkeys(field for field in [*required, *query.fields] if field)
+            params[selection.param] = selection.separator.join(fields)
+        if cursor and self._manifest.pagination.cursor_preserves_query:
+            return params
+        for predicate in query.filters:
+            params.update(_filter_params(pushdown, predicate) or {})
+        sort = _find_sort(pushdown, field=query.order_by, descending=query.descending)
+        if sort is not None:
+            params.update(sort.request_params)
+        return params
+
+    def _with_incremental_filter(
+        self,
+        *,
+        definition: ApiResourceDefinition,
+        query: ApiResourceQuery | None,
+        since: str | None,
+    ) -> ApiResourceQuery | None:
+        """Send a client-filtered incremental cursor to the API too when the manifest declares a matching filter."""
+        if (
+            not since
+            or not definition.resource.supports_incremental
+            or self._manifest.incremental.strategy != "client_filter"
+        ):
+            return query
+        predicate = ApiFilterPredicate(
+            field=self._manifest.incremental.cursor_field,
+            operator="gte",
+            value=since,
+        )
+        if _filter_params(self._pushdown_config(definition.resource.name), predicate) is None:
+            return query
+        base = query or ApiResourceQuery()
+        return ApiResourceQuery(
+            filters=[*base.filters, predicate],
+            fields=base.fields,
+            order_by=base.order_by,
+            descending=base.descending,
+            limit=base.limit,
+        )
+
     def _filter_incremental_records(
         self,
         *,
@@ -252,6 +394,29 @@ class DeclarativeHttpApiConnector(HttpApiConnector):
             raw_cursor = last_record.get(definition.resource.primary_key or "id")
         return _normalized_cursor(raw_cursor)
 
+    def _remaining_cursors(
+        self,
+        *,
+        payload: Any,
+        records: list[Mapping[str, Any]],
+        current_cursor: str | None,
+        next_cursor: str | None,
+    ) -> list[str] | None:
+        """Offsets of every later page, when the first page of an offset-paginated resource reports a total."""
+        pagination = self._manifest.pagination
+        if (
+            current_cursor
+            or not next_cursor
+            or not records
+            or pagination.strategy != "offset"
+            or pagination.next_cursor_source in {"link_header", "response"}
+        ):
+            return None
+        total = _coerce_numeric_cursor(_extract_path(payload, pagination.response_total_field))
+        if total is None:
+            return None
+        return [str(offset) for offset in range(len(records), total, len(records))]
+
     def _checkpoint_cursor(self, *, records: list[Mapping[str, Any]]) -> str | None:
         field_name = self._manifest.incremental.cursor_field
         if not field_name:
@@ -303,6 +468,81 @@ def _build_resource_definition(
     )
 
 
+def _merge_pushdown(
+    manifest_pushdown: DeclarativePushdownConfig | None,
+    resource_pushdown: DeclarativePushdownConfig | None,
+) -> DeclarativePushdownConfig:
+    manifest_pushdown = manifest_pushdown or DeclarativePushdownConfig()
+    resource_pushdown = resource_pushdown or DeclarativePushdownConfig()
+    return DeclarativePushdownConfig(
+        filters=[*resource_pushdown.filters, *manifest_pushdown.filters],
+        field_selection=resource_pushdown.field_selection or manifest_pushdown.field_selection,
+        sorts=[*resource_pushdown.sorts, *manifest_pushdown.sorts],
+    )
+
+
+def _filter_params(
+    pushdown: DeclarativePushdownConfig,
+    predicate: ApiFilterPredicate,
+) -> dict[str, Any] | None:
+    """Request params that restrict the API to (a superset of) the records matching `predicate`."""
+    field_name = str(predicate.field or "").strip().lower()
+    candidates = [entry for entry in pushdown.filters if entry.field.lower() == field_name]
+    if not candidates:
+        return None
+    values = predicate.value if isinstance(predicate.value, (list, tuple)) else [predicate.value]
+    fallbacks = _FILTER_FALLBACKS.get(predicate.operator, ())
+    if predicate.operator == "in" and len(values) == 1:
+        fallbacks = (*fallbacks, ("eq",))
+    for operators in fallbacks:
+        entries = [
+            next((entry for entry in candidates if entry.operator == operator), None)
+            for operator in operators
+        ]
+        if any(entry is None for entry in entries):
+            continue
+        return {
+            entry.param: _filter_param_value(entry, values)
+            for entry in entries
+            if entry is not None
+        }
+    return None
+
+
+def _filter_param_value(entry: DeclarativeFilterParam, values: list[Any]) -> Any:
+    formatted = [_format_filter_value(value, value_type=entry.value_type) for value in values]
+    if entry.operator != "in":
+        return formatted[0]
+    if entry.separator is None:
+        return formatted
+    return entry.separator.join(formatted)
+
+
+def _format_filter_value(value: Any, *, value_type: str) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return _normalize_incremental_value(str(value), cursor_type=value_type)
+
+
+def _find_sort(
+    pushdown: DeclarativePushdownConfig,
+    *,
+    field: str | None,
+    descending: bool,
+) -> DeclarativeSortOption | None:
+    if not field:
+        return None
+    normalized = field.strip().lower()
+    return next(
+        (
+            option
+            for option in pushdown.sorts
+            if option.field.lower() == normalized and option.descending == descending
+        ),
+        None,
+    )
+
+
 def _config_values(config: BaseConnectorConfig) -> dict[str, Any]:
     if hasattr(config, "model_dump"):
         payload = config.model_dump(mode="json")
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from langbridge.connectors.base.config import (
     BaseConnectorConfigSchemaFactory, 
     BaseConnectorConfigFactory,
@@ -7,18 +9,58 @@ from langbridge.connectors.base.config import (
     ConnectorRuntimeType
 )
 
+FAISS_INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+
 class FaissConnectorConfig(BaseConnectorConfig):
     location: str
+    # flat searches exactly; ivf_flat, ivf_pq and hnsw are approximate.
+    index_type: str = "flat"
+    # IVF: inverted lists (default ~4 * sqrt(vectors)) and lists probed per search.
+    nlist: Optional[int] = None
+    nprobe: int = 16
+    # IVF-PQ: sub-quantizers per vector (rounded down to a divisor of the dimension).
+    pq_m: int = 16
+    # HNSW: graph degree and construction / search beam widths.
+    hnsw_m: int = 32
+    ef_construction: int = 200
+    ef_search: int = 64
+    # IVF indexes search exactly until they hold this many vectors, then train, and
+    # retrain once they have grown by `retrain_growth` since.
+    train_min_vectors: int = 10_000
+    retrain_growth: float = 4.0
+    # Changes logged since the last snapshot before the index file is rewritten.
+    snapshot_every: int = 10_000
+    mmap: bool = True
 
     @classmethod
     def create_from_dict(cls, data: dict) -> "FaissConnectorConfig":
         location = data.get("location")
         if location is None:
             raise ValueError("Both 'location' must be provided and non-None.")
-        return cls(
-            location=location
-        )
-        
+        index_type = str(data.get("index_type") or "flat").strip().lower()
+        if index_type not in FAISS_INDEX_TYPES:
+            raise ValueError(f"Unsupported FAISS index_type '{index_type}'; use one of {', '.join(FAISS_INDEX_TYPES)}.")
+        options = {
+            key: data[key]
+            for key in (
+                "nlist",
+                "nprobe",
+                "pq_m",
+                "hnsw_m",
+                "ef_construction",
+                "ef_search",
+                "train_min_vectors",
+                "retrain_growth",
+                "snapshot_every",
+            )
+            if data.get(key) is not None
+        }
+        mmap = data.get("mmap", True)
+        if not isinstance(mmap, bool):
+            mmap = str(mmap).strip().lower() in {"1", "true", "yes", "on"}
+        return cls(location=location, index_type=index_type, mmap=mmap, **options)
+
 class FaissConnectorConfigFactory(BaseConnectorConfigFactory):
     type = ConnectorRuntimeType.FAISS
 
@@ -36,6 +78,39 @@ class FaissConnectorConfigSchemaFactory(BaseConnectorConfigSchemaFactory):
             description="Faiss Connector (Faiss)",
             version="1.0",
             config=[
-                ConnectorConfigEntrySchema(field="location", label="Location", description="Faiss Location", type="string", required=True)
+                ConnectorConfigEntrySchema(field="location", label="Location", description="Faiss Location", type="string", required=True),
+                ConnectorConfigEntrySchema(
+                    field="index_type",
+                    label="Index Type",
+                    description="Exact (flat) or approximate (ivf_flat, ivf_pq, hnsw) search",
+                    type="string",
+                    required=False,
+                    default="flat",
+                    value_list=list(FAISS_INDEX_TYPES),
+                ),
+                ConnectorConfigEntrySchema(
+                    field="nprobe",
+                    label="IVF Probes",
+                    description="Inverted lists searched per query for IVF indexes",
+                    type="number",
+                    required=False,
+                    default="16",
+                ),
+                ConnectorConfigEntrySchema(
+                    field="ef_search",
+                    label="HNSW efSearch",
+                    description="Search beam width for HNSW indexes",
+                    type="number",
+                    required=False,
+                    default="64",
+                ),
+                ConnectorConfigEntrySchema(
+                    field="snapshot_every",
+                    label="Snapshot Interval",
+                    description="Logged changes between index snapshots",
+                    type="number",
+                    required=False,
+                    default="10000",
+                ),
             ]
         )
\ No newline at end of file
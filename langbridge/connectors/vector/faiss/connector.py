@@ -1,8 +1,12 @@
 import asyncio
 import json
 import logging
+import math
+import os
+import re
+import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 import uuid
 
 import numpy as np
@@ -14,16 +18,39 @@ from langbridge.connectors.base.errors import ConnectorError
 from .config import FaissConnectorConfig
 from langbridge.runtime.logger import get_root_logger
 
-try: 
-    import faiss 
+try:
+    import faiss
 except ImportError as exc:
     faiss = None
     _FAISS_IMPORT_ERROR = exc
-else:  
+else:
     _FAISS_IMPORT_ERROR = None
 
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS vectors (id INTEGER PRIMARY KEY, vector BLOB NOT NULL, metadata TEXT)",
+    "CREATE TABLE IF NOT EXISTS log (seq INTEGER PRIMARY KEY AUTOINCREMENT, op TEXT NOT NULL, id INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)",
+)
+_READ_CHUNK_ROWS = 50_000
+# FAISS wants ~39 training points per centroid and uses at most 256.
+_MIN_POINTS_PER_LIST = 39
+_MAX_POINTS_PER_LIST = 256
+# Seeds the training sample, so rebuilding from the same vectors trains the same index.
+_TRAIN_SAMPLE_SEED = 1234
+
+
 class FaissConnector(ManagedVectorDB):
-    """Lightweight FAISS connector that stores a persistent local index."""
+    """
+    Persistent local FAISS index.
+
+    Vectors and their metadata live in a SQLite sidecar (`<index>.meta.sqlite3`)
+    whose `log` table records every upsert and delete since the last snapshot.
+    Searches combine the snapshot index, memory-mapped from `<index>.<seq>.faiss`,
+    with an in-memory exact index of vectors added since and skip ids deleted
+    since. Every `snapshot_every` logged changes the two are merged into a new
+    snapshot, which is also when IVF indexes are (re)trained and HNSW graphs
+    rebuilt.
+    """
 
     RUNTIME_TYPE = ConnectorRuntimeType.FAISS
 
@@ -36,10 +63,24 @@ class FaissConnector(ManagedVectorDB):
             self._index_path = base_path
             base_path = self._index_path.parent
         self._storage_dir = base_path
-        self._metadata_path = self._index_path.with_name(self._index_path.name + ".meta.json")
-        self._index: Any | None = None
+        self._metadata_path = self._index_path.with_name(self._index_path.name + ".meta.sqlite3")
+        self._legacy_metadata_path = self._index_path.with_name(self._index_path.name + ".meta.json")
+        self._snapshot_pattern = re.compile(
+            rf"^{re.escape(self._index_path.stem)}\.(\d+){re.escape(self._index_path.suffix)}$"
+        )
+        self._db: Optional[sqlite3.Connection] = None
+        # Snapshot index (memory-mapped) and the vectors changed since it was written.
+        self._main: Any | None = None
+        self._main_kind: str = "flat"
+        self._snapshot_name: Optional[str] = None
+        self._snapshot_seq: int = 0
+        self._trained_size: int = 0
+        self._delta: Any | None = None
+        self._delta_ids: set[int] = set()
+        self._tombstones: set[int] = set()
+        self._selector: Optional[Tuple[Any, Any]] = None
+        self._pending_changes: int = 0
         self._dimension: Optional[int] = None
-        self._metadata: Dict[int, Any] = {}
         self._next_id: int = 1
         self._loaded: bool = False
         self._lock = asyncio.Lock()
@@ -48,7 +89,7 @@ class FaissConnector(ManagedVectorDB):
         self._require_faiss()
         async with self._lock:
             await self._ensure_loaded()
-            
+
     @staticmethod
     async def create_managed_instance(
         kwargs: Any,
@@ -61,32 +102,22 @@ class FaissConnector(ManagedVectorDB):
             logger = get_root_logger()
         config = FaissConnectorConfig(location=f"~/langbridge/faiss_data/{index_name}")
         return FaissConnector(config=config, logger=logger)
-    
+
     async def create_index(self, dimension, *, metric = "cosine"):
         self._require_faiss()
         async with self._lock:
             await self._ensure_loaded()
-            if self._index is not None:
+            if self._dimension is not None:
                 raise ConnectorError("FAISS index already exists.")
             if metric != "cosine":
                 raise ConnectorError("Only 'cosine' metric is supported in this FAISS connector.")
-            self._dimension = dimension
-            base_index = faiss.IndexFlatIP(self._dimension)
-            self._index = faiss.IndexIDMap(base_index)
-            await self._persist_state()
-            
+            await self._run(self._ensure_index_ready, int(dimension))
+
     async def delete_index(self):
         self._require_faiss()
         async with self._lock:
             await self._ensure_loaded()
-            self._index = None
-            self._dimension = None
-            self._metadata = {}
-            self._next_id = 1
-            if self._index_path.exists():
-                self._index_path.unlink()
-            if self._metadata_path.exists():
-                self._metadata_path.unlink()
+            await self._run(self._delete_index_sync)
 
     async def upsert_vectors(
         self,
@@ -113,22 +144,23 @@ class FaissConnector(ManagedVectorDB):
 
         async with self._lock:
             await self._ensure_loaded()
-            self._ensure_index_ready(matrix.shape[1])
-            if self._index is None or self._dimension is None:
-                raise ConnectorError("FAISS index unavailable; call test_connection first.")
-
-            ids = np.arange(self._next_id, self._next_id + len(matrix), dtype="int64")
-            self._next_id += len(matrix)
-            try:
-                self._index.add_with_ids(matrix, ids)
-            except Exception as exc:  # pragma: no cover - relies on FAISS internals
-                raise ConnectorError(f"Failed to add vectors to FAISS index: {exc}") from exc
+            return await self._run(self._upsert_sync, matrix, payloads)
 
-            for idx, payload in zip(ids.tolist(), payloads):
-                self._metadata[int(idx)] = payload
+    async def list_vectors(self) -> Dict[int, Any]:
+        self._require_faiss()
+        async with self._lock:
+            await self._ensure_loaded()
+            return await self._run(self._list_sync)
 
-            await self._persist_state()
-            return [int(idx) for idx in ids]
+    async def delete_vectors(self, ids: Sequence[int]) -> None:
+        if not ids:
+            return
+        self._require_faiss()
+        async with self._lock:
+            await self._ensure_loaded()
+            if self._dimension is None:
+                return
+            await self._run(self._delete_sync, [int(idx) for idx in ids])
 
     async def search(
         self,
@@ -147,103 +179,142 @@ class FaissConnector(ManagedVectorDB):
             raise ConnectorError(f"Invalid query vector: {exc}") from exc
         async with self._lock:
             await self._ensure_loaded()
-            if self._index is None or self._dimension is None:
+            if self._dimension is None:
                 raise ConnectorError("FAISS index unavailable; call test_connection first.")
             if query.shape[1] != self._dimension:
                 raise ConnectorError(
                     f"Query vector dimension {query.shape[1]} does not match index dimension {self._dimension}."
                 )
-            try:
-                distances, indices = self._index.search(query.reshape(1, -1), top_k)
-            except Exception as exc:  # pragma: no cover - relies on FAISS internals
-                raise ConnectorError(f"FAISS search failed: {exc}") from exc
+            matches = await self._run(self._search_sync, query, top_k)
 
-            results: List[Dict[str, Any]] = []
-            for idx, dist in zip(indices[0], distances[0]):
-                if idx == -1:
+        results: List[Dict[str, Any]] = []
+        for idx, score, metadata_entry in matches:
+            if metadata_filters:
+                if not metadata_entry or not all(
+                    item in metadata_entry.items() for item in metadata_filters.items()
+                ):
                     continue
-                metadata_entry = self._metadata.get(int(idx))
-                
-                if metadata_filters:
-                    if not metadata_entry or not all(
-                        item in metadata_entry.items() for item in metadata_filters.items()
-                    ):
-                        continue
-                
-                results.append({
-                    "id": int(idx),
-                    "score": float(dist),
-                    "metadata": metadata_entry,
-                })
-            return results
+            results.append({
+                "id": idx,
+                "score": score,
+                "metadata": metadata_entry,
+            })
+        return results
 
     async def _ensure_loaded(self) -> None:
         if self._loaded:
             return
-        await run_sync(self._load_state)
+        await self._run(self._load_state)
         self._loaded = True
 
-    async def _persist_state(self) -> None:
+    async def _run(self, fn, *args):
         try:
-            await run_sync(self._persist_state_sync)
-        except Exception as exc:  # pragma: no cover - surfaced to callers
-            raise ConnectorError(f"Failed to persist FAISS index: {exc}") from exc
+            return await run_sync(fn, *args)
+        except ConnectorError:
+            raise
+        except (sqlite3.Error, OSError, RuntimeError) as exc:  # pragma: no cover - surfaced to callers
+            raise ConnectorError(f"FAISS index operation failed: {exc}") from exc
 
     def _load_state(self) -> None:
         self._storage_dir.mkdir(parents=True, exist_ok=True)
-        self._metadata = {}
-        self._next_id = 1
-
         if faiss is None:
             return
+        db = self._connect()
+        state = dict(db.execute("SELECT key, value FROM state").fetchall())
+        if not state and self._legacy_metadata_path.exists():
+            self._migrate_legacy()
+            state = dict(db.execute("SELECT key, value FROM state").fetchall())
 
-        try:
-            if self._index_path.exists():
-                self._index = faiss.read_index(str(self._index_path))
-                self._dimension = int(self._index.d)
+        self._dimension = int(state["dimension"]) if state.get("dimension") else None
+        self._next_id = int(state.get("next_id") or 1)
+        self._snapshot_name = state.get("snapshot") or None
+        self._snapshot_seq = int(state.get("snapshot_seq") or 0)
+        self._main_kind = state.get("main_kind") or "flat"
+        self._trained_size = int(state.get("trained_size") or 0)
+        self._main = None
+        if self._snapshot_name:
+            self._main = self._read_snapshot(self._storage_dir / self._snapshot_name)
+        self._reset_delta()
+
+        # Replay whatever was logged after the snapshot was written.
+        added: Dict[int, None] = {}
+        for op, idx in db.execute(
+            "SELECT op, id FROM log WHERE seq > ? ORDER BY seq", (self._snapshot_seq,)
+        ):
+            self._pending_changes += 1
+            if op == "add":
+                added[idx] = None
+            elif idx in added:
+                del added[idx]
             else:
-                self._index = None
-                self._dimension = None
-        except Exception as exc:  # pragma: no cover - relies on FAISS internals
-            raise ConnectorError(f"Failed to load FAISS index: {exc}") from exc
+                self._tombstones.add(idx)
+        for ids, matrix in self._read_vectors(list(added)):
+            self._add_to_delta(matrix, ids)
+        if self._pending_changes >= max(1, self.config.snapshot_every):
+            self._snapshot_sync()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            db = sqlite3.connect(str(self._metadata_path), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                db.execute(statement)
+            db.commit()
+            self._db = db
+        return self._db
+
+    def _write_state(self, **values: Any) -> None:
+        self._connect().executemany(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+            [(key, None if value is None else str(value)) for key, value in values.items()],
+        )
+
+    def _migrate_legacy(self) -> None:
+        # Indexes written before the SQLite sidecar kept metadata in a JSON file and
+        # vectors only inside `index.faiss`; move both into the sidecar and log them.
+        try:
+            with self._legacy_metadata_path.open("r", encoding="utf-8") as handle:
+                legacy_state = json.load(handle)
+        except Exception as exc:  # pragma: no cover - IO/JSON guard
+            raise ConnectorError(f"Failed to load FAISS metadata: {exc}") from exc
+
+        metadata: Dict[int, Any] = {}
+        raw_metadata = legacy_state.get("metadata") or legacy_state.get("items") or {}
+        if isinstance(raw_metadata, list):
+            for entry in raw_metadata:
+                if isinstance(entry, dict) and "id" in entry:
+                    metadata[int(entry["id"])] = entry.get("metadata")
+        elif isinstance(raw_metadata, dict):
+            for key, value in raw_metadata.items():
+                try:
+                    metadata[int(key)] = value
+                except (TypeError, ValueError):  # pragma: no cover - defensive guard
+                    continue
 
-        if self._metadata_path.exists():
+        dimension = legacy_state.get("dimension")
+        rows: List[Tuple[int, bytes, str]] = []
+        if self._index_path.exists():
             try:
-                with self._metadata_path.open("r", encoding="utf-8") as handle:
-                    state = json.load(handle)
-            except Exception as exc:  # pragma: no cover - IO/JSON guard
-                raise ConnectorError(f"Failed to load FAISS metadata: {exc}") from exc
-
-            self._next_id = int(state.get("next_id", 1))
-            stored_dimension = state.get("dimension")
-            if stored_dimension and not self._dimension:
-                self._dimension = int(stored_dimension)
-            raw_metadata = state.get("metadata") or state.get("items") or {}
-            if isinstance(raw_metadata, list):
-                for entry in raw_metadata:
-                    if not isinstance(entry, dict) or "id" not in entry:
-                        continue
-                    self._metadata[int(entry.get("id"))] = entry.get("metadata")
-            elif isinstance(raw_metadata, dict):
-                for key, value in raw_metadata.items():
-                    try:
-                        self._metadata[int(key)] = value
-                    except (TypeError, ValueError):  # pragma: no cover - defensive guard
-                        continue
-
-    def _persist_state_sync(self) -> None:
-        if faiss is None:
-            return
-        self._storage_dir.mkdir(parents=True, exist_ok=True)
-        if self._index is not None:
-            faiss.write_index(self._index, str(self._index_path))
-        state = {
-            "dimension": self._dimension,
-            "next_id": self._next_id,
-            "metadata": {str(key): value for key, value in self._metadata.items()},
-        }
-        with self._metadata_path.open("w", encoding="utf-8") as handle:
-            json.dump(state, handle)
+                legacy_index = faiss.read_index(str(self._index_path))
+                ids = faiss.vector_to_array(legacy_index.id_map).astype("int64")
+                vectors = legacy_index.index.reconstruct_n(0, legacy_index.ntotal)
+            except Exception as exc:  # pragma: no cover - relies on FAISS internals
+                raise ConnectorError(f"Failed to load FAISS index: {exc}") from exc
+            dimension = int(legacy_index.d)
+            vectors = self._normalize_matrix(np.asarray(vectors, dtype="float32"))
+            rows = [
+                (int(idx), vector.astype("float32").tobytes(), json.dumps(metadata.get(int(idx))))
+                for idx, vector in zip(ids.tolist(), vectors)
+            ]
+
+        db = self._connect()
+        with db:
+            db.executemany("INSERT OR REPLACE INTO vectors (id, vector, metadata) VALUES (?, ?, ?)", rows)
+            db.executemany("INSERT INTO log (op, id) VALUES ('add', ?)", [(row[0],) for row in rows])
+            self._write_state(dimension=dimension, next_id=int(legacy_state.get("next_id", 1)))
+        self._index_path.unlink(missing_ok=True)
+        self._legacy_metadata_path.unlink(missing_ok=True)
 
     def _ensure_index_ready(self, dimension: int) -> None:
         if self._dimension and self._dimension != dimension:
@@ -251,19 +322,297 @@ class FaissConnector(ManagedVectorDB):
                 f"Existing FAISS index dimension {self._dimension} does not match provided dimension {dimension}."
             )
         if self._dimension is None:
-            self._dimension = dimension
-        if self._index is None:
             if faiss is None:
                 raise ConnectorError("FAISS runtime not available.")
-            base_index = faiss.IndexFlatIP(self._dimension)
-            self._index = faiss.IndexIDMap(base_index)
+            self._dimension = dimension
+            db = self._connect()
+            with db:
+                self._write_state(dimension=dimension, next_id=self._next_id)
+            self._reset_delta()
+
+    def _upsert_sync(self, matrix: np.ndarray, payloads: List[Any]) -> List[int]:
+        self._ensure_index_ready(matrix.shape[1])
+        ids = np.arange(self._next_id, self._next_id + len(matrix), dtype="int64")
+        db = self._connect()
+        with db:
+            db.executemany(
+                "INSERT OR REPLACE INTO vectors (id, vector, metadata) VALUES (?, ?, ?)",
+                [
+                    (int(idx), vector.astype("float32").tobytes(), json.dumps(payload))
+                    for idx, vector, payload in zip(ids.tolist(), matrix, payloads)
+                ],
+            )
+            db.executemany("INSERT INTO log (op, id) VALUES ('add', ?)", [(int(idx),) for idx in ids])
+            self._write_state(next_id=int(ids[-1]) + 1)
+        self._next_id = int(ids[-1]) + 1
+        self._add_to_delta(matrix, ids)
+        self._pending_changes += len(ids)
+        self._maybe_snapshot()
+        return [int(idx) for idx in ids]
+
+    def _delete_sync(self, ids: List[int]) -> None:
+        db = self._connect()
+        present: List[int] = []
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            present.extend(
+                row[0] for row in db.execute(f"SELECT id FROM vectors WHERE id IN ({placeholders})", chunk)
+            )
+        if not present:
+            return
+        with db:
+            db.executemany("DELETE FROM vectors WHERE id = ?", [(idx,) for idx in present])
+            db.executemany("INSERT INTO log (op, id) VALUES ('delete', ?)", [(idx,) for idx in present])
+        in_delta = [idx for idx in present if idx in self._delta_ids]
+        in_main = [idx for idx in present if idx not in self._delta_ids]
+        if in_delta:
+            self._delta.remove_ids(np.asarray(in_delta, dtype="int64"))
+            self._delta_ids.difference_update(in_delta)
+        if in_main:
+            self._tombstones.update(in_main)
+            self._selector = None
+        self._pending_changes += len(present)
+        self._maybe_snapshot()
+
+    def _list_sync(self) -> Dict[int, Any]:
+        return {
+            int(idx): json.loads(payload) if payload is not None else None
+            for idx, payload in self._connect().execute("SELECT id, metadata FROM vectors")
+        }
+
+    def _search_sync(self, query: np.ndarray, top_k: int) -> List[Tuple[int, float, Any]]:
+        candidates: List[Tuple[float, int]] = []
+        try:
+            if self._main is not None and self._main.ntotal:
+                distances, indices = self._main.search(query, top_k, params=self._search_params())
+                candidates.extend(zip(distances[0].tolist(), indices[0].tolist()))
+            if self._delta is not None and self._delta.ntotal:
+                distances, indices = self._delta.search(query, top_k)
+                candidates.extend(zip(distances[0].tolist(), indices[0].tolist()))
+        except Exception as exc:  # pragma: no cover - relies on FAISS internals
+            raise ConnectorError(f"FAISS search failed: {exc}") from exc
+
+        best = sorted(
+            ((score, int(idx)) for score, idx in candidates if idx != -1),
+            key=lambda item: item[0],
+            reverse=True,
+        )[:top_k]
+        if not best:
+            return []
+        placeholders = ",".join("?" * len(best))
+        metadata = {
+            int(idx): json.loads(payload) if payload is not None else None
+            for idx, payload in self._connect().execute(
+                f"SELECT id, metadata FROM vectors WHERE id IN ({placeholders})",
+                [idx for _, idx in best],
+            )
+        }
+        return [(idx, float(score), metadata.get(idx)) for score, idx in best]
+
+    def _search_params(self) -> Any:
+        selector = None
+        if self._tombstones:
+            if self._selector is None:
+                # Keep the batch alive alongside the NOT wrapper that points at it.
+                batch = faiss.IDSelectorBatch(np.fromiter(self._tombstones, dtype="int64"))
+                self._selector = (batch, faiss.IDSelectorNot(batch))
+            selector = self._selector[1]
+        if self._main_kind == "hnsw":
+            return faiss.SearchParametersHNSW(efSearch=max(1, self.config.ef_search), sel=selector)
+        if self._main_kind in {"ivf_flat", "ivf_pq"}:
+            return faiss.SearchParametersIVF(nprobe=max(1, self.config.nprobe), sel=selector)
+        return faiss.SearchParameters(sel=selector)
+
+    def _maybe_snapshot(self) -> None:
+        if self._pending_changes >= max(1, self.config.snapshot_every):
+            self._snapshot_sync()
+
+    def _snapshot_sync(self) -> None:
+        """Fold the logged changes into a new snapshot file and truncate the log."""
+        if self._dimension is None:
+            return
+        db = self._connect()
+        live = int(db.execute("SELECT COUNT(*) FROM vectors").fetchone()[0])
+        last_seq = db.execute("SELECT MAX(seq) FROM log").fetchone()[0]
+        seq = int(last_seq) if last_seq is not None else self._snapshot_seq
+        kind = self._target_kind(live)
+        retrain = kind != "flat" and kind != "hnsw" and (
+            kind != self._main_kind or live >= self._trained_size * max(1.0, self.config.retrain_growth)
+        )
+        rebuild = (
+            self._main is None
+            or kind != self._main_kind
+            or retrain
+            or (kind == "hnsw" and bool(self._tombstones))
+        )
+        try:
+            if rebuild:
+                index = self._build_index(kind, live)
+                trained_size = live if retrain else self._trained_size
+            else:
+                # A private, writable copy; the mapped snapshot stays in use until replaced.
+                index = faiss.read_index(str(self._storage_dir / self._snapshot_name))
+                if self._tombstones:
+                    index.remove_ids(np.fromiter(self._tombstones, dtype="int64"))
+                for ids, matrix in self._read_vectors(sorted(self._delta_ids)):
+                    index.add_with_ids(matrix, ids)
+                trained_size = self._trained_size
+            name = f"{self._index_path.stem}.{seq}{self._index_path.suffix}"
+            target = self._storage_dir / name
+            staging = target.with_name(target.name + ".tmp")
+            faiss.write_index(index, str(staging))
+            os.replace(staging, target)
+        except ConnectorError:
+            raise
+        except Exception as exc:  # pragma: no cover - relies on FAISS internals
+            raise ConnectorError(f"Failed to snapshot FAISS index: {exc}") from exc
+
+        with db:
+            self._write_state(snapshot=name, snapshot_seq=seq, main_kind=kind, trained_size=trained_size)
+            db.execute("DELETE FROM log WHERE seq <= ?", (seq,))
+        previous = self._snapshot_name
+        self._snapshot_name = name
+        self._snapshot_seq = seq
+        self._main_kind = kind
+        self._trained_size = trained_size
+        self._main = self._read_snapshot(target)
+        self._reset_delta()
+        if previous and previous != name:
+            (self._storage_dir / previous).unlink(missing_ok=True)
+
+    def _target_kind(self, live: int) -> str:
+        kind = self.config.index_type
+        if kind in {"ivf_flat", "ivf_pq"} and live < max(1, self.config.train_min_vectors):
+            # Too few vectors to train on yet; search them exactly.
+            return "flat"
+        return kind
+
+    def _build_index(self, kind: str, live: int) -> Any:
+        dimension = int(self._dimension)
+        if kind == "hnsw":
+            index = faiss.index_factory(dimension, f"IDMap,HNSW{max(2, self.config.hnsw_m)},Flat", faiss.METRIC_INNER_PRODUCT)
+            faiss.downcast_index(index.index).hnsw.efConstruction = max(1, self.config.ef_construction)
+        elif kind in {"ivf_flat", "ivf_pq"}:
+            nlist = self._nlist(live)
+            sample = min(live, nlist * _MAX_POINTS_PER_LIST)
+            if kind == "ivf_flat":
+                encoding = "Flat"
+            else:
+                # 8-bit codebooks (256 centroids each) until there are too few vectors to fit them.
+                nbits = max(1, min(8, int(math.log2(max(2, live // _MIN_POINTS_PER_LIST)))))
+                encoding = f"PQ{self._pq_m(dimension)}x{nbits}"
+                sample = min(live, max(sample, (1 << nbits) * _MAX_POINTS_PER_LIST))
+            index = faiss.index_factory(dimension, f"IVF{nlist},{encoding}", faiss.METRIC_INNER_PRODUCT)
+            index.train(self._training_sample(sample))
+        else:
+            index = faiss.index_factory(dimension, "IDMap,Flat", faiss.METRIC_INNER_PRODUCT)
+        for ids, matrix in self._read_all_vectors():
+            index.add_with_ids(matrix, ids)
+        return index
+
+    def _training_sample(self, size: int) -> np.ndarray:
+        """`size` live vectors drawn with a fixed seed, in id order."""
+        ids = np.fromiter(
+            (row[0] for row in self._connect().execute("SELECT id FROM vectors ORDER BY id")),
+            dtype="int64",
+        )
+        rng = np.random.default_rng(_TRAIN_SAMPLE_SEED)
+        chosen = np.sort(rng.choice(ids, size=min(size, len(ids)), replace=False))
+        matrices = [matrix for _, matrix in self._read_vectors(chosen.tolist())]
+        return np.concatenate(matrices) if matrices else np.empty((0, int(self._dimension)), dtype="float32")
+
+    def _nlist(self, live: int) -> int:
+        if self.config.nlist:
+            return max(1, min(int(self.config.nlist), live))
+        return max(1, min(int(4 * math.sqrt(live)), live // _MIN_POINTS_PER_LIST))
+
+    def _pq_m(self, dimension: int) -> int:
+        m = max(1, min(int(self.config.pq_m), dimension))
+        while dimension % m:
+            m -= 1
+        return m
+
+    def _read_snapshot(self, path: Path) -> Any:
+        try:
+            if self.config.mmap:
+                try:
+                    return faiss.read_index(str(path), faiss.IO_FLAG_MMAP)
+                except RuntimeError:
+                    # Not every index layout can be mapped; read it into memory instead.
+                    pass
+            return faiss.read_index(str(path))
+        except Exception as exc:  # pragma: no cover - relies on FAISS internals
+            raise ConnectorError(f"Failed to load FAISS index: {exc}") from exc
+
+    def _read_vectors(self, ids: List[int]) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        db = self._connect()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = db.execute(f"SELECT id, vector FROM vectors WHERE id IN ({placeholders})", chunk).fetchall()
+            if rows:
+                yield self._rows_to_matrix(rows)
+
+    def _read_all_vectors(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        cursor = self._connect().execute("SELECT id, vector FROM vectors ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(_READ_CHUNK_ROWS)
+            if not rows:
+                return
+            yield self._rows_to_matrix(rows)
+
+    def _rows_to_matrix(self, rows: List[Tuple[int, bytes]]) -> Tuple[np.ndarray, np.ndarray]:
+        ids = np.asarray([row[0] for row in rows], dtype="int64")
+        matrix = np.frombuffer(b"".join(row[1] for row in rows), dtype="float32").reshape(len(rows), -1)
+        return ids, matrix
+
+    def _add_to_delta(self, matrix: np.ndarray, ids: np.ndarray) -> None:
+        try:
+            self._delta.add_with_ids(np.ascontiguousarray(matrix, dtype="float32"), ids)
+        except Exception as exc:  # pragma: no cover - relies on FAISS internals
+            raise ConnectorError(f"Failed to add vectors to FAISS index: {exc}") from exc
+        self._delta_ids.update(int(idx) for idx in ids)
+
+    def _reset_delta(self) -> None:
+        self._delta = (
+            faiss.index_factory(self._dimension, "IDMap,Flat", faiss.METRIC_INNER_PRODUCT)
+            if self._dimension is not None
+            else None
+        )
+        self._delta_ids = set()
+        self._tombstones = set()
+        self._selector = None
+        self._pending_changes = 0
+
+    def _delete_index_sync(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(self._metadata_path) + suffix).unlink(missing_ok=True)
+        if self._storage_dir.exists():
+            for path in self._storage_dir.iterdir():
+                if self._snapshot_pattern.match(path.name):
+                    path.unlink(missing_ok=True)
+        self._index_path.unlink(missing_ok=True)
+        self._legacy_metadata_path.unlink(missing_ok=True)
+        self._main = None
+        self._main_kind = "flat"
+        self._snapshot_name = None
+        self._snapshot_seq = 0
+        self._trained_size = 0
+        self._dimension = None
+        self._next_id = 1
+        self._reset_delta()
+        self._loaded = False
 
     @staticmethod
     def _normalize_matrix(matrix: np.ndarray) -> np.ndarray:
-        norm = np.linalg.norm(matrix)
-        if norm == 0:
-            return matrix
-        return matrix / norm
+        # Per row, so vectors score the same whichever batch they were upserted in.
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).astype("float32")
 
     @staticmethod
     def _to_matrix(vectors: Sequence[Sequence[float]]) -> np.ndarray:
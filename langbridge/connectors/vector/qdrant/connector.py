@@ -36,7 +36,7 @@ class QdrantConnector(ManagedVectorDB):
             https=config.https,
         )
         self._collection = config.collection
-        self._next_id = 1
+        self._next_id: Optional[int] = None
         self._lock = asyncio.Lock()
 
     async def test_connection(self) -> None:
@@ -106,6 +106,10 @@ class QdrantConnector(ManagedVectorDB):
                 raise ConnectorError("Metadata length must match number of vectors.")
 
         async with self._lock:
+            if self._next_id is None:
+                # Continue after ids already in the collection rather than overwrite them.
+                existing = await run_sync(self._scroll_payloads)
+                self._next_id = max((int(idx) for idx in existing), default=0) + 1
             ids = list(range(self._next_id, self._next_id + len(vectors)))
             self._next_id += len(vectors)
             points = [
@@ -119,6 +123,20 @@ class QdrantConnector(ManagedVectorDB):
             )
             return ids
 
+    async def list_vectors(self) -> Dict[int, Any]:
+        self._require_qdrant()
+        return await run_sync(self._scroll_payloads)
+
+    async def delete_vectors(self, ids: Sequence[int]) -> None:
+        if not ids:
+            return
+        self._require_qdrant()
+        await run_sync(
+            self._client.delete,
+            collection_name=self._collection,
+            points_selector=qmodels.PointIdsList(points=[int(idx) for idx in ids]),
+        )
+
     async def search(
         self,
         vector: Sequence[float],
@@ -150,6 +168,26 @@ class QdrantConnector(ManagedVectorDB):
             )
         return output
 
+    def _scroll_payloads(self) -> Dict[int, Any]:
+        payloads: Dict[int, Any] = {}
+        try:
+            self._client.get_collection(self._collection)
+        except Exception:
+            return payloads
+        offset = None
+        while True:
+            points, offset = self._client.scroll(
+                collection_name=self._collection,
+                limit=1000,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            for point in points:
+                payloads[int(point.id)] = point.payload
+            if offset is None:
+                return payloads
+
     @staticmethod
     def _require_qdrant() -> None:
         if QdrantClient is not None:
@@ -1,6 +1,13 @@
 
 from typing import Any
 
+from langbridge.federation.cancellation import (
+    CancellationToken,
+    QueryCancelledError,
+    QueryDeadlineExceededError,
+    cancellation_scope,
+    current_cancellation,
+)
 from langbridge.federation.models.smq import SMQFilter, SMQOrderItem, SMQQuery, SMQTimeDimension
 from langbridge.federation.models.virtual_dataset import (
     FederationWorkflow,
@@ -11,6 +18,7 @@ from langbridge.federation.models.virtual_dataset import (
 )
 from langbridge.federation.models.plans import (
     ExecutionSummary,
+    FederatedExplainAnalyzePlan,
     FederatedExplainPlan,
     LogicalPlan,
     PhysicalPlan,
@@ -19,6 +27,11 @@ from langbridge.federation.models.plans import (
 
 __all__ = [
     "FederatedQueryService",
+    "CancellationToken",
+    "QueryCancelledError",
+    "QueryDeadlineExceededError",
+    "cancellation_scope",
+    "current_cancellation",
     "SMQFilter",
     "SMQOrderItem",
     "SMQQuery",
@@ -29,6 +42,7 @@ __all__ = [
     "VirtualRelationship",
     "VirtualTableBinding",
     "ExecutionSummary",
+    "FederatedExplainAnalyzePlan",
     "FederatedExplainPlan",
     "LogicalPlan",
     "PhysicalPlan",
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_LOGGER = logging.getLogger(__name__)
+_NATIVE_CANCEL_GRACE_S = 5.0
+
+_CURRENT_CANCELLATION: ContextVar["CancellationToken | None"] = ContextVar(
+    "federation_cancellation",
+    default=None,
+)
+
+
+class QueryCancelledError(Exception):
+    """Raised when an in-flight federated query is cancelled."""
+
+
+class QueryDeadlineExceededError(QueryCancelledError, TimeoutError):
+    """Raised when an in-flight federated query runs past its deadline."""
+
+
+class CancellationToken:
+    """
+    Cancellation signal and optional deadline shared by every stage of one query.
+
+    Native cancel hooks (driver cancel, DuckDB interrupt) are registered with
+    `on_cancel` or passed to `run`, and fire once when the token is cancelled or
+    its deadline passes.
+    """
+
+    def __init__(self, *, deadline: float | None = None) -> None:
+        self._deadline = deadline
+        self._reason: str | None = None
+        self._deadline_exceeded = False
+        self._callbacks: list[Callable[[], Any]] = []
+        self._event = asyncio.Event()
+
+    @classmethod
+    def with_timeout(cls, timeout_s: float | None) -> "CancellationToken":
+        if timeout_s is None or timeout_s <= 0:
+            return cls()
+        return cls(deadline=time.monotonic() + float(timeout_s))
+
+    @property
+    def deadline(self) -> float | None:
+        return self._deadline
+
+    @property
+    def reason(self) -> str | None:
+        return self._reason
+
+    @property
+    def cancelled(self) -> bool:
+        if self._reason is None and self._deadline_passed():
+            self._expire()
+        return self._reason is not None
+
+    def remaining_s(self) -> float | None:
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def cancel(self, reason: str = "Query was cancelled.") -> None:
+        if self._reason is not None:
+            return
+        self._reason = reason
+        self._event.set()
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            _invoke_cancel_callback(callback)
+
+    def on_cancel(self, callback: Callable[[], Any]) -> Callable[[], None]:
+        if self.cancelled:
+            _invoke_cancel_callback(callback)
+            return lambda: None
+        self._callbacks.append(callback)
+
+        def _unregister() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return _unregister
+
+    def child(self, *, timeout_s: float | None = None) -> "CancellationToken":
+        deadline = self._deadline
+        if timeout_s is not None and timeout_s > 0:
+            child_deadline = time.monotonic() + float(timeout_s)
+            deadline = child_deadline if deadline is None else min(deadline, child_deadline)
+        child = CancellationToken(deadline=deadline)
+        self.on_cancel(lambda: child.cancel(self._reason or "Query was cancelled."))
+        return child
+
+    def raise_if_cancelled(self) -> None:
+        if not self.cancelled:
+            return
+        if self._deadline_exceeded:
+            raise QueryDeadlineExceededError(self._reason)
+        raise QueryCancelledError(self._reason)
+
+    async def sleep(self, delay_s: float) -> None:
+        self.raise_if_cancelled()
+        remaining = self.remaining_s()
+        timeout = delay_s if remaining is None else min(delay_s, remaining)
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.raise_if_cancelled()
+
+    async def run(
+        self,
+        awaitable: Awaitable[T],
+        *,
+        on_cancel: Callable[[], Any] | None = None,
+    ) -> T:
+        """
+        Await `awaitable` until it completes, the token is cancelled, or the deadline passes.
+
+        When `on_cancel` is supplied it is treated as the native cancel for the work and the
+        task is given a short grace period to unwind on its own (for example a DuckDB query
+        running in a worker thread after `interrupt()`); otherwise the task is cancelled.
+        """
+        self.raise_if_cancelled()
+        task = asyncio.ensure_future(awaitable)
+        waiter = asyncio.ensure_future(self._event.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {task, waiter},
+                timeout=self.remaining_s(),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            waiter.cancel()
+
+        if task in done:
+            return task.result()
+
+        if not self.cancelled:
+            self._expire()
+        await _abandon_task(task, on_cancel=on_cancel)
+        self.raise_if_cancelled()
+        raise QueryCancelledError(self._reason)  # pragma: no cover - raise_if_cancelled always raises here
+
+    def _deadline_passed(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _expire(self) -> None:
+        if self._reason is not None:
+            return
+        self._deadline_exceeded = True
+        self.cancel("Query exceeded its execution deadline.")
+
+
+def current_cancellation() -> CancellationToken | None:
+    return _CURRENT_CANCELLATION.get()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken | None) -> Iterator[CancellationToken | None]:
+    context_token = _CURRENT_CANCELLATION.set(token)
+    try:
+        yield token
+    finally:
+        _CURRENT_CANCELLATION.reset(context_token)
+
+
+async def _abandon_task(task: asyncio.Future, *, on_cancel: Callable[[], Any] | None) -> None:
+    if on_cancel is not None:
+        _invoke_cancel_callback(on_cancel)
+        done, _ = await asyncio.wait({task}, timeout=_NATIVE_CANCEL_GRACE_S)
+        if task in done:
+            _consume_outcome(task)
+            return
+    task.cancel()
+    done, _ = await asyncio.wait({task}, timeout=_NATIVE_CANCEL_GRACE_S)
+    if task in done:
+        _consume_outcome(task)
+    else:
+        _LOGGER.warning("Cancelled federated work did not stop within %.1fs.", _NATIVE_CANCEL_GRACE_S)
+
+
+def _consume_outcome(task: asyncio.Future) -> None:
+    if task.cancelled():
+        return
+    exception = task.exception()
+    if exception is not None:
+        _LOGGER.debug("Cancelled federated work finished with %r.", exception)
+
+
+def _invoke_cancel_callback(callback: Callable[[], Any]) -> None:
+    try:
+        result = callback()
+        if asyncio.iscoroutine(result):
+            asyncio.ensure_future(result)
+    except Exception:  # pragma: no cover - native cancel hooks are best effort
+        _LOGGER.debug("Cancellation callback failed.", exc_info=True)
@@ -1,20 +1,38 @@
+import asyncio
+import dataclasses
 import logging
 import math
 import time
-from typing import Any
+from typing import Any, Callable
 
 import duckdb
 import pyarrow as pa
+import sqlglot
+from sqlglot import exp
 
-from langbridge.connectors.base.connector import ApiConnector
+from langbridge.connectors.base.connector import (
+    ApiConnector,
+    ApiExtractResult,
+    ApiFilterPredicate,
+    ApiResourceQuery,
+)
 from langbridge.connectors.base.resource_paths import (
     api_resource_root,
     materialize_api_resource_rows,
 )
-from langbridge.federation.connectors.base import RemoteExecutionResult, RemoteSource, SourceCapabilities
+from langbridge.federation.cancellation import CancellationToken
+from langbridge.federation.connectors.base import (
+    RemoteExecutionResult,
+    RemoteSource,
+    SourceCapabilities,
+    execute_duckdb_arrow,
+)
 from langbridge.federation.models.plans import SourceSubplan
 from langbridge.federation.models.virtual_dataset import TableStatistics, VirtualTableBinding
 
+# Pages assumed for row estimates when a resource's first page only links to the next one.
+_UNSEEN_PAGES_ESTIMATE = 10
+
 
 def _records_to_arrow(records: list[dict[str, Any]]) -> pa.Table:
     if not records:
@@ -22,7 +40,189 @@ def _records_to_arrow(records: list[dict[str, Any]]) -> pa.Table:
     return pa.Table.from_pylist(records)
 
 
+def _concat_pages(pages: list[pa.Table]) -> pa.Table:
+    non_empty = [page for page in pages if page.num_columns > 0]
+    if not non_empty:
+        return pa.table({})
+    if len(non_empty) == 1:
+        return non_empty[0]
+    # Pages infer their own schema, so a column that is all-null on one page must still unify with the next.
+    return pa.concat_tables(non_empty, promote_options="permissive")
+
+
+_COMPARISON_OPERATORS: dict[type[exp.Expression], str] = {
+    exp.EQ: "eq",
+    exp.GT: "gt",
+    exp.GTE: "gte",
+    exp.LT: "lt",
+    exp.LTE: "lte",
+}
+_REVERSED_OPERATORS = {"eq": "eq", "gt": "lt", "gte": "lte", "lt": "gt", "lte": "gte"}
+_NOT_A_LITERAL = object()
+
+
+def derive_resource_query(
+    expression: exp.Expression | None,
+    binding: VirtualTableBinding,
+    *,
+    table_name: str | None = None,
+) -> ApiResourceQuery | None:
+    """
+    Extract server-side hints from a single-table SELECT over `binding`.
+
+    Filters are the WHERE conjuncts comparing a column with literals, fields are the
+    top-level record fields the query reads, and a limit (with its ORDER BY column) is
+    only derived when nothing else in the query could drop or reorder rows first.
+    `table_name` is the name the SQL reads the binding under, if not its own.
+    """
+    if not isinstance(expression, exp.Select) or expression.args.get("with") or expression.args.get("joins"):
+        return None
+    tables = list(expression.find_all(exp.Table))
+    if len(tables) != 1 or expression.find(exp.Subquery) is not None:
+        return None
+    table = tables[0]
+    if table.name.lower() != str(table_name or binding.table).lower():
+        return None
+    qualifiers = {table.alias_or_name.lower(), table.name.lower()}
+
+    where = expression.args.get("where")
+    filters = _pushable_filters(where.this, qualifiers=qualifiers) if where is not None else []
+    fields = _referenced_fields(expression, qualifiers=qualifiers)
+    limit, order_by, descending = _pushable_limit(expression, qualifiers=qualifiers)
+    if not filters and fields is None and limit is None:
+        return None
+    return ApiResourceQuery(
+        filters=filters,
+        fields=fields,
+        order_by=order_by,
+        descending=descending,
+        limit=limit,
+    )
+
+
+def _pushable_filters(condition: exp.Expression, *, qualifiers: set[str]) -> list[ApiFilterPredicate]:
+    condition = condition.unnest()
+    conjuncts = list(condition.flatten()) if isinstance(condition, exp.And) else [condition]
+    filters: list[ApiFilterPredicate] = []
+    for conjunct in conjuncts:
+        conjunct = conjunct.unnest()
+        operator = _COMPARISON_OPERATORS.get(type(conjunct))
+        if operator is not None:
+            left, right = conjunct.left, conjunct.right
+            column, value = _column_name(left, qualifiers), _literal_value(right)
+            if column is None or value is _NOT_A_LITERAL:
+                column, value = _column_name(right, qualifiers), _literal_value(left)
+                operator = _REVERSED_OPERATORS[operator]
+            if column is not None and value is not _NOT_A_LITERAL:
+                filters.append(ApiFilterPredicate(field=column, operator=operator, value=value))
+            continue
+        if isinstance(conjunct, exp.In) and not conjunct.args.get("query"):
+            column = _column_name(conjunct.this, qualifiers)
+            values = [_literal_value(item) for item in conjunct.expressions]
+            if column is not None and values and _NOT_A_LITERAL not in values:
+                filters.append(ApiFilterPredicate(field=column, operator="in", value=values))
+            continue
+        if isinstance(conjunct, exp.Between):
+            column = _column_name(conjunct.this, qualifiers)
+            low, high = _literal_value(conjunct.args.get("low")), _literal_value(conjunct.args.get("high"))
+            if column is not None and low is not _NOT_A_LITERAL and high is not _NOT_A_LITERAL:
+                filters.append(ApiFilterPredicate(field=column, operator="gte", value=low))
+                filters.append(ApiFilterPredicate(field=column, operator="lte", value=high))
+    return filters
+
+
+def _referenced_fields(expression: exp.Select, *, qualifiers: set[str]) -> list[str] | None:
+    for projection in expression.expressions:
+        if isinstance(projection, exp.Star) or (
+            isinstance(projection, exp.Column) and isinstance(projection.this, exp.Star)
+        ):
+            return None
+    aliases = {projection.alias.lower() for projection in expression.expressions if isinstance(projection, exp.Alias)}
+    projected_columns = {
+        column.name.lower()
+        for projection in expression.expressions
+        for column in projection.find_all(exp.Column)
+    }
+    fields: set[str] = set()
+    for column in expression.find_all(exp.Column):
+        name = _column_name(column, qualifiers)
+        if not name:
+            continue
+        if name.lower() in aliases and name.lower() not in projected_columns:
+            continue
+        # Flattened columns (`customer__email`) come from their top-level field.
+        fields.add(name.split("__", 1)[0])
+    return sorted(fields)
+
+
+def _pushable_limit(expression: exp.Select, *, qualifiers: set[str]) -> tuple[int | None, str | None, bool]:
+    limit_node = expression.args.get("limit")
+    if limit_node is None:
+        return None, None, False
+    if any(expression.args.get(key) for key in ("where", "group", "having", "qualify", "distinct")):
+        return None, None, False
+    if expression.find(exp.AggFunc) is not None or expression.find(exp.Window) is not None:
+        return None, None, False
+    limit = _literal_value(limit_node.expression)
+    offset_node = expression.args.get("offset")
+    offset = _literal_value(offset_node.expression) if offset_node is not None else 0
+    if not isinstance(limit, int) or not isinstance(offset, int):
+        return None, None, False
+    order_by: str | None = None
+    descending = False
+    order = expression.args.get("order")
+    if order is not None:
+        aliases = {projection.alias.lower() for projection in expression.expressions if isinstance(projection, exp.Alias)}
+        keys = order.expressions
+        order_by = _column_name(keys[0].this, qualifiers) if len(keys) == 1 else None
+        if order_by is None or order_by.lower() in aliases:
+            return None, None, False
+        descending = bool(keys[0].args.get("desc"))
+    return limit + offset, order_by, descending
+
+
+def _column_name(node: exp.Expression | None, qualifiers: set[str]) -> str | None:
+    if not isinstance(node, exp.Column) or isinstance(node.this, exp.Star):
+        return None
+    if node.table and node.table.lower() not in qualifiers:
+        return None
+    return node.name or None
+
+
+def _literal_value(node: exp.Expression | None) -> Any:
+    if isinstance(node, exp.Cast):
+        node = node.this
+    if isinstance(node, exp.Boolean):
+        return bool(node.this)
+    negate = isinstance(node, exp.Neg)
+    if negate:
+        node = node.this
+    if not isinstance(node, exp.Literal):
+        return _NOT_A_LITERAL
+    if node.is_string:
+        return _NOT_A_LITERAL if negate else node.this
+    try:
+        value: int | float = int(node.this)
+    except ValueError:
+        value = float(node.this)
+    return -value if negate else value
+
+
 class ApiConnectorRemoteSource(RemoteSource):
+    """
+    Runs sub-plan SQL over API resources loaded into an in-memory DuckDB.
+
+    Only the bindings the SQL references are fetched; SQL naming no known binding
+    reads the sub-plan's own. Every page of a resource is
+    followed; pages the connector can address up front (`remaining_cursors`) are
+    requested concurrently, at most `max_concurrent_pages` at a time, and each page
+    is converted to Arrow as it arrives rather than accumulating raw records.
+
+    Filters, projections and limits of single-table sub-plans are offered to the
+    connector as an `ApiResourceQuery`; DuckDB still evaluates the full SQL, so the
+    connector only has to return a superset of the matching records.
+    """
+
     def __init__(
         self,
         *,
@@ -30,11 +230,15 @@ class ApiConnectorRemoteSource(RemoteSource):
         connector: ApiConnector,
         bindings: list[VirtualTableBinding],
         logger: logging.Logger | None = None,
+        max_concurrent_pages: int = 4,
+        max_pages: int = 10_000,
     ) -> None:
         self.source_id = source_id
         self._connector = connector
         self._bindings = {binding.table_key: binding for binding in bindings}
         self._logger = logger or logging.getLogger(__name__)
+        self._max_concurrent_pages = max(1, max_concurrent_pages)
+        self._max_pages = max(1, max_pages)
 
     def capabilities(self) -> SourceCapabilities:
         return SourceCapabilities(
@@ -48,21 +252,45 @@ class ApiConnectorRemoteSource(RemoteSource):
     def dialect(self) -> str:
         return "duckdb"
 
-    async def execute(self, subplan: SourceSubplan) -> RemoteExecutionResult:
+    async def execute(
+        self,
+        subplan: SourceSubplan,
+        *,
+        cancellation: CancellationToken | None = None,
+    ) -> RemoteExecutionResult:
         self._logger.debug("Executing remote subplan stage=%s source=%s", subplan.stage_id, self.source_id)
         started = time.perf_counter()
         connection = duckdb.connect(database=":memory:")
         try:
-            await self._register_bindings(connection=connection)
             sql = (subplan.sql or "").strip()
             if not sql:
                 binding = self._require_binding(subplan.table_key)
                 sql = f"SELECT * FROM {self._qualified_relation_name(binding)}"
-            result = connection.execute(sql)
-            table = result.fetch_arrow_table()
+            expression = self._parse(sql)
+            bindings, aliases = self._referenced_bindings(expression=expression, table_key=subplan.table_key)
+            queries = {binding.table_key: derive_resource_query(expression, binding) for binding in bindings}
+            if len(aliases) == 1:
+                queries[subplan.table_key] = derive_resource_query(
+                    expression,
+                    bindings[0],
+                    table_name=aliases[0][1],
+                )
+            await self._register_bindings(
+                connection=connection,
+                bindings=bindings,
+                queries=queries,
+                aliases={subplan.table_key: aliases} if aliases else None,
+            )
+            query_started = time.perf_counter()
+            table = await execute_duckdb_arrow(connection, sql, cancellation=cancellation)
+            finished = time.perf_counter()
             return RemoteExecutionResult(
-                table=table if isinstance(table, pa.Table) else pa.table({}),
-                elapsed_ms=int((time.perf_counter() - started) * 1000),
+                table=table,
+                elapsed_ms=int((finished - started) * 1000),
+                phases_ms={
+                    "api_fetch": int((query_started - started) * 1000),
+                    "local_query": int((finished - query_started) * 1000),
+                },
             )
         finally:
             connection.close()
@@ -72,9 +300,17 @@ class ApiConnectorRemoteSource(RemoteSource):
         if table_binding.stats is not None:
             return table_binding.stats
 
+        # Only the first page is read: the planner must not download the resource that
+        # execution is about to fetch anyway.
         try:
-            arrow_table = await self._fetch_binding_table(table_binding)
-            row_count = float(arrow_table.num_rows)
+            arrow_table, first_page = await self._fetch_first_page(table_binding)
+            if first_page.remaining_cursors:
+                pages = 1 + len(first_page.remaining_cursors)
+            elif first_page.next_cursor:
+                pages = _UNSEEN_PAGES_ESTIMATE
+            else:
+                pages = 1
+            row_count = float(arrow_table.num_rows * pages)
             bytes_per_row = 128.0
             if arrow_table.num_rows > 0:
                 bytes_per_row = max(1.0, float(arrow_table.nbytes) / float(arrow_table.num_rows))
@@ -84,35 +320,214 @@ class ApiConnectorRemoteSource(RemoteSource):
             self._logger.warning("Falling back to heuristic stats for source=%s table=%s", self.source_id, table_name)
             return TableStatistics(row_count_estimate=1_000_000.0, bytes_per_row=128.0)
 
+    def _parse(self, sql: str) -> exp.Expression | None:
+        try:
+            return sqlglot.parse_one(sql, read="duckdb")
+        except sqlglot.errors.ParseError:
+            self._logger.debug("Could not parse subplan SQL for source=%s; fetching every binding", self.source_id)
+            return None
+
+    def _referenced_bindings(
+        self,
+        *,
+        expression: exp.Expression | None,
+        table_key: str,
+    ) -> tuple[list[VirtualTableBinding], list[tuple[str, str]]]:
+        """
+        Resolve the bindings a sub-plan reads, falling back to every binding if the SQL cannot be parsed.
+
+        When the SQL names no known binding, the sub-plan's own binding is read and the
+        `(schema, table)` names it referenced are returned as aliases for it.
+        """
+        if expression is None:
+            return list(self._bindings.values()), []
+
+        cte_names = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+        referenced: set[tuple[str, str]] = set()
+        for table in expression.find_all(exp.Table):
+            name = table.name.lower()
+            if not name or (not table.db and name in cte_names):
+                continue
+            referenced.add((table.db.lower(), name))
+
+        selected = [
+            binding
+            for binding in self._bindings.values()
+            if any(
+                name == str(binding.table).lower()
+                and (not schema or schema == str(binding.schema_name or "").lower())
+                for schema, name in referenced
+            )
+        ]
+        if not selected:
+            return [self._require_binding(table_key)], sorted(referenced)
+        return selected, []
+
     async def _register_bindings(
         self,
         *,
         connection: duckdb.DuckDBPyConnection,
+        bindings: list[VirtualTableBinding],
+        queries: dict[str, ApiResourceQuery | None] | None = None,
+        aliases: dict[str, list[tuple[str, str]]] | None = None,
     ) -> None:
-        for index, binding in enumerate(self._bindings.values()):
-            arrow_table = await self._fetch_binding_table(binding)
+        tables = await asyncio.gather(
+            *(
+                self._fetch_binding_table(binding, query=(queries or {}).get(binding.table_key))
+                for binding in bindings
+            )
+        )
+        for index, (binding, arrow_table) in enumerate(zip(bindings, tables)):
             temp_name = self._temporary_relation_name(index=index, binding=binding)
             connection.register(temp_name, arrow_table)
             if binding.schema_name:
                 connection.execute(
                     f"CREATE SCHEMA IF NOT EXISTS {self._quote_identifier(binding.schema_name)}"
                 )
-            connection.execute(
-                "CREATE OR REPLACE VIEW "
-                f"{self._qualified_relation_name(binding)} AS SELECT * FROM {self._quote_identifier(temp_name)}"
-            )
+            relations = [self._qualified_relation_name(binding)]
+            for schema_name, table_name in (aliases or {}).get(binding.table_key, []):
+                relation = self._quote_identifier(table_name)
+                if schema_name:
+                    connection.execute(f"CREATE SCHEMA IF NOT EXISTS {self._quote_identifier(schema_name)}")
+                    relation = f"{self._quote_identifier(schema_name)}.{relation}"
+                relations.append(relation)
+            for relation in dict.fromkeys(relations):
+                connection.execute(
+                    f"CREATE OR REPLACE VIEW {relation} AS SELECT * FROM {self._quote_identifier(temp_name)}"
+                )
 
-    async def _fetch_binding_table(self, binding: VirtualTableBinding) -> pa.Table:
+    async def _page_reader(
+        self,
+        binding: VirtualTableBinding,
+        query: ApiResourceQuery | None,
+    ) -> tuple[str, dict[str, Any], int | None, Callable[[ApiExtractResult], pa.Table]]:
+        """The root resource, extract kwargs, row limit and page-to-Arrow conversion for `binding`."""
         resource_path = self._resource_path(binding)
         root_resource_name = api_resource_root(resource_path)
-        extract_result = await self._connector.extract_resource(resource_name=root_resource_name)
-        rows = materialize_api_resource_rows(
-            resource_path=resource_path,
-            records=list(extract_result.records or []),
-            primary_key=await self._resource_primary_key(root_resource_name),
-            flatten=self._flatten_paths(binding),
+        primary_key = await self._resource_primary_key(root_resource_name)
+        flatten = self._flatten_paths(binding)
+        # Child resources are rows of nested arrays, so record-level hints do not apply to them.
+        extract_kwargs, row_limit = self._pushdown(
+            resource_name=root_resource_name,
+            query=query if resource_path == root_resource_name else None,
         )
-        return _records_to_arrow(rows.rows)
+
+        def _to_arrow(page: ApiExtractResult) -> pa.Table:
+            rows = materialize_api_resource_rows(
+                resource_path=resource_path,
+                records=list(page.records or []),
+                primary_key=primary_key,
+                flatten=flatten,
+            )
+            return _records_to_arrow(rows.rows)
+
+        return root_resource_name, extract_kwargs, row_limit, _to_arrow
+
+    async def _fetch_first_page(self, binding: VirtualTableBinding) -> tuple[pa.Table, ApiExtractResult]:
+        root_resource_name, extract_kwargs, _, to_arrow = await self._page_reader(binding, None)
+        first_page = await self._connector.extract_resource(resource_name=root_resource_name, **extract_kwargs)
+        return to_arrow(first_page), first_page
+
+    async def _fetch_binding_table(
+        self,
+        binding: VirtualTableBinding,
+        *,
+        query: ApiResourceQuery | None = None,
+    ) -> pa.Table:
+        root_resource_name, extract_kwargs, row_limit, _to_arrow = await self._page_reader(binding, query)
+        first_page = await self._connector.extract_resource(resource_name=root_resource_name, **extract_kwargs)
+        pages = [_to_arrow(first_page)]
+        fetched_rows = pages[0].num_rows
+        if first_page.remaining_cursors and row_limit is None:
+            pages.extend(
+                await self._fetch_pages_concurrently(
+                    resource_name=root_resource_name,
+                    cursors=first_page.remaining_cursors,
+                    to_arrow=_to_arrow,
+                    extract_kwargs=extract_kwargs,
+                )
+            )
+            return _concat_pages(pages)
+
+        cursor = first_page.next_cursor
+        seen_cursors: set[str] = set()
+        while cursor and cursor not in seen_cursors:
+            if row_limit is not None and fetched_rows >= row_limit:
+                break
+            if len(pages) >= self._max_pages:
+                self._logger.warning(
+                    "Stopped paginating source=%s resource=%s after %s pages",
+                    self.source_id,
+                    root_resource_name,
+                    len(pages),
+                )
+                break
+            seen_cursors.add(cursor)
+            page = await self._connector.extract_resource(
+                resource_name=root_resource_name,
+                cursor=cursor,
+                **extract_kwargs,
+            )
+            pages.append(_to_arrow(page))
+            fetched_rows += pages[-1].num_rows
+            cursor = page.next_cursor
+        return _concat_pages(pages)
+
+    def _pushdown(
+        self,
+        *,
+        resource_name: str,
+        query: ApiResourceQuery | None,
+    ) -> tuple[dict[str, Any], int | None]:
+        """
+        Resolve the extract kwargs and row limit for `query`.
+
+        Pagination may stop early at the limit only when the rows come back in the
+        query's order, i.e. the query has no ORDER BY or the connector sorts by it.
+        """
+        if query is None:
+            return {}, None
+        planner = getattr(self._connector, "plan_resource_query", None)
+        accepted = planner(resource_name, query) if callable(planner) else None
+        row_limit = query.limit
+        if query.order_by is not None and (
+            accepted is None
+            or accepted.order_by != query.order_by
+            or accepted.descending != query.descending
+        ):
+            row_limit = None
+        if accepted is None:
+            return {}, row_limit
+        return {"query": dataclasses.replace(accepted, limit=row_limit)}, row_limit
+
+    async def _fetch_pages_concurrently(
+        self,
+        *,
+        resource_name: str,
+        cursors: list[str],
+        to_arrow: Callable[[ApiExtractResult], pa.Table],
+        extract_kwargs: dict[str, Any],
+    ) -> list[pa.Table]:
+        if len(cursors) >= self._max_pages:
+            self._logger.warning(
+                "Limiting source=%s resource=%s to %s pages",
+                self.source_id,
+                resource_name,
+                self._max_pages,
+            )
+            cursors = cursors[: self._max_pages - 1]
+        semaphore = asyncio.Semaphore(self._max_concurrent_pages)
+
+        async def _fetch(cursor: str) -> pa.Table:
+            async with semaphore:
+                page = await self._connector.extract_resource(
+                    resource_name=resource_name,
+                    cursor=cursor,
+                    **extract_kwargs,
+                )
+            return to_arrow(page)
+
+        return list(await asyncio.gather(*(_fetch(cursor) for cursor in cursors)))
 
     def _require_binding(self, table_key: str) -> VirtualTableBinding:
         binding = self._bindings.get(table_key)
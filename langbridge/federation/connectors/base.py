@@ -1,8 +1,11 @@
-﻿
-from dataclasses import dataclass
+﻿import asyncio
+from dataclasses import dataclass, field
+from typing import Any
 
+import duckdb
 import pyarrow as pa
 
+from langbridge.federation.cancellation import CancellationToken
 from langbridge.federation.models.plans import SourceSubplan
 from langbridge.federation.models.virtual_dataset import TableStatistics, VirtualTableBinding
 
@@ -20,6 +23,7 @@ class SourceCapabilities:
 class RemoteExecutionResult:
     table: pa.Table
     elapsed_ms: int
+    phases_ms: dict[str, int] = field(default_factory=dict)
 
 
 class RemoteSource:
@@ -31,8 +35,32 @@ class RemoteSource:
     def dialect(self) -> str:
         raise NotImplementedError
 
-    async def execute(self, subplan: SourceSubplan) -> RemoteExecutionResult:
+    async def execute(
+        self,
+        subplan: SourceSubplan,
+        *,
+        cancellation: CancellationToken | None = None,
+    ) -> RemoteExecutionResult:
         raise NotImplementedError
 
     async def estimate_table_stats(self, binding: VirtualTableBinding) -> TableStatistics:
         raise NotImplementedError
+
+
+async def execute_duckdb_arrow(
+    connection: duckdb.DuckDBPyConnection,
+    sql: str,
+    *,
+    cancellation: CancellationToken | None = None,
+) -> pa.Table:
+    """Run a DuckDB query off the event loop, interrupting it if the query is cancelled."""
+
+    def _execute() -> Any:
+        return connection.execute(sql).fetch_arrow_table()
+
+    work = asyncio.to_thread(_execute)
+    if cancellation is None:
+        table = await work
+    else:
+        table = await cancellation.run(work, on_cancel=connection.interrupt)
+    return table if isinstance(table, pa.Table) else pa.table({})
@@ -5,20 +5,26 @@ from typing import Any
 
 import duckdb
 import pyarrow as pa
+import sqlglot
 
 from langbridge.federation.utils import (
     resolve_local_storage_path,
 )
+from langbridge.federation.cancellation import CancellationToken
+from langbridge.federation.connectors.api import derive_resource_query
 from langbridge.federation.connectors.base import (
     RemoteExecutionResult,
     RemoteSource,
     SourceCapabilities,
+    execute_duckdb_arrow,
 )
 from langbridge.federation.models.plans import SourceSubplan
 from langbridge.federation.models.virtual_dataset import (
     TableStatistics,
     VirtualTableBinding,
 )
+from langbridge import telemetry
+from langbridge.storage.dataset_table import DatasetTable, StatsPredicate, is_dataset_table
 
 
 class DuckDbFileRemoteSource(RemoteSource):
@@ -45,17 +51,31 @@ class DuckDbFileRemoteSource(RemoteSource):
     def dialect(self) -> str:
         return "duckdb"
 
-    async def execute(self, subplan: SourceSubplan) -> RemoteExecutionResult:
+    async def execute(
+        self,
+        subplan: SourceSubplan,
+        *,
+        cancellation: CancellationToken | None = None,
+    ) -> RemoteExecutionResult:
         binding = self._require_binding(subplan.table_key)
         started = time.perf_counter()
         connection = duckdb.connect(database=":memory:")
         try:
-            self._register_binding(connection=connection, binding=binding)
-            result = connection.execute(subplan.sql)
-            table = result.fetch_arrow_table()
+            self._register_binding(
+                connection=connection,
+                binding=binding,
+                predicates=self._stats_predicates(subplan.sql, binding),
+            )
+            query_started = time.perf_counter()
+            table = await execute_duckdb_arrow(connection, subplan.sql, cancellation=cancellation)
+            finished = time.perf_counter()
             return RemoteExecutionResult(
-                table=table if isinstance(table, pa.Table) else pa.table({}),
-                elapsed_ms=int((time.perf_counter() - started) * 1000),
+                table=table,
+                elapsed_ms=int((finished - started) * 1000),
+                phases_ms={
+                    "register": int((query_started - started) * 1000),
+                    "file_scan": int((finished - query_started) * 1000),
+                },
             )
         except Exception as e:
             self._logger.error("Error executing subplan on file source %s: %s", self.source_id, str(e), exc_info=True)
@@ -68,6 +88,13 @@ class DuckDbFileRemoteSource(RemoteSource):
         if table_binding.stats is not None:
             return table_binding.stats
 
+        table = self._dataset_table(table_binding)
+        snapshot = table.current_snapshot() if table is not None else None
+        if snapshot is not None:
+            row_count = snapshot.row_count
+            bytes_per_row = max(1.0, snapshot.size_bytes / row_count) if row_count > 0 else 128.0
+            return TableStatistics(row_count_estimate=float(row_count), bytes_per_row=bytes_per_row)
+
         connection = duckdb.connect(database=":memory:")
         try:
             self._register_binding(connection=connection, binding=table_binding)
@@ -106,13 +133,18 @@ class DuckDbFileRemoteSource(RemoteSource):
         *,
         connection: duckdb.DuckDBPyConnection,
         binding: VirtualTableBinding,
+        predicates: list[StatsPredicate] | None = None,
     ) -> None:
         metadata = binding.metadata if isinstance(binding.metadata, dict) else {}
         storage_uri = self._storage_uri_from_binding(binding)
         file_format = str(metadata.get("file_format") or "").strip().lower()
         if file_format not in {"csv", "parquet"}:
             raise ValueError(f"Unsupported file format '{file_format}' for binding '{binding.table_key}'.")
-        scan_sql = self._build_scan_sql(storage_uri=storage_uri, file_format=file_format, metadata=metadata)
+        table = self._dataset_table(binding) if file_format == "parquet" else None
+        if table is not None:
+            scan_sql = self._build_table_scan_sql(table=table, predicates=predicates or [])
+        else:
+            scan_sql = self._build_scan_sql(storage_uri=storage_uri, file_format=file_format, metadata=metadata)
         if binding.schema_name:
             connection.execute(
                 f"CREATE SCHEMA IF NOT EXISTS {self._quote_identifier(binding.schema_name)}"
@@ -129,6 +161,44 @@ class DuckDbFileRemoteSource(RemoteSource):
             raise ValueError(f"File binding '{binding.table_key}' is missing storage_uri metadata.")
         return storage_uri
 
+    def _dataset_table(self, binding: VirtualTableBinding) -> DatasetTable | None:
+        try:
+            path = resolve_local_storage_path(self._storage_uri_from_binding(binding))
+        except ValueError:
+            return None
+        return DatasetTable(path) if is_dataset_table(path) else None
+
+    def _build_table_scan_sql(self, *, table: DatasetTable, predicates: list[StatsPredicate]) -> str:
+        # Resolve the snapshot once so the whole scan reads one consistent file list.
+        snapshot = table.current_snapshot()
+        if snapshot is None:
+            raise FileNotFoundError(f"Dataset table '{table.root}' has no committed snapshot.")
+        scanned = len(snapshot.prune(predicates))
+        labels = {"source": self.source_id}
+        telemetry.increment(telemetry.DATASET_FILES_SCANNED, scanned, labels={**labels, "result": "scanned"})
+        telemetry.increment(
+            telemetry.DATASET_FILES_SCANNED,
+            len(snapshot.data_files) - scanned,
+            labels={**labels, "result": "pruned"},
+        )
+        return table.scan_sql(snapshot, predicates=predicates)
+
+    @staticmethod
+    def _stats_predicates(sql: str | None, binding: VirtualTableBinding) -> list[StatsPredicate]:
+        if not sql:
+            return []
+        try:
+            expression = sqlglot.parse_one(sql, read="duckdb")
+        except sqlglot.errors.ParseError:
+            return []
+        query = derive_resource_query(expression, binding)
+        if query is None:
+            return []
+        return [
+            StatsPredicate(column=item.field, operator=item.operator, value=item.value)
+            for item in query.filters
+        ]
+
     @staticmethod
     def _build_scan_sql(*, storage_uri: str, file_format: str, metadata: dict[str, Any]) -> str:
         # path = resolve_local_storage_path(storage_uri).as_posix().replace("'", "''")
@@ -8,10 +8,12 @@ import duckdb
 import pyarrow as pa
 
 from langbridge.connectors.base import StorageConnector
+from langbridge.federation.cancellation import CancellationToken
 from langbridge.federation.connectors.base import (
     RemoteExecutionResult,
     RemoteSource,
     SourceCapabilities,
+    execute_duckdb_arrow,
 )
 from langbridge.federation.models.plans import SourceSubplan
 from langbridge.federation.models.virtual_dataset import (
@@ -51,18 +53,28 @@ class DuckDbParquetRemoteSource(RemoteSource):
     def dialect(self) -> str:
         return "duckdb"
 
-    async def execute(self, subplan: SourceSubplan) -> RemoteExecutionResult:
+    async def execute(
+        self,
+        subplan: SourceSubplan,
+        *,
+        cancellation: CancellationToken | None = None,
+    ) -> RemoteExecutionResult:
         binding = self._require_binding(subplan.table_key)
         started = time.perf_counter()
         connection = duckdb.connect(database=":memory:")
         try:
             await self._configure_connection(connection=connection, binding=binding)
             await self._register_binding(connection=connection, binding=binding)
-            result = connection.execute(subplan.sql)
-            table = result.fetch_arrow_table()
+            query_started = time.perf_counter()
+            table = await execute_duckdb_arrow(connection, subplan.sql, cancellation=cancellation)
+            finished = time.perf_counter()
             return RemoteExecutionResult(
-                table=table if isinstance(table, pa.Table) else pa.table({}),
-                elapsed_ms=int((time.perf_counter() - started) * 1000),
+                table=table,
+                elapsed_ms=int((finished - started) * 1000),
+                phases_ms={
+                    "register": int((query_started - started) * 1000),
+                    "file_scan": int((finished - query_started) * 1000),
+                },
             )
         except Exception as exc:
             self._logger.error(
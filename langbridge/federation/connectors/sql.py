@@ -1,11 +1,13 @@
 
 import logging
 import math
+import time
 from typing import Any
 
 import pyarrow as pa
 
 from langbridge.connectors.base.connector import QueryResult, SqlConnector
+from langbridge.federation.cancellation import CancellationToken
 from langbridge.federation.connectors.base import RemoteExecutionResult, RemoteSource, SourceCapabilities
 from langbridge.federation.models.plans import SourceSubplan
 from langbridge.federation.models.virtual_dataset import TableStatistics, VirtualTableBinding
@@ -48,10 +50,30 @@ class SqlConnectorRemoteSource(RemoteSource):
     def dialect(self) -> str:
         return self._dialect
 
-    async def execute(self, subplan: SourceSubplan) -> RemoteExecutionResult:
+    async def execute(
+        self,
+        subplan: SourceSubplan,
+        *,
+        cancellation: CancellationToken | None = None,
+    ) -> RemoteExecutionResult:
         self._logger.debug("Executing remote subplan stage=%s source=%s", subplan.stage_id, self.source_id)
-        result = await self._connector.execute(subplan.sql)
-        return RemoteExecutionResult(table=_rows_to_arrow(result), elapsed_ms=result.elapsed_ms)
+        if cancellation is None:
+            result = await self._connector.execute(subplan.sql)
+        else:
+            cancellation.raise_if_cancelled()
+            remaining_s = cancellation.remaining_s()
+            timeout_s = max(1, math.ceil(remaining_s)) if remaining_s is not None else 30
+            result = await cancellation.run(self._connector.execute(subplan.sql, timeout_s=timeout_s))
+        convert_started = time.perf_counter()
+        table = _rows_to_arrow(result)
+        return RemoteExecutionResult(
+            table=table,
+            elapsed_ms=result.elapsed_ms,
+            phases_ms={
+                "source_query": result.elapsed_ms,
+                "arrow_convert": int((time.perf_counter() - convert_started) * 1000),
+            },
+        )
 
     async def estimate_table_stats(self, binding: VirtualTableBinding) -> TableStatistics:
         if binding.stats is not None:
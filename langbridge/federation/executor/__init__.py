@@ -1,3 +1,4 @@
+from langbridge.federation.executor.adaptive import AdaptiveReplanner, DynamicFilterCandidate
 from langbridge.federation.executor.artifact_store import ArtifactStore
 from langbridge.federation.executor.cache_context import (
     StageCacheDescriptor,
@@ -16,6 +17,8 @@ from langbridge.federation.executor.scheduler import (
 from langbridge.federation.executor.stage_executor import StageExecutionContext, StageExecutor
 
 __all__ = [
+    "AdaptiveReplanner",
+    "DynamicFilterCandidate",
     "ArtifactStore",
     "StageCacheDescriptor",
     "StageCacheInput",
@@ -0,0 +1,350 @@
+import math
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Mapping
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import sqlglot
+from sqlglot import exp
+
+from langbridge.federation.connectors import RemoteSource
+from langbridge.federation.executor.artifact_store import ArtifactStore
+from langbridge.federation.models.plans import PhysicalPlan, StageArtifact, StageDefinition, StageType
+from langbridge.federation.models.virtual_dataset import FederationWorkflow, TableStatistics
+from langbridge.federation.planner.optimizer import build_scan_sql, choose_join_order, choose_join_strategies
+from langbridge.federation.planner.parser import split_conjunctive_predicates
+
+_SAFE_JOIN_KINDS = {"", "inner", "outer", "cross"}
+
+
+@dataclass(frozen=True, slots=True)
+class DynamicFilterCandidate:
+    """An equi-join edge where `target_alias` may be pre-filtered by the key values of `build_alias`."""
+
+    target_alias: str
+    target_column: str
+    build_alias: str
+    build_column: str
+
+
+class AdaptiveReplanner:
+    """
+    Re-optimizes the part of a federated plan that has not started yet from observed stage output.
+
+    Before execution, scans whose join partner is expected to be small enough to supply
+    a dynamic filter are deferred behind it. After every batch the scheduler calls
+    `replan`: completed small scans inject `column IN (...)` filters into pending scans,
+    and once every scan feeding the local stage has finished, its join order and join
+    strategies are re-derived from actual rows and bytes instead of estimates.
+    """
+
+    def __init__(
+        self,
+        *,
+        workflow: FederationWorkflow,
+        sources: Mapping[str, RemoteSource],
+        artifact_store: ArtifactStore,
+    ) -> None:
+        self._workflow = workflow
+        self._sources = sources
+        self._artifact_store = artifact_store
+        self._max_values = max(0, workflow.dynamic_filter_max_values)
+        self._candidates: list[DynamicFilterCandidate] | None = None
+
+    def prepare(self, plan: PhysicalPlan) -> PhysicalPlan:
+        """Defer large scans behind a join partner estimated to fit in a dynamic filter."""
+        stages = {stage.stage_id: stage for stage in plan.stages}
+        scan_ids = _scan_stage_ids(plan)
+        deferred: set[str] = set()
+        builders: set[str] = set()
+
+        def _estimate(stage_id: str) -> float:
+            subplan = stages[stage_id].subplan
+            if subplan is None or subplan.estimated_rows is None:
+                return math.inf
+            return subplan.estimated_rows
+
+        candidates = sorted(
+            self._dynamic_filter_candidates(plan),
+            key=lambda candidate: _estimate(scan_ids[candidate.build_alias]),
+        )
+        for candidate in candidates:
+            target_id = scan_ids[candidate.target_alias]
+            build_id = scan_ids[candidate.build_alias]
+            build_rows = _estimate(build_id)
+            if build_rows > self._max_values or _estimate(target_id) <= build_rows:
+                continue
+            if target_id in builders or build_id in deferred or not self._can_filter(stages[target_id]):
+                continue
+            target = stages[target_id]
+            if build_id not in target.dependencies:
+                stages[target_id] = target.model_copy(update={"dependencies": [*target.dependencies, build_id]})
+            deferred.add(target_id)
+            builders.add(build_id)
+
+        if not deferred:
+            return plan
+        return plan.model_copy(update={"stages": [stages[stage.stage_id] for stage in plan.stages]})
+
+    def replan(
+        self,
+        *,
+        plan: PhysicalPlan,
+        workspace_id: str,
+        artifacts: Mapping[str, StageArtifact],
+        pending: set[str],
+    ) -> PhysicalPlan:
+        """Rewrite pending stages of `plan` using the artifacts of the stages completed so far."""
+        stages = {stage.stage_id: stage for stage in plan.stages}
+        scan_ids = _scan_stage_ids(plan)
+        changed = False
+        build_tables: dict[str, pa.Table] = {}
+
+        for candidate in self._dynamic_filter_candidates(plan):
+            target_id = scan_ids[candidate.target_alias]
+            build_id = scan_ids[candidate.build_alias]
+            target = stages[target_id]
+            if target_id not in pending or build_id in pending:
+                continue
+            if build_id in target.metadata.get("dynamic_filter_inputs", []):
+                continue
+            build_artifact = artifacts.get(build_id)
+            if build_artifact is None or build_artifact.rows > self._max_values or not self._can_filter(target):
+                continue
+            if build_id not in build_tables:
+                build_tables[build_id] = self._artifact_store.read_stage_output(
+                    workspace_id=workspace_id,
+                    plan_id=plan.plan_id,
+                    stage_id=build_id,
+                )
+            predicate = self._dynamic_filter(candidate=candidate, build_table=build_tables[build_id])
+            if predicate is None:
+                continue
+            rewritten = self._apply_dynamic_filter(stage=target, predicate=predicate, build_stage_id=build_id)
+            if rewritten is not None:
+                stages[target_id] = rewritten
+                changed = True
+
+        join_order = plan.join_order
+        join_strategies = plan.join_strategies
+        result_stage = stages.get(plan.result_stage_id)
+        if (
+            result_stage is not None
+            and result_stage.stage_type == StageType.LOCAL_COMPUTE
+            and result_stage.stage_id in pending
+            and not result_stage.metadata.get("replanned_from_actuals")
+            and all(dependency in artifacts for dependency in result_stage.dependencies)
+        ):
+            alias_stats = {
+                alias: _observed_stats(artifacts[stage_id])
+                for alias, stage_id in scan_ids.items()
+                if stage_id in artifacts
+            }
+            join_order = choose_join_order(logical_plan=plan.logical_plan, alias_stats=alias_stats)
+            join_strategies = choose_join_strategies(
+                logical_plan=plan.logical_plan,
+                alias_stats=alias_stats,
+                broadcast_threshold_bytes=self._workflow.broadcast_threshold_bytes,
+            )
+            stages[result_stage.stage_id] = result_stage.model_copy(
+                update={
+                    "metadata": {
+                        **result_stage.metadata,
+                        "join_order": join_order,
+                        "join_strategies": {key: value.value for key, value in join_strategies.items()},
+                        "replanned_from_actuals": True,
+                    }
+                }
+            )
+            changed = True
+
+        if not changed:
+            return plan
+        return plan.model_copy(
+            update={
+                "stages": [stages[stage.stage_id] for stage in plan.stages],
+                "join_order": join_order,
+                "join_strategies": join_strategies,
+            }
+        )
+
+    def _dynamic_filter_candidates(self, plan: PhysicalPlan) -> list[DynamicFilterCandidate]:
+        if self._candidates is None:
+            self._candidates = _find_dynamic_filter_candidates(plan)
+        return self._candidates
+
+    def _can_filter(self, stage: StageDefinition) -> bool:
+        if stage.stage_type != StageType.REMOTE_SCAN or stage.subplan is None:
+            return False
+        source = self._sources.get(stage.subplan.source_id)
+        return source is not None and source.capabilities().pushdown_filter
+
+    def _dynamic_filter(
+        self,
+        *,
+        candidate: DynamicFilterCandidate,
+        build_table: pa.Table,
+    ) -> exp.Expression | None:
+        column_index = _column_index(build_table, candidate.build_column)
+        if column_index is None:
+            return None
+        values = [value for value in pc.unique(build_table.column(column_index)).to_pylist() if value is not None]
+        if not values:
+            # Nothing on the build side can satisfy the equi-join, so neither can the target.
+            return exp.EQ(this=exp.Literal.number(1), expression=exp.Literal.number(0))
+        if len(values) > self._max_values:
+            return None
+        literals = [_literal(value) for value in sorted(values)]
+        if any(literal is None for literal in literals):
+            return None
+        return exp.In(
+            this=exp.column(candidate.target_column, table=candidate.target_alias),
+            expressions=literals,
+        )
+
+    def _apply_dynamic_filter(
+        self,
+        *,
+        stage: StageDefinition,
+        predicate: exp.Expression,
+        build_stage_id: str,
+    ) -> StageDefinition | None:
+        subplan = stage.subplan
+        if subplan is None:
+            return None
+        binding = self._workflow.dataset.tables.get(subplan.table_key)
+        source = self._sources.get(subplan.source_id)
+        if binding is None or source is None:
+            return None
+        dialect = source.dialect()
+        dynamic_filters = [*stage.metadata.get("dynamic_filters", []), predicate.sql(dialect=dialect)]
+        try:
+            filters = [sqlglot.parse_one(item, read=dialect) for item in [*subplan.pushed_filters, *dynamic_filters]]
+        except sqlglot.errors.ParseError:
+            return None
+        sql = build_scan_sql(
+            alias=subplan.alias,
+            binding=binding,
+            projected_columns=subplan.projected_columns,
+            pushed_filters=filters,
+            pushed_limit=subplan.pushed_limit,
+            dialect=dialect,
+        )
+        dependencies = list(stage.dependencies)
+        if build_stage_id not in dependencies:
+            dependencies.append(build_stage_id)
+        return stage.model_copy(
+            update={
+                "subplan": subplan.model_copy(update={"sql": sql}),
+                "dependencies": dependencies,
+                "metadata": {
+                    **stage.metadata,
+                    "dynamic_filters": dynamic_filters,
+                    "dynamic_filter_inputs": [*stage.metadata.get("dynamic_filter_inputs", []), build_stage_id],
+                },
+            }
+        )
+
+
+def _find_dynamic_filter_candidates(plan: PhysicalPlan) -> list[DynamicFilterCandidate]:
+    """
+    Collect equi-join edges of the local stage where a semi-join reduction is safe.
+
+    Filtering one join input by the keys of another only drops rows the join itself
+    would drop, which holds for both sides of inner joins and for the null-supplying
+    side of a LEFT join. Queries with RIGHT/FULL/semi/anti joins are left alone.
+    """
+    scan_ids = _scan_stage_ids(plan)
+    result_stage = next((stage for stage in plan.stages if stage.stage_id == plan.result_stage_id), None)
+    if (
+        result_stage is None
+        or result_stage.stage_type != StageType.LOCAL_COMPUTE
+        or not result_stage.sql
+        or plan.logical_plan.has_cte
+        or len(scan_ids) < 2
+    ):
+        return []
+    try:
+        expression = sqlglot.parse_one(result_stage.sql, read=result_stage.sql_dialect or "duckdb")
+    except sqlglot.errors.ParseError:
+        return []
+    if not isinstance(expression, exp.Select):
+        return []
+
+    table_references: dict[str, int] = {}
+    for table in expression.find_all(exp.Table):
+        table_references[table.name] = table_references.get(table.name, 0) + 1
+
+    joins = expression.args.get("joins") or []
+    for join in joins:
+        if str(join.side or "").lower() in {"right", "full"} or str(join.kind or "").lower() not in _SAFE_JOIN_KINDS:
+            return []
+
+    candidates: list[DynamicFilterCandidate] = []
+    for join in joins:
+        joined_alias = join.this.alias_or_name if isinstance(join.this, exp.Table) else None
+        on_expr = join.args.get("on")
+        if joined_alias not in scan_ids or on_expr is None:
+            continue
+        left_join = str(join.side or "").lower() == "left"
+        for predicate in split_conjunctive_predicates(on_expr):
+            if not isinstance(predicate, exp.EQ):
+                continue
+            left, right = predicate.this, predicate.expression
+            if not isinstance(left, exp.Column) or not isinstance(right, exp.Column):
+                continue
+            if left.table not in scan_ids or right.table not in scan_ids or left.table == right.table:
+                continue
+            for target, build in ((left, right), (right, left)):
+                if left_join and target.table != joined_alias:
+                    continue
+                if table_references.get(scan_ids[target.table], 0) != 1:
+                    continue
+                candidates.append(
+                    DynamicFilterCandidate(
+                        target_alias=target.table,
+                        target_column=target.name,
+                        build_alias=build.table,
+                        build_column=build.name,
+                    )
+                )
+    return candidates
+
+
+def _scan_stage_ids(plan: PhysicalPlan) -> dict[str, str]:
+    return {
+        stage.subplan.alias: stage.stage_id
+        for stage in plan.stages
+        if stage.stage_type == StageType.REMOTE_SCAN and stage.subplan is not None
+    }
+
+
+def _observed_stats(artifact: StageArtifact) -> TableStatistics:
+    return TableStatistics(
+        row_count_estimate=float(artifact.rows),
+        bytes_per_row=float(artifact.bytes_written / max(artifact.rows, 1)),
+    )
+
+
+def _column_index(table: pa.Table, column_name: str) -> int | None:
+    lowered = column_name.lower()
+    for index, name in enumerate(table.column_names):
+        if name.lower() == lowered:
+            return index
+    return None
+
+
+def _literal(value: object) -> exp.Expression | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, Decimal)):
+        return exp.Literal.number(value)
+    if isinstance(value, float):
+        return exp.Literal.number(value) if math.isfinite(value) else None
+    if isinstance(value, str):
+        return exp.Literal.string(value)
+    return None
+
+
+__all__ = ["AdaptiveReplanner", "DynamicFilterCandidate"]
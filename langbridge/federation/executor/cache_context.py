@@ -120,7 +120,7 @@ class StageCacheResolver:
         dependency_caches: Mapping[str, StageCacheDescriptor | None] | None = None,
     ) -> StageCacheDescriptor:
         if stage.stage_type in {StageType.REMOTE_SCAN, StageType.REMOTE_FULL_QUERY}:
-            return self._describe_remote_stage(stage=stage)
+            return self._describe_remote_stage(stage=stage, dependency_caches=dependency_caches or {})
         if stage.stage_type == StageType.LOCAL_COMPUTE:
             return self._describe_local_stage(stage=stage, dependency_caches=dependency_caches or {})
         return StageCacheDescriptor(
@@ -130,13 +130,26 @@ class StageCacheResolver:
             reason=f"Unsupported stage type '{stage.stage_type}' for cache resolution.",
         )
 
-    def _describe_remote_stage(self, *, stage: StageDefinition) -> StageCacheDescriptor:
+    def _describe_remote_stage(
+        self,
+        *,
+        stage: StageDefinition,
+        dependency_caches: Mapping[str, StageCacheDescriptor | None],
+    ) -> StageCacheDescriptor:
         table_keys = self._stage_table_keys(stage=stage)
         inputs = [
             self._describe_binding(self._bindings[table_key])
             for table_key in table_keys
             if table_key in self._bindings
         ]
+        if inputs:
+            # Dynamic filters are derived from other stages' output, so those become inputs too.
+            inputs.extend(
+                _dependency_inputs(
+                    dependency_stage_ids=stage.metadata.get("dynamic_filter_inputs", []),
+                    dependency_caches=dependency_caches,
+                )
+            )
         if not inputs:
             return StageCacheDescriptor(
                 cacheable=False,
@@ -152,36 +165,10 @@ class StageCacheResolver:
         stage: StageDefinition,
         dependency_caches: Mapping[str, StageCacheDescriptor | None],
     ) -> StageCacheDescriptor:
-        inputs: list[StageCacheInput] = []
-        for dependency_stage_id in sorted(stage.dependencies):
-            dependency_cache = dependency_caches.get(dependency_stage_id)
-            if dependency_cache is None:
-                inputs.append(
-                    StageCacheInput(
-                        kind=StageCacheInputKind.DEPENDENCY,
-                        cache_policy=StageCacheInputPolicy.UNKNOWN,
-                        dependency_stage_id=dependency_stage_id,
-                        reason="Dependency cache metadata is unavailable.",
-                    )
-                )
-                continue
-            inputs.append(
-                StageCacheInput(
-                    kind=StageCacheInputKind.DEPENDENCY,
-                    cache_policy=(
-                        StageCacheInputPolicy.DEPENDENCY
-                        if dependency_cache.cacheable and dependency_cache.cache_key
-                        else StageCacheInputPolicy.UNKNOWN
-                    ),
-                    dependency_stage_id=dependency_stage_id,
-                    freshness_key=dependency_cache.cache_key,
-                    reason=(
-                        dependency_cache.reason
-                        if not dependency_cache.cacheable
-                        else None
-                    ),
-                )
-            )
+        inputs = _dependency_inputs(
+            dependency_stage_ids=stage.dependencies,
+            dependency_caches=dependency_caches,
+        )
         return StageCacheDescriptor.from_inputs(inputs=inputs)
 
     def _stage_table_keys(self, *, stage: StageDefinition) -> list[str]:
@@ -252,6 +239,44 @@ class StageCacheResolver:
         )
 
 
+def _dependency_inputs(
+    *,
+    dependency_stage_ids: list[str],
+    dependency_caches: Mapping[str, StageCacheDescriptor | None],
+) -> list[StageCacheInput]:
+    inputs: list[StageCacheInput] = []
+    for dependency_stage_id in sorted(dependency_stage_ids):
+        dependency_cache = dependency_caches.get(dependency_stage_id)
+        if dependency_cache is None:
+            inputs.append(
+                StageCacheInput(
+                    kind=StageCacheInputKind.DEPENDENCY,
+                    cache_policy=StageCacheInputPolicy.UNKNOWN,
+                    dependency_stage_id=dependency_stage_id,
+                    reason="Dependency cache metadata is unavailable.",
+                )
+            )
+            continue
+        inputs.append(
+            StageCacheInput(
+                kind=StageCacheInputKind.DEPENDENCY,
+                cache_policy=(
+                    StageCacheInputPolicy.DEPENDENCY
+                    if dependency_cache.cacheable and dependency_cache.cache_key
+                    else StageCacheInputPolicy.UNKNOWN
+                ),
+                dependency_stage_id=dependency_stage_id,
+                freshness_key=dependency_cache.cache_key,
+                reason=(
+                    dependency_cache.reason
+                    if not dependency_cache.cacheable
+                    else None
+                ),
+            )
+        )
+    return inputs
+
+
 def _descriptor_policy(value: DatasetFreshnessPolicy) -> StageCacheInputPolicy:
     if value == DatasetFreshnessPolicy.REVISION:
         return StageCacheInputPolicy.REVISION
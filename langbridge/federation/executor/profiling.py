@@ -0,0 +1,162 @@
+import json
+import os
+import tempfile
+from typing import Any
+
+import duckdb
+
+from langbridge.federation.models.plans import ExecutionSummary, PhysicalPlan, StageDefinition, StageMetrics, StageType
+
+_MAX_DETAIL_CHARS = 240
+_PROFILE_OPERATOR_KEYS = (
+    "operator_name",
+    "operator_type",
+    "operator_timing",
+    "operator_cardinality",
+    "operator_rows_scanned",
+    "extra_info",
+)
+
+
+class DuckDbProfileCapture:
+    """
+    Collects DuckDB's JSON profiling output for queries run on one connection.
+
+    DuckDB writes the profile of the last query to `profiling_output`, so the
+    capture owns a temporary file for the lifetime of the connection.
+    """
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection) -> None:
+        self._connection = connection
+        handle, self._path = tempfile.mkstemp(prefix="langbridge-duckdb-profile-", suffix=".json")
+        os.close(handle)
+
+    def enable(self) -> None:
+        escaped_path = self._path.replace("'", "''")
+        self._connection.execute("PRAGMA enable_profiling = 'json'")
+        self._connection.execute(f"PRAGMA profiling_output = '{escaped_path}'")
+
+    def read(self) -> dict[str, Any] | None:
+        try:
+            with open(self._path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return _compact_profile(payload) if isinstance(payload, dict) else None
+
+    def close(self) -> None:
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+
+def render_analyzed_plan(*, plan: PhysicalPlan, summary: ExecutionSummary) -> list[str]:
+    """Render the stage DAG as an indented EXPLAIN ANALYZE style tree, rooted at the result stage."""
+    stages = {stage.stage_id: stage for stage in plan.stages}
+    metrics = {metric.stage_id: metric for metric in summary.stage_metrics}
+    lines = [f"Federated plan {plan.plan_id} (total {summary.total_runtime_ms} ms)"]
+    _render_stage(
+        stage=stages[plan.result_stage_id],
+        stages=stages,
+        metrics=metrics,
+        depth=0,
+        lines=lines,
+    )
+    return lines
+
+
+def _render_stage(
+    *,
+    stage: StageDefinition,
+    stages: dict[str, StageDefinition],
+    metrics: dict[str, StageMetrics],
+    depth: int,
+    lines: list[str],
+) -> None:
+    indent = "  " * depth
+    detail_indent = indent + "      "
+    metric = metrics.get(stage.stage_id)
+    header = f"{indent}->  {stage.stage_id} [{stage.stage_type.value}"
+    if stage.source_id:
+        header += f" source={stage.source_id}"
+    header += "]"
+    if metric is None:
+        lines.append(f"{header} (never executed)")
+    else:
+        estimated = "?" if metric.estimated_rows is None else f"{metric.estimated_rows:.0f}"
+        lines.append(
+            f"{header} (estimated rows={estimated}) "
+            f"(actual time={metric.runtime_ms} ms rows={metric.rows} attempts={metric.attempts} "
+            f"cache={'hit' if metric.cached else 'miss'})"
+        )
+        if metric.phases_ms:
+            phases = " ".join(f"{name}={elapsed_ms} ms" for name, elapsed_ms in metric.phases_ms.items())
+            lines.append(f"{detail_indent}Phases: {phases}")
+        if metric.rows_in is not None or metric.bytes_in is not None:
+            lines.append(
+                f"{detail_indent}Input: rows={_format_count(metric.rows_in)} bytes={_format_count(metric.bytes_in)}"
+            )
+        lines.append(f"{detail_indent}Output: rows={metric.rows} bytes={metric.bytes_written}")
+        if metric.engine_profile:
+            lines.append(f"{detail_indent}DuckDB: latency={_format_seconds(metric.engine_profile.get('latency'))}")
+            for operator in metric.engine_profile.get("children") or []:
+                _render_operator(operator=operator, indent=detail_indent + "  ", lines=lines)
+    if stage.subplan is not None and stage.subplan.sql:
+        lines.append(f"{detail_indent}Remote SQL: {' '.join(stage.subplan.sql.split())}")
+    for dynamic_filter in stage.metadata.get("dynamic_filters") or []:
+        lines.append(f"{detail_indent}Dynamic filter: {_truncate(dynamic_filter)}")
+    if stage.metadata.get("replanned_from_actuals"):
+        strategies = ", ".join(f"{key}={value}" for key, value in stage.metadata.get("join_strategies", {}).items())
+        lines.append(
+            f"{detail_indent}Re-planned from actuals: join order={','.join(stage.metadata.get('join_order', []))}"
+            + (f" strategies={strategies}" if strategies else "")
+        )
+    if stage.stage_type != StageType.LOCAL_COMPUTE:
+        # Scan dependencies only sequence adaptive dynamic filters; the build scans render under the local stage.
+        return
+
+    for dependency_id in stage.dependencies:
+        dependency = stages.get(dependency_id)
+        if dependency is not None:
+            _render_stage(stage=dependency, stages=stages, metrics=metrics, depth=depth + 1, lines=lines)
+
+
+def _render_operator(*, operator: dict[str, Any], indent: str, lines: list[str]) -> None:
+    name = str(operator.get("operator_name") or operator.get("operator_type") or "?").strip()
+    lines.append(
+        f"{indent}{name} (rows={_format_count(operator.get('operator_cardinality'))} "
+        f"time={_format_seconds(operator.get('operator_timing'))})"
+    )
+    for child in operator.get("children") or []:
+        _render_operator(operator=child, indent=indent + "  ", lines=lines)
+
+
+def _compact_profile(payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "latency": payload.get("latency"),
+        "rows_returned": payload.get("rows_returned"),
+        "cpu_time": payload.get("cpu_time"),
+        "children": [_compact_operator(child) for child in payload.get("children") or []],
+    }
+
+
+def _compact_operator(payload: dict[str, Any]) -> dict[str, Any]:
+    operator = {key: payload[key] for key in _PROFILE_OPERATOR_KEYS if key in payload}
+    operator["children"] = [_compact_operator(child) for child in payload.get("children") or []]
+    return operator
+
+
+def _truncate(text: str) -> str:
+    collapsed = " ".join(text.split())
+    return collapsed if len(collapsed) <= _MAX_DETAIL_CHARS else collapsed[: _MAX_DETAIL_CHARS - 3] + "..."
+
+
+def _format_count(value: Any) -> str:
+    return "?" if value is None else str(value)
+
+
+def _format_seconds(value: Any) -> str:
+    if not isinstance(value, (int, float)):
+        return "?"
+    return f"{value * 1000:.3f} ms"
@@ -4,8 +4,11 @@ import time
 from dataclasses import dataclass
 from typing import Awaitable, Callable
 
+from langbridge.federation.cancellation import CancellationToken, QueryCancelledError
+from langbridge.federation.executor.adaptive import AdaptiveReplanner
 from langbridge.federation.executor.stage_executor import StageExecutionContext, StageExecutor
 from langbridge.federation.models.plans import ExecutionSummary, PhysicalPlan, StageArtifact, StageDefinition, StageMetrics
+from langbridge import telemetry
 
 
 class StageDispatcher:
@@ -47,6 +50,7 @@ class CallbackStageDispatcher(StageDispatcher):
 class SchedulerResult:
     summary: ExecutionSummary
     artifacts: dict[str, StageArtifact]
+    plan: PhysicalPlan | None = None
 
 
 class StageScheduler:
@@ -55,18 +59,29 @@ class StageScheduler:
         *,
         dispatcher: StageDispatcher,
         stage_parallelism: int,
+        replanner: AdaptiveReplanner | None = None,
     ) -> None:
         self._dispatcher = dispatcher
         self._stage_parallelism = max(1, stage_parallelism)
+        self._replanner = replanner
 
     async def run(
         self,
         *,
         plan: PhysicalPlan,
         workspace_id: str,
+        cancellation: CancellationToken | None = None,
+        profile: bool = False,
     ) -> SchedulerResult:
         started = time.perf_counter()
-        context = StageExecutionContext(workspace_id=workspace_id, plan_id=plan.plan_id)
+        context = StageExecutionContext(
+            workspace_id=workspace_id,
+            plan_id=plan.plan_id,
+            cancellation=cancellation,
+            profile=profile,
+        )
+        if self._replanner is not None:
+            plan = self._replanner.prepare(plan)
         remaining: dict[str, StageDefinition] = {stage.stage_id: stage for stage in plan.stages}
         completed: set[str] = set()
         artifacts: dict[str, StageArtifact] = {}
@@ -82,17 +97,30 @@ class StageScheduler:
                 unresolved = ", ".join(sorted(remaining.keys()))
                 raise RuntimeError(f"Stage DAG contains unresolved dependencies: {unresolved}")
 
+            ready_at = time.perf_counter()
             for batch in _chunk(ready, self._stage_parallelism):
-                tasks = [
-                    asyncio.create_task(self._execute_with_retry(stage=stage, context=context))
-                    for stage in batch
-                ]
-                batch_results = await asyncio.gather(*tasks)
+                # Earlier batches may have re-planned these stages; run the current definitions.
+                batch = [remaining[stage.stage_id] for stage in batch]
+                if cancellation is not None:
+                    cancellation.raise_if_cancelled()
+                for _ in batch:
+                    telemetry.observe_since(telemetry.QUEUE_WAIT, ready_at, labels={"queue": "federation_stage"})
+                batch_results = await _gather_or_cancel(
+                    [self._execute_with_retry(stage=stage, context=context) for stage in batch]
+                )
                 for stage, artifact, metric in batch_results:
                     artifacts[stage.stage_id] = artifact
                     metrics[stage.stage_id] = metric
                     completed.add(stage.stage_id)
                     remaining.pop(stage.stage_id, None)
+                if self._replanner is not None and remaining:
+                    plan = self._replanner.replan(
+                        plan=plan,
+                        workspace_id=workspace_id,
+                        artifacts=artifacts,
+                        pending=set(remaining),
+                    )
+                    remaining = {stage.stage_id: stage for stage in plan.stages if stage.stage_id in remaining}
 
         total_runtime_ms = int((time.perf_counter() - started) * 1000)
         summary = ExecutionSummary(
@@ -100,7 +128,7 @@ class StageScheduler:
             total_runtime_ms=total_runtime_ms,
             stage_metrics=[metrics[stage.stage_id] for stage in plan.stages if stage.stage_id in metrics],
         )
-        return SchedulerResult(summary=summary, artifacts=artifacts)
+        return SchedulerResult(summary=summary, artifacts=artifacts, plan=plan)
 
     async def _execute_with_retry(
         self,
@@ -115,14 +143,34 @@ class StageScheduler:
                 artifact, metric = await self._dispatcher.run(stage=stage, context=context)
                 metric.attempts = attempt
                 return stage, artifact, metric
+            except QueryCancelledError:
+                raise
             except Exception as exc:
                 last_error = exc
                 if attempt >= max_attempts:
                     break
-                await asyncio.sleep(min(0.25 * attempt, 1.0))
+                backoff_s = min(0.25 * attempt, 1.0)
+                if context.cancellation is not None:
+                    await context.cancellation.sleep(backoff_s)
+                else:
+                    await asyncio.sleep(backoff_s)
         assert last_error is not None
         raise last_error
 
 
+async def _gather_or_cancel(
+    coroutines: list[Awaitable[tuple[StageDefinition, StageArtifact, StageMetrics]]],
+) -> list[tuple[StageDefinition, StageArtifact, StageMetrics]]:
+    """Run a batch of stages, cancelling the rest of the batch as soon as one fails."""
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 def _chunk(items: list[StageDefinition], size: int) -> list[list[StageDefinition]]:
     return [items[index : index + size] for index in range(0, len(items), size)]
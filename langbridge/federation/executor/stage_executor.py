@@ -1,21 +1,36 @@
 ﻿
+import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import duckdb
 import pyarrow as pa
 
+from langbridge.federation.cancellation import CancellationToken
 from langbridge.federation.connectors import RemoteSource
 from langbridge.federation.executor.artifact_store import ArtifactStore
 from langbridge.federation.executor.cache_context import StageCacheDescriptor, StageCacheResolver
+from langbridge.federation.executor.profiling import DuckDbProfileCapture
 from langbridge.federation.models.plans import StageArtifact, StageDefinition, StageMetrics, StageType
 from langbridge.federation.utils.sql import normalize_sql_dialect
+from langbridge import telemetry
 
 
 @dataclass(slots=True)
 class StageExecutionContext:
     workspace_id: str
     plan_id: str
+    cancellation: CancellationToken | None = None
+    profile: bool = False
+
+
+@dataclass(slots=True)
+class _LocalComputeOutput:
+    table: pa.Table
+    rows_in: int = 0
+    bytes_in: int = 0
+    phases_ms: dict[str, int] = field(default_factory=dict)
+    engine_profile: dict | None = None
 
 
 class StageExecutor:
@@ -35,8 +50,28 @@ class StageExecutor:
         *,
         stage: StageDefinition,
         context: StageExecutionContext,
+    ) -> tuple[StageArtifact, StageMetrics]:
+        with telemetry.timed(
+            "federation.stage",
+            histogram=telemetry.FEDERATION_STAGE_DURATION,
+            labels={"stage_type": stage.stage_type.value},
+            attributes={"stage_id": stage.stage_id, "plan_id": context.plan_id},
+        ) as span:
+            artifact, metrics = await self._execute_stage(stage=stage, context=context)
+            span.set_attributes({"rows": metrics.rows, "cached": metrics.cached})
+            return artifact, metrics
+
+    async def _execute_stage(
+        self,
+        *,
+        stage: StageDefinition,
+        context: StageExecutionContext,
     ) -> tuple[StageArtifact, StageMetrics]:
         started = time.perf_counter()
+        if context.cancellation is not None:
+            context.cancellation.raise_if_cancelled()
+        phases_ms: dict[str, int] = {}
+        estimated_rows = stage.subplan.estimated_rows if stage.subplan is not None else None
         cache_descriptor = self._cache_resolver.describe_stage(
             stage=stage,
             dependency_caches=self._dependency_caches(stage=stage, context=context),
@@ -48,8 +83,13 @@ class StageExecutor:
             stage_id=stage.stage_id,
             expected_cache=cache_descriptor,
         )
+        phases_ms["cache_lookup"] = _elapsed_ms(started)
+        telemetry.increment(
+            telemetry.CACHE_LOOKUPS,
+            labels={"cache": "federation_stage", "result": "miss" if cached is None else "hit"},
+        )
         if cached is not None:
-            runtime_ms = int((time.perf_counter() - started) * 1000)
+            runtime_ms = _elapsed_ms(started)
             return cached, StageMetrics(
                 stage_id=stage.stage_id,
                 attempts=1,
@@ -59,6 +99,8 @@ class StageExecutor:
                 cached=True,
                 started_at=time.time(),
                 finished_at=time.time(),
+                estimated_rows=estimated_rows,
+                phases_ms=phases_ms,
             )
 
         if stage.stage_type in {StageType.REMOTE_SCAN, StageType.REMOTE_FULL_QUERY}:
@@ -67,7 +109,28 @@ class StageExecutor:
             source = self._sources.get(stage.subplan.source_id)
             if source is None:
                 raise ValueError(f"No remote source registered for source_id '{stage.subplan.source_id}'.")
-            remote_result = await source.execute(stage.subplan)
+            remote_started = time.perf_counter()
+            source_kind = type(source).__name__
+            with telemetry.timed(
+                "federation.remote_source.execute",
+                histogram=telemetry.CONNECTOR_QUERY_DURATION,
+                labels={"source_kind": source_kind},
+                attributes={"source_id": stage.subplan.source_id, "stage_id": stage.stage_id},
+            ) as span:
+                remote_execution = source.execute(stage.subplan, cancellation=context.cancellation)
+                if context.cancellation is None:
+                    remote_result = await remote_execution
+                else:
+                    remote_result = await context.cancellation.run(remote_execution)
+                span.set_attribute("rows", remote_result.table.num_rows)
+            telemetry.increment(
+                telemetry.CONNECTOR_ROWS,
+                remote_result.table.num_rows,
+                labels={"source_kind": source_kind},
+            )
+            phases_ms["remote_execute"] = _elapsed_ms(remote_started)
+            phases_ms.update(remote_result.phases_ms)
+            write_started = time.perf_counter()
             artifact = self._artifact_store.write_stage_output(
                 workspace_id=context.workspace_id,
                 plan_id=context.plan_id,
@@ -75,7 +138,8 @@ class StageExecutor:
                 table=remote_result.table,
                 cache=cache_descriptor,
             )
-            runtime_ms = int((time.perf_counter() - started) * 1000)
+            phases_ms["artifact_write"] = _elapsed_ms(write_started)
+            runtime_ms = _elapsed_ms(started)
             return artifact, StageMetrics(
                 stage_id=stage.stage_id,
                 attempts=1,
@@ -86,6 +150,10 @@ class StageExecutor:
                 cached=False,
                 started_at=time.time() - (runtime_ms / 1000),
                 finished_at=time.time(),
+                rows_in=remote_result.table.num_rows,
+                bytes_in=remote_result.table.nbytes,
+                estimated_rows=estimated_rows,
+                phases_ms=phases_ms,
             )
 
         if stage.stage_type == StageType.LOCAL_COMPUTE:
@@ -99,34 +167,28 @@ class StageExecutor:
 
             connection = duckdb.connect(database=":memory:")
             try:
-                table_inputs = stage.metadata.get("table_inputs", {})
-                for relation_name, dependency_stage_id in table_inputs.items():
-                    table = self._artifact_store.read_stage_output(
-                        workspace_id=context.workspace_id,
-                        plan_id=context.plan_id,
-                        stage_id=str(dependency_stage_id),
-                    )
-                    connection.register(relation_name, table)
-
-                arrow_result = connection.execute(stage.sql).arrow()
-                local_table: pa.Table
-                if isinstance(arrow_result, pa.Table):
-                    local_table = arrow_result
-                elif hasattr(arrow_result, "read_all"):
-                    local_table = arrow_result.read_all()
-                elif hasattr(arrow_result, "to_arrow_table"):
-                    local_table = arrow_result.to_arrow_table()
-                else:  # pragma: no cover - defensive fallback for duckdb return types
-                    local_table = pa.Table.from_batches(list(arrow_result))
+                work = asyncio.to_thread(
+                    self._run_local_compute,
+                    connection=connection,
+                    stage=stage,
+                    context=context,
+                )
+                if context.cancellation is None:
+                    local_output = await work
+                else:
+                    local_output = await context.cancellation.run(work, on_cancel=connection.interrupt)
+                phases_ms.update(local_output.phases_ms)
 
+                write_started = time.perf_counter()
                 artifact = self._artifact_store.write_stage_output(
                     workspace_id=context.workspace_id,
                     plan_id=context.plan_id,
                     stage_id=stage.stage_id,
-                    table=local_table,
+                    table=local_output.table,
                     cache=cache_descriptor,
                 )
-                runtime_ms = int((time.perf_counter() - started) * 1000)
+                phases_ms["artifact_write"] = _elapsed_ms(write_started)
+                runtime_ms = _elapsed_ms(started)
                 return artifact, StageMetrics(
                     stage_id=stage.stage_id,
                     attempts=1,
@@ -136,12 +198,60 @@ class StageExecutor:
                     cached=False,
                     started_at=time.time() - (runtime_ms / 1000),
                     finished_at=time.time(),
+                    rows_in=local_output.rows_in,
+                    bytes_in=local_output.bytes_in,
+                    estimated_rows=estimated_rows,
+                    phases_ms=phases_ms,
+                    engine_profile=local_output.engine_profile,
                 )
             finally:
                 connection.close()
 
         raise ValueError(f"Unsupported stage type '{stage.stage_type}'.")
 
+    def _run_local_compute(
+        self,
+        *,
+        connection: duckdb.DuckDBPyConnection,
+        stage: StageDefinition,
+        context: StageExecutionContext,
+    ) -> _LocalComputeOutput:
+        output = _LocalComputeOutput(table=pa.table({}))
+        read_started = time.perf_counter()
+        table_inputs = stage.metadata.get("table_inputs", {})
+        for relation_name, dependency_stage_id in table_inputs.items():
+            table = self._artifact_store.read_stage_output(
+                workspace_id=context.workspace_id,
+                plan_id=context.plan_id,
+                stage_id=str(dependency_stage_id),
+            )
+            output.rows_in += table.num_rows
+            output.bytes_in += table.nbytes
+            connection.register(relation_name, table)
+        output.phases_ms["artifact_read"] = _elapsed_ms(read_started)
+
+        profile_capture = DuckDbProfileCapture(connection) if context.profile else None
+        try:
+            if profile_capture is not None:
+                profile_capture.enable()
+            compute_started = time.perf_counter()
+            arrow_result = connection.execute(stage.sql).arrow()
+            if isinstance(arrow_result, pa.Table):
+                output.table = arrow_result
+            elif hasattr(arrow_result, "read_all"):
+                output.table = arrow_result.read_all()
+            elif hasattr(arrow_result, "to_arrow_table"):
+                output.table = arrow_result.to_arrow_table()
+            else:  # pragma: no cover - defensive fallback for duckdb return types
+                output.table = pa.Table.from_batches(list(arrow_result))
+            output.phases_ms["local_compute"] = _elapsed_ms(compute_started)
+            if profile_capture is not None:
+                output.engine_profile = profile_capture.read()
+        finally:
+            if profile_capture is not None:
+                profile_capture.close()
+        return output
+
     def _dependency_caches(
         self,
         *,
@@ -157,3 +267,7 @@ class StageExecutor:
             )
             dependency_caches[dependency_stage_id] = None if manifest is None else manifest.cache
         return dependency_caches
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
@@ -1,5 +1,6 @@
 from langbridge.federation.models.plans import (
     ExecutionSummary,
+    FederatedExplainAnalyzePlan,
     FederatedExplainPlan,
     JoinRef,
     JoinStrategy,
@@ -28,6 +29,7 @@ from langbridge.federation.models.virtual_dataset import (
 
 __all__ = [
     "ExecutionSummary",
+    "FederatedExplainAnalyzePlan",
     "FederatedExplainPlan",
     "JoinRef",
     "JoinStrategy",
@@ -107,6 +107,11 @@ class StageMetrics(BaseModel):
     cached: bool = False
     started_at: float = Field(default_factory=time.time)
     finished_at: float | None = None
+    rows_in: int | None = None
+    bytes_in: int | None = None
+    estimated_rows: float | None = None
+    phases_ms: dict[str, int] = Field(default_factory=dict)
+    engine_profile: dict[str, Any] | None = None
 
 
 class ExecutionSummary(BaseModel):
@@ -128,3 +133,8 @@ class ResultHandle(BaseModel):
 class FederatedExplainPlan(BaseModel):
     logical_plan: LogicalPlan
     physical_plan: PhysicalPlan
+
+
+class FederatedExplainAnalyzePlan(FederatedExplainPlan):
+    execution: ExecutionSummary
+    plan_text: list[str] = Field(default_factory=list)
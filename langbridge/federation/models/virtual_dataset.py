@@ -109,6 +109,8 @@ class FederationWorkflow(BaseModel):
     partition_count: int = 8
     max_stage_retries: int = 2
     stage_parallelism: int = 4
+    adaptive_execution: bool = True
+    dynamic_filter_max_values: int = 1000
 
 
 DatasetExecutionDescriptor.model_rebuild()
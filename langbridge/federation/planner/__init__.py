@@ -1,5 +1,5 @@
 from langbridge.federation.planner.parser import QueryParsingError
-from langbridge.federation.planner.planner import FederatedPlanner, PlanningOutput
+from langbridge.federation.planner.planner import CompiledQuery, FederatedPlanner, PlanningOutput
 from langbridge.federation.planner.stats import StatsStore
 
-__all__ = ["QueryParsingError", "FederatedPlanner", "PlanningOutput", "StatsStore"]
+__all__ = ["CompiledQuery", "QueryParsingError", "FederatedPlanner", "PlanningOutput", "StatsStore"]
@@ -1,5 +1,6 @@
 ﻿
 from dataclasses import dataclass
+from typing import Callable
 
 import sqlglot
 from sqlglot import exp
@@ -41,6 +42,7 @@ class FederatedOptimizer:
         source_dialects: dict[str, str],
         input_dialect: str,
         local_dialect: str,
+        observed_scan_stats: Callable[[str, list[str]], TableStatistics | None] | None = None,
     ) -> OptimizedPlan:
         aliases = list(logical_plan.tables.keys())
         required_columns, has_unqualified = extract_required_columns(expression, aliases)
@@ -80,6 +82,7 @@ class FederatedOptimizer:
         )
 
         source_subplans: list[SourceSubplan] = []
+        alias_stats: dict[str, TableStatistics] = {}
         if pushdown_full_query:
             source_id = next(iter(distinct_sources))
             target_dialect = source_dialects.get(source_id, input_dialect)
@@ -124,7 +127,7 @@ class FederatedOptimizer:
                     target_dialect=target_dialect,
                 )
             ]
-            sql = _build_scan_sql(
+            sql = build_scan_sql(
                 alias=alias,
                 binding=binding,
                 projected_columns=projected_columns,
@@ -132,7 +135,11 @@ class FederatedOptimizer:
                 pushed_limit=None,
                 dialect=target_dialect,
             )
+            rendered_filters = [expr.sql(dialect=target_dialect) for expr in pushable_filters]
             stats = stats_by_table.get(table_ref.table_key) or binding.stats or TableStatistics()
+            if observed_scan_stats is not None:
+                stats = observed_scan_stats(table_ref.table_key, rendered_filters) or stats
+            alias_stats[alias] = stats
             estimated_rows = stats.row_count_estimate
             estimated_bytes = estimate_bytes(rows=estimated_rows, bytes_per_row=stats.bytes_per_row)
             source_subplans.append(
@@ -143,20 +150,17 @@ class FederatedOptimizer:
                     table_key=table_ref.table_key,
                     sql=sql,
                     projected_columns=projected_columns,
-                    pushed_filters=[
-                        expr.sql(dialect=target_dialect)
-                        for expr in pushable_filters
-                    ],
+                    pushed_filters=rendered_filters,
                     pushed_limit=None,
                     estimated_rows=estimated_rows,
                     estimated_bytes=estimated_bytes,
                 )
             )
 
-        join_order = _choose_join_order(logical_plan=logical_plan, stats_by_table=stats_by_table)
-        join_strategies = _choose_join_strategies(
+        join_order = choose_join_order(logical_plan=logical_plan, alias_stats=alias_stats)
+        join_strategies = choose_join_strategies(
             logical_plan=logical_plan,
-            stats_by_table=stats_by_table,
+            alias_stats=alias_stats,
             broadcast_threshold_bytes=self._broadcast_threshold_bytes,
         )
 
@@ -179,7 +183,7 @@ class FederatedOptimizer:
         )
 
 
-def _build_scan_sql(
+def build_scan_sql(
     *,
     alias: str,
     binding,
@@ -389,14 +393,14 @@ def _binding_requires_logical_name_rewrite(binding) -> bool:
     return not logical_names.issubset(physical_names)
 
 
-def _choose_join_order(
+def choose_join_order(
     *,
     logical_plan: LogicalPlan,
-    stats_by_table: dict[str, TableStatistics],
+    alias_stats: dict[str, TableStatistics],
 ) -> list[str]:
     alias_rows: dict[str, float] = {}
-    for alias, table_ref in logical_plan.tables.items():
-        stats = stats_by_table.get(table_ref.table_key)
+    for alias in logical_plan.tables:
+        stats = alias_stats.get(alias)
         alias_rows[alias] = stats.row_count_estimate if (stats and stats.row_count_estimate is not None) else 1_000_000.0
 
     sorted_aliases = sorted(alias_rows.items(), key=lambda item: item[1])
@@ -431,17 +435,16 @@ def _choose_join_order(
     return ordered
 
 
-def _choose_join_strategies(
+def choose_join_strategies(
     *,
     logical_plan: LogicalPlan,
-    stats_by_table: dict[str, TableStatistics],
+    alias_stats: dict[str, TableStatistics],
     broadcast_threshold_bytes: int,
 ) -> dict[str, JoinStrategy]:
     strategies: dict[str, JoinStrategy] = {}
 
     def _table_bytes(alias: str) -> float:
-        table_ref = logical_plan.tables[alias]
-        stats = stats_by_table.get(table_ref.table_key) or TableStatistics()
+        stats = alias_stats.get(alias) or TableStatistics()
         rows = stats.row_count_estimate if stats.row_count_estimate is not None else 1_000_000.0
         return rows * stats.bytes_per_row
 
@@ -43,7 +43,27 @@ def logical_plan_from_sql(
 ) -> tuple[LogicalPlan, exp.Expression]:
     normalized_sql = _normalize_portable_sql(sql)
     parsed = parse_sql(normalized_sql, dialect=dialect)
-    select_expr = parsed.select
+    return logical_plan_from_expression(
+        expression=parsed.expression,
+        sql=normalized_sql,
+        virtual_dataset=virtual_dataset,
+        dialect=dialect,
+        query_type=query_type,
+    )
+
+
+def logical_plan_from_expression(
+    *,
+    expression: exp.Expression,
+    sql: str,
+    virtual_dataset: VirtualDataset,
+    dialect: str = "tsql",
+    query_type: QueryType = QueryType.SQL,
+) -> tuple[LogicalPlan, exp.Expression]:
+    """Build the logical plan from an already parsed (or compiled) query; `sql` is its rendered text."""
+    select_expr = _extract_select(expression)
+    if select_expr is None:
+        raise QueryParsingError("Only SELECT/CTE queries are supported in federation v1.")
 
     cte_names = _extract_cte_names(select_expr)
     has_cte = bool(cte_names)
@@ -53,7 +73,7 @@ def logical_plan_from_sql(
     joins: list[JoinRef]
     if has_cte:
         table_map = _resolve_physical_tables(
-            expression=parsed.expression,
+            expression=expression,
             virtual_dataset=virtual_dataset,
             cte_names=cte_names,
         )
@@ -95,7 +115,7 @@ def logical_plan_from_sql(
 
     logical_plan = LogicalPlan(
         query_type=query_type,
-        sql=normalized_sql,
+        sql=sql,
         from_alias=base_alias,
         tables=table_map,
         joins=joins,
@@ -107,7 +127,7 @@ def logical_plan_from_sql(
         offset=_extract_int(select_expr.args.get("offset")),
         has_cte=has_cte,
     )
-    return logical_plan, parsed.expression
+    return logical_plan, expression
 
 
 _INTERVAL_LITERAL_WITH_UNIT_RE = re.compile(
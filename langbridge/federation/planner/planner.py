@@ -1,17 +1,28 @@
 ﻿
 from dataclasses import dataclass
+from typing import Callable
+
+from sqlglot import exp
 
 from langbridge.federation.models.plans import LogicalPlan, PhysicalPlan, QueryType
 from langbridge.federation.models.smq import SMQQuery
 from langbridge.federation.models.virtual_dataset import FederationWorkflow, TableStatistics
 from langbridge.federation.planner.optimizer import FederatedOptimizer, OptimizedPlan
-from langbridge.federation.planner.parser import logical_plan_from_sql
+from langbridge.federation.planner.parser import logical_plan_from_expression, logical_plan_from_sql
 from langbridge.federation.planner.physical_planner import PhysicalPlanner
 from langbridge.federation.planner.smq_compiler import SMQCompiler
 from langbridge.federation.planner.stats import StatsStore
 from langbridge.semantic.model import SemanticModel
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledQuery:
+    """A semantic query already compiled to a sqlglot tree (and its SQL text) in `dialect`."""
+
+    sql: str
+    expression: exp.Expression
+
+
 @dataclass(slots=True)
 class PlanningOutput:
     logical_plan: LogicalPlan
@@ -56,6 +67,7 @@ class FederatedPlanner:
             source_dialects=source_dialects,
             input_dialect=dialect,
             local_dialect=local_dialect,
+            observed_scan_stats=self._observed_scan_stats(workflow),
         )
         physical_plan = self._physical_planner.build(optimized_plan=optimized)
         return PlanningOutput(logical_plan=logical_plan, physical_plan=physical_plan, sql=sql)
@@ -93,10 +105,45 @@ class FederatedPlanner:
             source_dialects=source_dialects,
             input_dialect=dialect,
             local_dialect=local_dialect,
+            observed_scan_stats=self._observed_scan_stats(workflow),
         )
         physical_plan: PhysicalPlan = self._physical_planner.build(optimized_plan=optimized)
         return PlanningOutput(logical_plan=logical_plan, physical_plan=physical_plan, sql=sql)
 
+    def plan_compiled(
+        self,
+        *,
+        query: CompiledQuery,
+        dialect: str,
+        workflow: FederationWorkflow,
+        source_dialects: dict[str, str],
+        local_dialect: str = "duckdb",
+    ) -> PlanningOutput:
+        """Plan a pre-compiled semantic query without rendering and re-parsing its SQL."""
+        logical_plan, expression = logical_plan_from_expression(
+            expression=query.expression,
+            sql=query.sql,
+            virtual_dataset=workflow.dataset,
+            dialect=dialect,
+            query_type=QueryType.SMQ,
+        )
+
+        optimizer = FederatedOptimizer(
+            broadcast_threshold_bytes=workflow.broadcast_threshold_bytes,
+        )
+        optimized: OptimizedPlan = optimizer.optimize(
+            logical_plan=logical_plan,
+            expression=expression,
+            virtual_dataset=workflow.dataset,
+            stats_by_table=self._resolve_stats(workflow),
+            source_dialects=source_dialects,
+            input_dialect=dialect,
+            local_dialect=local_dialect,
+            observed_scan_stats=self._observed_scan_stats(workflow),
+        )
+        physical_plan: PhysicalPlan = self._physical_planner.build(optimized_plan=optimized)
+        return PlanningOutput(logical_plan=logical_plan, physical_plan=physical_plan, sql=query.sql)
+
     def _resolve_stats(self, workflow: FederationWorkflow) -> dict[str, TableStatistics]:
         self._stats_store.apply_overrides(
             workspace_id=workflow.workspace_id,
@@ -113,3 +160,20 @@ class FederatedPlanner:
                 continue
             resolved[table_key] = TableStatistics(row_count_estimate=1_000_000.0, bytes_per_row=128.0)
         return resolved
+
+    def _observed_scan_stats(
+        self,
+        workflow: FederationWorkflow,
+    ) -> Callable[[str, list[str]], TableStatistics | None]:
+        overridden = set(workflow.dataset.stats_overrides)
+
+        def _lookup(table_key: str, pushed_filters: list[str]) -> TableStatistics | None:
+            if table_key in overridden:
+                return None
+            return self._stats_store.get_scan(
+                workspace_id=workflow.workspace_id,
+                table_key=table_key,
+                pushed_filters=pushed_filters,
+            )
+
+        return _lookup
@@ -1,14 +1,22 @@
 ﻿
+import hashlib
 from collections import defaultdict
 
 from langbridge.federation.models.virtual_dataset import TableStatistics
 
 
 class StatsStore:
-    """In-memory stats registry keyed by workspace/table for heuristic planning."""
+    """
+    In-memory stats registry keyed by workspace/table for heuristic planning.
+
+    Besides table-level stats, the store keeps the cardinality observed for each
+    distinct scan (table plus pushed filters), so a repeated filtered scan is
+    planned from what it actually returned last time.
+    """
 
     def __init__(self) -> None:
         self._stats: dict[str, dict[str, TableStatistics]] = defaultdict(dict)
+        self._scan_stats: dict[str, dict[tuple[str, str], TableStatistics]] = defaultdict(dict)
 
     def get(self, *, workspace_id: str, table_key: str) -> TableStatistics | None:
         return self._stats.get(workspace_id, {}).get(table_key)
@@ -16,6 +24,25 @@ class StatsStore:
     def upsert(self, *, workspace_id: str, table_key: str, stats: TableStatistics) -> None:
         self._stats.setdefault(workspace_id, {})[table_key] = stats
 
+    def get_scan(
+        self,
+        *,
+        workspace_id: str,
+        table_key: str,
+        pushed_filters: list[str],
+    ) -> TableStatistics | None:
+        return self._scan_stats.get(workspace_id, {}).get((table_key, scan_signature(pushed_filters)))
+
+    def record_scan(
+        self,
+        *,
+        workspace_id: str,
+        table_key: str,
+        pushed_filters: list[str],
+        stats: TableStatistics,
+    ) -> None:
+        self._scan_stats.setdefault(workspace_id, {})[(table_key, scan_signature(pushed_filters))] = stats
+
     def apply_overrides(
         self,
         *,
@@ -27,3 +54,8 @@ class StatsStore:
         table_stats = self._stats.setdefault(workspace_id, {})
         for table_key, stats in overrides.items():
             table_stats[table_key] = stats
+
+
+def scan_signature(pushed_filters: list[str]) -> str:
+    normalized = sorted(" ".join(str(item).split()).lower() for item in pushed_filters)
+    return hashlib.sha256("\n".join(normalized).encode("utf-8")).hexdigest()[:16]
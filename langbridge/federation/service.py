@@ -4,18 +4,30 @@ from typing import Any
 
 import pyarrow as pa
 
+from langbridge.federation.cancellation import CancellationToken, current_cancellation
 from langbridge.federation.connectors import RemoteSource
-from langbridge.federation.executor import ArtifactStore, LocalStageDispatcher, StageExecutor, StageScheduler
+from langbridge.federation.executor import (
+    AdaptiveReplanner,
+    ArtifactStore,
+    LocalStageDispatcher,
+    StageExecutor,
+    StageScheduler,
+)
 from langbridge.federation.executor.cache_context import StageCacheResolver
+from langbridge.federation.executor.profiling import render_analyzed_plan
 from langbridge.federation.models import (
+    FederatedExplainAnalyzePlan,
     FederatedExplainPlan,
     FederationWorkflow,
+    PhysicalPlan,
     QueryType,
     ResultHandle,
     SMQQuery,
+    StageArtifact,
+    StageType,
     TableStatistics,
 )
-from langbridge.federation.planner import FederatedPlanner
+from langbridge.federation.planner import CompiledQuery, FederatedPlanner, PlanningOutput
 from langbridge.semantic.model import SemanticModel
 
 
@@ -50,37 +62,110 @@ class FederatedQueryService:
 
     async def execute(
         self,
-        query: SMQQuery | str | dict[str, Any],
+        query: CompiledQuery | SMQQuery | str | dict[str, Any],
         dialect: str = "duckdb",
         workspace_id: str = "",
+        cancellation: CancellationToken | None = None,
     ) -> ResultHandle:
+        planning = self._plan(query=query, dialect=dialect, workspace_id=workspace_id, purpose="execution")
+        return await self._execute_plan(
+            planning=planning,
+            workspace_id=workspace_id,
+            cancellation=cancellation,
+            profile=False,
+        )
+
+    async def fetch_arrow(self, result_handle: ResultHandle | str) -> pa.Table:
+        handle = self._resolve_result_handle(result_handle)
+        return self._artifact_store.read_artifact(handle.artifact_key)
+
+    async def explain(
+        self,
+        query: CompiledQuery | SMQQuery | str | dict[str, Any],
+        dialect: str = "tsql",
+        workspace_id: str = "",
+    ) -> FederatedExplainPlan:
+        planning = self._plan(query=query, dialect=dialect, workspace_id=workspace_id, purpose="explain")
+        return FederatedExplainPlan(
+            logical_plan=planning.logical_plan,
+            physical_plan=planning.physical_plan,
+        )
+
+    async def explain_analyze(
+        self,
+        query: CompiledQuery | SMQQuery | str | dict[str, Any],
+        dialect: str = "tsql",
+        workspace_id: str = "",
+        cancellation: CancellationToken | None = None,
+    ) -> FederatedExplainAnalyzePlan:
+        """Execute the query with stage profiling enabled and return the plan annotated with runtime metrics."""
+        planning = self._plan(query=query, dialect=dialect, workspace_id=workspace_id, purpose="explain")
+        result_handle = await self._execute_plan(
+            planning=planning,
+            workspace_id=workspace_id,
+            cancellation=cancellation,
+            profile=True,
+        )
+        return FederatedExplainAnalyzePlan(
+            logical_plan=planning.logical_plan,
+            physical_plan=planning.physical_plan,
+            execution=result_handle.execution,
+            plan_text=render_analyzed_plan(plan=planning.physical_plan, summary=result_handle.execution),
+        )
+
+    def _plan(
+        self,
+        *,
+        query: CompiledQuery | SMQQuery | str | dict[str, Any],
+        dialect: str,
+        workspace_id: str,
+        purpose: str,
+    ) -> PlanningOutput:
         workflow = self._require_workflow(workspace_id)
         sources = self._require_sources(workspace_id)
-
         source_dialects = {source_id: source.dialect() for source_id, source in sources.items()}
 
+        if isinstance(query, CompiledQuery):
+            return self._planner.plan_compiled(
+                query=query,
+                dialect=dialect,
+                local_dialect="duckdb",
+                workflow=workflow,
+                source_dialects=source_dialects,
+            )
+
         if isinstance(query, str):
-            planning = self._planner.plan_sql(
+            return self._planner.plan_sql(
                 sql=query,
                 dialect=dialect,
                 local_dialect="duckdb",
                 workflow=workflow,
                 source_dialects=source_dialects,
             )
-        else:
-            smq = query if isinstance(query, SMQQuery) else SMQQuery.model_validate(query)
-            semantic_model = self._semantic_models.get(workspace_id)
-            if semantic_model is None:
-                raise ValueError("SMQ execution requires a semantic model registered for the workspace.")
-            planning = self._planner.plan_smq(
-                query=smq,
-                semantic_model=semantic_model,
-                dialect=dialect,
-                local_dialect="duckdb",
-                workflow=workflow,
-                source_dialects=source_dialects,
-            )
 
+        smq = query if isinstance(query, SMQQuery) else SMQQuery.model_validate(query)
+        semantic_model = self._semantic_models.get(workspace_id)
+        if semantic_model is None:
+            raise ValueError(f"SMQ {purpose} requires a semantic model registered for the workspace.")
+        return self._planner.plan_smq(
+            query=smq,
+            semantic_model=semantic_model,
+            dialect=dialect,
+            local_dialect="duckdb",
+            workflow=workflow,
+            source_dialects=source_dialects,
+        )
+
+    async def _execute_plan(
+        self,
+        *,
+        planning: PlanningOutput,
+        workspace_id: str,
+        cancellation: CancellationToken | None,
+        profile: bool,
+    ) -> ResultHandle:
+        workflow = self._require_workflow(workspace_id)
+        sources = self._require_sources(workspace_id)
         cache_resolver = StageCacheResolver(
             workflow=workflow,
             plan=planning.physical_plan,
@@ -91,8 +176,25 @@ class FederatedQueryService:
             sources=sources,
         )
         dispatcher = LocalStageDispatcher(stage_executor=stage_executor)
-        scheduler = StageScheduler(dispatcher=dispatcher, stage_parallelism=workflow.stage_parallelism)
-        scheduler_result = await scheduler.run(plan=planning.physical_plan, workspace_id=workspace_id)
+        replanner = (
+            AdaptiveReplanner(workflow=workflow, sources=sources, artifact_store=self._artifact_store)
+            if workflow.adaptive_execution
+            else None
+        )
+        scheduler = StageScheduler(
+            dispatcher=dispatcher,
+            stage_parallelism=workflow.stage_parallelism,
+            replanner=replanner,
+        )
+        scheduler_result = await scheduler.run(
+            plan=planning.physical_plan,
+            workspace_id=workspace_id,
+            cancellation=cancellation or current_cancellation(),
+            profile=profile,
+        )
+        if scheduler_result.plan is not None:
+            # Surface the re-planned stages (dynamic filters, join choices) to explain analyze.
+            planning.physical_plan = scheduler_result.plan
 
         result_stage_id = planning.physical_plan.result_stage_id
         result_artifact = scheduler_result.artifacts[result_stage_id]
@@ -112,62 +214,37 @@ class FederatedQueryService:
         )
         return result_handle
 
-    async def fetch_arrow(self, result_handle: ResultHandle | str) -> pa.Table:
-        handle = self._resolve_result_handle(result_handle)
-        return self._artifact_store.read_artifact(handle.artifact_key)
-
-    async def explain(
+    def _record_runtime_stats(
         self,
-        query: SMQQuery | str | dict[str, Any],
-        dialect: str = "tsql",
-        workspace_id: str = "",
-    ) -> FederatedExplainPlan:
-        workflow = self._require_workflow(workspace_id)
-        sources = self._require_sources(workspace_id)
-        source_dialects = {source_id: source.dialect() for source_id, source in sources.items()}
-
-        if isinstance(query, str):
-            planning = self._planner.plan_sql(
-                sql=query,
-                dialect=dialect,
-                local_dialect="duckdb",
-                workflow=workflow,
-                source_dialects=source_dialects,
-            )
-        else:
-            smq = query if isinstance(query, SMQQuery) else SMQQuery.model_validate(query)
-            semantic_model = self._semantic_models.get(workspace_id)
-            if semantic_model is None:
-                raise ValueError("SMQ explain requires a semantic model registered for the workspace.")
-            planning = self._planner.plan_smq(
-                query=smq,
-                semantic_model=semantic_model,
-                dialect=dialect,
-                local_dialect="duckdb",
-                workflow=workflow,
-                source_dialects=source_dialects,
-            )
-
-        return FederatedExplainPlan(
-            logical_plan=planning.logical_plan,
-            physical_plan=planning.physical_plan,
-        )
-
-    def _record_runtime_stats(self, *, workspace_id: str, plan, artifacts: dict[str, Any]) -> None:
+        *,
+        workspace_id: str,
+        plan: PhysicalPlan,
+        artifacts: dict[str, StageArtifact],
+    ) -> None:
+        stats_store = self._planner.stats_store
         for stage in plan.stages:
-            if stage.subplan is None:
+            if stage.stage_type != StageType.REMOTE_SCAN or stage.subplan is None:
                 continue
             artifact = artifacts.get(stage.stage_id)
-            if artifact is None or artifact.rows <= 0:
+            if artifact is None or stage.metadata.get("dynamic_filters"):
+                continue
+            stats = TableStatistics(
+                row_count_estimate=float(artifact.rows),
+                bytes_per_row=float(artifact.bytes_written / max(artifact.rows, 1)),
+            )
+            stats_store.record_scan(
+                workspace_id=workspace_id,
+                table_key=stage.subplan.table_key,
+                pushed_filters=stage.subplan.pushed_filters,
+                stats=stats,
+            )
+            # Only an unfiltered scan observes the size of the whole table.
+            if artifact.rows <= 0 or stage.subplan.pushed_filters or stage.subplan.pushed_limit is not None:
                 continue
-            bytes_per_row = float(artifact.bytes_written / max(artifact.rows, 1))
-            self._planner.stats_store.upsert(
+            stats_store.upsert(
                 workspace_id=workspace_id,
                 table_key=stage.subplan.table_key,
-                stats=TableStatistics(
-                    row_count_estimate=float(artifact.rows),
-                    bytes_per_row=bytes_per_row,
-                ),
+                stats=stats,
             )
 
     def _resolve_result_handle(self, result_handle: ResultHandle | str) -> ResultHandle:
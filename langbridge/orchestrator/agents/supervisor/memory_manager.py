@@ -10,7 +10,7 @@ from langbridge.runtime.models import (
     RuntimeMessageRole,
     RuntimeThreadMessage,
 )
-from langbridge.runtime.embeddings import EmbeddingProvider
+from langbridge.runtime.embeddings import Embedder
 from langbridge.runtime.ports import ConversationMemoryStore
 from langbridge.connectors.base.config import ConnectorRuntimeType
 from langbridge.connectors.base.connector import ManagedVectorDB
@@ -31,7 +31,7 @@ class MemoryManager:
         self,
         *,
         repository: ConversationMemoryStore,
-        embedding_provider: Optional[EmbeddingProvider],
+        embedding_provider: Optional[Embedder],
         logger: Optional[logging.Logger] = None,
     ) -> None:
         self._repository = repository
@@ -14,6 +14,8 @@ from urllib.parse import parse_qs, unquote, urljoin, urlparse
 
 try:  # pragma: no cover - optional dependency for environments that do not execute HTTP providers
     import httpx
+
+    from langbridge.connectors.base.http_pool import HttpClientPool, RetryPolicy, get_http_client_pool
 except Exception:  # pragma: no cover
     httpx = None  # type: ignore
 
@@ -213,20 +215,20 @@ class DuckDuckGoInstantAnswerProvider:
     ) -> list[WebSearchResultItem]:
         if httpx is None:
             raise RuntimeError("httpx is required for DuckDuckGoInstantAnswerProvider.")
-        timeout = httpx.Timeout(timebox_seconds)
-        async with httpx.AsyncClient(timeout=timeout, headers={"User-Agent": self.user_agent}) as client:
-            results = await self._search_with_client_async(
-                client,
-                query,
-                max_results=max_results,
-                region=region,
-                safe_search=safe_search,
-            )
-            await self._attach_html_content_async(
-                client,
-                results,
-                timeout_seconds=min(max(1, timebox_seconds), 5),
-            )
+        pool = get_http_client_pool()
+        results = await self._search_with_pool_async(
+            pool,
+            query,
+            max_results=max_results,
+            region=region,
+            safe_search=safe_search,
+            timeout_seconds=timebox_seconds,
+        )
+        await self._attach_html_content_async(
+            pool,
+            results,
+            timeout_seconds=min(max(1, timebox_seconds), 5),
+        )
         return results
 
     def _search_with_client(
@@ -253,26 +255,37 @@ class DuckDuckGoInstantAnswerProvider:
         html_response.raise_for_status()
         return self._parse_html_results(html_response.text, max_results=max_results)
 
-    async def _search_with_client_async(
+    async def _search_with_pool_async(
         self,
-        client: "httpx.AsyncClient",
+        pool: "HttpClientPool",
         query: str,
         *,
         max_results: int,
         region: Optional[str],
         safe_search: Optional[str],
+        timeout_seconds: int,
     ) -> list[WebSearchResultItem]:
-        response = await client.get(self.base_url, params=self._build_params(query, region=region, safe_search=safe_search))
+        response = await pool.request(
+            "GET",
+            self.base_url,
+            retry=self._retry_policy(timeout_seconds),
+            timeout=httpx.Timeout(timeout_seconds),
+            headers={"User-Agent": self.user_agent},
+            params=self._build_params(query, region=region, safe_search=safe_search),
+        )
         response.raise_for_status()
         payload = response.json()
         results = self._parse_results(query, payload, max_results=max_results)
         if results:
             return results
 
-        html_response = await client.get(
+        html_response = await pool.request(
+            "GET",
             self.html_search_url,
+            retry=self._retry_policy(timeout_seconds),
+            timeout=httpx.Timeout(timeout_seconds),
+            headers={"User-Agent": self.user_agent},
             params=self._build_html_params(query, region=region, safe_search=safe_search),
-            follow_redirects=True,
         )
         html_response.raise_for_status()
         return self._parse_html_results(html_response.text, max_results=max_results)
@@ -331,7 +344,7 @@ class DuckDuckGoInstantAnswerProvider:
 
     async def _read_html_content_async(
         self,
-        client: "httpx.AsyncClient",
+        pool: "HttpClientPool",
         url: str,
         *,
         timeout_seconds: int,
@@ -339,7 +352,13 @@ class DuckDuckGoInstantAnswerProvider:
         if httpx is None or not url:
             return None
         try:
-            response = await client.get(url, timeout=httpx.Timeout(timeout_seconds), follow_redirects=True)
+            response = await pool.request(
+                "GET",
+                url,
+                retry=RetryPolicy(max_attempts=1),
+                timeout=httpx.Timeout(timeout_seconds),
+                headers={"User-Agent": self.user_agent},
+            )
             response.raise_for_status()
         except Exception:
             return None
@@ -359,19 +378,30 @@ class DuckDuckGoInstantAnswerProvider:
 
     async def _attach_html_content_async(
         self,
-        client: "httpx.AsyncClient",
+        pool: "HttpClientPool",
         results: list[WebSearchResultItem],
         *,
         timeout_seconds: int,
     ) -> None:
-        for result in results:
-            if result.html_content:
-                continue
-            result.html_content = await self._read_html_content_async(
-                client,
-                result.url,
-                timeout_seconds=timeout_seconds,
+        pending = [result for result in results if not result.html_content]
+        contents = await asyncio.gather(
+            *(
+                self._read_html_content_async(pool, result.url, timeout_seconds=timeout_seconds)
+                for result in pending
             )
+        )
+        for result, content in zip(pending, contents):
+            result.html_content = content
+
+    @staticmethod
+    def _retry_policy(timeout_seconds: int) -> "RetryPolicy":
+        # Keep retries inside the caller's timebox rather than honoring long Retry-After waits.
+        return RetryPolicy(
+            max_attempts=2,
+            backoff_base_s=0.25,
+            backoff_max_s=1.0,
+            max_retry_after_s=min(2.0, timeout_seconds / 2),
+        )
 
     def _parse_results(
         self,
@@ -1,9 +1,13 @@
 
 
+import functools
+import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Mapping, MutableMapping, Union
+from typing import Any, Callable, Mapping, MutableMapping, Union
+
+from langbridge import telemetry
 
 try:  # pragma: no cover - optional dependency fallback for lightweight test environments
     from langchain_core.messages import BaseMessage
@@ -32,6 +36,9 @@ class ProviderNotRegisteredError(LookupError):
     """Raised when no provider implementation is registered for a name."""
 
 
+_INSTRUMENTED_METHODS = ("complete", "acomplete", "invoke", "ainvoke", "create_embeddings")
+
+
 def _extract_value(obj: Any, key: str, default: Any = None) -> Any:
     if isinstance(obj, Mapping):
         return obj.get(key, default)
@@ -84,6 +91,14 @@ class LLMProvider(ABC):
 
     name: LLMProviderName
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for method_name in _INSTRUMENTED_METHODS:
+            method = cls.__dict__.get(method_name)
+            if method is None or getattr(method, "__isabstractmethod__", False):
+                continue
+            setattr(cls, method_name, _instrument_provider_call(method_name, method))
+
     def __init__(self, config: LLMConnectionConfig):
         if not isinstance(config, LLMConnectionConfig):
             raise ProviderConfigurationError("LLMProvider requires an LLMConnectionConfig instance.")
@@ -164,3 +179,38 @@ class LLMProvider(ABC):
         embedding_model: str | None = None,
     ) -> list[list[float]]:
         """Asynchronously create embeddings for a list of texts."""
+
+
+def _instrument_provider_call(operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a provider call in a span and its latency histogram."""
+    if getattr(method, "__langbridge_instrumented__", False):
+        return method
+    histogram = telemetry.EMBEDDING_DURATION if operation == "create_embeddings" else telemetry.LLM_CALL_DURATION
+
+    def _timed(provider: "LLMProvider"):
+        provider_name = getattr(getattr(provider, "name", None), "value", "unknown")
+        return telemetry.timed(
+            f"llm.{operation}",
+            histogram=histogram,
+            labels={"provider": provider_name, "operation": operation},
+            attributes={"model": getattr(getattr(provider, "_config", None), "model", None)},
+        )
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def _async_wrapper(self: "LLMProvider", *args: Any, **kwargs: Any) -> Any:
+            with _timed(self):
+                return await method(self, *args, **kwargs)
+
+        wrapper: Callable[..., Any] = _async_wrapper
+    else:
+
+        @functools.wraps(method)
+        def _sync_wrapper(self: "LLMProvider", *args: Any, **kwargs: Any) -> Any:
+            with _timed(self):
+                return method(self, *args, **kwargs)
+
+        wrapper = _sync_wrapper
+    wrapper.__langbridge_instrumented__ = True  # type: ignore[attr-defined]
+    return wrapper
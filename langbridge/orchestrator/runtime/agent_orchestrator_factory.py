@@ -7,7 +7,7 @@ import sqlglot
 import yaml
 from sqlglot import exp
 
-from langbridge.runtime.embeddings import EmbeddingProvider
+from langbridge.runtime.embeddings import Embedder
 from langbridge.orchestrator.errors import AgentError
 from langbridge.runtime.events import AgentEventEmitter
 from langbridge.runtime.models import DatasetMetadata, SemanticModelMetadata
@@ -176,7 +176,7 @@ class AgentOrchestratorFactory:
         *,
         definition: AgentDefinitionModel,
         llm_provider: LLMProvider,
-        embedding_provider: Optional[EmbeddingProvider],
+        embedding_provider: Optional[Embedder],
         event_emitter: Optional[AgentEventEmitter] = None,
     ) -> AgentRuntime:
         tool_config = self._build_agent_tool_config(definition)
@@ -352,7 +352,7 @@ class AgentOrchestratorFactory:
         tool_config: AgentToolConfig,
         access_policy: DataAccessPolicy,
         llm_provider: LLMProvider,
-        embedding_provider: Optional[EmbeddingProvider],
+        embedding_provider: Optional[Embedder],
         event_emitter: Optional[AgentEventEmitter],
     ) -> AnalystToolBuildResult:
         if not tool_config.allow_sql or not tool_config.analyst_bindings:
@@ -506,7 +506,7 @@ class AgentOrchestratorFactory:
         selected_datasets: list[DatasetMetadata],
         binding: AnalystBinding,
         llm_provider: LLMProvider,
-        embedding_provider: Optional[EmbeddingProvider],
+        embedding_provider: Optional[Embedder],
         event_emitter: Optional[AgentEventEmitter],
     ) -> SqlAnalystTool:
         workflow, _workflow_dialect = await self._build_dataset_workflow(selected_datasets)
@@ -541,7 +541,7 @@ class AgentOrchestratorFactory:
         binding: AnalystBinding,
         workflow: FederationWorkflow,
         llm_provider: LLMProvider,
-        embedding_provider: Optional[EmbeddingProvider],
+        embedding_provider: Optional[Embedder],
         event_emitter: Optional[AgentEventEmitter],
     ) -> SqlAnalystTool:
         context = await self._build_semantic_model_context(
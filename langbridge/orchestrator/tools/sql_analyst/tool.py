@@ -15,7 +15,7 @@ from typing import Any, Dict, List, Optional
 import sqlglot
 from sqlglot import exp
 
-from langbridge.runtime.embeddings import EmbeddingProvider
+from langbridge.runtime.embeddings import Embedder
 from langbridge.runtime.events import (
     AgentEventVisibility,
     AgentEventEmitter,
@@ -82,7 +82,7 @@ class SqlAnalystTool:
         logger: logging.Logger | None = None,
         llm_temperature: float = 0.0,
         priority: int = 0,
-        embedder: Optional[EmbeddingProvider] = None,
+        embedder: Optional[Embedder] = None,
         event_emitter: Optional[AgentEventEmitter] = None,
         semantic_vector_search_service: SemanticVectorSearchService | None = None,
         semantic_vector_search_workspace_id: uuid.UUID | None = None,
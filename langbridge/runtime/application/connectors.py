@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import uuid
 from typing import TYPE_CHECKING, Any, Mapping, Set
@@ -24,6 +25,7 @@ from langbridge.runtime.models.metadata import (
 )
 from langbridge.runtime.models.state import ConnectorSyncMode, ConnectorSyncStatus
 from langbridge.runtime.persistence.mappers.connectors import to_connector_record
+from langbridge.runtime.services.sync_executor import SYNC_PRIORITY_INTERACTIVE
 from langbridge.runtime.utils.connector_runtime import (
     build_connector_runtime_payload,
     resolve_connector_capabilities,
@@ -636,6 +638,7 @@ class ConnectorApplication:
         resources: list[str],
         sync_mode: str = "INCREMENTAL",
         force_full_refresh: bool = False,
+        priority: int = SYNC_PRIORITY_INTERACTIVE,
     ) -> dict[str, Any]:
         connector = self._host._resolve_connector(connector_name)
         normalized_resources = [
@@ -656,6 +659,7 @@ class ConnectorApplication:
             )
             datasets_by_resource = self._host._datasets_for_resources(datasets)
 
+        dataset_refs: list[str] = []
         for resource_name in normalized_resources:
             bound_datasets = datasets_by_resource.get(resource_name, [])
             if not bound_datasets:
@@ -668,17 +672,40 @@ class ConnectorApplication:
                     f"Connector '{connector.name}' has multiple synced datasets bound to resource path "
                     f"'{resource_name}'. Resource paths must be unique per connector."
                 )
-            dataset_payload = await self._host.sync_dataset(
-                dataset_ref=str(bound_datasets[0].id),
-                sync_mode=normalized_sync_mode,
-                force_full_refresh=force_full_refresh,
-            )
-            resource_summaries = list(dataset_payload.get("resources") or [])
+            dataset_refs.append(str(bound_datasets[0].id))
+
+        # Resources sync concurrently; the host's sync executor bounds how many hit the
+        # connector at once, so one slow resource no longer holds up the rest. A failed
+        # resource is reported next to the others' summaries instead of replacing them.
+        outcomes = await asyncio.gather(
+            *(
+                self._host.sync_dataset(
+                    dataset_ref=dataset_ref,
+                    sync_mode=normalized_sync_mode,
+                    force_full_refresh=force_full_refresh,
+                    priority=priority,
+                )
+                for dataset_ref in dataset_refs
+            ),
+            return_exceptions=True,
+        )
+        errors: list[dict[str, Any]] = []
+        for resource_name, dataset_ref, outcome in zip(normalized_resources, dataset_refs, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                errors.append({"resource_name": resource_name, "dataset_id": dataset_ref, "error": str(outcome)})
+                continue
+            resource_summaries = list(outcome.get("resources") or [])
             if resource_summaries:
                 summaries.append(resource_summaries[0])
 
+        summary = f"Connector resource sync delegated to {len(summaries)} dataset(s)."
+        if errors:
+            failed = ", ".join(f"'{error['resource_name']}' ({error['error']})" for error in errors)
+            summary = f"{summary} {len(errors)} failed: {failed}."
         return {
-            "status": "succeeded",
+            "status": "failed" if errors else "succeeded",
             "connector_id": connector.id,
             "connector_name": connector.name,
             "sync_mode": (
@@ -687,5 +714,6 @@ class ConnectorApplication:
                 else normalized_sync_mode.value
             ),
             "resources": summaries,
-            "summary": f"Connector resource sync delegated to {len(summaries)} dataset(s).",
+            "errors": errors,
+            "summary": summary,
         }
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Mapping
+from urllib.parse import urlsplit
 
 from langbridge.connectors.base import ApiResource, SqlConnectorFactory
 from langbridge.connectors.base.config import ConnectorSyncStrategy
@@ -46,6 +47,7 @@ from langbridge.runtime.utils.datasets import (
 )
 from langbridge.runtime.utils.lineage import stable_payload_hash
 from langbridge.runtime.services.dataset_execution import describe_file_source_schema
+from langbridge.runtime.services.sync_executor import SYNC_PRIORITY_INTERACTIVE
 
 if TYPE_CHECKING:
     from langbridge.runtime.bootstrap.configured_runtime import ConfiguredLocalRuntimeHost
@@ -171,6 +173,7 @@ class _DatasetSyncInput:
     lookback_window: str | None
     backfill_start: str | None
     backfill_end: str | None
+    partition_by: str | None
 
     @classmethod
     def from_config(cls, request: LocalRuntimeDatasetConfig) -> "_DatasetSyncInput":
@@ -186,6 +189,7 @@ class _DatasetSyncInput:
                 lookback_window=None,
                 backfill_start=None,
                 backfill_end=None,
+                partition_by=None,
             )
         return cls(
             source=_DatasetSourceInput.from_source_config(sync_config.source),
@@ -197,6 +201,7 @@ class _DatasetSyncInput:
             lookback_window=str(sync_config.lookback_window or "").strip() or None,
             backfill_start=str(sync_config.backfill_start or "").strip() or None,
             backfill_end=str(sync_config.backfill_end or "").strip() or None,
+            partition_by=str(sync_config.partition_by or "").strip() or None,
         )
 
     @property
@@ -232,6 +237,18 @@ def _sync_source_key(source: _DatasetSourceInput) -> str:
     raise BusinessValidationError("Synced datasets must define sync.source.")
 
 
+def _sync_source_host(connector: ConnectorMetadata) -> str | None:
+    connector_config = (connector.config or {}).get("config") or {}
+    host = str(connector_config.get("host") or "").strip()
+    if host:
+        return host
+    for key in ("base_url", "api_base_url", "url"):
+        value = str(connector_config.get(key) or "").strip()
+        if value:
+            return urlsplit(value).hostname
+    return None
+
+
 def _sync_source_label(source: _DatasetSourceInput) -> str:
     if source.is_resource:
         return f"API resource path '{source.resource_name}'"
@@ -761,6 +778,7 @@ class DatasetApplication:
                 lookback_window=sync_config.lookback_window,
                 backfill_start=sync_config.backfill_start,
                 backfill_end=sync_config.backfill_end,
+                partition_by=sync_config.partition_by,
             ),
         )
         return resolved_connector, sync_config
@@ -814,6 +832,7 @@ class DatasetApplication:
         if requested_strategy not in {
             ConnectorSyncStrategy.FULL_REFRESH,
             ConnectorSyncStrategy.INCREMENTAL,
+            ConnectorSyncStrategy.CDC,
         }:
             raise BusinessValidationError(
                 f"Dataset '{dataset_name}' requests unsupported sync strategy '{requested_strategy.value}'."
@@ -827,6 +846,16 @@ class DatasetApplication:
                 f"Dataset '{dataset_name}' requests incremental sync, "
                 f"but connector '{connector.name}' does not support incremental sync."
             )
+        if requested_strategy == ConnectorSyncStrategy.CDC:
+            if not connector_capabilities.supports_change_data_capture:
+                raise BusinessValidationError(
+                    f"Dataset '{dataset_name}' requests CDC sync, "
+                    f"but connector '{connector.name}' does not support change data capture."
+                )
+            if not sync.source.is_table:
+                raise BusinessValidationError(
+                    f"Dataset '{dataset_name}' requests CDC sync, which requires sync.source.table."
+                )
         return DatasetSyncConfig(
             source=_sync_source_payload(sync.source),
             strategy=requested_strategy,
@@ -837,12 +866,15 @@ class DatasetApplication:
             lookback_window=sync.lookback_window,
             backfill_start=sync.backfill_start,
             backfill_end=sync.backfill_end,
+            partition_by=sync.partition_by,
         )
 
     async def build_scheduled_sync_tasks(self):
         from langbridge.runtime.hosting.background import (
+            BackgroundTaskSchedule,
             RuntimeBackgroundTaskDefinition,
             background_task_schedule_from_dataset_cadence,
+            build_dataset_compaction_default_task,
             build_dataset_sync_default_task,
         )
 
@@ -854,9 +886,11 @@ class DatasetApplication:
             )
 
         tasks: list[RuntimeBackgroundTaskDefinition] = []
+        has_synced_datasets = False
         for dataset in datasets:
             if dataset.materialization_mode != DatasetMaterializationMode.SYNCED:
                 continue
+            has_synced_datasets = True
             connector = self._host._connector_for_id(dataset.connection_id)
             _, sync_config = self._require_dataset_sync_contract(
                 dataset=dataset,
@@ -880,6 +914,14 @@ class DatasetApplication:
                     ),
                 )
             )
+        if has_synced_datasets and settings.DATASET_COMPACTION_INTERVAL_SECONDS > 0:
+            tasks.append(
+                build_dataset_compaction_default_task(
+                    schedule=BackgroundTaskSchedule.interval(
+                        seconds=settings.DATASET_COMPACTION_INTERVAL_SECONDS
+                    ),
+                )
+            )
         return tuple(tasks)
 
     def _validate_dataset_mutation(
@@ -1735,6 +1777,7 @@ class DatasetApplication:
         dataset_ref: str,
         sync_mode: str = "INCREMENTAL",
         force_full_refresh: bool = False,
+        priority: int = SYNC_PRIORITY_INTERACTIVE,
     ) -> dict[str, Any]:
         async with self._host._runtime_operation_scope():
             dataset = await self._host._resolve_dataset_record(dataset_ref)
@@ -1745,50 +1788,71 @@ class DatasetApplication:
             )
 
         requested_sync_mode = self._host._normalize_sync_mode(sync_mode)
+        effective_sync_mode = ConnectorSyncMode.FULL_REFRESH if force_full_refresh else requested_sync_mode
 
-        active_state = None
-        try:
-            async with self._host._runtime_operation_scope() as uow:
-                dataset = await self._host._resolve_dataset_record(dataset_ref)
-                summary = await self._host._runtime_host.sync_dataset(
-                    workspace_id=self._host.context.workspace_id,
-                    actor_id=self._host.context.actor_id,
-                    connector_record=connector,
-                    dataset=dataset,
-                    sync_mode=(
-                        ConnectorSyncMode.FULL_REFRESH
-                        if force_full_refresh
-                        else requested_sync_mode
-                    ),
-                )
-                sync_source = _DatasetSourceInput.from_source_config(sync_config.source)
-                active_state = await self._host.services.dataset_sync.get_or_create_state(
-                    workspace_id=self._host.context.workspace_id,
-                    connection_id=connector.id,
-                    connector_type=self._host._resolve_connector_runtime_type(connector),
-                    resource_name=_sync_source_key(sync_source),
-                    sync_mode=requested_sync_mode,
-                )
-                if uow is not None:
-                    await uow.commit()
-        except Exception as exc:
-            if active_state is not None:
+        async def _run() -> dict[str, Any]:
+            active_state = None
+            try:
+                async with self._host._runtime_operation_scope() as uow:
+                    dataset = await self._host._resolve_dataset_record(dataset_ref)
+                    summary = await self._host._runtime_host.sync_dataset(
+                        workspace_id=self._host.context.workspace_id,
+                        actor_id=self._host.context.actor_id,
+                        connector_record=connector,
+                        dataset=dataset,
+                        sync_mode=effective_sync_mode,
+                    )
+                    sync_source = _DatasetSourceInput.from_source_config(sync_config.source)
+                    active_state = await self._host.services.dataset_sync.get_or_create_state(
+                        workspace_id=self._host.context.workspace_id,
+                        connection_id=connector.id,
+                        connector_type=self._host._resolve_connector_runtime_type(connector),
+                        resource_name=_sync_source_key(sync_source),
+                        sync_mode=requested_sync_mode,
+                    )
+                    if uow is not None:
+                        await uow.commit()
+            except Exception as exc:
                 async with self._host._runtime_operation_scope() as failure_uow:
+                    # The sync's unit of work was rolled back, so resolve the state again;
+                    # mark_failed restores any SQL resume checkpoint onto it.
+                    if active_state is None:
+                        active_state = await self._host.services.dataset_sync.get_or_create_state(
+                            workspace_id=self._host.context.workspace_id,
+                            connection_id=connector.id,
+                            connector_type=self._host._resolve_connector_runtime_type(connector),
+                            resource_name=_sync_source_key(
+                                _DatasetSourceInput.from_source_config(sync_config.source)
+                            ),
+                            sync_mode=requested_sync_mode,
+                        )
                     await self._host.services.dataset_sync.mark_failed(
                         state=active_state,
                         error_message=str(exc),
                     )
                     if failure_uow is not None:
                         await failure_uow.commit()
-            raise
+                raise
 
-        return {
-            "status": "succeeded",
-            "dataset_id": dataset.id,
-            "dataset_name": dataset.name,
-            "connector_id": connector.id,
-            "connector_name": connector.name,
-            "sync_mode": summary.get("sync_mode"),
-            "resources": [summary],
-            "summary": f"Dataset sync completed for '{dataset.name}'.",
-        }
+            return {
+                "status": "succeeded",
+                "dataset_id": dataset.id,
+                "dataset_name": dataset.name,
+                "connector_id": connector.id,
+                "connector_name": connector.name,
+                "sync_mode": summary.get("sync_mode"),
+                "resources": [summary],
+                "summary": f"Dataset sync completed for '{dataset.name}'.",
+            }
+
+        # Overlapping requests for the same dataset and mode share one run; the executor
+        # also caps concurrent syncs per connector and per source host.
+        return await self._host.sync_executor.run(
+            key=f"{dataset.id}:{effective_sync_mode.value}",
+            run=_run,
+            workspace=str(self._host.context.workspace_id),
+            connector=str(connector.id),
+            host=_sync_source_host(connector),
+            dataset=str(dataset.id),
+            priority=priority,
+        )
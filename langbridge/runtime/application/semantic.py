@@ -14,7 +14,8 @@ from langbridge.runtime.models.metadata import (
     SemanticModelMetadata,
 )
 from langbridge.runtime.persistence.mappers.semantic_models import to_semantic_model_record
-from langbridge.semantic.query import SemanticQuery
+from langbridge.runtime.services.semantic_result_cache import get_semantic_result_cache
+from langbridge.semantic.query import SemanticQuery, get_compiled_semantic_model_cache
 from langbridge.semantic.loader import SemanticModelError, load_semantic_model, load_unified_semantic_model
 
 if TYPE_CHECKING:
@@ -296,6 +297,8 @@ class SemanticApplication:
             await uow.commit()
 
         self._host._upsert_runtime_semantic_model_record(updated_record)
+        get_compiled_semantic_model_cache().invalidate(updated_record.id)
+        get_semantic_result_cache().invalidate_model(updated_record.id)
         return await self.get_semantic_model(model_ref=str(updated_record.id))
 
     async def delete_semantic_model(self, *, model_ref: str) -> dict[str, Any]:
@@ -318,6 +321,8 @@ class SemanticApplication:
             model_name=record.name,
             model_id=record.id,
         )
+        get_compiled_semantic_model_cache().invalidate(record.id)
+        get_semantic_result_cache().invalidate_model(record.id)
         return {"ok": True, "deleted": True, "id": record.id, "name": record.name}
 
     async def query_semantic(self, *args: Any, **kwargs: Any) -> Any:
@@ -431,6 +436,63 @@ class SemanticApplication:
             response_payload["connector_id"] = connector_id
         return response_payload
 
+    async def refresh_semantic_pre_aggregations(
+        self,
+        *,
+        semantic_model: str | None = None,
+        names: list[str] | None = None,
+        force: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Refresh the pre-aggregations of one semantic model, or of every model that declares them."""
+        records = (
+            [self._host._resolve_semantic_model_record(semantic_model)]
+            if semantic_model
+            else [
+                record
+                for record in self._host._semantic_models.values()
+                if record.semantic_model is not None and record.semantic_model.pre_aggregations
+            ]
+        )
+        results: list[dict[str, Any]] = []
+        async with self._host._runtime_operation_scope() as uow:
+            for record in records:
+                refreshed = await self._host._runtime_host.refresh_semantic_pre_aggregations(
+                    workspace_id=self._host.context.workspace_id,
+                    semantic_model_id=record.id,
+                    names=names,
+                    force=force,
+                )
+                results.extend({"semantic_model": record.name, **item} for item in refreshed)
+            if uow is not None:
+                await uow.commit()
+        return results
+
+    def build_scheduled_pre_aggregation_tasks(self):
+        from langbridge.runtime.hosting.background import (
+            RuntimeBackgroundTaskDefinition,
+            background_task_schedule_from_dataset_cadence,
+            build_semantic_pre_aggregation_refresh_default_task,
+        )
+
+        tasks: list[RuntimeBackgroundTaskDefinition] = []
+        for record in self._host._semantic_models.values():
+            if record.semantic_model is None:
+                continue
+            for name, definition in (record.semantic_model.pre_aggregations or {}).items():
+                tasks.append(
+                    build_semantic_pre_aggregation_refresh_default_task(
+                        semantic_model=record.name,
+                        pre_aggregation=name,
+                        schedule=(
+                            background_task_schedule_from_dataset_cadence(definition.refresh_every)
+                            if definition.refresh_every
+                            else None
+                        ),
+                        run_on_startup=True,
+                    )
+                )
+        return tuple(tasks)
+
     async def refresh_semantic_vector_search(self, *args: Any, **kwargs: Any) -> Any:
         async with self._host._runtime_operation_scope() as uow:
             result = await self._host._runtime_host.refresh_semantic_vector_search(*args, **kwargs)
@@ -35,6 +35,7 @@ from langbridge.runtime.ports import (
 )
 from langbridge.runtime.utils.connector_runtime import (
     build_connector_runtime_payload,
+    configure_api_response_cache,
     resolve_connector_capabilities,
 )
 from langbridge.connectors.base.resource_paths import (
@@ -127,6 +128,7 @@ from langbridge.runtime.services.semantic_vector_search_service import (
     SemanticVectorSearchService,
 )
 from langbridge.runtime.services.sql_query_service import SqlQueryService
+from langbridge.runtime.services.sync_executor import SYNC_PRIORITY_INTERACTIVE, SyncExecutor
 from langbridge.runtime.settings import runtime_settings as settings
 from langbridge.orchestrator.definitions import AgentDefinitionFactory
 from langbridge.semantic.loader import (
@@ -344,6 +346,7 @@ class ConfiguredLocalRuntimeHost(RuntimeHost):
         thread_repository: ThreadStore,
         thread_message_repository: ThreadMessageStore,
         persistence_controller: _ConfiguredRuntimePersistenceController | None = None,
+        sync_executor: SyncExecutor | None = None,
         owns_runtime_resources: bool = True,
     ) -> None:
         self._config_path = config_path
@@ -366,6 +369,7 @@ class ConfiguredLocalRuntimeHost(RuntimeHost):
         self._thread_repository = thread_repository
         self._thread_message_repository = thread_message_repository
         self._persistence_controller = persistence_controller
+        self._sync_executor = sync_executor or SyncExecutor.from_settings()
         self._owns_runtime_resources = owns_runtime_resources
         self.context = context
         self._applications = build_runtime_applications(self)
@@ -382,6 +386,10 @@ class ConfiguredLocalRuntimeHost(RuntimeHost):
     def persistence_controller(self):
         return self._persistence_controller
 
+    @property
+    def sync_executor(self) -> SyncExecutor:
+        return self._sync_executor
+
     @property
     def metadata_store(self) -> ResolvedLocalRuntimeMetadataStoreConfig:
         return self._metadata_store
@@ -411,10 +419,13 @@ class ConfiguredLocalRuntimeHost(RuntimeHost):
             thread_repository=self._thread_repository,
             thread_message_repository=self._thread_message_repository,
             persistence_controller=self._persistence_controller,
+            sync_executor=self._sync_executor,
             owns_runtime_resources=False,
         )
 
     async def aclose(self) -> None:
+        if self._owns_runtime_resources:
+            await self._sync_executor.aclose()
         if self._owns_runtime_resources and self._persistence_controller is not None:
             await self._persistence_controller.aclose()
         await self._runtime_host.aclose()
@@ -521,11 +532,13 @@ class ConfiguredLocalRuntimeHost(RuntimeHost):
         dataset_ref: str,
         sync_mode: str = "INCREMENTAL",
         force_full_refresh: bool = False,
+        priority: int = SYNC_PRIORITY_INTERACTIVE,
     ) -> dict[str, Any]:
         return await self._applications.datasets.sync_dataset(
             dataset_ref=dataset_ref,
             sync_mode=sync_mode,
             force_full_refresh=force_full_refresh,
+            priority=priority,
         )
 
     async def query_semantic(self, *args: Any, **kwargs: Any) -> Any:
@@ -889,12 +902,27 @@ class ConfiguredLocalRuntimeHost(RuntimeHost):
         resources: list[str],
         sync_mode: str = "INCREMENTAL",
         force_full_refresh: bool = False,
+        priority: int = SYNC_PRIORITY_INTERACTIVE,
     ) -> dict[str, Any]:
         return await self._applications.connectors.sync_connector_resources(
             connector_name=connector_name,
             resources=resources,
             sync_mode=sync_mode,
             force_full_refresh=force_full_refresh,
+            priority=priority,
+        )
+
+    async def refresh_semantic_pre_aggregations(
+        self,
+        *,
+        semantic_model: str | None = None,
+        names: list[str] | None = None,
+        force: bool = False,
+    ) -> list[dict[str, Any]]:
+        return await self._applications.semantic.refresh_semantic_pre_aggregations(
+            semantic_model=semantic_model,
+            names=names,
+            force=force,
         )
 
     async def refresh_semantic_vector_search(self, *args: Any, **kwargs: Any) -> Any:
@@ -1524,6 +1552,7 @@ class ConfiguredLocalRuntimeHostFactory:
     ) -> ConfiguredLocalRuntimeHost:
         resolved_config_path = Path(config_path).resolve()
         local_runtime_config: LocalRuntimeConfig = ConfiguredLocalRuntimeHostFactory._load_config(resolved_config_path)
+        configure_api_response_cache()
         resources = ConfiguredLocalRuntimeHostFactory._build_resources(
             config_path=resolved_config_path,
             config=local_runtime_config,
@@ -2141,6 +2170,7 @@ class ConfiguredLocalRuntimeHostFactory:
                 if sync_strategy not in {
                     ConnectorSyncStrategy.FULL_REFRESH,
                     ConnectorSyncStrategy.INCREMENTAL,
+                    ConnectorSyncStrategy.CDC,
                 }:
                     raise ValueError(
                         f"Dataset '{dataset.name}' requests unsupported sync strategy '{sync_strategy.value}'."
@@ -2153,6 +2183,16 @@ class ConfiguredLocalRuntimeHostFactory:
                         f"Dataset '{dataset.name}' requests incremental sync, "
                         f"but connector '{connector.name}' does not support incremental sync."
                     )
+                if sync_strategy == ConnectorSyncStrategy.CDC:
+                    if not connector_capabilities.supports_change_data_capture:
+                        raise ValueError(
+                            f"Dataset '{dataset.name}' requests CDC sync, "
+                            f"but connector '{connector.name}' does not support change data capture."
+                        )
+                    if not sync_source.table:
+                        raise ValueError(
+                            f"Dataset '{dataset.name}' requests CDC sync, which requires sync.source.table."
+                        )
                 sync_contract = DatasetSyncConfig(
                     source=sync_source.model_dump(mode="json", exclude_none=True),
                     strategy=sync_strategy,
@@ -2163,6 +2203,7 @@ class ConfiguredLocalRuntimeHostFactory:
                     lookback_window=str(sync_config.lookback_window or "").strip() or None,
                     backfill_start=str(sync_config.backfill_start or "").strip() or None,
                     backfill_end=str(sync_config.backfill_end or "").strip() or None,
+                    partition_by=str(sync_config.partition_by or "").strip() or None,
                 )
                 binding_key = (connector.id, str(sync_source_key or ""))
                 if binding_key in synced_source_bindings:
@@ -93,6 +93,7 @@ from langbridge.runtime.services.semantic_vector_search_service import (
     SemanticVectorSearchService,
 )
 from langbridge.runtime.services.sql_query_service import SqlQueryService
+from langbridge.runtime.utils.connector_runtime import configure_api_response_cache
 
 
 def build_local_runtime(
@@ -118,6 +119,7 @@ def build_local_runtime(
     logger: logging.Logger | None = None,
     cache_metadata: bool = True,
 ) -> RuntimeHost:
+    configure_api_response_cache()
     dataset_store = RepositoryDatasetCatalogStore(repository=dataset_repository)
     dataset_column_store = (
         RepositoryDatasetColumnStore(repository=dataset_column_repository)
@@ -84,6 +84,7 @@ class LocalRuntimeDatasetSyncConfig(BaseModel):
     lookback_window: str | None = None
     backfill_start: str | None = None
     backfill_end: str | None = None
+    partition_by: str | None = None
     sync_on_start: bool = False
 
     @field_validator("strategy", mode="before")
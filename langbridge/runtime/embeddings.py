@@ -1,20 +1,160 @@
 
 import asyncio
-from dataclasses import dataclass
-from typing import Any, Iterable, List, Sequence
+import hashlib
+import math
+import sqlite3
+import threading
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, List, Protocol, Sequence
 
-from openai import AzureOpenAI, OpenAI, OpenAIError  # type: ignore[import-untyped]
+from openai import (  # type: ignore[import-untyped]
+    APIConnectionError,
+    APIStatusError,
+    AsyncAzureOpenAI,
+    AsyncOpenAI,
+    OpenAIError,
+)
 
+from langbridge.connectors.base.http_pool import RetryPolicy
+from langbridge import telemetry
 from langbridge.runtime.models import LLMProvider
+from langbridge.runtime.settings import runtime_settings as settings
 
 DEFAULT_OPENAI_EMBED_MODEL = "text-embedding-3-small"
 DEFAULT_AZURE_API_VERSION = "2024-05-01-preview"
+# OpenAI caps a request at 2048 inputs and 300k tokens; stay under both.
+DEFAULT_EMBEDDING_BATCH_SIZE = 1000
+DEFAULT_EMBEDDING_BATCH_TOKENS = 250_000
+DEFAULT_EMBEDDING_MAX_CONCURRENCY = 4
+DEFAULT_EMBEDDING_COALESCE_MS = 5
+DEFAULT_EMBEDDING_MAX_ATTEMPTS = 6
 
 
 class EmbeddingProviderError(RuntimeError):
     pass
 
 
+class Embedder(Protocol):
+    """What callers need from an embedding provider."""
+
+    embedding_model: str | None
+
+    async def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        """One vector per non-blank text, in order."""
+        ...
+
+
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English; counting UTF-8 bytes / 3 errs
+    # high so batches stay under the request limit without a tokenizer.
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batched provider calls.
+
+    Texts requested within `coalesce_window_s` of each other are sent together;
+    a text already waiting or in flight is not sent again, its callers share one
+    result. Batches are cut at `max_batch_texts` texts or `max_batch_tokens`
+    estimated tokens and at most `max_concurrency` are sent at once.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[str]], Awaitable[List[List[float]]]],
+        *,
+        max_batch_texts: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS,
+        max_concurrency: int = DEFAULT_EMBEDDING_MAX_CONCURRENCY,
+        coalesce_window_s: float = DEFAULT_EMBEDDING_COALESCE_MS / 1000,
+    ) -> None:
+        self._send = send
+        self._max_batch_texts = max(1, int(max_batch_texts))
+        self._max_batch_tokens = max(1, int(max_batch_tokens))
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._coalesce_window_s = max(0.0, float(coalesce_window_s))
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._in_flight: dict[str, asyncio.Future[List[float]]] = {}
+        self._pending: list[str] = []
+        self._pending_tokens = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures and semaphores belong to one event loop.
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._in_flight = {}
+            self._pending = []
+            self._pending_tokens = 0
+            self._flush_handle = None
+
+        futures: list[asyncio.Future[List[float]]] = []
+        for text in texts:
+            future = self._in_flight.get(text)
+            if future is None:
+                future = loop.create_future()
+                self._in_flight[text] = future
+                self._pending.append(text)
+                self._pending_tokens += estimate_tokens(text)
+            futures.append(future)
+
+        if len(self._pending) >= self._max_batch_texts or self._pending_tokens >= self._max_batch_tokens:
+            self._flush()
+        elif self._pending and self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._coalesce_window_s, self._flush)
+        # Shielded: one caller giving up must not cancel a result others share.
+        vectors = await asyncio.gather(*(asyncio.shield(future) for future in futures))
+        return [list(vector) for vector in vectors]
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending, self._pending_tokens = self._pending, [], 0
+        for batch in _token_batches(pending, self._max_batch_texts, self._max_batch_tokens):
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: List[str]) -> None:
+        assert self._semaphore is not None
+        try:
+            async with self._semaphore:
+                vectors = await self._send(batch)
+            if len(vectors) != len(batch):
+                raise EmbeddingProviderError(
+                    f"Embedding provider returned {len(vectors)} vectors for {len(batch)} texts."
+                )
+        except Exception as exc:
+            self._settle(batch, error=exc)
+            return
+        except BaseException:
+            self._settle(batch, error=None)
+            raise
+        for text, vector in zip(batch, vectors):
+            future = self._in_flight.pop(text, None)
+            if future is not None and not future.done():
+                future.set_result(vector)
+
+    def _settle(self, batch: List[str], *, error: Exception | None) -> None:
+        # Fail (or, when the dispatch itself was cancelled, cancel) every waiter.
+        for text in batch:
+            future = self._in_flight.pop(text, None)
+            if future is None or future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+
 @dataclass(slots=True)
 class EmbeddingProvider:
     provider: LLMProvider
@@ -23,13 +163,36 @@ class EmbeddingProvider:
     configuration: dict
     embedding_model: str | None = None
     _client: Any | None = None
-    _batch_size: int = 1000
+    _client_loop: asyncio.AbstractEventLoop | None = None
+    _batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE
+    _dimensions: int | None = None
+    _retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    _batcher: EmbeddingBatcher | None = None
 
     def __post_init__(self) -> None:
         self.configuration = dict(self.configuration or {})
         self.embedding_model = self._resolve_embedding_model()
         self._client = self._build_client()
-        self._batch_size = int(self.configuration.get("embedding_batch_size", 1000))
+        self._batch_size = int(self.configuration.get("embedding_batch_size", DEFAULT_EMBEDDING_BATCH_SIZE))
+        dimensions = self.configuration.get("embedding_dimensions")
+        self._dimensions = int(dimensions) if dimensions else None
+        self._retry_policy = RetryPolicy(
+            max_attempts=int(self.configuration.get("embedding_max_attempts", DEFAULT_EMBEDDING_MAX_ATTEMPTS))
+        )
+        self._batcher = EmbeddingBatcher(
+            self._embed_chunk,
+            max_batch_texts=self._batch_size,
+            max_batch_tokens=int(
+                self.configuration.get("embedding_batch_tokens", DEFAULT_EMBEDDING_BATCH_TOKENS)
+            ),
+            max_concurrency=int(
+                self.configuration.get("embedding_max_concurrency", DEFAULT_EMBEDDING_MAX_CONCURRENCY)
+            ),
+            coalesce_window_s=float(
+                self.configuration.get("embedding_coalesce_ms", DEFAULT_EMBEDDING_COALESCE_MS)
+            )
+            / 1000,
+        )
 
     @classmethod
     def from_llm_connection(cls, connection: Any) -> "EmbeddingProvider":
@@ -42,28 +205,68 @@ class EmbeddingProvider:
             configuration=getattr(connection, "configuration", {}) or {},
         )
 
+    @property
+    def cache_key(self) -> str:
+        """Names the vector space this provider embeds into: provider, endpoint, model or deployment, dimensions."""
+        endpoint = self.configuration.get("api_base") or self.configuration.get("azure_endpoint") or ""
+        return "|".join(
+            (self.provider.value, str(endpoint).rstrip("/"), str(self.embedding_model), str(self._dimensions or ""))
+        )
+
     async def embed(self, texts: Sequence[str]) -> List[List[float]]:
         cleaned = [text.strip() for text in texts if isinstance(text, str) and text.strip()]
         if not cleaned:
             return []
+        assert self._batcher is not None
+        return await self._batcher.embed(cleaned)
 
-        embeddings: List[List[float]] = []
-        for chunk in _chunk(cleaned, self._batch_size):
-            chunk_embeddings = await asyncio.to_thread(self._embed_chunk, chunk)
-            embeddings.extend(chunk_embeddings)
-        return embeddings
-
-    def _embed_chunk(self, chunk: Sequence[str]) -> List[List[float]]:
-        try:
-            response = self._client.embeddings.create(
-                model=self.embedding_model,
-                input=list(chunk),
-            )
-        except OpenAIError as exc:  # pragma: no cover
-            raise EmbeddingProviderError(f"Embedding request failed: {exc}") from exc
-
+    async def _embed_chunk(self, chunk: List[str]) -> List[List[float]]:
+        labels = {"provider": self.provider.value}
+        # Same label set as the orchestrator's `create_embeddings` calls, which record this histogram too.
+        duration_labels = {**labels, "operation": "create_embeddings"}
+        client = self._client_for_loop()
+        options = {"dimensions": self._dimensions} if self._dimensions else {}
+        attempt = 1
+        while True:
+            try:
+                with telemetry.timed(
+                    "embedding.request",
+                    histogram=telemetry.EMBEDDING_DURATION,
+                    labels=duration_labels,
+                    attributes={"model": self.embedding_model, "texts": len(chunk), "attempt": attempt},
+                ):
+                    response = await client.embeddings.create(
+                        model=self.embedding_model,
+                        input=list(chunk),
+                        **options,
+                    )
+                break
+            except (APIStatusError, APIConnectionError) as exc:
+                response_payload = getattr(exc, "response", None)
+                status_code = getattr(response_payload, "status_code", None)
+                # Embedding the same texts twice is harmless, so 5xx responses are retried
+                # like 429s even though the request is a POST.
+                retryable = (
+                    isinstance(exc, APIConnectionError)
+                    or int(status_code or 0) in self._retry_policy.retry_statuses
+                )
+                if not retryable or attempt >= self._retry_policy.max_attempts:
+                    raise EmbeddingProviderError(f"Embedding request failed: {exc}") from exc
+                await asyncio.sleep(self._retry_policy.delay_s(attempt=attempt, response=response_payload))
+                attempt += 1
+            except OpenAIError as exc:  # pragma: no cover
+                raise EmbeddingProviderError(f"Embedding request failed: {exc}") from exc
+        telemetry.increment(telemetry.EMBEDDING_TEXTS, len(chunk), labels=labels)
         return [list(item.embedding) for item in response.data]
 
+    def _client_for_loop(self) -> Any:
+        # Async clients hold connections bound to the loop that first used them.
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not None and self._client_loop is not loop:
+            self._client = self._build_client()
+        self._client_loop = loop
+        return self._client
+
     def _resolve_embedding_model(self) -> str:
         configured = (
             self.configuration.get("embedding_model")
@@ -82,8 +285,9 @@ class EmbeddingProvider:
         raise EmbeddingProviderError(f"Provider '{self.provider}' does not support embeddings.")
 
     def _build_client(self):
+        # Retries are ours (see `_embed_chunk`), so the client's own are disabled.
         if self.provider == LLMProvider.OPENAI:
-            return OpenAI(api_key=self.api_key)
+            return AsyncOpenAI(api_key=self.api_key, max_retries=0)
         if self.provider == LLMProvider.AZURE:
             endpoint = self.configuration.get("api_base") or self.configuration.get("azure_endpoint")
             if not endpoint:
@@ -91,20 +295,216 @@ class EmbeddingProvider:
                     "Azure OpenAI connections must include 'api_base' in configuration."
                 )
             api_version = self.configuration.get("api_version", DEFAULT_AZURE_API_VERSION)
-            return AzureOpenAI(
+            return AsyncAzureOpenAI(
                 api_key=self.api_key,
                 azure_endpoint=endpoint,
                 api_version=api_version,
+                max_retries=0,
             )
         raise EmbeddingProviderError(f"Provider '{self.provider}' does not support embeddings.")
 
 
-def _chunk(values: Iterable[str], size: int) -> Iterable[List[str]]:
+class LocalEmbeddingProvider:
+    """
+    Deterministic, offline embedder for tests and local development.
+
+    Each text maps to a unit vector derived from its SHA-256 digest, so equal texts
+    always embed equally. Requests go through the same `EmbeddingBatcher` as the
+    hosted providers; `batches` records every batch sent.
+    """
+
+    def __init__(
+        self,
+        *,
+        dimension: int = 16,
+        max_batch_texts: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS,
+        max_concurrency: int = DEFAULT_EMBEDDING_MAX_CONCURRENCY,
+        coalesce_window_s: float = DEFAULT_EMBEDDING_COALESCE_MS / 1000,
+    ) -> None:
+        self.dimension = int(dimension)
+        self.embedding_model = f"local-sha256-{self.dimension}"
+        self.cache_key = f"local|{self.embedding_model}"
+        self.batches: list[list[str]] = []
+        self._batcher = EmbeddingBatcher(
+            self._embed_chunk,
+            max_batch_texts=max_batch_texts,
+            max_batch_tokens=max_batch_tokens,
+            max_concurrency=max_concurrency,
+            coalesce_window_s=coalesce_window_s,
+        )
+
+    async def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        cleaned = [text.strip() for text in texts if isinstance(text, str) and text.strip()]
+        if not cleaned:
+            return []
+        return await self._batcher.embed(cleaned)
+
+    async def _embed_chunk(self, chunk: List[str]) -> List[List[float]]:
+        self.batches.append(list(chunk))
+        return [self.vector(text) for text in chunk]
+
+    def vector(self, text: str) -> List[float]:
+        digest = b""
+        counter = 0
+        while len(digest) < self.dimension:
+            digest += hashlib.sha256(f"{counter}:{text}".encode("utf-8")).digest()
+            counter += 1
+        values = [byte / 127.5 - 1.0 for byte in digest[: self.dimension]]
+        norm = math.sqrt(sum(value * value for value in values)) or 1.0
+        return [value / norm for value in values]
+
+
+def _token_batches(texts: Sequence[str], max_texts: int, max_tokens: int) -> Iterable[List[str]]:
     batch: List[str] = []
-    for value in values:
-        batch.append(value)
-        if len(batch) >= size:
+    batch_tokens = 0
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if batch and (len(batch) >= max_texts or batch_tokens + tokens > max_tokens):
             yield batch
-            batch = []
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += tokens
     if batch:
         yield batch
+
+
+@dataclass(slots=True)
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed store of embeddings keyed by embedding space and text hash.
+
+    The space is the provider's `cache_key` (provider, endpoint or deployment, model
+    and requested dimensions), so identical strings are embedded once per space,
+    whichever semantic model or workspace asks for them. Vectors are kept as
+    float32, the precision the vector stores index them at.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self.stats = EmbeddingCacheStats()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    async def embed(self, provider: Embedder, texts: Sequence[str]) -> List[List[float]]:
+        """
+        Embed `texts` with `provider`, sending only texts not embedded before.
+
+        Like `EmbeddingProvider.embed`, blank texts are dropped and the rest are
+        stripped. Providers without an `embedding_model` are called directly; those
+        without a `cache_key` share entries only with providers of the same type.
+        """
+        cleaned = [text.strip() for text in texts if isinstance(text, str) and text.strip()]
+        model = getattr(provider, "embedding_model", None)
+        if not cleaned or not model:
+            return await provider.embed(cleaned) if cleaned else []
+
+        space = getattr(provider, "cache_key", None) or f"{type(provider).__qualname__}|{model}"
+        found = await asyncio.to_thread(self._read, space, cleaned)
+        missing = [text for text in dict.fromkeys(cleaned) if text not in found]
+        with self._lock:
+            self.stats.hits += len(cleaned) - len(missing)
+            self.stats.misses += len(missing)
+        if len(cleaned) > len(missing):
+            telemetry.increment(
+                telemetry.CACHE_LOOKUPS,
+                len(cleaned) - len(missing),
+                labels={"cache": "embedding", "result": "hit"},
+            )
+        if missing:
+            telemetry.increment(telemetry.CACHE_LOOKUPS, len(missing), labels={"cache": "embedding", "result": "miss"})
+            embeddings = await provider.embed(missing)
+            if len(embeddings) != len(missing):
+                raise EmbeddingProviderError("Embedding provider returned a different number of vectors than texts.")
+            fresh = {text: list(vector) for text, vector in zip(missing, embeddings)}
+            await asyncio.to_thread(self._write, space, fresh)
+            found.update(fresh)
+        return [list(found[text]) for text in cleaned]
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM embeddings")
+            connection.commit()
+
+    def _read(self, space: str, texts: Sequence[str]) -> dict[str, List[float]]:
+        hashes = {_text_hash(text): text for text in texts}
+        found: dict[str, List[float]] = {}
+        keys = list(hashes)
+        with self._lock:
+            connection = self._connect()
+            # Stay under SQLite's bound-parameter limit.
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                rows = connection.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({','.join('?' * len(batch))})",
+                    [space, *batch],
+                ).fetchall()
+                for text_hash, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[hashes[text_hash]] = vector.tolist()
+        return found
+
+    def _write(self, space: str, embeddings: dict[str, List[float]]) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dimension, vector) VALUES (?, ?, ?, ?)",
+                [
+                    (space, _text_hash(text), len(vector), array("f", vector).tobytes())
+                    for text, vector in embeddings.items()
+                ],
+            )
+            connection.commit()
+            self.stats.stores += len(embeddings)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+            # The `model` column holds the embedding space (see `EmbeddingProvider.cache_key`).
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, text_hash TEXT NOT NULL, dimension INTEGER NOT NULL, "
+                "vector BLOB NOT NULL, PRIMARY KEY (model, text_hash))"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+_embedding_cache: EmbeddingCache | None = None
+_embedding_cache_lock = threading.Lock()
+
+
+def configure_embedding_cache(cache: EmbeddingCache | None) -> None:
+    """Replace the process-wide embedding cache (None disables it)."""
+    global _embedding_cache
+    with _embedding_cache_lock:
+        _embedding_cache = cache
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """The process-wide embedding cache, opened at `EMBEDDING_CACHE_PATH` on first use."""
+    global _embedding_cache
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache(settings.EMBEDDING_CACHE_PATH)
+        return _embedding_cache
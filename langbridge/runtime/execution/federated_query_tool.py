@@ -2,7 +2,7 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 import pyarrow as pa
 from langbridge.connectors.base import get_connector_config_factory
@@ -18,7 +18,9 @@ from langbridge.federation.connectors import (
 )
 from langbridge.federation.executor import ArtifactStore
 from langbridge.federation.models import FederationWorkflow, SMQQuery
+from langbridge.federation.planner import CompiledQuery
 from langbridge.federation.service import FederatedQueryService
+from langbridge import telemetry
 from langbridge.runtime.providers import (
     ConnectorMetadataProvider,
     CredentialProvider,
@@ -30,11 +32,30 @@ from langbridge.runtime.settings import runtime_settings as settings
 from langbridge.semantic.loader import load_semantic_model
 
 class FederatedQueryToolRequest(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     workspace_id: str
     query: dict[str, Any] | str
     dialect: str = "tsql"
+    # A workflow instance is used as-is; only dict payloads are validated.
     workflow: FederationWorkflow
     semantic_model: dict[str, Any] | str | None = None
+    # Set by callers that already compiled the semantic query; `query` and
+    # `semantic_model` are then informational and the SMQ is not compiled again.
+    compiled_query: CompiledQuery | None = None
+    analyze: bool = False
+
+    def planner_query(self) -> CompiledQuery | SMQQuery | str:
+        if self.compiled_query is not None:
+            return self.compiled_query
+        if isinstance(self.query, str):
+            return self.query
+        return SMQQuery.model_validate(self.query)
+
+    def load_semantic_model(self):
+        if self.compiled_query is not None or self.semantic_model is None:
+            return None
+        return load_semantic_model(self.semantic_model)
 
 
 class FederatedQueryTool:
@@ -57,27 +78,38 @@ class FederatedQueryTool:
         )
     async def execute_federated_query(self, query_payload: dict[str, Any]) -> dict[str, Any]:
         request = FederatedQueryToolRequest.model_validate(query_payload)
+        with telemetry.timed(
+            "federated_query_tool.execute",
+            histogram=telemetry.FEDERATED_QUERY_DURATION,
+            labels={"operation": "execute"},
+            attributes={"workspace_id": request.workspace_id},
+        ) as span:
+            result = await self._execute(request)
+            span.set_attribute("rows", result["row_count"])
+            return result
+
+    async def explain_federated_query(self, query_payload: dict[str, Any]) -> dict[str, Any]:
+        request = FederatedQueryToolRequest.model_validate(query_payload)
+        operation = "explain_analyze" if request.analyze else "explain"
+        with telemetry.timed(
+            f"federated_query_tool.{operation}",
+            histogram=telemetry.FEDERATED_QUERY_DURATION,
+            labels={"operation": operation},
+            attributes={"workspace_id": request.workspace_id},
+        ):
+            return await self._explain(request)
+
+    async def _execute(self, request: FederatedQueryToolRequest) -> dict[str, Any]:
         sources = await self._build_sources(request.workflow)
-        semantic_model = (
-            load_semantic_model(request.semantic_model)
-            if request.semantic_model is not None
-            else None
-        )
         self._service.register_workspace(
             workspace_id=request.workspace_id,
             workflow=request.workflow,
             sources=sources,
-            semantic_model=semantic_model,
+            semantic_model=request.load_semantic_model(),
         )
 
-        query_value: str | SMQQuery
-        if isinstance(request.query, str):
-            query_value = request.query
-        else:
-            query_value = SMQQuery.model_validate(request.query)
-
         result_handle = await self._service.execute(
-            query=query_value,
+            query=request.planner_query(),
             dialect=request.dialect,
             workspace_id=request.workspace_id,
         )
@@ -91,23 +123,25 @@ class FederatedQueryTool:
             "execution": result_handle.execution.model_dump(mode="json"),
         }
 
-    async def explain_federated_query(self, query_payload: dict[str, Any]) -> dict[str, Any]:
-        request = FederatedQueryToolRequest.model_validate(query_payload)
+    async def _explain(self, request: FederatedQueryToolRequest) -> dict[str, Any]:
         sources = await self._build_sources(request.workflow)
-        semantic_model = (
-            load_semantic_model(request.semantic_model)
-            if request.semantic_model is not None
-            else None
-        )
         self._service.register_workspace(
             workspace_id=request.workspace_id,
             workflow=request.workflow,
             sources=sources,
-            semantic_model=semantic_model,
+            semantic_model=request.load_semantic_model(),
         )
 
+        if request.analyze:
+            analyzed = await self._service.explain_analyze(
+                query=request.planner_query(),
+                dialect=request.dialect,
+                workspace_id=request.workspace_id,
+            )
+            return analyzed.model_dump(mode="json")
+
         explain = await self._service.explain(
-            query=request.query,
+            query=request.planner_query(),
             dialect=request.dialect,
             workspace_id=request.workspace_id,
         )
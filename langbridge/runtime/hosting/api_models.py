@@ -216,6 +216,7 @@ class RuntimeDatasetSyncConfigRequest(RuntimeRequestModel):
     lookback_window: str | None = None
     backfill_start: str | None = None
     backfill_end: str | None = None
+    partition_by: str | None = None
     sync_on_start: bool = False
 
     @field_validator("strategy", mode="before")
@@ -391,6 +392,7 @@ class RuntimeSqlQueryRequest(RuntimeRequestModel):
     requested_limit: int | None = Field(default=None, ge=1)
     requested_timeout_seconds: int | None = Field(default=None, ge=1)
     explain: bool = False
+    analyze: bool = False
 
     @model_validator(mode="after")
     def _validate_sql_mode(self) -> "RuntimeSqlQueryRequest":
@@ -420,6 +422,17 @@ class RuntimeSqlQueryResponse(RuntimeModel):
     error: dict[str, Any] | None = None
     query: str | None = None
     generated_sql: str | None = None
+    query_profile: dict[str, Any] | None = None
+
+
+def query_profile_from_payload(payload: dict[str, Any]) -> dict[str, Any] | None:
+    """The EXPLAIN ANALYZE plan in a SQL job result payload, if it was analyzed."""
+    stats = payload.get("stats")
+    explain = stats.get("explain") if isinstance(stats, dict) else None
+    if not isinstance(explain, dict) or not explain.get("analyze"):
+        return None
+    plan = explain.get("plan")
+    return plan if isinstance(plan, dict) else None
 
 
 class RuntimeAgentAskRequest(RuntimeRequestModel):
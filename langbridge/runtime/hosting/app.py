@@ -1,22 +1,32 @@
+import asyncio
 import logging
 import os
 import uuid
 from collections.abc import Iterable
 from contextlib import asynccontextmanager
 import inspect
+import time
 from pathlib import Path
 from typing import Any
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from langbridge.connectors.base.http_pool import get_http_client_pool
 from langbridge.mcp import DEFAULT_MCP_MOUNT_PATH, build_runtime_mcp_server
 from langbridge.ui import register_runtime_ui
+from langbridge.federation.cancellation import (
+    CancellationToken,
+    QueryCancelledError,
+    QueryDeadlineExceededError,
+    cancellation_scope,
+)
 from langbridge.runtime.hosting.auth import (
     RuntimeAuthConfig,
     RuntimeAuthMode,
     RuntimeAuthPrincipal,
     RuntimeAuthResolver,
 )
+from langbridge import telemetry
 from langbridge.runtime.hosting.odbc import RuntimeOdbcEndpoint, RuntimeOdbcEndpointConfig
 from langbridge.runtime.hosting.background import (
     BackgroundTaskSchedule,
@@ -72,6 +82,7 @@ from langbridge.runtime.hosting.api_models import (
     RuntimeThreadUpdateRequest,
     RuntimeSqlQueryRequest,
     RuntimeSqlQueryResponse,
+    query_profile_from_payload,
 )
 
 _CONFIG_PATH_ENV = "LANGBRIDGE_RUNTIME_CONFIG_PATH"
@@ -178,6 +189,7 @@ def create_runtime_api_app(
             if odbc_server is not None:
                 await odbc_server.close()
             await _close_runtime_host(host)
+            await get_http_client_pool().aclose()
 
     app = FastAPI(
         title="Langbridge Runtime Host",
@@ -209,10 +221,37 @@ def create_runtime_api_app(
                 )
             return response
 
+    @app.middleware("http")
+    async def _record_request_telemetry(request: Request, call_next):
+        started = time.perf_counter()
+        status_code = 500
+        with telemetry.span("http.request", attributes={"http.method": request.method}) as span:
+            try:
+                response = await call_next(request)
+                status_code = response.status_code
+                return response
+            finally:
+                route_path = getattr(request.scope.get("route"), "path", None) or "unmatched"
+                span.set_attributes({"http.route": route_path, "http.status_code": status_code})
+                if status_code >= 500:
+                    span.set_status("error", f"HTTP {status_code}")
+                telemetry.observe_since(
+                    telemetry.HTTP_REQUEST_DURATION,
+                    started,
+                    labels={"method": request.method, "route": route_path, "status_code": status_code},
+                )
+
     @app.get("/api/runtime/v1/health")
     async def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(
+            content=telemetry.render_prometheus(telemetry.get_telemetry().registry),
+            media_type=telemetry.PROMETHEUS_CONTENT_TYPE,
+        )
+
     @app.get("/api/runtime/v1/auth/bootstrap")
     async def runtime_auth_bootstrap_status() -> dict[str, Any]:
         return await _build_runtime_auth_status(auth_resolver)
@@ -699,7 +738,13 @@ def create_runtime_api_app(
         body: RuntimeSqlQueryRequest,
     ) -> RuntimeSqlQueryResponse:
         configured_host = await _resolve_request_host(request)
-        return await _execute_runtime_sql(configured_host, body)
+        cancellation = CancellationToken()
+        disconnect_watcher = asyncio.create_task(_cancel_on_client_disconnect(request, cancellation))
+        try:
+            with cancellation_scope(cancellation):
+                return await _execute_runtime_sql(configured_host, body)
+        finally:
+            disconnect_watcher.cancel()
 
     @app.get("/api/runtime/v1/agents")
     async def list_agents(request: Request) -> dict[str, Any]:
@@ -1094,13 +1139,18 @@ async def _execute_runtime_sql(
         allow_dml=False,
         allow_federation=is_federated,
         selected_datasets=selected_datasets,
-        explain=bool(request.explain),
+        explain=bool(request.explain or request.analyze),
+        analyze=bool(request.analyze),
         correlation_id=runtime_host.context.request_id,
     )
     try:
         payload = await runtime_host.execute_sql(request=create_request)
     except HTTPException:
         raise
+    except QueryDeadlineExceededError as exc:
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+    except QueryCancelledError as exc:
+        raise HTTPException(status_code=499, detail=str(exc)) from exc
     except Exception as exc:
         _raise_runtime_internal_server_error("SQL query", exc)
     return RuntimeSqlQueryResponse(
@@ -1115,6 +1165,7 @@ async def _execute_runtime_sql(
         redaction_applied=bool(payload.get("redaction_applied")),
         query=request.query,
         generated_sql=payload.get("generated_sql"),
+        query_profile=query_profile_from_payload(payload),
     )
 
 
@@ -1122,6 +1173,19 @@ def _parse_runtime_features_env(value: str | None) -> tuple[str, ...]:
     return _normalize_runtime_features(str(value or "").split(","))
 
 
+async def _cancel_on_client_disconnect(
+    request: Request,
+    cancellation: CancellationToken,
+    *,
+    poll_interval_s: float = 0.5,
+) -> None:
+    while not cancellation.cancelled:
+        if await request.is_disconnected():
+            cancellation.cancel("Client disconnected before the query completed.")
+            return
+        await asyncio.sleep(poll_interval_s)
+
+
 def _raise_runtime_internal_server_error(operation: str, exc: Exception) -> None:
     logging.getLogger(__name__).exception("Runtime API %s failed", operation)
     raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -1293,7 +1357,8 @@ async def _register_runtime_dataset_background_tasks(
         if str(task.name or "").strip()
     }
     dataset_tasks = await runtime_host._applications.datasets.build_scheduled_sync_tasks()
-    for task in dataset_tasks:
+    pre_aggregation_tasks = runtime_host._applications.semantic.build_scheduled_pre_aggregation_tasks()
+    for task in (*dataset_tasks, *pre_aggregation_tasks):
         if task.name in existing_names:
             continue
         task_manager.register_default_task(task)
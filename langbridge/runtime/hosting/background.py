@@ -4,13 +4,18 @@ import inspect
 import logging
 from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, replace
+from pathlib import Path
 from typing import Any, Literal
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from langbridge import telemetry
 from langbridge.runtime.scheduling import dataset_sync_cadence_to_seconds
 from langbridge.runtime.services.runtime_host import RuntimeHost
+from langbridge.runtime.services.sync_executor import SYNC_PRIORITY_SCHEDULED
+from langbridge.runtime.settings import runtime_settings
+from langbridge.storage.dataset_table import DatasetTableConflictError, find_dataset_tables
 
 BackgroundTaskKind = Literal["default", "custom"]
 
@@ -21,8 +26,13 @@ class BackgroundTaskSchedule:
     seconds: float | None = None
     cron_expression: str | None = None
     timezone: str | None = None
+    # Random delay of up to this many seconds added to each run, so schedules that fall
+    # on the same instant spread out instead of all hitting their sources together.
+    jitter_seconds: float | None = None
 
     def __post_init__(self) -> None:
+        if self.jitter_seconds is not None and self.jitter_seconds < 0:
+            raise ValueError("Background task jitter must not be negative.")
         if self.trigger == "interval":
             if self.seconds is None or self.seconds <= 0:
                 raise ValueError("Interval background tasks require a positive seconds value.")
@@ -38,8 +48,14 @@ class BackgroundTaskSchedule:
         raise ValueError(f"Unsupported background task trigger '{self.trigger}'.")
 
     @classmethod
-    def interval(cls, *, seconds: float, timezone: str | None = None) -> "BackgroundTaskSchedule":
-        return cls(trigger="interval", seconds=seconds, timezone=timezone)
+    def interval(
+        cls,
+        *,
+        seconds: float,
+        timezone: str | None = None,
+        jitter_seconds: float | None = None,
+    ) -> "BackgroundTaskSchedule":
+        return cls(trigger="interval", seconds=seconds, timezone=timezone, jitter_seconds=jitter_seconds)
 
     @classmethod
     def cron(
@@ -47,8 +63,14 @@ class BackgroundTaskSchedule:
         *,
         expression: str,
         timezone: str | None = None,
+        jitter_seconds: float | None = None,
     ) -> "BackgroundTaskSchedule":
-        return cls(trigger="cron", cron_expression=expression, timezone=timezone)
+        return cls(
+            trigger="cron",
+            cron_expression=expression,
+            timezone=timezone,
+            jitter_seconds=jitter_seconds,
+        )
 
 
 @dataclass(slots=True, frozen=True)
@@ -331,9 +353,12 @@ class RuntimeBackgroundTaskManager:
         }
         if definition.schedule is None:
             return
+        jitter = int(definition.schedule.jitter_seconds or 0) or None
         if definition.schedule.trigger == "interval":
             if definition.schedule.timezone is not None:
                 add_job_kwargs["timezone"] = definition.schedule.timezone
+            if jitter is not None:
+                add_job_kwargs["jitter"] = jitter
             self._scheduler.add_job(
                 self._execute_definition_by_name,
                 trigger="interval",
@@ -346,6 +371,7 @@ class RuntimeBackgroundTaskManager:
             definition.schedule.cron_expression or "",
             timezone=definition.schedule.timezone,
         )
+        trigger.jitter = jitter
         self._scheduler.add_job(
             self._execute_definition_by_name,
             trigger=trigger,
@@ -390,10 +416,15 @@ class RuntimeBackgroundTaskManager:
             )
             return None
         async with task_lock:
-            result = handler(context)
-            if inspect.isawaitable(result):
-                return await result
-            return result
+            with telemetry.timed(
+                "background_task.run",
+                histogram=telemetry.BACKGROUND_TASK_DURATION,
+                labels={"task": context.task_name, "kind": context.kind},
+            ):
+                result = handler(context)
+                if inspect.isawaitable(result):
+                    return await result
+                return result
 
     @staticmethod
     def _job_id(name: str) -> str:
@@ -424,12 +455,17 @@ def build_connector_sync_default_task(
         sync_method = getattr(context.runtime_host, "sync_connector_resources", None)
         if sync_method is None:
             raise RuntimeError("Runtime host does not expose sync_connector_resources().")
-        return await sync_method(
+        result = await sync_method(
             connector_name=connector_name,
             resources=list(normalized_resources),
             sync_mode=sync_mode,
             force_full_refresh=force_full_refresh,
+            priority=SYNC_PRIORITY_SCHEDULED,
         )
+        # The other resources have finished by now; fail the run so the scheduler logs it.
+        if isinstance(result, dict) and result.get("status") == "failed":
+            raise RuntimeError(str(result.get("summary")))
+        return result
 
     return RuntimeBackgroundTaskDefinition.default(
         name=task_name,
@@ -441,8 +477,12 @@ def build_connector_sync_default_task(
 
 
 def background_task_schedule_from_dataset_cadence(cadence: str) -> BackgroundTaskSchedule:
+    seconds = dataset_sync_cadence_to_seconds(cadence)
+    # Jitter never exceeds a tenth of the interval, so short cadences keep their rhythm.
+    jitter_seconds = min(float(runtime_settings.SYNC_SCHEDULE_JITTER_SECONDS), seconds / 10)
     return BackgroundTaskSchedule.interval(
-        seconds=dataset_sync_cadence_to_seconds(cadence)
+        seconds=seconds,
+        jitter_seconds=jitter_seconds if jitter_seconds > 0 else None,
     )
 
 
@@ -473,6 +513,7 @@ def build_dataset_sync_default_task(
             dataset_ref=normalized_dataset_ref,
             sync_mode=sync_mode,
             force_full_refresh=force_full_refresh,
+            priority=SYNC_PRIORITY_SCHEDULED,
         )
 
     return RuntimeBackgroundTaskDefinition.default(
@@ -484,6 +525,82 @@ def build_dataset_sync_default_task(
     )
 
 
+def build_dataset_compaction_default_task(
+    *,
+    schedule: BackgroundTaskSchedule,
+    name: str = "dataset-compaction",
+    root: str | Path | None = None,
+    target_file_rows: int | None = None,
+    run_on_startup: bool = False,
+    description: str | None = None,
+) -> RuntimeBackgroundTaskDefinition:
+    async def _handler(context: BackgroundTaskExecutionContext) -> Any:
+        base_dir = Path(root) if root is not None else Path(runtime_settings.DATASET_FILE_LOCAL_DIR)
+        file_rows = target_file_rows or runtime_settings.DATASET_COMPACTION_TARGET_ROWS
+
+        def _compact() -> int:
+            compacted = 0
+            for table in find_dataset_tables(
+                base_dir,
+                retain_snapshots=runtime_settings.DATASET_TABLE_RETAIN_SNAPSHOTS,
+            ):
+                try:
+                    if table.compact(target_file_rows=file_rows) is not None:
+                        compacted += 1
+                except DatasetTableConflictError:
+                    context.manager._logger.info(
+                        "Skipping compaction of '%s': a concurrent commit won.",
+                        table.root,
+                    )
+            return compacted
+
+        return await asyncio.to_thread(_compact)
+
+    return RuntimeBackgroundTaskDefinition.default(
+        name=name,
+        handler=_handler,
+        schedule=schedule,
+        run_on_startup=run_on_startup,
+        description=description or "Compact small data files and deletes of synced dataset tables.",
+    )
+
+
+def build_semantic_pre_aggregation_refresh_default_task(
+    *,
+    semantic_model: str,
+    pre_aggregation: str,
+    schedule: BackgroundTaskSchedule | None = None,
+    name: str | None = None,
+    force: bool = False,
+    run_on_startup: bool = False,
+    description: str | None = None,
+) -> RuntimeBackgroundTaskDefinition:
+    normalized_model = str(semantic_model or "").strip()
+    normalized_pre_aggregation = str(pre_aggregation or "").strip()
+    if not normalized_model or not normalized_pre_aggregation:
+        raise ValueError("Pre-aggregation refresh tasks require a semantic_model and a pre_aggregation.")
+    task_name = name or f"semantic-pre-aggregation:{normalized_model}:{normalized_pre_aggregation}"
+
+    async def _handler(context: BackgroundTaskExecutionContext) -> Any:
+        refresh_method = getattr(context.runtime_host, "refresh_semantic_pre_aggregations", None)
+        if refresh_method is None:
+            raise RuntimeError("Runtime host does not expose refresh_semantic_pre_aggregations().")
+        return await refresh_method(
+            semantic_model=normalized_model,
+            names=[normalized_pre_aggregation],
+            force=force,
+        )
+
+    return RuntimeBackgroundTaskDefinition.default(
+        name=task_name,
+        handler=_handler,
+        schedule=schedule,
+        run_on_startup=run_on_startup,
+        description=description
+        or f"Refresh pre-aggregation '{normalized_pre_aggregation}' of semantic model '{normalized_model}'.",
+    )
+
+
 def build_semantic_vector_refresh_default_task(
     *,
     schedule: BackgroundTaskSchedule,
@@ -556,6 +673,8 @@ __all__ = [
     "RuntimeBackgroundTaskManager",
     "background_task_schedule_from_dataset_cadence",
     "build_connector_sync_default_task",
+    "build_dataset_compaction_default_task",
     "build_dataset_sync_default_task",
+    "build_semantic_pre_aggregation_refresh_default_task",
     "build_semantic_vector_refresh_default_task",
 ]
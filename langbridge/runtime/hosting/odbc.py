@@ -15,15 +15,24 @@ import duckdb
 import sqlglot
 from sqlglot import exp
 
+from langbridge.federation.cancellation import (
+    CancellationToken,
+    QueryCancelledError,
+    QueryDeadlineExceededError,
+    cancellation_scope,
+)
+from langbridge import telemetry
 from langbridge.runtime.bootstrap import ConfiguredLocalRuntimeHost
 from langbridge.runtime.context import RuntimeContext
 from langbridge.runtime.hosting.auth import RuntimeAuthConfig, RuntimeAuthMode
 from langbridge.runtime.models.jobs import CreateSqlJobRequest, SqlWorkbenchMode
+from langbridge.runtime.utils.sql import strip_explain_analyze
 
 _LOGGER = logging.getLogger(__name__)
 _PROTO_VERSION = 196608
 _SSL_REQUEST_CODE = 80877103
 _CANCEL_REQUEST_CODE = 80877102
+_QUERY_CANCELED_SQLSTATE = "57014"
 _PUBLIC_SCHEMA = "public"
 _DATABASE_NAME = "langbridge"
 _SERVER_VERSION = "16.0-langbridge"
@@ -170,6 +179,7 @@ class RuntimeOdbcQueryGateway:
         if self._is_metadata_query(rendered_query):
             return await self._execute_metadata_query(rendered_query)
 
+        rendered_query, analyze = strip_explain_analyze(rendered_query)
         runtime_query = self._normalize_runtime_query(rendered_query)
         effective_max_rows = self._effective_limit(max_rows=max_rows)
         scoped_host = self._runtime_host.with_context(
@@ -197,7 +207,8 @@ class RuntimeOdbcQueryGateway:
                 allow_dml=False,
                 allow_federation=True,
                 selected_datasets=[],
-                explain=False,
+                explain=analyze,
+                analyze=analyze,
                 correlation_id=scoped_host.context.request_id,
             )
         )
@@ -206,7 +217,7 @@ class RuntimeOdbcQueryGateway:
         return RuntimeOdbcQueryResult(
             columns=columns,
             rows=rows,
-            command_tag=f"SELECT {len(rows)}",
+            command_tag="EXPLAIN" if analyze else f"SELECT {len(rows)}",
         )
 
     def _effective_limit(self, *, max_rows: int | None) -> int:
@@ -466,6 +477,7 @@ class RuntimeOdbcEndpoint:
         self._auth_config = auth_config
         self._config = config or RuntimeOdbcEndpointConfig()
         self._server: asyncio.AbstractServer | None = None
+        self._active_queries: dict[tuple[int, int], CancellationToken] = {}
 
     @property
     def config(self) -> RuntimeOdbcEndpointConfig:
@@ -509,8 +521,11 @@ class RuntimeOdbcEndpoint:
     ) -> None:
         statements: dict[str, _PreparedStatement] = {}
         portals: dict[str, _BoundPortal] = {}
+        backend_key = (os.getpid() & 0x7FFFFFFF, uuid.uuid4().int & 0x7FFFFFFF)
         try:
-            base_context = await self._startup(reader=reader, writer=writer)
+            base_context = await self._startup(reader=reader, writer=writer, backend_key=backend_key)
+            if base_context is None:
+                return
             gateway = RuntimeOdbcQueryGateway(
                 runtime_host=self._runtime_host,
                 context=base_context,
@@ -529,6 +544,7 @@ class RuntimeOdbcEndpoint:
                     await self._execute_query(
                         writer=writer,
                         gateway=gateway,
+                        backend_key=backend_key,
                         query=query,
                         max_rows=None,
                     )
@@ -620,6 +636,7 @@ class RuntimeOdbcEndpoint:
                     await self._execute_query(
                         writer=writer,
                         gateway=gateway,
+                        backend_key=backend_key,
                         query=statement.query,
                         parameters=portal.parameters,
                         max_rows=max_rows,
@@ -659,7 +676,8 @@ class RuntimeOdbcEndpoint:
         *,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
-    ) -> RuntimeContext:
+        backend_key: tuple[int, int],
+    ) -> RuntimeContext | None:
         startup_params: dict[str, str] = {}
         while True:
             length = _unpack_int32(await reader.readexactly(4))
@@ -670,7 +688,12 @@ class RuntimeOdbcEndpoint:
                 await writer.drain()
                 continue
             if code == _CANCEL_REQUEST_CODE:
-                raise ValueError("Cancellation requests are not supported.")
+                # CancelRequest arrives on its own connection and gets no response.
+                self._cancel_active_query(
+                    process_id=_unpack_int32(payload[4:8]),
+                    secret_key=_unpack_int32(payload[8:12]),
+                )
+                return None
             if code != _PROTO_VERSION:
                 raise ValueError("Unsupported PostgreSQL protocol version.")
             startup_params = _parse_startup_parameters(payload[4:])
@@ -695,7 +718,7 @@ class RuntimeOdbcEndpoint:
         await _write_message(writer, "S", _cstring("TimeZone") + _cstring("UTC"))
         await _write_message(writer, "S", _cstring("standard_conforming_strings") + _cstring("on"))
         await _write_message(writer, "S", _cstring("integer_datetimes") + _cstring("on"))
-        await _write_message(writer, "K", struct.pack("!II", os.getpid() & 0x7FFFFFFF, uuid.uuid4().int & 0x7FFFFFFF))
+        await _write_message(writer, "K", struct.pack("!II", *backend_key))
         await self._write_ready(writer)
 
         username = str(startup_params.get("user") or "runtime").strip() or "runtime"
@@ -712,23 +735,51 @@ class RuntimeOdbcEndpoint:
         *,
         writer: asyncio.StreamWriter,
         gateway: RuntimeOdbcQueryGateway,
+        backend_key: tuple[int, int],
         query: str,
         parameters: list[Any] | None = None,
         max_rows: int | None = None,
     ) -> None:
-        result = await gateway.execute(
-            query,
-            parameters=parameters,
-            max_rows=max_rows,
-        )
-        if result.columns:
-            await _write_message(writer, "T", _encode_row_description(result.columns))
-            for row in result.rows:
-                await _write_message(writer, "D", _encode_data_row(row))
-        elif not result.rows and result.command_tag == "EMPTY":
-            await _write_message(writer, "I", b"")
+        with telemetry.timed("odbc.query", histogram=telemetry.ODBC_QUERY_DURATION) as span:
+            cancellation = CancellationToken()
+            self._active_queries[backend_key] = cancellation
+            try:
+                with cancellation_scope(cancellation):
+                    result = await cancellation.run(
+                        gateway.execute(
+                            query,
+                            parameters=parameters,
+                            max_rows=max_rows,
+                        )
+                    )
+            except QueryCancelledError as exc:
+                message = (
+                    "canceling statement due to statement timeout"
+                    if isinstance(exc, QueryDeadlineExceededError)
+                    else "canceling statement due to user request"
+                )
+                span.set_status("error", message)
+                await _write_error(writer, message=message, code=_QUERY_CANCELED_SQLSTATE, ready=False)
+                return
+            finally:
+                if self._active_queries.get(backend_key) is cancellation:
+                    self._active_queries.pop(backend_key, None)
+            span.set_attributes({"command_tag": result.command_tag, "rows": len(result.rows)})
+            if result.columns:
+                await _write_message(writer, "T", _encode_row_description(result.columns))
+                for row in result.rows:
+                    await _write_message(writer, "D", _encode_data_row(row))
+            elif not result.rows and result.command_tag == "EMPTY":
+                await _write_message(writer, "I", b"")
+                return
+            await _write_message(writer, "C", _cstring(result.command_tag))
+
+    def _cancel_active_query(self, *, process_id: int, secret_key: int) -> None:
+        cancellation = self._active_queries.get((process_id, secret_key))
+        if cancellation is None:
+            _LOGGER.debug("Ignoring cancel request for idle or unknown runtime ODBC backend.")
             return
-        await _write_message(writer, "C", _cstring(result.command_tag))
+        cancellation.cancel("Query was cancelled by the client.")
 
     @staticmethod
     async def _write_ready(writer: asyncio.StreamWriter) -> None:
@@ -786,6 +837,7 @@ async def _write_error(
     message: str,
     code: str = "XX000",
     severity: str = "ERROR",
+    ready: bool = True,
 ) -> None:
     payload = (
         b"S" + _cstring(severity)
@@ -796,7 +848,8 @@ async def _write_error(
     )
     try:
         await _write_message(writer, "E", payload)
-        await _write_message(writer, "Z", b"I")
+        if ready:
+            await _write_message(writer, "Z", b"I")
     except Exception:  # pragma: no cover - best effort on broken sockets
         return
 
@@ -1,5 +1,5 @@
 """
-Logging utilities with OpenTelemetry defaults for logs and traces.
+Logging utilities with OpenTelemetry defaults for logs, traces and metrics.
 """
 import logging
 import os
@@ -7,26 +7,36 @@ import tempfile
 from logging.handlers import RotatingFileHandler
 from typing import Optional
 
-from opentelemetry import _logs, trace
+from opentelemetry import _logs, metrics, trace
 from opentelemetry.exporter.otlp.proto.grpc._log_exporter import (
     OTLPLogExporter as GrpcOTLPLogExporter,
 )
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+    OTLPMetricExporter as GrpcOTLPMetricExporter,
+)
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
     OTLPSpanExporter as GrpcOTLPSpanExporter,
 )
 from opentelemetry.exporter.otlp.proto.http._log_exporter import (
     OTLPLogExporter as HttpOTLPLogExporter,
 )
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+    OTLPMetricExporter as HttpOTLPMetricExporter,
+)
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
     OTLPSpanExporter as HttpOTLPSpanExporter,
 )
 from opentelemetry.instrumentation.logging import LoggingInstrumentor
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
 from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
+from langbridge.telemetry import OtlpTelemetryExporter, configure_telemetry
+
 
 DEFAULT_LOG_DIR = "./"
 DEFAULT_LOG_FILE = "app.log"
@@ -119,6 +129,15 @@ def _build_span_exporter() -> Optional[object]:
     return GrpcOTLPSpanExporter()
 
 
+def _build_metric_exporter() -> Optional[object]:
+    if not _exporter_enabled("OTEL_METRICS_EXPORTER"):
+        return None
+    protocol = _get_protocol("OTEL_EXPORTER_OTLP_METRICS_PROTOCOL")
+    if protocol in {"http/protobuf", "http"}:
+        return HttpOTLPMetricExporter()
+    return GrpcOTLPMetricExporter()
+
+
 def _build_resource(service_name: Optional[str]) -> Resource: # type: ignore
     if Resource is None:  # pragma: no cover - guarded by _otel_disabled
         raise RuntimeError("OpenTelemetry resource support is unavailable")
@@ -175,6 +194,14 @@ def setup_logging(
     if span_exporter is not None:
         tracer_provider.add_span_processor(BatchSpanProcessor(span_exporter))
 
+    metric_exporter = _build_metric_exporter()
+    metric_readers = [] if metric_exporter is None else [PeriodicExportingMetricReader(metric_exporter)]
+    metrics.set_meter_provider(MeterProvider(resource=resource, metric_readers=metric_readers))
+
+    # Runtime spans and metrics (langbridge.telemetry) ride the same OTLP pipeline.
+    if span_exporter is not None or metric_exporter is not None:
+        configure_telemetry(exporter=OtlpTelemetryExporter())
+
     logger_provider = LoggerProvider(resource=resource)
     _logs.set_logger_provider(logger_provider)
 
@@ -132,6 +132,7 @@ class CreateSqlJobRequest(RuntimeJobRequestModel):
     selected_datasets: list[uuid.UUID] = Field(default_factory=list)
     federated_datasets: list[SqlSelectedDataset] = Field(default_factory=list)
     explain: bool = False
+    analyze: bool = False
     correlation_id: str | None = None
 
     @model_validator(mode="after")
@@ -180,6 +181,8 @@ class CreateSqlJobRequest(RuntimeJobRequestModel):
 
         if not self.query.strip():
             raise ValueError("query is required.")
+        if self.analyze:
+            self.explain = True
         self.query_dialect = self.query_dialect.strip().lower() or "tsql"
         return self
 
@@ -266,6 +269,8 @@ class CreateDatasetProfileJobRequest(RuntimeJobRequestModel):
     workspace_id: uuid.UUID
     actor_id: uuid.UUID = _actor_id_field()
     user_context: dict[str, Any] = Field(default_factory=dict)
+    # Profile a TABLESAMPLE of this percentage of rows; counts are scaled up with error bounds.
+    sample_percent: float | None = Field(default=None, gt=0, le=100)
     correlation_id: str | None = None
     operation: Literal["profile"] = "profile"
 
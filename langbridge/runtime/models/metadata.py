@@ -50,6 +50,7 @@ class ConnectorCapabilities(RuntimeModel):
     supports_live_datasets: bool = False
     supports_synced_datasets: bool = False
     supports_incremental_sync: bool = False
+    supports_change_data_capture: bool = False
     supports_query_pushdown: bool = False
     supports_preview: bool = False
     supports_federated_execution: bool = False
@@ -241,6 +242,7 @@ class DatasetSyncConfig(RuntimeModel):
     lookback_window: str | None = None
     backfill_start: str | None = None
     backfill_end: str | None = None
+    partition_by: str | None = None
     sync_on_start: bool = False
 
     @field_validator("strategy", mode="before")
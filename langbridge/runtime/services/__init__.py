@@ -15,6 +15,7 @@ __all__ = [
     "SemanticQueryExecutionService",
     "SemanticVectorSearchService",
     "SqlQueryService",
+    "SyncExecutor",
     "build_binding_for_dataset",
     "build_file_scan_sql",
     "synthetic_file_connector_id",
@@ -98,4 +99,8 @@ def __getattr__(name: str) -> Any:
         from langbridge.runtime.services.sql_query_service import SqlQueryService
 
         return SqlQueryService
+    if name == "SyncExecutor":
+        from langbridge.runtime.services.sync_executor import SyncExecutor
+
+        return SyncExecutor
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
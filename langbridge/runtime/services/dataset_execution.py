@@ -16,6 +16,7 @@ from langbridge.runtime.models.metadata import (
 )
 from langbridge.runtime.ports import DatasetCatalogStore
 from langbridge.runtime.providers import DatasetMetadataProvider
+from langbridge.storage.dataset_table import DatasetTable, is_dataset_table
 from langbridge.runtime.utils.datasets import (
     build_dataset_execution_capabilities,
     build_dataset_relation_identity,
@@ -731,7 +732,10 @@ def describe_file_source_schema(
 
 def build_file_scan_sql(*, storage_uri: str, file_config: dict[str, Any] | None = None) -> str:
     config_payload = dict(file_config or {})
-    normalized_uri = resolve_local_storage_path(storage_uri).as_posix().replace("'", "''")
+    local_path = resolve_local_storage_path(storage_uri)
+    if is_dataset_table(local_path):
+        return DatasetTable(local_path).scan_sql()
+    normalized_uri = local_path.as_posix().replace("'", "''")
     configured = str(
         config_payload.get("format")
         or config_payload.get("file_format")
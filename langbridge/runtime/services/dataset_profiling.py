@@ -0,0 +1,323 @@
+"""
+Query builders for dataset profiling.
+
+A profile reads the dataset with at most two statements, however many columns it has.
+The summary query computes row count, null count, distinct count, min/max and average
+length for every column. The distribution query is a single `GROUPING SETS` scan that
+yields value frequencies (top values) for low-cardinality columns and equal-width
+histogram buckets for numeric columns, using the bounds found by the summary query.
+Both are written in the dataset's dialect, so single-source datasets push them down
+to the source. With a sample percentage both read a `TABLESAMPLE` of the dataset, and
+counts are scaled up with 95% error bounds.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Literal, Mapping
+
+from sqlglot import exp
+
+ProfileColumnKind = Literal["numeric", "string", "temporal", "boolean", "other"]
+
+PROFILE_TOP_K = 10
+PROFILE_HISTOGRAM_BUCKETS = 10
+# Columns with more distinct values than this get no top values; every value would
+# be near-unique and the grouped result would be as large as the column.
+PROFILE_TOP_K_MAX_DISTINCT = 1_000
+
+_Z_95 = 1.96
+# Warehouses where an approximate distinct count is much cheaper than an exact one and
+# sqlglot renders it correctly; the rest (including DuckDB, which runs locally) count exactly.
+_APPROX_DISTINCT_DIALECTS = frozenset({"snowflake", "bigquery"})
+_TABLESAMPLE_METHODS = {
+    "duckdb": "BERNOULLI",
+    "postgres": "BERNOULLI",
+    "snowflake": "BERNOULLI",
+    "bigquery": "SYSTEM",
+    "tsql": "SYSTEM",
+}
+_GROUPING_SETS_DIALECTS = frozenset({"duckdb", "postgres", "snowflake", "bigquery", "tsql", "oracle"})
+# Dialect the distribution query falls back to when the source cannot run GROUPING SETS;
+# the federation planner then scans the columns and groups them locally.
+_LOCAL_DIALECT = "duckdb"
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileColumn:
+    name: str
+    data_type: str
+    kind: ProfileColumnKind
+    # False for columns under a redaction rule: their values (min/max, top values,
+    # histogram bounds) are never read back.
+    reveal_values: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileDistributionPlan:
+    sql: str
+    dialect: str
+    top_k_columns: dict[int, str]
+    histogram_columns: dict[int, tuple[float, float]]
+
+
+def profile_column_kind(data_type: str | None, *, dialect: str) -> ProfileColumnKind:
+    try:
+        parsed = exp.DataType.build(str(data_type or "").strip(), dialect=dialect)
+    except Exception:
+        return "other"
+    if parsed.is_type(*exp.DataType.NUMERIC_TYPES):
+        return "numeric"
+    if parsed.is_type(*exp.DataType.TEXT_TYPES):
+        return "string"
+    if parsed.is_type(*exp.DataType.TEMPORAL_TYPES):
+        return "temporal"
+    if parsed.is_type(exp.DataType.Type.BOOLEAN):
+        return "boolean"
+    return "other"
+
+
+def profile_table_sample(*, dialect: str, sample_percent: float | None) -> exp.TableSample | None:
+    """Return the TABLESAMPLE clause for `sample_percent`, or None to read every row."""
+    if sample_percent is None or sample_percent >= 100:
+        return None
+    method = _TABLESAMPLE_METHODS.get(dialect)
+    if method is None:
+        return None
+    return exp.TableSample(method=exp.var(method), percent=exp.Literal.number(sample_percent))
+
+
+def build_profile_summary_sql(
+    *,
+    table_key: str,
+    columns: list[ProfileColumn],
+    filters: list[exp.Expression],
+    sample: exp.TableSample | None,
+    dialect: str,
+) -> str:
+    projections: list[exp.Expression] = [_alias(exp.Count(this=exp.Star()), "row_count")]
+    for index, column in enumerate(columns):
+        column_expr = _column(column.name)
+        projections.append(_alias(exp.Count(this=column_expr.copy()), f"c{index}_non_null"))
+        if column.kind != "other":
+            distinct: exp.Expression = (
+                exp.ApproxDistinct(this=column_expr.copy())
+                if dialect in _APPROX_DISTINCT_DIALECTS
+                else exp.Count(this=exp.Distinct(expressions=[column_expr.copy()]))
+            )
+            projections.append(_alias(distinct, f"c{index}_distinct"))
+        if column.reveal_values and column.kind in {"numeric", "string", "temporal"}:
+            projections.append(_alias(exp.Min(this=column_expr.copy()), f"c{index}_min"))
+            projections.append(_alias(exp.Max(this=column_expr.copy()), f"c{index}_max"))
+        if column.kind == "string":
+            projections.append(
+                _alias(exp.Avg(this=exp.Length(this=column_expr.copy())), f"c{index}_avg_length")
+            )
+    return _select(projections, table_key=table_key, filters=filters, sample=sample).sql(dialect=dialect)
+
+
+def build_profile_distribution_plan(
+    *,
+    table_key: str,
+    columns: list[ProfileColumn],
+    summary: Mapping[str, Any],
+    filters: list[exp.Expression],
+    sample_percent: float | None,
+    dialect: str,
+) -> ProfileDistributionPlan | None:
+    """Plan the grouped scan for top values and histograms, or None if no column needs one."""
+    query_dialect = dialect if dialect in _GROUPING_SETS_DIALECTS else _LOCAL_DIALECT
+    keys: list[exp.Expression] = []
+    top_k_columns: dict[int, str] = {}
+    histogram_columns: dict[int, tuple[float, float]] = {}
+    for index, column in enumerate(columns):
+        if not column.reveal_values or column.kind == "other":
+            continue
+        column_expr = _column(column.name)
+        distinct = summary.get(f"c{index}_distinct")
+        non_null = summary.get(f"c{index}_non_null")
+        # Unique columns have no meaningful top values.
+        if (
+            isinstance(distinct, (int, float))
+            and 0 < distinct <= PROFILE_TOP_K_MAX_DISTINCT
+            and (not isinstance(non_null, (int, float)) or distinct < non_null)
+        ):
+            top_k_columns[index] = column.name
+            keys.append(_alias(column_expr.copy(), f"t{index}"))
+        lower, upper = _as_float(summary.get(f"c{index}_min")), _as_float(summary.get(f"c{index}_max"))
+        if column.kind == "numeric" and lower is not None and upper is not None and upper > lower:
+            histogram_columns[index] = (lower, upper)
+            keys.append(_alias(_histogram_bucket(column_expr, lower=lower, upper=upper), f"h{index}"))
+    if not keys:
+        return None
+
+    query = _select(
+        [*keys, _alias(exp.Count(this=exp.Star()), "row_count")],
+        table_key=table_key,
+        filters=filters,
+        sample=profile_table_sample(dialect=query_dialect, sample_percent=sample_percent),
+    )
+    query = query.group_by(
+        exp.GroupingSets(expressions=[exp.Tuple(expressions=[key.this.copy()]) for key in keys])
+    )
+    return ProfileDistributionPlan(
+        sql=query.sql(dialect=query_dialect),
+        dialect=query_dialect,
+        top_k_columns=top_k_columns,
+        histogram_columns=histogram_columns,
+    )
+
+
+def assemble_column_profiles(
+    *,
+    columns: list[ProfileColumn],
+    summary: Mapping[str, Any],
+    distribution_rows: list[Mapping[str, Any]],
+    distribution: ProfileDistributionPlan | None,
+    sample_fraction: float | None,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Turn the summary row and grouped rows into table-level and per-column profiles."""
+    sampled_rows = int(summary.get("row_count") or 0)
+    scale = 1.0 / sample_fraction if sample_fraction else 1.0
+    table_profile: dict[str, Any] = {
+        "row_count_estimate": round(sampled_rows * scale),
+        "row_count_margin": None,
+        "sampled_rows": sampled_rows,
+    }
+    if sample_fraction:
+        # Bernoulli sampling: the sampled count is Binomial(N, f).
+        table_profile["row_count_margin"] = round(
+            _Z_95 * math.sqrt(sampled_rows * (1.0 - sample_fraction)) / sample_fraction
+        )
+
+    frequencies: dict[str, list[tuple[Any, int]]] = {}
+    for row in distribution_rows:
+        for key, value in row.items():
+            if key == "row_count" or value is None:
+                continue
+            frequencies.setdefault(key, []).append((value, int(row.get("row_count") or 0)))
+
+    profiles: list[dict[str, Any]] = []
+    for index, column in enumerate(columns):
+        non_null = int(summary.get(f"c{index}_non_null") or 0)
+        null_count = max(sampled_rows - non_null, 0)
+        null_rate = null_count / sampled_rows if sampled_rows else None
+        profile: dict[str, Any] = {
+            "name": column.name,
+            "data_type": column.data_type,
+            "null_count": round(null_count * scale),
+            "null_rate": null_rate,
+        }
+        if sample_fraction and null_rate is not None:
+            profile["null_rate_margin"] = _Z_95 * math.sqrt(null_rate * (1.0 - null_rate) / sampled_rows)
+        distinct = summary.get(f"c{index}_distinct")
+        if isinstance(distinct, (int, float)):
+            # A sample can only under-count distinct values, so this is a lower bound when sampled.
+            profile["distinct_count"] = int(distinct)
+        if f"c{index}_min" in summary:
+            profile["min"] = _profile_value(summary.get(f"c{index}_min"))
+            profile["max"] = _profile_value(summary.get(f"c{index}_max"))
+        if f"c{index}_avg_length" in summary:
+            average = _as_float(summary.get(f"c{index}_avg_length"))
+            profile["avg_length"] = round(average, 3) if average is not None else None
+        if distribution is not None and index in distribution.top_k_columns:
+            ranked = sorted(frequencies.get(f"t{index}", []), key=lambda item: (-item[1], str(item[0])))
+            profile["top_values"] = [
+                {"value": _profile_value(value), "count": round(count * scale)}
+                for value, count in ranked[:PROFILE_TOP_K]
+            ]
+        if distribution is not None and index in distribution.histogram_columns:
+            lower, upper = distribution.histogram_columns[index]
+            width = (upper - lower) / PROFILE_HISTOGRAM_BUCKETS
+            counts = {int(bucket): count for bucket, count in frequencies.get(f"h{index}", [])}
+            profile["histogram"] = [
+                {
+                    "lower": lower + bucket * width,
+                    "upper": upper if bucket == PROFILE_HISTOGRAM_BUCKETS - 1 else lower + (bucket + 1) * width,
+                    "count": round(counts.get(bucket, 0) * scale),
+                }
+                for bucket in range(PROFILE_HISTOGRAM_BUCKETS)
+            ]
+        profiles.append(profile)
+    return table_profile, profiles
+
+
+def _histogram_bucket(column_expr: exp.Expression, *, lower: float, upper: float) -> exp.Expression:
+    value = exp.Cast(this=column_expr.copy(), to=exp.DataType.build("DOUBLE"))
+    width = (upper - lower) / PROFILE_HISTOGRAM_BUCKETS
+    return exp.Case(
+        ifs=[
+            exp.If(
+                this=exp.LTE(this=value.copy(), expression=exp.Literal.number(lower)),
+                true=exp.Literal.number(0),
+            ),
+            exp.If(
+                this=exp.GTE(this=value.copy(), expression=exp.Literal.number(upper)),
+                true=exp.Literal.number(PROFILE_HISTOGRAM_BUCKETS - 1),
+            ),
+        ],
+        default=exp.Floor(
+            this=exp.Div(
+                this=exp.Paren(this=exp.Sub(this=value.copy(), expression=exp.Literal.number(lower))),
+                expression=exp.Literal.number(width),
+            )
+        ),
+    )
+
+
+def _select(
+    projections: list[exp.Expression],
+    *,
+    table_key: str,
+    filters: list[exp.Expression],
+    sample: exp.TableSample | None,
+) -> exp.Select:
+    table = exp.table_(table_key, quoted=False)
+    if sample is not None:
+        table.set("sample", sample)
+    query = exp.select(*projections).from_(table)
+    if filters:
+        query = query.where(exp.and_(*(item.copy() for item in filters)))
+    return query
+
+
+def _column(name: str) -> exp.Column:
+    return exp.Column(this=exp.Identifier(this=name, quoted=True))
+
+
+def _alias(expression: exp.Expression, alias: str) -> exp.Expression:
+    return exp.alias_(expression, alias, quoted=True)
+
+
+def _as_float(value: Any) -> float | None:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    return None
+
+
+def _profile_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return None
+    return value
+
+
+__all__ = [
+    "PROFILE_HISTOGRAM_BUCKETS",
+    "PROFILE_TOP_K",
+    "PROFILE_TOP_K_MAX_DISTINCT",
+    "ProfileColumn",
+    "ProfileColumnKind",
+    "ProfileDistributionPlan",
+    "assemble_column_profiles",
+    "build_profile_distribution_plan",
+    "build_profile_summary_sql",
+    "profile_column_kind",
+    "profile_table_sample",
+]
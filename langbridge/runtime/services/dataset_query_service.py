@@ -1,13 +1,16 @@
+import asyncio
 import enum
 import hashlib
 import json
 import logging
 import re
+import shutil
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import pyarrow.parquet as pq
 import sqlglot
 from sqlglot import exp
 from .errors import ExecutionValidationError
@@ -47,10 +50,19 @@ from langbridge.runtime.services.dataset_execution import (
     DatasetExecutionResolver,
     build_file_scan_sql,
 )
+from langbridge.runtime.services.dataset_profiling import (
+    ProfileColumn,
+    assemble_column_profiles,
+    build_profile_distribution_plan,
+    build_profile_summary_sql,
+    profile_column_kind,
+    profile_table_sample,
+)
 from langbridge.runtime.utils.datasets import (
     build_dataset_execution_capabilities,
     build_dataset_relation_identity,
 )
+from langbridge.storage.dataset_table import DatasetTable, PartitionSpec, TableSnapshot
 from langbridge.runtime.utils.lineage import (
     LineageEdgeType,
     LineageNodeType,
@@ -67,7 +79,7 @@ from langbridge.runtime.utils.sql import (
 from langbridge.runtime.settings import runtime_settings as settings
 
 
-_DEFAULT_PROFILE_COLUMN_LIMIT = 5
+_DEFAULT_PROFILE_COLUMN_LIMIT = 200
 DatasetExecutionRequest = (
     CreateDatasetPreviewJobRequest
     | CreateDatasetProfileJobRequest
@@ -307,56 +319,72 @@ class DatasetQueryService:
             actor_id=request.actor_id,
             dialect=dialect,
         )
-        count_sql = self._build_count_sql(table_key=table_key, filters=base_filters, dialect=dialect)
-        count_execution = await self._federated_query_tool.execute_federated_query(
+        redacted_columns = {str(name).lower() for name in dict(policy.redaction_rules_json or {})}
+        profiled_columns = [
+            ProfileColumn(
+                name=column.name,
+                data_type=column.data_type,
+                kind=profile_column_kind(column.data_type, dialect=dialect),
+                reveal_values=column.name.lower() not in redacted_columns,
+            )
+            for column in columns
+            if column.is_allowed and not column.is_computed
+        ][:_DEFAULT_PROFILE_COLUMN_LIMIT]
+
+        # Every column is profiled by one summary query and at most one grouped query,
+        # instead of a query per column.
+        sample = profile_table_sample(dialect=dialect, sample_percent=request.sample_percent)
+        sample_fraction = float(request.sample_percent) / 100.0 if sample is not None else None
+        summary_sql = build_profile_summary_sql(
+            table_key=table_key,
+            columns=profiled_columns,
+            filters=base_filters,
+            sample=sample,
+            dialect=dialect,
+        )
+        summary_execution = await self._federated_query_tool.execute_federated_query(
             {
                 "workspace_id": str(request.workspace_id),
-                "query": count_sql,
+                "query": summary_sql,
                 "dialect": dialect,
                 "workflow": workflow.model_dump(mode="json"),
             }
         )
-        row_count_estimate = self._extract_single_numeric(
-            count_execution,
-            preferred_keys=["row_count", "count", "rowcount"],
-        )
+        summary = self._first_row(summary_execution)
 
-        profiled_columns = [
-            column
-            for column in columns
-            if column.is_allowed and not column.is_computed
-        ][: _DEFAULT_PROFILE_COLUMN_LIMIT]
-        distinct_counts: dict[str, int] = {}
-        null_rates: dict[str, float] = {}
-        for column in profiled_columns:
-            stats_sql = self._build_column_profile_sql(
-                table_key=table_key,
-                column_name=column.name,
-                filters=base_filters,
-                dialect=dialect,
-            )
-            stats_execution = await self._federated_query_tool.execute_federated_query(
+        distribution = build_profile_distribution_plan(
+            table_key=table_key,
+            columns=profiled_columns,
+            summary=summary,
+            filters=base_filters,
+            sample_percent=request.sample_percent if sample is not None else None,
+            dialect=dialect,
+        )
+        distribution_rows: list[dict[str, Any]] = []
+        if distribution is not None:
+            distribution_execution = await self._federated_query_tool.execute_federated_query(
                 {
                     "workspace_id": str(request.workspace_id),
-                    "query": stats_sql,
-                    "dialect": dialect,
+                    "query": distribution.sql,
+                    "dialect": distribution.dialect,
                     "workflow": workflow.model_dump(mode="json"),
                 }
             )
-            distinct_count = self._extract_single_numeric(
-                stats_execution,
-                preferred_keys=["distinct_count", "distinct"],
-            )
-            null_count = self._extract_single_numeric(
-                stats_execution,
-                preferred_keys=["null_count", "nulls"],
-            )
-            if distinct_count is not None:
-                distinct_counts[column.name] = distinct_count
-            if row_count_estimate and row_count_estimate > 0 and null_count is not None:
-                null_rates[column.name] = float(null_count) / float(row_count_estimate)
+            distribution_rows = [
+                {str(key).lower(): value for key, value in row.items()}
+                for row in distribution_execution.get("rows") or []
+                if isinstance(row, dict)
+            ]
 
-        execution_meta = self._extract_execution_meta(count_execution)
+        table_profile, column_profiles = assemble_column_profiles(
+            columns=profiled_columns,
+            summary=summary,
+            distribution_rows=distribution_rows,
+            distribution=distribution,
+            sample_fraction=sample_fraction,
+        )
+        row_count_estimate = table_profile["row_count_estimate"] if summary else None
+        execution_meta = self._extract_execution_meta(summary_execution)
         now = datetime.now(timezone.utc)
         dataset.row_count_estimate = row_count_estimate
         dataset.bytes_estimate = execution_meta["bytes_scanned"]
@@ -368,9 +396,22 @@ class DatasetQueryService:
         return {
             "dataset_id": str(dataset.id),
             "row_count_estimate": row_count_estimate,
+            "row_count_margin": table_profile["row_count_margin"],
             "bytes_estimate": execution_meta["bytes_scanned"],
-            "distinct_counts": distinct_counts,
-            "null_rates": null_rates,
+            "distinct_counts": {
+                profile["name"]: profile["distinct_count"]
+                for profile in column_profiles
+                if "distinct_count" in profile
+            },
+            "null_rates": {
+                profile["name"]: profile["null_rate"]
+                for profile in column_profiles
+                if profile["null_rate"] is not None
+            },
+            "columns": column_profiles,
+            "sampled": sample is not None,
+            "sample_percent": request.sample_percent if sample is not None else None,
+            "sampled_rows": table_profile["sampled_rows"],
             "profiled_at": now.isoformat(),
         }
 
@@ -396,30 +437,21 @@ class DatasetQueryService:
             raise ExecutionValidationError("CSV ingest only supports csv source files.")
 
         source_sql = build_file_scan_sql(storage_uri=storage_uri, file_config=file_config)
-        parquet_file = (
-            Path(settings.DATASET_FILE_LOCAL_DIR)
-            / "parquet"
-            / str(request.workspace_id)
-            / f"{dataset.id}.parquet"
+        dataset_dir = Path(settings.DATASET_FILE_LOCAL_DIR) / "parquet" / str(request.workspace_id)
+        table = DatasetTable(
+            dataset_dir / str(dataset.id),
+            partition_spec=PartitionSpec.parse(file_config.get("partition_by")),
+            retain_snapshots=settings.DATASET_TABLE_RETAIN_SNAPSHOTS,
         )
-        parquet_file.parent.mkdir(parents=True, exist_ok=True)
-        escaped_parquet_file = str(parquet_file).replace("'", "''")
-
-        connection = self._execution_engine.open_connection()
-        try:
-            describe_rows = connection.execute(
-                f"DESCRIBE SELECT * FROM {source_sql}"
-            ).fetchall()
-            count_rows = connection.execute(
-                f"SELECT COUNT(*) AS row_count FROM {source_sql}"
-            ).fetchall()
-            connection.execute(
-                f"COPY (SELECT * FROM {source_sql}) TO '{escaped_parquet_file}' (FORMAT PARQUET)"
-            )
-        finally:
-            connection.close()
+        row_count, describe_rows, snapshot = await asyncio.to_thread(
+            self._copy_file_source_to_table,
+            source_sql=source_sql,
+            table=table,
+        )
+        # Datasets ingested before the table layout were written to one `<id>.parquet` file.
+        (dataset_dir / f"{dataset.id}.parquet").unlink(missing_ok=True)
 
-        dataset.storage_uri = parquet_file.resolve().as_uri()
+        dataset.storage_uri = table.root.resolve().as_uri()
         dataset.dialect = "duckdb"
         dataset.file_config = {
             **file_config,
@@ -436,7 +468,7 @@ class DatasetQueryService:
         dataset.materialization_mode = DatasetMaterializationMode.LIVE
         dataset.table_name = dataset.table_name or dataset.name
         dataset.schema_name = dataset.schema_name or None
-        dataset.row_count_estimate = int(count_rows[0][0]) if count_rows else None
+        dataset.row_count_estimate = row_count
         dataset.updated_at = datetime.now(timezone.utc)
 
         existing_columns = await self._dataset_column_repository.list_for_dataset(dataset_id=dataset.id)
@@ -481,9 +513,52 @@ class DatasetQueryService:
             "storage_uri": dataset.storage_uri,
             "row_count_estimate": dataset.row_count_estimate,
             "column_count": len(describe_rows),
+            "column_stats": self._snapshot_column_stats(snapshot),
+            "file_count": len(snapshot.data_files),
             "format": "parquet",
         }
 
+    def _copy_file_source_to_table(
+        self,
+        *,
+        source_sql: str,
+        table: DatasetTable,
+    ) -> tuple[int, list[tuple[Any, ...]], TableSnapshot]:
+        """
+        Convert a file source to Parquet in one streaming pass and commit it to `table`.
+
+        DuckDB sniffs column types from a sample, then parses the input (every file of
+        a glob) in parallel and rolls the output into files of bounded size, so memory
+        stays flat however large the input is. The row count comes from COPY itself and
+        the column types and statistics from the written Parquet footers.
+        """
+        staging_dir = table.staging_path().with_suffix("")
+        staging_dir.parent.mkdir(parents=True, exist_ok=True)
+        escaped_staging_dir = staging_dir.as_posix().replace("'", "''")
+        connection = self._execution_engine.open_connection()
+        try:
+            copy_rows = connection.execute(
+                f"COPY (SELECT * FROM {source_sql}) TO '{escaped_staging_dir}' "
+                f"(FORMAT PARQUET, FILE_SIZE_BYTES {max(1, settings.DATASET_INGEST_FILE_BYTES)})"
+            ).fetchall()
+            staged_files = sorted(staging_dir.glob("*.parquet"))
+            if not staged_files:
+                raise ExecutionValidationError("CSV ingest produced no parquet output.")
+            describe_rows = connection.execute(
+                f"DESCRIBE SELECT * FROM read_parquet('{escaped_staging_dir}/*.parquet')"
+            ).fetchall()
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        finally:
+            connection.close()
+        try:
+            snapshot = table.overwrite(staged_files, schema=pq.read_schema(staged_files[0]))
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        row_count = int(copy_rows[0][0]) if copy_rows else snapshot.row_count
+        return row_count, describe_rows, snapshot
+
     async def _run_bulk_create(
         self,
         request: CreateDatasetBulkCreateJobRequest,
@@ -1401,55 +1476,6 @@ class DatasetQueryService:
                 raise ExecutionValidationError(f"Invalid row filter policy expression: {exc}") from exc
         return expressions
 
-    def _build_count_sql(
-        self,
-        *,
-        table_key: str,
-        filters: list[exp.Expression],
-        dialect: str,
-    ) -> str:
-        query = (
-            exp.select(exp.alias_(exp.Count(this=exp.Star()), "row_count", quoted=True))
-            .from_(exp.table_(table_key, quoted=False))
-        )
-        if filters:
-            query = query.where(exp.and_(*filters))
-        return query.sql(dialect=dialect)
-
-    def _build_column_profile_sql(
-        self,
-        *,
-        table_key: str,
-        column_name: str,
-        filters: list[exp.Expression],
-        dialect: str,
-    ) -> str:
-        column_expr = exp.Column(this=exp.Identifier(this=column_name, quoted=True))
-        distinct_expr = exp.alias_(
-            exp.Count(this=column_expr.copy(), distinct=True),
-            "distinct_count",
-            quoted=True,
-        )
-        null_expr = exp.alias_(
-            exp.Sum(
-                this=exp.Case(
-                    ifs=[
-                        (
-                            exp.Is(this=column_expr.copy(), expression=exp.Null()),
-                            exp.Literal.number(1),
-                        )
-                    ],
-                    default=exp.Literal.number(0),
-                )
-            ),
-            "null_count",
-            quoted=True,
-        )
-        query = exp.select(distinct_expr, null_expr).from_(exp.table_(table_key, quoted=False))
-        if filters:
-            query = query.where(exp.and_(*filters))
-        return query.sql(dialect=dialect)
-
     @staticmethod
     def _literal_expression(value: Any, *, dialect: str) -> exp.Expression:
         if value is None:
@@ -1496,33 +1522,34 @@ class DatasetQueryService:
         job_record.status = desired_status.value
 
     @staticmethod
-    def _extract_single_numeric(
-        execution: dict[str, Any],
-        *,
-        preferred_keys: list[str],
-    ) -> int | None:
+    def _first_row(execution: dict[str, Any]) -> dict[str, Any]:
         rows_payload = execution.get("rows") or []
-        if not isinstance(rows_payload, list) or not rows_payload:
-            return None
-        first_row = rows_payload[0]
-        if not isinstance(first_row, dict):
-            return None
-
-        lowered = {str(key).lower(): value for key, value in first_row.items()}
-        for key in preferred_keys:
-            value = lowered.get(key)
-            if isinstance(value, bool):
-                continue
-            if isinstance(value, (int, float)):
-                return int(value)
-            if isinstance(value, str) and value.strip().isdigit():
-                return int(value.strip())
+        if not isinstance(rows_payload, list) or not rows_payload or not isinstance(rows_payload[0], dict):
+            return {}
+        return {str(key).lower(): value for key, value in rows_payload[0].items()}
 
-        for value in first_row.values():
-            if isinstance(value, bool):
-                continue
-            if isinstance(value, (int, float)):
-                return int(value)
-            if isinstance(value, str) and value.strip().isdigit():
-                return int(value.strip())
-        return None
+    @staticmethod
+    def _snapshot_column_stats(snapshot: TableSnapshot) -> dict[str, dict[str, Any]]:
+        """Fold the per-file min/max/null counts of a snapshot into one entry per column."""
+        column_stats: dict[str, dict[str, Any]] = {}
+        for name in snapshot.schema.names:
+            null_count: int | None = 0
+            bounds: list[tuple[Any, Any]] = []
+            bounded = True
+            for data_file in snapshot.data_files:
+                stats = data_file.column_stats.get(name)
+                if stats is None or stats.null_count is None:
+                    null_count = None
+                elif null_count is not None:
+                    null_count += stats.null_count
+                if stats is not None and stats.min is not None and stats.max is not None:
+                    bounds.append((stats.min, stats.max))
+                elif stats is None or stats.null_count != data_file.row_count:
+                    # Only an all-null file may lack bounds without hiding values.
+                    bounded = False
+            column_stats[name] = {
+                "null_count": null_count,
+                "min": min(low for low, _ in bounds) if bounded and bounds else None,
+                "max": max(high for _, high in bounds) if bounded and bounds else None,
+            }
+        return column_stats
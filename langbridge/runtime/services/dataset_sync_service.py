@@ -1,15 +1,25 @@
+import asyncio
 import re
 import sys
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 import logging
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
+from sqlglot import exp
 
+from langbridge.connectors.base.change_capture import (
+    ChangeCaptureTable,
+    ChangeDataCaptureConnector,
+    ChangeEvent,
+    ChangeOperation,
+)
 from langbridge.connectors.base.connector import ApiConnector
 from langbridge.connectors.base.resource_paths import (
     api_resource_root,
@@ -21,6 +31,7 @@ from langbridge.connectors.base import (
     SqlConnectorFactory,
     get_connector_config_factory,
 )
+from langbridge import telemetry
 from langbridge.runtime.utils.lineage import (
     LineageEdgeType,
     LineageNodeType,
@@ -30,11 +41,17 @@ from langbridge.runtime.utils.lineage import (
     stable_payload_hash,
 )
 from langbridge.runtime.utils.connector_runtime import build_connector_runtime_payload
+from langbridge.storage.dataset_table import DatasetTable, PartitionSpec, StatsPredicate, TableSnapshot
+from langbridge.storage.parquet_stream import (
+    StreamingParquetResult,
+    StreamingParquetWriter,
+    unify_schemas,
+)
 from langbridge.runtime.utils.datasets import (
     build_dataset_execution_capabilities,
     build_dataset_relation_identity,
 )
-from langbridge.connectors.base.connector import ApiResource
+from langbridge.connectors.base.connector import ApiChildResource, ApiResource, ApiResourceCardinality
 from langbridge.connectors.base.config import ConnectorRuntimeType, ConnectorSyncStrategy
 from langbridge.runtime.models import (
     ConnectorSyncState,
@@ -65,8 +82,14 @@ from langbridge.runtime.models.metadata import (
 from langbridge.runtime.models.state import ConnectorSyncMode, ConnectorSyncStatus
 from langbridge.runtime.security import SecretProviderRegistry
 from langbridge.runtime.settings import runtime_settings as settings
+from langbridge.runtime.services.semantic_result_cache import get_semantic_result_cache
 
 _RESOURCE_SANITIZER = re.compile(r"[^0-9A-Za-z_]+")
+# Stands in for the source query while a sync page query is rendered in the connector
+# dialect; the source SQL is substituted afterwards so it is never re-generated.
+_SQL_SYNC_INPUT = "langbridge_sync_input"
+# Marks deleted rows in a staged CDC delta; never part of the dataset schema.
+_CDC_DELETED = "_langbridge_deleted"
 
 
 async def _flush_stores(*stores: Any) -> None:
@@ -101,6 +124,49 @@ class MaterializedDatasetResult:
     schema_drift: dict[str, Any] | None = None
 
 
+@dataclass(slots=True)
+class _SqlSyncRange:
+    """One key range of a SQL sync: `lower` inclusive, `upper` exclusive, `after` the last key read."""
+
+    lower: Any = None
+    upper: Any = None
+    after: Any = None
+    cursor: str | None = None
+    done: bool = False
+    nulls: bool = False
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "lower": self.lower,
+            "upper": self.upper,
+            "after": self.after,
+            "cursor": self.cursor,
+            "done": self.done,
+            "nulls": self.nulls,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, Any]) -> "_SqlSyncRange":
+        return cls(
+            lower=payload.get("lower"),
+            upper=payload.get("upper"),
+            after=payload.get("after"),
+            cursor=payload.get("cursor"),
+            done=bool(payload.get("done")),
+            nulls=bool(payload.get("nulls")),
+        )
+
+
+@dataclass(slots=True)
+class _SqlSyncRead:
+    staged: StreamingParquetResult
+    next_cursor: str | None
+    query_sql: str | None
+    key_column: str | None
+    page_count: int
+    resumed: bool
+
+
 class ConnectorSyncRuntime:
     def __init__(
         self,
@@ -122,6 +188,8 @@ class ConnectorSyncRuntime:
         self._secret_provider_registry = secret_provider_registry or SecretProviderRegistry()
         self._api_connector_factory = ApiConnectorFactory()
         self._sql_connector_factory = SqlConnectorFactory()
+        self._sql_sync_limiters: dict[uuid.UUID, asyncio.Semaphore] = {}
+        self._sql_sync_checkpoints: dict[tuple[uuid.UUID, uuid.UUID, str], dict[str, Any]] = {}
 
     async def get_or_create_state(
         self,
@@ -290,6 +358,35 @@ class ConnectorSyncRuntime:
         dataset: DatasetMetadata,
         sync_mode: ConnectorSyncMode,
         max_sync_retry: int = 3,
+    ) -> dict[str, Any]:
+        with telemetry.timed(
+            "connector_sync.sync_dataset",
+            histogram=telemetry.SYNC_JOB_DURATION,
+            labels={"sync_mode": _enum_value(sync_mode).lower()},
+            attributes={"dataset_id": str(dataset.id), "connector": connector_record.name},
+        ):
+            result = await self._sync_dataset(
+                workspace_id=workspace_id,
+                actor_id=actor_id,
+                connector_record=connector_record,
+                dataset=dataset,
+                sync_mode=sync_mode,
+                max_sync_retry=max_sync_retry,
+            )
+        # Cached semantic results over this dataset go stale; they are served (within
+        # their stale-while-revalidate window) only while being recomputed.
+        get_semantic_result_cache().invalidate_dataset(dataset.id)
+        return result
+
+    async def _sync_dataset(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        actor_id: uuid.UUID,
+        connector_record: ConnectorMetadata,
+        dataset: DatasetMetadata,
+        sync_mode: ConnectorSyncMode,
+        max_sync_retry: int,
     ) -> dict[str, Any]:
         if connector_record.connector_type is None:
             raise ValueError(f"Connector '{connector_record.name}' is missing connector_type.")
@@ -336,31 +433,51 @@ class ConnectorSyncRuntime:
 
             page_cursor: str | None = None
             page_count = 0
-            extracted_records: list[dict[str, Any]] = []
             checkpoint_cursor = state.last_cursor
-            for _ in range(max_sync_retry):
-                extract_result = await api_connector.extract_resource(
-                    resolved_resource.name,
-                    since=since,
-                    cursor=page_cursor,
-                    limit=None,
-                )
-                extracted_records.extend(list(extract_result.records or []))
-                checkpoint_cursor = self._pick_newer_cursor(
-                    checkpoint_cursor, extract_result.checkpoint_cursor
-                )
-                page_count += 1
-                page_cursor = extract_result.next_cursor
-                if not page_cursor:
-                    break
+            cardinality: ApiResourceCardinality | None = None
+            child_resources: dict[str, ApiChildResource] = {}
+            # Each page is materialized and handed to the writer as it arrives, so memory
+            # is bounded by the page and write batch sizes rather than the resource size.
+            with self._sync_writer(
+                dataset=dataset,
+                connection_id=connection_id,
+                sync_mode=effective_sync_mode,
+            ) as writer:
+                for _ in range(max_sync_retry):
+                    extract_result = await api_connector.extract_resource(
+                        resolved_resource.name,
+                        since=since,
+                        cursor=page_cursor,
+                        limit=None,
+                    )
+                    page_rows = materialize_api_resource_rows(
+                        resource_path=resource_path,
+                        records=list(extract_result.records or []),
+                        primary_key=resolved_resource.primary_key,
+                        flatten=source_payload.get("flatten"),
+                    )
+                    if cardinality is None or (page_rows.rows and writer.row_count == 0):
+                        cardinality = page_rows.cardinality
+                    writer.write_rows(page_rows.rows)
+                    for child in page_rows.child_resources:
+                        child_resources.setdefault(child.path, child)
+                    checkpoint_cursor = self._pick_newer_cursor(
+                        checkpoint_cursor, extract_result.checkpoint_cursor
+                    )
+                    page_count += 1
+                    page_cursor = extract_result.next_cursor
+                    if not page_cursor:
+                        break
+                staged = writer.close()
 
             now = datetime.now(timezone.utc)
-            materialized_rows = materialize_api_resource_rows(
-                resource_path=resource_path,
-                records=extracted_records,
-                primary_key=resolved_resource.primary_key,
-                flatten=source_payload.get("flatten"),
-            )
+            if cardinality is None:
+                cardinality = materialize_api_resource_rows(
+                    resource_path=resource_path,
+                    records=[],
+                    primary_key=resolved_resource.primary_key,
+                    flatten=source_payload.get("flatten"),
+                ).cardinality
             materialized = await self._materialize_existing_dataset(
                 actor_id=actor_id,
                 connection_id=connection_id,
@@ -369,12 +486,12 @@ class ConnectorSyncRuntime:
                 dataset=dataset,
                 sync_source=sync_source,
                 source_key=source_key,
-                rows=materialized_rows.rows,
+                staged=staged,
                 primary_key=self._materialization_primary_key(
                     resource_path=resource_path,
                     root_resource_name=resolved_resource.name,
                     root_primary_key=resolved_resource.primary_key,
-                    rows=materialized_rows.rows,
+                    columns=staged.schema.names,
                 ),
                 sync_mode=effective_sync_mode,
             )
@@ -389,7 +506,7 @@ class ConnectorSyncRuntime:
             state.last_sync_at = now
             state.status = ConnectorSyncStatus.SUCCEEDED
             state.error_message = None
-            state.records_synced = len(materialized_rows.rows)
+            state.records_synced = staged.row_count
             state.bytes_synced = materialized.bytes_written
             state.state = {
                 "page_count": page_count,
@@ -397,7 +514,7 @@ class ConnectorSyncRuntime:
                 "root_resource_name": resolved_resource.name,
                 "dataset_id": str(materialized.dataset_id),
                 "dataset_name": materialized.dataset_name,
-                "cardinality": materialized_rows.cardinality.value,
+                "cardinality": cardinality.value,
                 "schema_drift": materialized.schema_drift,
                 "child_resources": [
                     {
@@ -408,7 +525,7 @@ class ConnectorSyncRuntime:
                         "supports_flattening": child.supports_flattening,
                         "addressable": child.addressable,
                     }
-                    for child in materialized_rows.child_resources
+                    for child in child_resources.values()
                 ],
                 "last_sync_at": now.isoformat(),
             }
@@ -430,39 +547,48 @@ class ConnectorSyncRuntime:
         if sync_source.table or sync_source.sql:
             sql_connector = self._build_sql_connector(connector_record)
             await sql_connector.test_connection()
-            source_query = (
-                f"SELECT * FROM {str(sync_source.table).strip()}"
-                if sync_source.table
-                else str(sync_source.sql).strip()
-            )
+            if dataset.sync is not None and _enum_value(dataset.sync.strategy) == ConnectorSyncStrategy.CDC.value:
+                return await self._sync_sql_changes(
+                    actor_id=actor_id,
+                    connection_id=connection_id,
+                    connector_record=connector_record,
+                    connector_type=connector_type,
+                    dataset=dataset,
+                    sync_source=sync_source,
+                    source_key=source_key,
+                    source_payload=source_payload,
+                    state=state,
+                    sql_connector=sql_connector,
+                    sync_mode=normalized_sync_mode,
+                )
             effective_sync_mode = normalized_sync_mode
-            if (
-                normalized_sync_mode == ConnectorSyncMode.INCREMENTAL
-                and state.last_cursor is not None
-                and str(dataset.sync.cursor_field or "").strip()
-            ):
-                cursor_field = str(dataset.sync.cursor_field or "").strip()
-                cursor_literal = self._sql_literal(state.last_cursor)
-                wrapped = f"SELECT * FROM ({source_query}) AS langbridge_sync_source"
-                source_query = f"{wrapped} WHERE {cursor_field} >= {cursor_literal}"
-            result = await sql_connector.execute(
-                source_query,
-                params={},
-                max_rows=None,
-                timeout_s=30,
-            )
-            rows = [
-                {
-                    str(column): (raw_row[index] if index < len(raw_row) else None)
-                    for index, column in enumerate(result.columns)
-                }
-                for raw_row in result.rows
-            ]
-            primary_key = await self._resolve_sql_primary_key(
+            cursor_field = str(dataset.sync.cursor_field or "").strip() or None
+            table_primary_key = await self._resolve_sql_primary_key(
                 sql_connector=sql_connector,
                 sync_source=sync_source,
-                rows=rows,
+                columns=[],
             )
+            read = await self._read_sql_source(
+                sql_connector=sql_connector,
+                state=state,
+                table=self._dataset_table(dataset=dataset, connection_id=connection_id),
+                writer_factory=lambda: self._sync_writer(
+                    dataset=dataset,
+                    connection_id=connection_id,
+                    sync_mode=effective_sync_mode,
+                ),
+                source_query=(
+                    f"SELECT * FROM {str(sync_source.table).strip()}"
+                    if sync_source.table
+                    else str(sync_source.sql).strip()
+                ),
+                key_column=table_primary_key or cursor_field,
+                unique_key=bool(table_primary_key),
+                cursor_field=cursor_field,
+                sync_mode=effective_sync_mode,
+            )
+            staged = read.staged
+            primary_key = table_primary_key or ("id" if "id" in staged.schema.names else None)
             materialized = await self._materialize_existing_dataset(
                 actor_id=actor_id,
                 connection_id=connection_id,
@@ -471,26 +597,25 @@ class ConnectorSyncRuntime:
                 dataset=dataset,
                 sync_source=sync_source,
                 source_key=source_key,
-                rows=rows,
+                staged=staged,
                 primary_key=primary_key,
                 sync_mode=effective_sync_mode,
             )
+            self._sql_sync_checkpoints.pop(self._sql_checkpoint_key(state), None)
             now = datetime.now(timezone.utc)
             state.sync_mode = effective_sync_mode
-            state.last_cursor = self._resolve_next_sql_cursor(
-                rows=rows,
-                cursor_field=str(dataset.sync.cursor_field or "").strip() or None,
-                current_cursor=state.last_cursor,
-                sync_mode=effective_sync_mode,
-            )
+            state.last_cursor = read.next_cursor
             state.last_sync_at = now
             state.status = ConnectorSyncStatus.SUCCEEDED
             state.error_message = None
-            state.records_synced = len(rows)
+            state.records_synced = staged.row_count
             state.bytes_synced = materialized.bytes_written
             state.state = {
-                "query_sql": result.sql,
-                "row_count": len(rows),
+                "query_sql": read.query_sql,
+                "key_column": read.key_column,
+                "page_count": read.page_count,
+                "resumed": read.resumed,
+                "row_count": staged.row_count,
                 "source_label": self._sync_source_label(sync_source),
                 "schema_drift": materialized.schema_drift,
                 "dataset_id": str(materialized.dataset_id),
@@ -515,12 +640,610 @@ class ConnectorSyncRuntime:
             "Supported synced sources are resource, table, and sql."
         )
 
+    async def _sync_sql_changes(
+        self,
+        *,
+        actor_id: uuid.UUID,
+        connection_id: uuid.UUID,
+        connector_record: ConnectorMetadata,
+        connector_type: ConnectorRuntimeType,
+        dataset: DatasetMetadata,
+        sync_source: DatasetSource,
+        source_key: str,
+        source_payload: dict[str, Any],
+        state: ConnectorSyncState,
+        sql_connector: Any,
+        sync_mode: ConnectorSyncMode,
+    ) -> dict[str, Any]:
+        """
+        Sync a table from its source change log (`sync.strategy: CDC`).
+
+        The first sync, and any FULL_REFRESH sync, starts a capture and then snapshots the
+        table, so changes committed during the snapshot are replayed on top of it;
+        applying a change is idempotent per primary key. Later syncs read batches of at
+        most `DATASET_SYNC_CDC_BATCH_EVENTS` changes, up to `DATASET_SYNC_CDC_MAX_EVENTS`
+        per sync, and commit each batch as upserts plus deletes before acknowledging it.
+        The position to continue from is kept in `state.last_cursor`. A truncate
+        re-snapshots the table.
+        """
+        if not isinstance(sql_connector, ChangeDataCaptureConnector):
+            raise ValueError(f"Connector '{connector_record.name}' does not support change data capture.")
+        if not sync_source.table:
+            raise ValueError(f"Dataset '{dataset.name}' requests CDC sync, which requires sync.source.table.")
+        relation = str(sync_source.table).strip()
+        primary_key = await self._resolve_sql_primary_key(
+            sql_connector=sql_connector,
+            sync_source=sync_source,
+            columns=[],
+        )
+        if not primary_key:
+            raise ValueError(f"Dataset '{dataset.name}' requests CDC sync, but table '{relation}' has no primary key.")
+        _, schema_name, table_name = _relation_parts(relation)
+        tables = [ChangeCaptureTable(schema=schema_name, name=table_name)]
+        slot = f"langbridge_{dataset.id.hex[:24]}"
+        table = self._dataset_table(dataset=dataset, connection_id=connection_id)
+        previous = dict((state.state or {}).get("cdc") or {})
+        position = state.last_cursor if previous.get("slot") == slot else None
+        counts = {operation.value: 0 for operation in ChangeOperation}
+        lag_seconds: float | None = None
+        lag_bytes: int | None = None
+        snapshot_rows: int | None = None
+        materialized: MaterializedDatasetResult | None = None
+        existing_snapshot = table.current_snapshot()
+        existing_schema = existing_snapshot.schema if existing_snapshot is not None else None
+        delta_bytes = 0
+        applied_snapshot: TableSnapshot | None = None
+
+        async def _snapshot() -> None:
+            nonlocal snapshot_rows, materialized, applied_snapshot, existing_schema, delta_bytes
+            read = await self._read_sql_source(
+                sql_connector=sql_connector,
+                state=state,
+                table=table,
+                writer_factory=lambda: self._sync_writer(
+                    dataset=dataset,
+                    connection_id=connection_id,
+                    sync_mode=ConnectorSyncMode.FULL_REFRESH,
+                ),
+                source_query=f"SELECT * FROM {relation}",
+                key_column=primary_key,
+                unique_key=True,
+                cursor_field=None,
+                sync_mode=ConnectorSyncMode.FULL_REFRESH,
+            )
+            materialized = await self._materialize_existing_dataset(
+                actor_id=actor_id,
+                connection_id=connection_id,
+                connector_record=connector_record,
+                connector_type=connector_type,
+                dataset=dataset,
+                sync_source=sync_source,
+                source_key=source_key,
+                staged=read.staged,
+                primary_key=primary_key,
+                sync_mode=ConnectorSyncMode.FULL_REFRESH,
+            )
+            self._sql_sync_checkpoints.pop(self._sql_checkpoint_key(state), None)
+            snapshot_rows = read.staged.row_count
+            # Changes applied after this snapshot are published against it.
+            current = table.current_snapshot()
+            existing_schema = current.schema if current is not None else None
+            applied_snapshot = None
+            delta_bytes = 0
+
+        if position is None or sync_mode == ConnectorSyncMode.FULL_REFRESH:
+            position = await sql_connector.start_change_capture(slot=slot, tables=tables)
+            await _snapshot()
+
+        batch_events = max(1, settings.DATASET_SYNC_CDC_BATCH_EVENTS)
+        remaining = max(1, settings.DATASET_SYNC_CDC_MAX_EVENTS)
+        while remaining > 0:
+            batch = await sql_connector.read_changes(
+                slot=slot,
+                tables=tables,
+                position=position,
+                max_events=min(batch_events, remaining),
+            )
+            remaining -= max(1, len(batch.events))
+            lag_seconds, lag_bytes = batch.lag_seconds, batch.lag_bytes
+            if lag_seconds is not None:
+                telemetry.observe(
+                    telemetry.SYNC_REPLICATION_LAG,
+                    lag_seconds,
+                    labels={"connector_type": connector_type.value.lower()},
+                )
+            next_position = batch.position or position
+            if any(event.operation == ChangeOperation.TRUNCATE for event in batch.events):
+                counts[ChangeOperation.TRUNCATE.value] += 1
+                # Skip past the truncate first so the fresh snapshot is not truncated again.
+                await sql_connector.acknowledge_changes(slot=slot, position=next_position)
+                position = next_position
+                await _snapshot()
+            else:
+                if batch.events:
+                    staged_bytes, applied_snapshot = self._apply_change_events(
+                        dataset=dataset,
+                        connection_id=connection_id,
+                        table=table,
+                        events=batch.events,
+                        primary_key=primary_key,
+                    )
+                    delta_bytes += staged_bytes
+                    for event in batch.events:
+                        counts[event.operation.value] += 1
+                if next_position != position or batch.events:
+                    await sql_connector.acknowledge_changes(slot=slot, position=next_position)
+                position = next_position
+            state.last_cursor = position
+            if not batch.has_more:
+                break
+
+        if applied_snapshot is not None:
+            materialized = await self._publish_dataset_snapshot(
+                actor_id=actor_id,
+                connection_id=connection_id,
+                connector_record=connector_record,
+                connector_type=connector_type,
+                dataset=dataset,
+                sync_source=sync_source,
+                source_key=source_key,
+                table=table,
+                snapshot=applied_snapshot,
+                existing_schema=existing_schema,
+                bytes_written=delta_bytes,
+                sync_mode=sync_mode,
+                sync_label="CDC",
+            )
+        changes_applied = sum(
+            counts[operation.value]
+            for operation in (ChangeOperation.INSERT, ChangeOperation.UPDATE, ChangeOperation.DELETE)
+        )
+        current = table.current_snapshot()
+        now = datetime.now(timezone.utc)
+        state.sync_mode = sync_mode
+        state.last_cursor = position
+        state.last_sync_at = now
+        state.status = ConnectorSyncStatus.SUCCEEDED
+        state.error_message = None
+        state.records_synced = (snapshot_rows or 0) + changes_applied
+        state.bytes_synced = materialized.bytes_written if materialized is not None else 0
+        state.state = {
+            "cdc": {
+                "slot": slot,
+                "position": position,
+                "lag_seconds": lag_seconds,
+                "lag_bytes": lag_bytes,
+                "snapshot_rows": snapshot_rows,
+                "inserts": counts[ChangeOperation.INSERT.value],
+                "updates": counts[ChangeOperation.UPDATE.value],
+                "deletes": counts[ChangeOperation.DELETE.value],
+                "truncates": counts[ChangeOperation.TRUNCATE.value],
+            },
+            "key_column": primary_key,
+            "row_count": current.row_count if current is not None else 0,
+            "source_label": self._sync_source_label(sync_source),
+            "schema_drift": materialized.schema_drift if materialized is not None else None,
+            "dataset_id": str(dataset.id),
+            "dataset_name": dataset.name,
+            "last_sync_at": now.isoformat(),
+        }
+        state.updated_at = now
+        await self._connector_sync_state_repository.save(state)
+        return {
+            "source_key": source_key,
+            "source": source_payload,
+            "sync_mode": _enum_value(sync_mode),
+            "records_synced": int(state.records_synced or 0),
+            "bytes_synced": state.bytes_synced,
+            "last_cursor": state.last_cursor,
+            "dataset_ids": [str(dataset.id)],
+            "dataset_names": [dataset.name],
+        }
+
+    def _apply_change_events(
+        self,
+        *,
+        dataset: DatasetMetadata,
+        connection_id: uuid.UUID,
+        table: DatasetTable,
+        events: list[ChangeEvent],
+        primary_key: str,
+    ) -> tuple[int, TableSnapshot]:
+        """
+        Commit a batch of row changes as one append.
+
+        The last change per key wins: inserted and updated rows are appended, and every
+        changed key supersedes the live row it replaces, so a delete only leaves its
+        delete-file entry behind. Updates that left unchanged columns out are completed
+        first, since the appended row replaces the whole stored row.
+        """
+        events = self._fill_unchanged_columns(table=table, events=events, primary_key=primary_key)
+        with self._sync_writer(
+            dataset=dataset,
+            connection_id=connection_id,
+            sync_mode=ConnectorSyncMode.INCREMENTAL,
+        ) as writer:
+            writer.write_rows(
+                {**event.row, _CDC_DELETED: event.operation == ChangeOperation.DELETE} for event in events
+            )
+            staged = writer.close()
+        try:
+            delta = pq.read_table(staged.path)
+            identities = self._identity_array(delta, primary_key)
+            kept = self._last_occurrences(identities)
+            delta = delta.take(kept)
+            identities = identities.take(kept)
+            deleted = pc.fill_null(delta[_CDC_DELETED], False)
+            rows = delta.filter(pc.invert(deleted)).drop_columns([_CDC_DELETED])
+            pq.write_table(rows, staged.path)
+            current = table.current_snapshot()
+            snapshot = table.append(
+                staged.path,
+                schema=unify_schemas(current.schema if current is not None else None, rows.schema),
+                primary_key=primary_key,
+                replaced_identities=pc.unique(identities.drop_null()),
+                identity=lambda batch: self._identity_array(batch, primary_key),
+                identity_columns=self._identity_columns(primary_key),
+                replaced_predicates=self._key_range_predicates(delta, primary_key),
+            )
+            return int(staged.bytes_written or 0), snapshot
+        finally:
+            staged.path.unlink(missing_ok=True)
+
+    def _fill_unchanged_columns(
+        self,
+        *,
+        table: DatasetTable,
+        events: list[ChangeEvent],
+        primary_key: str,
+    ) -> list[ChangeEvent]:
+        """
+        Give updates their `unchanged` columns' values from the key's previous row.
+
+        The previous row is the latest earlier change to the key in this batch, or else
+        the live row in `table`; only files whose key stats may hold one are read.
+        """
+        if not any(event.unchanged for event in events):
+            return events
+        keys = self._identity_array(
+            pa.Table.from_pylist([{primary_key: event.row.get(primary_key)} for event in events]),
+            primary_key,
+        ).to_pylist()
+
+        # Keys whose previous row is not in this batch.
+        lookups: dict[str, Any] = {}
+        columns: set[str] = {primary_key}
+        seen: set[str] = set()
+        for event, key in zip(events, keys):
+            if event.unchanged and key is not None and key not in seen:
+                lookups[key] = event.row[primary_key]
+                columns.update(event.unchanged)
+            seen.add(key)
+
+        latest: dict[str, dict[str, Any]] = {}
+        current = table.current_snapshot()
+        if lookups and current is not None:
+            for batch in table.iter_batches(
+                current,
+                columns=[name for name in current.schema.names if name in columns],
+                predicates=[StatsPredicate(primary_key, "in", list(lookups.values()))],
+            ):
+                identities = self._identity_array(batch, primary_key)
+                found = pc.fill_null(pc.is_in(identities, value_set=pa.array(list(lookups), type=pa.string())), False)
+                for key, row in zip(identities.filter(found).to_pylist(), batch.filter(found).to_pylist()):
+                    latest[key] = row
+
+        completed: list[ChangeEvent] = []
+        for event, key in zip(events, keys):
+            if event.operation == ChangeOperation.DELETE:
+                latest.pop(key, None)
+            elif event.unchanged:
+                previous = latest.get(key)
+                if previous is None:
+                    raise ValueError(
+                        f"Change to key {key!r} of '{event.table.qualified_name}' omits unchanged columns "
+                        f"{sorted(event.unchanged)} and no previous row is stored for it; "
+                        "set REPLICA IDENTITY FULL on the source table and run a full refresh."
+                    )
+                row = {**event.row, **{name: previous.get(name) for name in sorted(event.unchanged)}}
+                event = replace(event, row=row, unchanged=frozenset())
+                latest[key] = row
+            elif key is not None:
+                latest[key] = event.row
+            completed.append(event)
+        return completed
+
     async def mark_failed(self, *, state: ConnectorSyncState, error_message: str) -> None:
+        # The failed sync's unit of work may have been rolled back; keep its last SQL
+        # checkpoint so the next sync can resume from it.
+        checkpoint = self._sql_sync_checkpoints.pop(self._sql_checkpoint_key(state), None)
+        if checkpoint is not None:
+            state.state = {**dict(state.state or {}), "sql_checkpoint": checkpoint}
         state.status = ConnectorSyncStatus.FAILED
         state.error_message = error_message
         state.updated_at = datetime.now(timezone.utc)
         await self._connector_sync_state_repository.save(state)
 
+    async def _read_sql_source(
+        self,
+        *,
+        sql_connector: Any,
+        state: ConnectorSyncState,
+        table: DatasetTable,
+        writer_factory: Callable[[], StreamingParquetWriter],
+        source_query: str,
+        key_column: str | None,
+        unique_key: bool,
+        cursor_field: str | None,
+        sync_mode: ConnectorSyncMode,
+    ) -> _SqlSyncRead:
+        """
+        Stage a SQL sync source with keyset-paginated page queries.
+
+        Pages are ordered by `key_column` and hold at most `DATASET_SYNC_SQL_PAGE_ROWS`
+        rows, so no query or source transaction spans the whole table. With
+        `DATASET_SYNC_SQL_MAX_CONCURRENCY` above one, integer keys are split into that
+        many ranges read concurrently; that limit also caps in-flight sync queries per
+        connector. Every `DATASET_SYNC_SQL_CHECKPOINT_ROWS` rows a range closes its
+        staged part and the parts plus each range's last key are saved in
+        `state.state["sql_checkpoint"]`, which the next sync of the same query resumes
+        from. Without a key column the source is read with one query.
+        """
+        dialect = getattr(sql_connector, "SQLGLOT_DIALECT", None)
+        page_rows = max(1, settings.DATASET_SYNC_SQL_PAGE_ROWS)
+        checkpoint_rows = max(1, settings.DATASET_SYNC_SQL_CHECKPOINT_ROWS)
+        concurrency = max(1, settings.DATASET_SYNC_SQL_MAX_CONCURRENCY)
+        limiter = self._sql_sync_limiter(state.connection_id)
+        filters: list[exp.Expression] = []
+        if sync_mode == ConnectorSyncMode.INCREMENTAL and state.last_cursor is not None and cursor_field:
+            filters.append(exp.GTE(this=exp.to_column(cursor_field), expression=self._sql_value(state.last_cursor)))
+        fingerprint = stable_payload_hash(
+            {
+                "query": source_query,
+                "key_column": key_column,
+                "sync_mode": _enum_value(sync_mode),
+                "since": state.last_cursor if filters else None,
+            }
+        )
+
+        def _select(*conditions: exp.Expression, order: bool = True, limit: int | None = None) -> exp.Select:
+            query = exp.select("*").from_(exp.to_table(_SQL_SYNC_INPUT).as_("langbridge_sync_source"))
+            for condition in (*filters, *conditions):
+                query = query.where(condition.copy(), copy=False)
+            if key_column and order:
+                query = query.order_by(exp.to_column(key_column), copy=False)
+            if limit is not None:
+                query = query.limit(limit, copy=False)
+            return query
+
+        def _range_conditions(sync_range: _SqlSyncRange) -> list[exp.Expression]:
+            if not key_column:
+                return []
+            if sync_range.nulls:
+                return [exp.Is(this=exp.to_column(key_column), expression=exp.Null())]
+            bounds = (
+                (exp.GTE, sync_range.lower),
+                (exp.LT, sync_range.upper),
+                (exp.GT, sync_range.after),
+            )
+            return [
+                comparison(this=exp.to_column(key_column), expression=self._sql_value(value))
+                for comparison, value in bounds
+                if value is not None
+            ]
+
+        async def _execute(query: exp.Select, *, max_rows: int | None) -> tuple[str, Any]:
+            sql = query.sql(dialect=dialect).replace(_SQL_SYNC_INPUT, f"({source_query})", 1)
+            async with limiter:
+                result = await sql_connector.execute(
+                    sql,
+                    params={},
+                    max_rows=max_rows,
+                    timeout_s=settings.DATASET_SYNC_SQL_TIMEOUT_SECONDS,
+                )
+            return sql, result
+
+        ranges, parts = self._resume_sql_checkpoint(state=state, table=table, fingerprint=fingerprint)
+        resumed = ranges is not None
+        if ranges is None:
+            ranges = [_SqlSyncRange()]
+            if key_column and concurrency > 1:
+                key = exp.to_column(key_column)
+                bounds_query = _select(order=False)
+                bounds_query.set(
+                    "expressions",
+                    [exp.Min(this=key.copy()).as_("lower_key"), exp.Max(this=key.copy()).as_("upper_key")],
+                )
+                _, bounds = await _execute(bounds_query, max_rows=1)
+                lower, upper = (list(bounds.rows[0]) + [None, None])[:2] if bounds.rows else (None, None)
+                if (
+                    isinstance(lower, int)
+                    and isinstance(upper, int)
+                    and not isinstance(lower, bool)
+                    and upper - lower >= page_rows
+                ):
+                    count = min(concurrency, (upper - lower) // page_rows + 1)
+                    edges = [lower + (upper - lower + 1) * index // count for index in range(1, count)]
+                    ranges = [
+                        _SqlSyncRange(lower=range_lower, upper=range_upper)
+                        for range_lower, range_upper in zip([None, *edges], [*edges, None])
+                    ]
+            if key_column and not unique_key and not filters:
+                # Keyset comparisons never match NULL keys; read those rows separately.
+                ranges.append(_SqlSyncRange(nulls=True))
+
+        committed = [sync_range.to_json() for sync_range in ranges]
+        checkpoint_key = self._sql_checkpoint_key(state)
+        checkpoint_lock = asyncio.Lock()
+        page_count = 0
+        query_sql: str | None = None
+
+        async def _checkpoint(index: int, sync_range: _SqlSyncRange, writer: StreamingParquetWriter | None) -> None:
+            if writer is not None:
+                part = writer.close()
+                if part.row_count:
+                    parts.append(part.path.relative_to(table.root).as_posix())
+                else:
+                    part.path.unlink(missing_ok=True)
+            committed[index] = sync_range.to_json()
+            checkpoint = {
+                "fingerprint": fingerprint,
+                "key_column": key_column,
+                "ranges": list(committed),
+                "parts": list(parts),
+            }
+            self._sql_sync_checkpoints[checkpoint_key] = checkpoint
+            async with checkpoint_lock:
+                state.state = {**dict(state.state or {}), "sql_checkpoint": checkpoint}
+                await self._connector_sync_state_repository.save(state)
+                await _flush_stores(self._connector_sync_state_repository)
+
+        async def _read_range(index: int, sync_range: _SqlSyncRange) -> None:
+            nonlocal page_count, query_sql
+            writer: StreamingParquetWriter | None = None
+            try:
+                while not sync_range.done:
+                    conditions = _range_conditions(sync_range)
+                    paged = bool(key_column) and not sync_range.nulls
+                    sql, result = await _execute(
+                        _select(*conditions, order=paged, limit=page_rows if paged else None),
+                        max_rows=page_rows if paged else None,
+                    )
+                    page_count += 1
+                    query_sql = query_sql or sql
+                    raw_rows = list(result.rows)
+                    columns = [str(column) for column in result.columns]
+                    finished = not paged or len(raw_rows) < page_rows
+                    last_key = None
+                    if paged and raw_rows:
+                        key_index = self._sql_key_index(columns, str(key_column))
+                        last_key = raw_rows[-1][key_index]
+                        if not finished and not unique_key:
+                            # A non-unique key may continue past the page: hold back the
+                            # rows sharing the last key and read that value in one query.
+                            boundary = next(
+                                position
+                                for position, raw_row in enumerate(raw_rows)
+                                if raw_row[key_index] == last_key
+                            )
+                            if boundary > 0:
+                                raw_rows = raw_rows[:boundary]
+                                last_key = raw_rows[-1][key_index]
+                            else:
+                                _, ties = await _execute(
+                                    _select(
+                                        *conditions,
+                                        exp.EQ(this=exp.to_column(str(key_column)), expression=self._sql_value(last_key)),
+                                        order=False,
+                                    ),
+                                    max_rows=None,
+                                )
+                                page_count += 1
+                                raw_rows = list(ties.rows)
+                    if writer is None:
+                        writer = writer_factory()
+                    # Row dicts only exist for one write batch at a time.
+                    for offset in range(0, len(raw_rows), writer.batch_rows):
+                        rows = [
+                            {
+                                column: (raw_row[position] if position < len(raw_row) else None)
+                                for position, column in enumerate(columns)
+                            }
+                            for raw_row in raw_rows[offset : offset + writer.batch_rows]
+                        ]
+                        sync_range.cursor = self._resolve_next_sql_cursor(
+                            rows=rows,
+                            cursor_field=cursor_field,
+                            current_cursor=sync_range.cursor,
+                            sync_mode=sync_mode,
+                        )
+                        writer.write_rows(rows)
+                    if last_key is not None:
+                        sync_range.after = self._checkpoint_value(last_key)
+                    sync_range.done = finished
+                    if finished or writer.row_count >= checkpoint_rows:
+                        completed, writer = writer, None
+                        await _checkpoint(index, sync_range, completed)
+            finally:
+                if writer is not None:
+                    writer.abort()
+
+        tasks = [asyncio.ensure_future(_read_range(index, sync_range)) for index, sync_range in enumerate(ranges)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        next_cursor = state.last_cursor
+        for sync_range in ranges:
+            next_cursor = self._pick_newer_cursor(next_cursor, sync_range.cursor)
+        return _SqlSyncRead(
+            staged=self._combine_sql_parts(table=table, parts=parts, writer_factory=writer_factory),
+            next_cursor=next_cursor,
+            query_sql=query_sql,
+            key_column=key_column,
+            page_count=page_count,
+            resumed=resumed,
+        )
+
+    @staticmethod
+    def _resume_sql_checkpoint(
+        *,
+        state: ConnectorSyncState,
+        table: DatasetTable,
+        fingerprint: str,
+    ) -> tuple[list[_SqlSyncRange] | None, list[str]]:
+        """Ranges and staged parts of an interrupted sync of the same query, if still usable."""
+        checkpoint = (state.state or {}).get("sql_checkpoint")
+        if not isinstance(checkpoint, Mapping):
+            return None, []
+        parts = [str(part) for part in checkpoint.get("parts") or []]
+        ranges = [_SqlSyncRange.from_json(item) for item in checkpoint.get("ranges") or []]
+        if ranges and checkpoint.get("fingerprint") == fingerprint and all((table.root / part).is_file() for part in parts):
+            return ranges, parts
+        for part in parts:
+            (table.root / part).unlink(missing_ok=True)
+        return None, []
+
+    @staticmethod
+    def _combine_sql_parts(
+        *,
+        table: DatasetTable,
+        parts: list[str],
+        writer_factory: Callable[[], StreamingParquetWriter],
+    ) -> StreamingParquetResult:
+        if len(parts) == 1:
+            path = table.root / parts[0]
+            parquet_file = pq.ParquetFile(path)
+            return StreamingParquetResult(
+                path=path,
+                schema=parquet_file.schema_arrow,
+                row_count=parquet_file.metadata.num_rows,
+                bytes_written=path.stat().st_size,
+            )
+        with writer_factory() as writer:
+            for part in parts:
+                for batch in pq.ParquetFile(table.root / part).iter_batches(batch_size=writer.batch_rows):
+                    writer.write_batch(batch)
+            staged = writer.close()
+        for part in parts:
+            (table.root / part).unlink(missing_ok=True)
+        return staged
+
+    def _sql_sync_limiter(self, connection_id: uuid.UUID) -> asyncio.Semaphore:
+        limiter = self._sql_sync_limiters.get(connection_id)
+        if limiter is None:
+            limiter = asyncio.Semaphore(max(1, settings.DATASET_SYNC_SQL_MAX_CONCURRENCY))
+            self._sql_sync_limiters[connection_id] = limiter
+        return limiter
+
+    @staticmethod
+    def _sql_checkpoint_key(state: ConnectorSyncState) -> tuple[uuid.UUID, uuid.UUID, str]:
+        return state.workspace_id, state.connection_id, str(state.source_key)
+
     async def _materialize_existing_dataset(
         self,
         *,
@@ -531,29 +1254,66 @@ class ConnectorSyncRuntime:
         dataset: DatasetMetadata,
         sync_source: DatasetSource,
         source_key: str,
-        rows: list[dict[str, Any]],
+        staged: StreamingParquetResult,
         primary_key: str | None,
         sync_mode: ConnectorSyncMode,
     ) -> MaterializedDatasetResult:
         normalized_sync_mode = ConnectorSyncMode(_enum_value(sync_mode).upper())
-        parquet_path = self._dataset_parquet_path(
-            workspace_id=dataset.workspace_id,
+        table = self._dataset_table(dataset=dataset, connection_id=connection_id)
+        existing_snapshot = table.current_snapshot()
+        existing_schema = existing_snapshot.schema if existing_snapshot is not None else None
+        # Commits read and write Parquet files; keep them off the event loop.
+        if normalized_sync_mode == ConnectorSyncMode.FULL_REFRESH:
+            snapshot = await asyncio.to_thread(
+                table.overwrite,
+                staged.path,
+                schema=staged.schema,
+                primary_key=primary_key,
+            )
+        else:
+            snapshot = await asyncio.to_thread(
+                self._append_to_dataset_table,
+                table=table,
+                staged=staged,
+                existing_schema=existing_schema,
+                primary_key=primary_key,
+            )
+        return await self._publish_dataset_snapshot(
+            actor_id=actor_id,
             connection_id=connection_id,
-            dataset_name=dataset.name,
-        )
-        existing_rows, existing_schema = self._read_existing_rows(parquet_path)
-        merged_rows = self._merge_rows(
-            existing_rows=existing_rows,
-            new_rows=rows,
-            primary_key=primary_key,
-            full_refresh=normalized_sync_mode == ConnectorSyncMode.FULL_REFRESH,
+            connector_record=connector_record,
+            connector_type=connector_type,
+            dataset=dataset,
+            sync_source=sync_source,
+            source_key=source_key,
+            table=table,
+            snapshot=snapshot,
+            existing_schema=existing_schema,
+            bytes_written=staged.bytes_written,
+            sync_mode=normalized_sync_mode,
         )
-        table = self._rows_to_table(rows=merged_rows, existing_schema=existing_schema)
-        schema_drift = self._describe_schema_drift(existing_schema=existing_schema, next_schema=table.schema)
-        parquet_path.parent.mkdir(parents=True, exist_ok=True)
-        pq.write_table(table, parquet_path)
-        storage_uri = parquet_path.resolve().as_uri()
-        bytes_written = parquet_path.stat().st_size if parquet_path.exists() else None
+
+    async def _publish_dataset_snapshot(
+        self,
+        *,
+        actor_id: uuid.UUID,
+        connection_id: uuid.UUID,
+        connector_record: ConnectorMetadata,
+        connector_type: ConnectorRuntimeType,
+        dataset: DatasetMetadata,
+        sync_source: DatasetSource,
+        source_key: str,
+        table: DatasetTable,
+        snapshot: TableSnapshot,
+        existing_schema: pa.Schema | None,
+        bytes_written: int | None,
+        sync_mode: ConnectorSyncMode,
+        sync_label: str | None = None,
+    ) -> MaterializedDatasetResult:
+        """Point the dataset at the table's committed snapshot and record a revision and lineage."""
+        normalized_sync_mode = ConnectorSyncMode(_enum_value(sync_mode).upper())
+        schema_drift = self._describe_schema_drift(existing_schema=existing_schema, next_schema=snapshot.schema)
+        storage_uri = table.root.resolve().as_uri()
         now = datetime.now(timezone.utc)
 
         file_config = {
@@ -589,6 +1349,7 @@ class ConnectorSyncRuntime:
             lookback_window=existing_sync.lookback_window,
             backfill_start=existing_sync.backfill_start,
             backfill_end=existing_sync.backfill_end,
+            partition_by=existing_sync.partition_by,
         )
         dataset.source_kind = self._sync_source_kind(sync_source)
         dataset.connector_kind = connector_type.value.lower()
@@ -599,8 +1360,8 @@ class ConnectorSyncRuntime:
         dataset.storage_uri = storage_uri
         dataset.file_config = file_config
         dataset.status = DatasetStatus.PUBLISHED
-        dataset.row_count_estimate = len(merged_rows)
-        dataset.bytes_estimate = bytes_written
+        dataset.row_count_estimate = snapshot.row_count
+        dataset.bytes_estimate = snapshot.size_bytes
         dataset.updated_at = now
         self._apply_dataset_descriptor_metadata(dataset=dataset)
         if not previously_materialized:
@@ -610,11 +1371,11 @@ class ConnectorSyncRuntime:
             )
         else:
             change_summary = (
-                f"{_enum_value(normalized_sync_mode).replace('_', ' ').title()} sync updated dataset "
+                f"{sync_label or _enum_value(normalized_sync_mode).replace('_', ' ').title()} sync updated dataset "
                 f"'{dataset.name}' from {self._sync_source_label(sync_source)}."
             )
 
-        await self._replace_columns(dataset=dataset, table=table)
+        await self._replace_columns(dataset=dataset, schema=snapshot.schema)
         policy = await self._get_or_create_policy(dataset=dataset)
         await self._create_dataset_revision(
             dataset=dataset,
@@ -629,19 +1390,19 @@ class ConnectorSyncRuntime:
             dataset_id=dataset.id,
             dataset_name=dataset.name,
             source_key=source_key,
-            row_count=len(merged_rows),
+            row_count=snapshot.row_count,
             bytes_written=bytes_written,
             schema_drift=schema_drift,
         )
 
-    async def _replace_columns(self, *, dataset: DatasetMetadata, table: pa.Table) -> None:
+    async def _replace_columns(self, *, dataset: DatasetMetadata, schema: pa.Schema) -> None:
         await self._dataset_column_repository.delete_for_dataset(dataset_id=dataset.id)
         # Persist deletes before re-inserting the refreshed schema so
         # predeclared synced datasets do not trip the unique
         # (dataset_id, name) constraint in the metadata store.
         await _flush_stores(self._dataset_column_repository)
         now = datetime.now(timezone.utc)
-        for ordinal, field in enumerate(table.schema):
+        for ordinal, field in enumerate(schema):
             self._dataset_column_repository.add(
                 DatasetColumnMetadata(
                     id=uuid.uuid4(),
@@ -1066,22 +1827,38 @@ class ConnectorSyncRuntime:
         return payload
 
     @staticmethod
-    def _sql_literal(value: Any) -> str:
+    def _sql_value(value: Any) -> exp.Expression:
         if value is None:
-            return "NULL"
+            return exp.Null()
         if isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
+            return exp.Boolean(this=value)
         if isinstance(value, (int, float)):
-            return str(value)
-        escaped = str(value).replace("'", "''")
-        return f"'{escaped}'"
+            return exp.Literal.number(value)
+        return exp.Literal.string(str(value))
+
+    @staticmethod
+    def _checkpoint_value(value: Any) -> Any:
+        """A key value as stored in sync state: JSON scalars as-is, anything else as text."""
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return str(value)
+
+    @staticmethod
+    def _sql_key_index(columns: list[str], key_column: str) -> int:
+        name = exp.to_column(key_column).name
+        if name in columns:
+            return columns.index(name)
+        lowered = [column.lower() for column in columns]
+        if name.lower() in lowered:
+            return lowered.index(name.lower())
+        raise ValueError(f"Sync key column '{key_column}' is not returned by the source query.")
 
     async def _resolve_sql_primary_key(
         self,
         *,
         sql_connector: Any,
         sync_source: DatasetSource,
-        rows: list[dict[str, Any]],
+        columns: list[str],
     ) -> str | None:
         if sync_source.table:
             try:
@@ -1092,7 +1869,7 @@ class ConnectorSyncRuntime:
                         return str(getattr(column, "name"))
             except Exception:
                 return None
-        if rows and any("id" in row for row in rows):
+        if "id" in columns:
             return "id"
         return None
 
@@ -1115,7 +1892,7 @@ class ConnectorSyncRuntime:
         return next_cursor
 
     @staticmethod
-    def _dataset_parquet_path(
+    def _dataset_table_path(
         *,
         workspace_id: uuid.UUID,
         connection_id: uuid.UUID,
@@ -1126,142 +1903,181 @@ class ConnectorSyncRuntime:
             / "api-connectors"
             / str(workspace_id)
             / str(connection_id)
-            / f"{dataset_name}.parquet"
+            / dataset_name
         )
 
-    @staticmethod
-    def _read_existing_rows(path: Path) -> tuple[list[dict[str, Any]], pa.Schema | None]:
-        if not path.exists():
-            return [], None
-        table = pq.read_table(path)
-        return table.to_pylist(), table.schema
+    def _dataset_table(self, *, dataset: DatasetMetadata, connection_id: uuid.UUID) -> DatasetTable:
+        table_path = self._dataset_table_path(
+            workspace_id=dataset.workspace_id,
+            connection_id=connection_id,
+            dataset_name=dataset.name,
+        )
+        table = DatasetTable(
+            table_path,
+            partition_spec=PartitionSpec.parse(self._sync_meta(dataset).get("partition_by")),
+            retain_snapshots=settings.DATASET_TABLE_RETAIN_SNAPSHOTS,
+        )
+        # Datasets synced before the table layout live in one `<name>.parquet` file,
+        # which becomes the first data file of the table.
+        legacy_path = table_path.with_name(f"{dataset.name}.parquet")
+        if not table.exists() and legacy_path.is_file():
+            table.append(legacy_path, schema=pq.read_schema(legacy_path))
+        return table
+
+    def _sync_writer(
+        self,
+        *,
+        dataset: DatasetMetadata,
+        connection_id: uuid.UUID,
+        sync_mode: ConnectorSyncMode,
+    ) -> StreamingParquetWriter:
+        table = self._dataset_table(dataset=dataset, connection_id=connection_id)
+        self._ensure_pyarrow_compatible_pandas_stub()
+        base_schema = None
+        if ConnectorSyncMode(_enum_value(sync_mode).upper()) == ConnectorSyncMode.FULL_REFRESH:
+            snapshot = table.current_snapshot()
+            base_schema = snapshot.schema if snapshot is not None else None
+        return StreamingParquetWriter(
+            table.staging_path(),
+            batch_rows=settings.DATASET_SYNC_BATCH_ROWS,
+            base_schema=base_schema,
+        )
 
-    @staticmethod
-    def _merge_rows(
+    def _append_to_dataset_table(
+        self,
         *,
-        existing_rows: list[dict[str, Any]],
-        new_rows: list[dict[str, Any]],
+        table: DatasetTable,
+        staged: StreamingParquetResult,
+        existing_schema: pa.Schema | None,
         primary_key: str | None,
-        full_refresh: bool,
-    ) -> list[dict[str, Any]]:
-        if full_refresh:
-            return list(new_rows)
-        if not primary_key:
-            return [*existing_rows, *new_rows]
-
-        merged: dict[str, dict[str, Any]] = {}
-        extras: list[dict[str, Any]] = []
-        for row in existing_rows:
-            key = ConnectorSyncRuntime._row_identity(row, primary_key)
-            if key is None:
-                extras.append(dict(row))
-            else:
-                merged[key] = dict(row)
-        for row in new_rows:
-            key = ConnectorSyncRuntime._row_identity(row, primary_key)
-            if key is None:
-                extras.append(dict(row))
-            else:
-                merged[key] = dict(row)
-        return [*merged.values(), *extras]
+    ) -> TableSnapshot:
+        """
+        Append the staged delta, superseding existing rows that share an identity.
+
+        The delta is deduplicated by identity (last row wins) and committed as a new
+        data file; existing rows with a delta identity are recorded in a delete file,
+        so only the key columns of existing files are read. Rows without an identity
+        are always kept. The delta is read in batches: only its key columns are held
+        whole, and it is rewritten batch by batch when it has duplicate keys.
+        """
+        deduplicated: Path | None = None
+        try:
+            schema = unify_schemas(existing_schema, staged.schema)
+            if not primary_key:
+                return table.append(staged.path, schema=schema)
+            parquet_file = pq.ParquetFile(staged.path)
+            key_columns = [
+                name for name in self._identity_columns(primary_key) if name in parquet_file.schema_arrow.names
+            ]
+            if not key_columns:
+                return table.append(staged.path, schema=schema, primary_key=primary_key)
+            keys = pa.Table.from_batches(
+                list(parquet_file.iter_batches(batch_size=settings.DATASET_SYNC_BATCH_ROWS, columns=key_columns)),
+                schema=pa.schema([parquet_file.schema_arrow.field(name) for name in key_columns]),
+            )
+            identities = self._identity_array(keys, primary_key)
+            kept = self._last_occurrences(identities)
+            path = staged.path
+            if len(kept) < keys.num_rows:
+                deduplicated = table.staging_path()
+                self._write_rows_at(parquet_file, kept, deduplicated)
+                path = deduplicated
+                identities = identities.take(kept)
+            return table.append(
+                path,
+                schema=schema,
+                primary_key=primary_key,
+                replaced_identities=pc.unique(identities.drop_null()),
+                identity=lambda batch: self._identity_array(batch, primary_key),
+                identity_columns=self._identity_columns(primary_key),
+                replaced_predicates=self._key_range_predicates(keys, primary_key),
+            )
+        finally:
+            staged.path.unlink(missing_ok=True)
+            if deduplicated is not None:
+                deduplicated.unlink(missing_ok=True)
 
     @staticmethod
-    def _rows_to_table(*, rows: list[dict[str, Any]], existing_schema: pa.Schema | None) -> pa.Table:
-        ConnectorSyncRuntime._ensure_pyarrow_compatible_pandas_stub()
-        normalized_rows = ConnectorSyncRuntime._normalize_rows_for_arrow(rows)
-        if normalized_rows:
-            try:
-                return pa.Table.from_pylist(normalized_rows)
-            except (pa.ArrowInvalid, pa.ArrowTypeError):
-                stringified_rows = [
-                    {key: (None if value is None else str(value)) for key, value in row.items()}
-                    for row in normalized_rows
-                ]
-                return pa.Table.from_pylist(stringified_rows)
-        if existing_schema is not None:
-            return pa.Table.from_arrays(
-                [pa.array([], type=field.type) for field in existing_schema],
-                schema=existing_schema,
-            )
-        return pa.table({})
+    def _write_rows_at(parquet_file: pq.ParquetFile, positions: pa.Array, target: Path) -> None:
+        """Stream the rows of `parquet_file` at the ascending `positions` into `target`."""
+        wanted = positions.to_numpy()
+        offset = 0
+        with pq.ParquetWriter(target, parquet_file.schema_arrow) as writer:
+            for batch in parquet_file.iter_batches(batch_size=settings.DATASET_SYNC_BATCH_ROWS):
+                start, stop = np.searchsorted(wanted, [offset, offset + batch.num_rows])
+                if stop > start:
+                    writer.write_batch(batch.take(pa.array(wanted[start:stop] - offset)))
+                offset += batch.num_rows
 
     @staticmethod
-    def _ensure_pyarrow_compatible_pandas_stub() -> None:
-        pandas_module = sys.modules.get("pandas")
-        if pandas_module is not None and not hasattr(pandas_module, "__version__"):
-            setattr(pandas_module, "__version__", "0.0.0")
+    def _identity_columns(primary_key: str) -> list[str]:
+        if primary_key == "_child_identity":
+            return ["_parent_id", "_child_index"]
+        return [primary_key]
 
     @staticmethod
-    def _normalize_rows_for_arrow(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        columns: set[str] = set()
-        for row in rows:
-            columns.update(str(key) for key in row.keys())
-        ordered_columns = sorted(columns)
+    def _key_range_predicates(data: pa.Table | pa.RecordBatch, primary_key: str) -> list[StatsPredicate]:
+        """
+        Bounds on the key of `data`, so a merge only reads the files that may hold one of its keys.
+
+        Child rows are bounded by their parent id, the leading part of their identity.
+        """
+        column = "_parent_id" if primary_key == "_child_identity" else primary_key
+        index = data.schema.get_field_index(column)
+        if index < 0:
+            return []
+        try:
+            bounds = pc.min_max(data.column(index))
+        except (pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            return []
+        low, high = bounds["min"].as_py(), bounds["max"].as_py()
+        if low is None or high is None:
+            return []
+        return [StatsPredicate(column, "gte", low), StatsPredicate(column, "lte", high)]
 
-        category_map: dict[str, set[str]] = {column: set() for column in ordered_columns}
-        for row in rows:
-            for column in ordered_columns:
-                value = row.get(column)
-                category = ConnectorSyncRuntime._value_category(value)
-                if category is not None:
-                    category_map[column].add(category)
+    @staticmethod
+    def _identity_array(data: pa.Table | pa.RecordBatch, primary_key: str) -> pa.Array:
+        """Vectorized row identity: the key as a string, or null when missing or blank."""
+
+        def _column(name: str) -> pa.Array:
+            index = data.schema.get_field_index(name)
+            if index < 0:
+                return pa.nulls(data.num_rows, type=pa.string())
+            column = data.column(index)
+            if isinstance(column, pa.ChunkedArray):
+                column = column.combine_chunks()
+            return column.cast(pa.string())
 
-        normalized: list[dict[str, Any]] = []
-        for row in rows:
-            normalized_row: dict[str, Any] = {}
-            for column in ordered_columns:
-                value = row.get(column)
-                categories = category_map[column]
-                if value is None:
-                    normalized_row[column] = None
-                elif categories <= {"int"}:
-                    normalized_row[column] = int(value)
-                elif categories <= {"int", "float"}:
-                    normalized_row[column] = float(value)
-                elif categories <= {"bool"}:
-                    normalized_row[column] = bool(value)
-                else:
-                    normalized_row[column] = str(value)
-            normalized.append(normalized_row)
-        return normalized
+        if primary_key == "_child_identity":
+            # Null when either part is null.
+            return pc.binary_join_element_wise(_column("_parent_id"), _column("_child_index"), ":")
+        identities = _column(primary_key)
+        blank = pc.fill_null(pc.equal(pc.utf8_trim_whitespace(identities), ""), False)
+        return pc.if_else(blank, pa.scalar(None, type=pa.string()), identities)
 
     @staticmethod
-    def _value_category(value: Any) -> str | None:
-        if value is None:
-            return None
-        if isinstance(value, bool):
-            return "bool"
-        if isinstance(value, int):
-            return "int"
-        if isinstance(value, float):
-            return "float"
-        return "string"
+    def _last_occurrences(identities: pa.Array) -> pa.Array:
+        """Row positions keeping the last row per identity and every row without one."""
+        positions = pa.table({"identity": identities, "position": pa.array(range(len(identities)), type=pa.int64())})
+        keyed = positions.filter(pc.is_valid(positions["identity"]))
+        latest = keyed.group_by("identity").aggregate([("position", "max")])["position_max"]
+        unkeyed = positions.filter(pc.is_null(positions["identity"]))["position"]
+        kept = pa.chunked_array([*latest.chunks, *unkeyed.chunks], type=pa.int64()).combine_chunks()
+        return kept.take(pc.sort_indices(kept))
 
     @staticmethod
-    def _row_identity(row: dict[str, Any], primary_key: str) -> str | None:
-        if primary_key == "_parent_id":
-            parent_id = row.get("_parent_id")
-            if parent_id is None or str(parent_id).strip() == "":
-                return None
-            return str(parent_id)
-        if primary_key == "_child_identity":
-            parent_id = row.get("_parent_id")
-            child_index = row.get("_child_index")
-            if parent_id is None or child_index is None:
-                return None
-            return f"{parent_id}:{child_index}"
-        value = row.get(primary_key)
-        if value is not None and str(value).strip():
-            return str(value)
-        return None
+    def _ensure_pyarrow_compatible_pandas_stub() -> None:
+        pandas_module = sys.modules.get("pandas")
+        if pandas_module is not None and not hasattr(pandas_module, "__version__"):
+            setattr(pandas_module, "__version__", "0.0.0")
 
     @staticmethod
-    def _child_primary_key(rows: list[dict[str, Any]]) -> str | None:
-        if any("id" in row for row in rows):
+    def _child_primary_key(columns: list[str]) -> str | None:
+        if "id" in columns:
             return "id"
-        if any("_parent_id" in row for row in rows) and any("_child_index" in row for row in rows):
+        if "_parent_id" in columns and "_child_index" in columns:
             return "_child_identity"
-        if any("_parent_id" in row for row in rows):
+        if "_parent_id" in columns:
             return "_parent_id"
         return None
 
@@ -1271,11 +2087,11 @@ class ConnectorSyncRuntime:
         resource_path: str,
         root_resource_name: str,
         root_primary_key: str | None,
-        rows: list[dict[str, Any]],
+        columns: list[str],
     ) -> str | None:
         if resource_path == root_resource_name:
             return root_primary_key
-        return ConnectorSyncRuntime._child_primary_key(rows)
+        return ConnectorSyncRuntime._child_primary_key(columns)
 
     @staticmethod
     def _pick_newer_cursor(current: str | None, candidate: str | None) -> str | None:
@@ -92,6 +92,12 @@ class RuntimeHost:
             raise RuntimeError("SemanticQueryExecutionService is not configured for this runtime host.")
         return await self.services.semantic_query.execute_unified_query(*args, **kwargs)
 
+    async def refresh_semantic_pre_aggregations(self, *args: Any, **kwargs: Any) -> Any:
+        if self.services.semantic_query is None:
+            raise RuntimeError("SemanticQueryExecutionService is not configured for this runtime host.")
+        kwargs.setdefault("workspace_id", self.context.workspace_id)
+        return await self.services.semantic_query.refresh_pre_aggregations(*args, **kwargs)
+
     async def refresh_semantic_vector_search(self, *args: Any, **kwargs: Any) -> Any:
         if self.services.semantic_vector_search is None:
             raise RuntimeError("SemanticVectorSearchService is not configured for this runtime host.")
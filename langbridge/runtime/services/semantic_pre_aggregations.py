@@ -0,0 +1,312 @@
+import asyncio
+import json
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from langbridge.runtime.settings import runtime_settings as settings
+from langbridge.storage.dataset_table import DatasetTable, PartitionSpec
+from langbridge.semantic.model import PreAggregation
+from langbridge.semantic.query.pre_aggregations import (
+    PRE_AGGREGATION_DATASET,
+    PreAggregationColumns,
+    PreAggregationMatch,
+)
+
+_STATE_FILE = "_pre_aggregation.json"
+_PARTITION_FORMATS = {"year": "%Y", "month": "%Y-%m", "day": "%Y-%m-%d"}
+
+
+@dataclass(frozen=True, slots=True)
+class PreAggregationState:
+    definition_hash: str
+    built_until: datetime
+    refreshed_at: datetime
+    snapshot_id: int
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "definition_hash": self.definition_hash,
+            "built_until": self.built_until.isoformat(),
+            "refreshed_at": self.refreshed_at.isoformat(),
+            "snapshot_id": self.snapshot_id,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, Any]) -> "PreAggregationState":
+        return cls(
+            definition_hash=str(payload["definition_hash"]),
+            built_until=datetime.fromisoformat(str(payload["built_until"])),
+            refreshed_at=datetime.fromisoformat(str(payload["refreshed_at"])),
+            snapshot_id=int(payload["snapshot_id"]),
+        )
+
+
+def bucket_start(value: datetime, granularity: str | None) -> datetime:
+    """Start of the `granularity` bucket holding `value` (naive UTC)."""
+    if granularity == "second":
+        return value.replace(microsecond=0)
+    if granularity == "minute":
+        return value.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+    day = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    if granularity == "year":
+        return day.replace(month=1, day=1)
+    return day
+
+
+def partition_keys(since: datetime, until: datetime, granularity: str) -> list[str]:
+    """Partition values (as `PartitionSpec` renders them) of every bucket in `[since, until]`."""
+    keys: list[str] = []
+    current = bucket_start(since, granularity)
+    while current <= until:
+        keys.append(current.strftime(_PARTITION_FORMATS[granularity]))
+        if granularity == "day":
+            current += timedelta(days=1)
+        elif granularity == "month":
+            current = current.replace(year=current.year + current.month // 12, month=current.month % 12 + 1)
+        else:
+            current = current.replace(year=current.year + 1)
+    return keys
+
+
+class PreAggregationStore:
+    """
+    Materialized semantic rollups, one dataset table per pre-aggregation.
+
+    Tables live under `DATASET_FILE_LOCAL_DIR/pre_aggregations/<workspace>/<model>/<name>`
+    next to a small state file recording which definition built them, up to when, and
+    the snapshot that build committed. A rollup is only served while both still match,
+    so a model edit or an interrupted refresh falls back to the source instead of
+    returning stale or half-written rows. Compaction rewrites snapshots without
+    changing their rows and is accepted as-is.
+    """
+
+    def __init__(self, root: str | Path | None = None) -> None:
+        self._root = Path(root) if root is not None else None
+
+    @property
+    def root(self) -> Path:
+        return self._root or Path(settings.DATASET_FILE_LOCAL_DIR) / "pre_aggregations"
+
+    def table(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        semantic_model_id: uuid.UUID,
+        name: str,
+        definition: PreAggregation,
+        columns: PreAggregationColumns,
+    ) -> DatasetTable:
+        partition_spec = None
+        if definition.partition_granularity and columns.time:
+            partition_spec = PartitionSpec(column=columns.time, transform=definition.partition_granularity)
+        return DatasetTable(
+            self.root / str(workspace_id) / str(semantic_model_id) / name,
+            partition_spec=partition_spec,
+            retain_snapshots=settings.DATASET_TABLE_RETAIN_SNAPSHOTS,
+        )
+
+    def load_state(self, table: DatasetTable) -> PreAggregationState | None:
+        try:
+            payload = json.loads((table.root / _STATE_FILE).read_text(encoding="utf-8"))
+            return PreAggregationState.from_json(payload)
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+    def servable_state(self, table: DatasetTable, *, definition_hash: str) -> PreAggregationState | None:
+        state = self.load_state(table)
+        if state is None or state.definition_hash != definition_hash:
+            return None
+        snapshot = table.current_snapshot()
+        if snapshot is None:
+            return None
+        if snapshot.snapshot_id != state.snapshot_id and snapshot.operation != "compact":
+            return None
+        return state
+
+    def write(
+        self,
+        table: DatasetTable,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        columns: PreAggregationColumns,
+        definition_hash: str,
+        built_until: datetime,
+        replace_since: datetime | None = None,
+    ) -> PreAggregationState:
+        """
+        Commit freshly built rollup rows and record the build.
+
+        With `replace_since` the rows replace every partition from the one holding it
+        onward and the rest of the table is kept; otherwise they replace the table.
+        """
+        current = table.current_snapshot()
+        data = current.schema.empty_table() if not rows and current is not None else _rows_to_table(rows, columns)
+        staged = table.staging_path()
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(data, staged)
+        try:
+            spec = table.partition_spec
+            if replace_since is not None and spec is not None and table.exists():
+                snapshot = table.append(
+                    staged,
+                    schema=data.schema,
+                    replaced_identities=pa.array(
+                        partition_keys(replace_since, max(built_until, replace_since), spec.transform),
+                        type=pa.string(),
+                    ),
+                    identity=spec.partition_values,
+                    identity_columns=(spec.column,),
+                )
+            else:
+                snapshot = table.overwrite(staged, schema=data.schema)
+        finally:
+            staged.unlink(missing_ok=True)
+        state = PreAggregationState(
+            definition_hash=definition_hash,
+            built_until=built_until,
+            refreshed_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            snapshot_id=snapshot.snapshot_id,
+        )
+        (table.root / _STATE_FILE).write_text(json.dumps(state.to_json()), encoding="utf-8")
+        return state
+
+    async def query(self, table: DatasetTable, sql: str, *, columns: Mapping[str, str]) -> list[dict[str, Any]]:
+        """Run `sql` (compiled against the rollup model) over `table` and rename its columns."""
+
+        def _run() -> list[dict[str, Any]]:
+            connection = duckdb.connect()
+            try:
+                connection.execute(
+                    f'CREATE TEMP VIEW "{PRE_AGGREGATION_DATASET}" AS SELECT * FROM {table.scan_sql()}'
+                )
+                result = connection.execute(sql).fetch_arrow_table()
+            finally:
+                connection.close()
+            return [
+                {columns.get(key, key): value for key, value in row.items()}
+                for row in result.to_pylist()
+            ]
+
+        return await asyncio.to_thread(_run)
+
+    async def combine(
+        self,
+        match: PreAggregationMatch,
+        *,
+        rollup_rows: Sequence[Mapping[str, Any]],
+        source_rows: Sequence[Mapping[str, Any]],
+        limit: int | None,
+        offset: int | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Merge rollup rows with rows read from the source after the rollup's last build.
+
+        Groups sharing dimension values on both sides (e.g. the month a build stopped
+        in) are folded together with each measure's re-aggregation.
+        """
+
+        def _run() -> list[dict[str, Any]]:
+            rollup = pa.Table.from_pylist(list(rollup_rows))
+            source = pa.Table.from_pylist(list(source_rows))
+            names = list(dict.fromkeys([*rollup.column_names, *source.column_names]))
+            measures = [name for name in names if name in match.reaggregations]
+            keys = [name for name in names if name not in match.reaggregations]
+            if match.reaggregations:
+                projections = ", ".join(
+                    [
+                        *(_quote(name) for name in keys),
+                        *(
+                            f"{match.reaggregations[name].upper()}({_quote(name)}) AS {_quote(name)}"
+                            for name in measures
+                        ),
+                    ]
+                )
+                group_by = f" GROUP BY {', '.join(_quote(name) for name in keys)}" if keys else ""
+            else:
+                projections = ", ".join(_quote(name) for name in names)
+                group_by = ""
+            sources = [
+                f"SELECT * FROM {alias}" for alias, data in (("rollup", rollup), ("source", source)) if data.num_columns
+            ]
+            if not sources:
+                return []
+            sql = f"SELECT {projections} FROM ({' UNION ALL BY NAME '.join(sources)}) AS combined{group_by}"
+            if match.order:
+                sql += " ORDER BY " + ", ".join(
+                    f"{_quote(column)} {direction.upper()}" for column, direction in match.order
+                )
+            if limit is not None:
+                sql += f" LIMIT {int(limit)}"
+            if offset:
+                sql += f" OFFSET {int(offset)}"
+            connection = duckdb.connect()
+            try:
+                connection.register("rollup", rollup)
+                connection.register("source", source)
+                return connection.execute(sql).fetch_arrow_table().to_pylist()
+            finally:
+                connection.close()
+
+        return await asyncio.to_thread(_run)
+
+
+def source_tail_needed(match: PreAggregationMatch, built_until: datetime) -> bool:
+    """Whether the query's time range can reach past the rollup's last build."""
+    if not match.definition.union_with_source:
+        return False
+    for time_dimension in match.query.time_dimensions:
+        end = _explicit_range_end(time_dimension.date_range)
+        if end is not None and end < built_until.date():
+            return False
+    return True
+
+
+def _explicit_range_end(date_range: Any) -> date | None:
+    # Inclusive last day of an explicit range; relative ranges may reach today.
+    try:
+        if isinstance(date_range, (list, tuple)) and len(date_range) == 2:
+            return date.fromisoformat(str(date_range[1]).strip())
+        if isinstance(date_range, str) and date_range.strip().lower().startswith("before:"):
+            return date.fromisoformat(date_range.split(":", 1)[1].strip()) - timedelta(days=1)
+        if isinstance(date_range, str) and date_range.strip().lower().startswith("on:"):
+            return date.fromisoformat(date_range.split(":", 1)[1].strip())
+    except ValueError:
+        return None
+    return None
+
+
+def _rows_to_table(rows: Sequence[Mapping[str, Any]], columns: PreAggregationColumns) -> pa.Table:
+    if not rows:
+        fields = [
+            *(pa.field(name, pa.string()) for name in columns.dimensions.values()),
+            *([pa.field(columns.time, pa.timestamp("us"))] if columns.time else []),
+            *(pa.field(name, pa.float64()) for name in columns.measures.values()),
+        ]
+        return pa.schema(fields).empty_table()
+    data = pa.Table.from_pylist([{name: row.get(name) for name in columns.names} for row in rows])
+    if columns.time and not pa.types.is_timestamp(data.schema.field(columns.time).type):
+        # Sources that hand back bucket starts as text still partition and re-bucket by time.
+        index = data.schema.get_field_index(columns.time)
+        data = data.set_column(index, columns.time, pc.cast(data[columns.time], pa.timestamp("us")))
+    return data
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
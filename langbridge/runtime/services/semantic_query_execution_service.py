@@ -1,10 +1,12 @@
+import asyncio
 import json
 import logging
 import re
 import uuid
-from collections.abc import Iterable, Mapping
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
 import yaml
@@ -28,19 +30,43 @@ from langbridge.connectors.base import (
 )
 from langbridge.connectors.base.config import ConnectorRuntimeType
 from langbridge.runtime.execution.federated_query_tool import FederatedQueryTool
+from langbridge.federation.models import FederationWorkflow, VirtualDataset, VirtualTableBinding
+from langbridge.federation.planner import CompiledQuery
 from langbridge.runtime.ports import DatasetCatalogStore
+from langbridge.runtime.scheduling import dataset_sync_cadence_to_seconds
 from langbridge.runtime.providers import (
     DatasetMetadataProvider,
     SemanticModelMetadataProvider,
 )
+from langbridge.runtime.services.semantic_pre_aggregations import (
+    PreAggregationStore,
+    bucket_start,
+    source_tail_needed,
+)
+from langbridge.runtime.services.semantic_result_cache import (
+    SemanticResultCachePolicy,
+    get_semantic_result_cache,
+    semantic_result_cache_policy,
+)
 from langbridge.runtime.settings import runtime_settings as settings
 from langbridge.semantic.loader import (
     SemanticModelError,
     load_semantic_model,
     load_unified_semantic_model,
 )
-from langbridge.semantic.model import SemanticModel
-from langbridge.semantic.query import SemanticQuery, SemanticQueryEngine
+from langbridge.semantic.model import PreAggregation, SemanticModel
+from langbridge.semantic.query import (
+    CompiledSemanticModel,
+    SemanticQuery,
+    SemanticQueryEngine,
+    SemanticQueryPlan,
+    get_compiled_semantic_model_cache,
+    match_pre_aggregation,
+    pre_aggregation_columns,
+    pre_aggregation_query,
+    semantic_model_content_hash,
+)
+from langbridge.semantic.query.query_model import FilterItem
 from langbridge.semantic.unified_query import (
     WorkspaceAwareQueryContext,
     UnifiedSourceModel,
@@ -102,6 +128,7 @@ class SemanticQueryExecutionService:
         logger: logging.Logger,
         dataset_provider: DatasetMetadataProvider | None = None,
         semantic_model_provider: SemanticModelMetadataProvider | None = None,
+        pre_aggregation_store: PreAggregationStore | None = None,
     ) -> None:
         self._dataset_repository = dataset_repository
         self._dataset_provider = dataset_provider
@@ -109,26 +136,13 @@ class SemanticQueryExecutionService:
         self._federated_query_tool = federated_query_tool
         self._logger = logger
         self._engine = SemanticQueryEngine()
+        self._pre_aggregations = pre_aggregation_store or PreAggregationStore()
+        self._pre_aggregation_locks: dict[Path, asyncio.Lock] = {}
+        self._revalidations: set[asyncio.Task[None]] = set()
         self._dataset_execution_resolver = DatasetExecutionResolver(
             dataset_repository=dataset_repository,
             dataset_provider=dataset_provider,
         )
-
-    @staticmethod
-    def _serialize_workflow_payload(workflow: Any) -> dict[str, Any]:
-        if isinstance(workflow, Mapping):
-            payload = dict(workflow)
-        else:
-            payload = workflow.model_dump(mode="json", by_alias=True)
-        tables = payload.get("dataset", {}).get("tables")
-        if isinstance(tables, Mapping):
-            for table_payload in tables.values():
-                if not isinstance(table_payload, dict):
-                    continue
-                schema_value = table_payload.get("schema")
-                if schema_value is not None and "schema_name" not in table_payload:
-                    table_payload["schema_name"] = schema_value
-        return payload
 
     @staticmethod
     def build_widget_query_payload(
@@ -309,49 +323,100 @@ class SemanticQueryExecutionService:
         if self._federated_query_tool is None:
             raise ExecutionValidationError("Federated query tool is not configured on this runtime node.")
 
-        semantic_model, table_connector_map = await self._build_unified_model_and_map(
+        unified_model, table_connector_map = await self._build_unified_model_and_map(
             workspace_id=workspace_id,
             semantic_model_ids=semantic_model_ids,
             source_models=source_models,
             relationships=relationships,
             metrics=metrics,
         )
+        semantic_model = unified_model.model
         execution_connector_id = self.build_unified_execution_connector_id(
             workspace_id=workspace_id
         )
-        execution_model = apply_workspace_aware_context(
-            semantic_model,
-            context=WorkspaceAwareQueryContext(
-                workspace_id=workspace_id,
-                execution_connector_id=execution_connector_id,
+        execution_hash = semantic_model_content_hash(
+            unified_model.content_hash,
+            {
+                "workspace_id": workspace_id,
+                "execution_connector_id": execution_connector_id,
+                "table_connector_map": table_connector_map,
+            },
+        )
+        compiled_execution_model = get_compiled_semantic_model_cache().get_or_compile(
+            "unified_execution",
+            execution_hash,
+            lambda: CompiledSemanticModel.compile(
+                apply_workspace_aware_context(
+                    semantic_model,
+                    context=WorkspaceAwareQueryContext(
+                        workspace_id=workspace_id,
+                        execution_connector_id=execution_connector_id,
+                    ),
+                    table_connector_map=table_connector_map,
+                ),
+                content_hash=execution_hash,
             ),
+            depends_on=self._normalize_model_ids(semantic_model_ids),
+        )
+        execution_model = compiled_execution_model.model
+
+        workflow = await self._build_federation_workflow(
+            workspace_id=workspace_id,
+            semantic_model=execution_model,
+            source_semantic_model=semantic_model,
             table_connector_map=table_connector_map,
         )
+        model_ids = self._normalize_model_ids(semantic_model_ids)
 
+        async def _execute() -> UnifiedQueryExecutionResult:
+            return await self._execute_unified_workflow(
+                workspace_id=workspace_id,
+                semantic_query=semantic_query,
+                semantic_model_ids=model_ids,
+                compiled_execution_model=compiled_execution_model,
+                execution_connector_id=execution_connector_id,
+                workflow=workflow,
+            )
+
+        policy = semantic_result_cache_policy(
+            workspace_id=workspace_id,
+            model_ids=model_ids,
+            content_hash=execution_hash,
+            semantic_query=semantic_query,
+            workflow=workflow,
+        )
+        return await self._cached_result(policy, _execute)
+
+    async def _execute_unified_workflow(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        semantic_query: SemanticQuery,
+        semantic_model_ids: list[uuid.UUID],
+        compiled_execution_model: CompiledSemanticModel,
+        execution_connector_id: uuid.UUID,
+        workflow: FederationWorkflow,
+    ) -> UnifiedQueryExecutionResult:
+        # Compiled once, in the dialect federation executes it in, and handed to the
+        # planner as a tree rather than an SMQ it would compile again.
         try:
             plan = self._engine.compile(
                 semantic_query,
-                execution_model,
-                dialect="tsql",
+                compiled_execution_model,
+                dialect="duckdb",
             )
         except Exception as exc:
             raise ExecutionValidationError(f"Semantic query translation failed: {exc}") from exc
 
-        workflow_payload = await self._build_federation_workflow_payload(
-            workspace_id=workspace_id,
-            semantic_model=execution_model,
-            source_semantic_model=semantic_model,
-            table_connector_map=table_connector_map,
+        execution = await self._federated_query_tool.execute_federated_query(
+            {
+                "workspace_id": str(workspace_id),
+                "query": plan.sql,
+                "compiled_query": CompiledQuery(sql=plan.sql, expression=plan.expression),
+                "dialect": "duckdb",
+                "workflow": workflow,
+            }
         )
-        tool_payload = {
-            "workspace_id": str(workspace_id),
-            "query": semantic_query.model_dump(by_alias=True, exclude_none=True),
-            "dialect": "duckdb",
-            "workflow": self._serialize_workflow_payload(workflow_payload),
-            "semantic_model": execution_model.model_dump(by_alias=True, exclude_none=True),
-        }
-
-        execution = await self._federated_query_tool.execute_federated_query(tool_payload)
         data_payload = execution.get("rows", [])
         if not isinstance(data_payload, list):
             raise ExecutionValidationError("Federated query execution returned an invalid row payload.")
@@ -360,7 +425,7 @@ class SemanticQueryExecutionService:
             id=uuid.uuid4(),
             workspace_id=workspace_id,
             connector_id=execution_connector_id,
-            semantic_model_ids=list(self._normalize_model_ids(semantic_model_ids)),
+            semantic_model_ids=list(semantic_model_ids),
             data=data_payload,
             annotations=plan.annotations,
             metadata=plan.metadata,
@@ -384,25 +449,315 @@ class SemanticQueryExecutionService:
         if semantic_model_record is None:
             raise ExecutionValidationError("Semantic model not found.")
 
-        semantic_model = self.load_model_payload(semantic_model_record.content_yaml)
-        raw_payload = self._parse_model_payload_from_record(semantic_model_record) or {}
-        raw_datasets = (
-            raw_payload.get("datasets")
-            if isinstance(raw_payload.get("datasets"), Mapping)
-            else raw_payload.get("tables")
+        compiled_model = self._compile_model_record(semantic_model_record)
+        workflow = await self._build_semantic_workflow(
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+            compiled_model=compiled_model,
         )
-        workflow, workflow_dialect = await self._dataset_execution_resolver.build_semantic_workflow(
+
+        async def _execute() -> StandardQueryExecutionResult:
+            return await self._execute_standard_workflow(
+                workspace_id=workspace_id,
+                semantic_model_id=semantic_model_id,
+                compiled_model=compiled_model,
+                semantic_query=semantic_query,
+                workflow=workflow,
+            )
+
+        policy = semantic_result_cache_policy(
             workspace_id=workspace_id,
-            workflow_id=f"workflow_semantic_dataset_{semantic_model_id.hex[:12]}",
-            dataset_name=f"semantic_dataset_{semantic_model_id.hex[:12]}",
-            semantic_model=semantic_model,
-            raw_datasets_payload=raw_datasets if isinstance(raw_datasets, Mapping) else None,
+            model_ids=[semantic_model_id],
+            content_hash=compiled_model.content_hash,
+            semantic_query=semantic_query,
+            workflow=workflow[0],
+            config=compiled_model.model.cache,
+        )
+        return await self._cached_result(policy, _execute)
+
+    async def _execute_standard_workflow(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        semantic_model_id: uuid.UUID,
+        compiled_model: CompiledSemanticModel,
+        semantic_query: SemanticQuery,
+        workflow: tuple[FederationWorkflow, str],
+    ) -> StandardQueryExecutionResult:
+        if compiled_model.model.pre_aggregations:
+            result = await self._execute_from_pre_aggregation(
+                workspace_id=workspace_id,
+                semantic_model_id=semantic_model_id,
+                compiled_model=compiled_model,
+                semantic_query=semantic_query,
+                workflow=workflow,
+            )
+            if result is not None:
+                return result
+
+        rows, plan = await self._execute_compiled_model_query(
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+            compiled_model=compiled_model,
+            semantic_query=semantic_query,
+            workflow=workflow,
+        )
+        response = SemanticQueryResponse(
+            id=uuid.uuid4(),
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+            data=rows,
+            annotations=plan.annotations,
+            metadata=plan.metadata,
+        )
+        return StandardQueryExecutionResult(response=response, compiled_sql=plan.sql)
+
+    async def _cached_result(
+        self,
+        policy: SemanticResultCachePolicy | None,
+        execute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Serve a query from the semantic result cache, or execute and cache it.
+
+        A stale hit is returned as-is while `execute` refreshes the entry in the
+        background.
+        """
+        if policy is None:
+            return await execute()
+        cache = get_semantic_result_cache()
+        cached = cache.lookup(policy)
+        if cached is None:
+            result = await execute()
+            cache.store(policy, _copy_result(result))
+            return result
+        result, stale = cached
+        if stale and cache.begin_revalidation(policy.key):
+            task = asyncio.create_task(self._revalidate(policy, execute))
+            self._revalidations.add(task)
+            task.add_done_callback(self._revalidations.discard)
+        return _copy_result(result)
+
+    async def _revalidate(
+        self,
+        policy: SemanticResultCachePolicy,
+        execute: Callable[[], Awaitable[Any]],
+    ) -> None:
+        cache = get_semantic_result_cache()
+        try:
+            cache.store(policy, _copy_result(await execute()))
+        except Exception:
+            self._logger.exception("Background refresh of a cached semantic query result failed.")
+        finally:
+            cache.end_revalidation(policy.key)
+
+    async def refresh_pre_aggregations(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        semantic_model_id: uuid.UUID,
+        names: Iterable[str] | None = None,
+        force: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Build or refresh a semantic model's pre-aggregations.
+
+        Rollups refreshed within their `refresh_every` are skipped unless `force` is
+        set. Partitioned rollups rebuild only the partitions from their last build (less
+        `update_window`) onward; the rest are rebuilt in full.
+        """
+        if self._federated_query_tool is None:
+            raise ExecutionValidationError("Federated query tool is not configured on this runtime node.")
+        semantic_model_record = await self._get_semantic_model_record(
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+        )
+        if semantic_model_record is None:
+            raise ExecutionValidationError("Semantic model not found.")
+        compiled_model = self._compile_model_record(semantic_model_record)
+        selected = set(names) if names is not None else None
+        results: list[dict[str, Any]] = []
+        for name, definition in (compiled_model.model.pre_aggregations or {}).items():
+            if selected is not None and name not in selected:
+                continue
+            results.append(
+                await self._refresh_pre_aggregation(
+                    workspace_id=workspace_id,
+                    semantic_model_id=semantic_model_id,
+                    compiled_model=compiled_model,
+                    name=name,
+                    definition=definition,
+                    force=force,
+                )
+            )
+        return results
+
+    async def _refresh_pre_aggregation(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        semantic_model_id: uuid.UUID,
+        compiled_model: CompiledSemanticModel,
+        name: str,
+        definition: PreAggregation,
+        force: bool,
+    ) -> dict[str, Any]:
+        columns = pre_aggregation_columns(definition, compiled_model)
+        table = self._pre_aggregations.table(
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+            name=name,
+            definition=definition,
+            columns=columns,
+        )
+        definition_hash = semantic_model_content_hash(compiled_model.content_hash, name)
+        lock = self._pre_aggregation_locks.setdefault(table.root, asyncio.Lock())
+        async with lock:
+            previous = None if force else self._pre_aggregations.servable_state(table, definition_hash=definition_hash)
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            if (
+                previous is not None
+                and definition.refresh_every
+                and now - previous.refreshed_at < timedelta(seconds=dataset_sync_cadence_to_seconds(definition.refresh_every))
+            ):
+                return {"name": name, "status": "fresh", "built_until": previous.built_until}
+
+            # Rollups unioned with the source stop at the last complete bucket; the rest
+            # cover everything the source holds now.
+            built_until = bucket_start(now, definition.granularity) if definition.union_with_source else now
+            since = None
+            if previous is not None and table.partition_spec is not None:
+                window = (
+                    timedelta(seconds=dataset_sync_cadence_to_seconds(definition.update_window))
+                    if definition.update_window
+                    else timedelta(0)
+                )
+                since = bucket_start(min(previous.built_until, now - window), definition.partition_granularity)
+            build_query = pre_aggregation_query(
+                definition,
+                since=since,
+                until=built_until if definition.union_with_source else None,
+            )
+            rows, _ = await self._execute_compiled_model_query(
+                workspace_id=workspace_id,
+                semantic_model_id=semantic_model_id,
+                compiled_model=compiled_model,
+                semantic_query=build_query,
+            )
+            state = await asyncio.to_thread(
+                self._pre_aggregations.write,
+                table,
+                rows,
+                columns=columns,
+                definition_hash=definition_hash,
+                built_until=built_until,
+                replace_since=since,
+            )
+        return {
+            "name": name,
+            "status": "refreshed",
+            "incremental": since is not None,
+            "rows": len(rows),
+            "built_until": state.built_until,
+        }
+
+    async def _execute_from_pre_aggregation(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        semantic_model_id: uuid.UUID,
+        compiled_model: CompiledSemanticModel,
+        semantic_query: SemanticQuery,
+        workflow: tuple[FederationWorkflow, str] | None = None,
+    ) -> StandardQueryExecutionResult | None:
+        match = match_pre_aggregation(semantic_query, compiled_model)
+        if match is None:
+            return None
+        columns = pre_aggregation_columns(match.definition, compiled_model)
+        table = self._pre_aggregations.table(
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+            name=match.name,
+            definition=match.definition,
+            columns=columns,
+        )
+        state = self._pre_aggregations.servable_state(
+            table,
+            definition_hash=semantic_model_content_hash(compiled_model.content_hash, match.name),
+        )
+        if state is None:
+            return None
+
+        with_source = source_tail_needed(match, state.built_until)
+        rollup_query = (
+            match.query.model_copy(update={"order": None, "limit": None, "offset": None})
+            if with_source
+            else match.query
+        )
+        plan = self._engine.compile(rollup_query, CompiledSemanticModel.compile(match.model), dialect="duckdb")
+        rows = await self._pre_aggregations.query(table, plan.sql, columns=match.columns)
+        if with_source:
+            # Rows the source gained since the build, merged into the rollup's.
+            source_query = semantic_query.model_copy(
+                update={
+                    "filters": [
+                        *semantic_query.filters,
+                        FilterItem(
+                            time_dimension=match.definition.time_dimension,
+                            operator="gte",
+                            values=[state.built_until.isoformat(sep=" ")],
+                        ),
+                    ],
+                    "order": None,
+                    "limit": None,
+                    "offset": None,
+                }
+            )
+            source_rows, _ = await self._execute_compiled_model_query(
+                workspace_id=workspace_id,
+                semantic_model_id=semantic_model_id,
+                compiled_model=compiled_model,
+                semantic_query=source_query,
+                workflow=workflow,
+            )
+            rows = await self._pre_aggregations.combine(
+                match,
+                rollup_rows=rows,
+                source_rows=source_rows,
+                limit=semantic_query.limit,
+                offset=semantic_query.offset,
+            )
+
+        self._logger.debug("Semantic query served from pre-aggregation '%s'.", match.name)
+        response = SemanticQueryResponse(
+            id=uuid.uuid4(),
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+            data=rows,
+            annotations=[dict(annotation) for annotation in compiled_model.annotations],
+            metadata=self._engine.build_result_metadata(semantic_query, compiled_model),
+        )
+        return StandardQueryExecutionResult(response=response, compiled_sql=plan.sql)
+
+    async def _execute_compiled_model_query(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        semantic_model_id: uuid.UUID,
+        compiled_model: CompiledSemanticModel,
+        semantic_query: SemanticQuery,
+        workflow: tuple[FederationWorkflow, str] | None = None,
+    ) -> tuple[list[dict[str, Any]], SemanticQueryPlan]:
+        workflow, workflow_dialect = workflow or await self._build_semantic_workflow(
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+            compiled_model=compiled_model,
         )
 
         try:
             plan = self._engine.compile(
                 semantic_query,
-                semantic_model,
+                compiled_model,
                 dialect=workflow_dialect,
             )
         except Exception as exc:
@@ -411,25 +766,37 @@ class SemanticQueryExecutionService:
         execution = await self._federated_query_tool.execute_federated_query(
             {
                 "workspace_id": str(workspace_id),
-                "query": semantic_query.model_dump(by_alias=True, exclude_none=True),
+                "query": plan.sql,
+                "compiled_query": CompiledQuery(sql=plan.sql, expression=plan.expression),
                 "dialect": workflow_dialect,
-                "workflow": self._serialize_workflow_payload(workflow),
-                "semantic_model": semantic_model.model_dump(by_alias=True, exclude_none=True),
+                "workflow": workflow,
             }
         )
         rows_payload = execution.get("rows", [])
         if not isinstance(rows_payload, list):
             raise ExecutionValidationError("Dataset-backed semantic query returned an invalid row payload.")
+        return [row for row in rows_payload if isinstance(row, dict)], plan
 
-        response = SemanticQueryResponse(
-            id=uuid.uuid4(),
+    async def _build_semantic_workflow(
+        self,
+        *,
+        workspace_id: uuid.UUID,
+        semantic_model_id: uuid.UUID,
+        compiled_model: CompiledSemanticModel,
+    ) -> tuple[FederationWorkflow, str]:
+        raw_payload = compiled_model.payload or {}
+        raw_datasets = (
+            raw_payload.get("datasets")
+            if isinstance(raw_payload.get("datasets"), Mapping)
+            else raw_payload.get("tables")
+        )
+        return await self._dataset_execution_resolver.build_semantic_workflow(
             workspace_id=workspace_id,
-            semantic_model_id=semantic_model_id,
-            data=[row for row in rows_payload if isinstance(row, dict)],
-            annotations=plan.annotations,
-            metadata=plan.metadata,
+            workflow_id=f"workflow_semantic_dataset_{semantic_model_id.hex[:12]}",
+            dataset_name=f"semantic_dataset_{semantic_model_id.hex[:12]}",
+            semantic_model=compiled_model.model,
+            raw_datasets_payload=raw_datasets if isinstance(raw_datasets, Mapping) else None,
         )
-        return StandardQueryExecutionResult(response=response, compiled_sql=plan.sql)
 
     async def _build_unified_model_and_map(
         self,
@@ -439,13 +806,14 @@ class SemanticQueryExecutionService:
         source_models: Iterable[UnifiedSemanticSourceModelRequest] | None = None,
         relationships: Iterable[Any] | None = None,
         metrics: Mapping[str, Any] | None = None,
-    ) -> tuple[SemanticModel, dict[str, uuid.UUID]]:
+    ) -> tuple[CompiledSemanticModel, dict[str, uuid.UUID]]:
         normalized_model_ids = self._normalize_model_ids(semantic_model_ids)
         source_model_defs_by_id = {
             source_model.id: source_model
             for source_model in (source_models or [])
         }
         loaded_source_models: list[UnifiedSourceModel] = []
+        source_hashes: list[str] = []
         table_connector_map: dict[str, uuid.UUID] = {}
         seen_keys: set[str] = set()
         for semantic_model_id in normalized_model_ids:
@@ -457,8 +825,10 @@ class SemanticQueryExecutionService:
                 raise ExecutionValidationError(
                     f"Semantic model '{semantic_model_id}' not found for unified query."
                 )
-            semantic_model = self.load_model_payload(semantic_model_record.content_yaml)
-            raw_payload = self._parse_model_payload_from_record(semantic_model_record) or {}
+            compiled_source = self._compile_model_record(semantic_model_record)
+            semantic_model = compiled_source.model
+            source_hashes.append(compiled_source.content_hash)
+            raw_payload = compiled_source.payload or {}
             raw_datasets = {}
             if isinstance(raw_payload, dict):
                 candidate = raw_payload.get("datasets")
@@ -546,31 +916,46 @@ class SemanticQueryExecutionService:
             else:
                 metrics_payload[metric_name] = metric_value
 
-        try:
+        unified_hash = semantic_model_content_hash(
+            {
+                "sources": [
+                    [source.key, source.model_id, content_hash, source.connector_id, source.name, source.description]
+                    for source, content_hash in zip(loaded_source_models, source_hashes)
+                ],
+                "relationships": relationships_payload,
+                "metrics": metrics_payload,
+            }
+        )
+
+        def _build_unified() -> CompiledSemanticModel:
             semantic_model, _ = build_unified_semantic_model(
                 source_models=loaded_source_models,
                 relationships=relationships_payload,
                 metrics=metrics_payload or None,
             )
-            return semantic_model, table_connector_map
+            return CompiledSemanticModel.compile(semantic_model, content_hash=unified_hash)
+
+        try:
+            compiled_model = get_compiled_semantic_model_cache().get_or_compile(
+                "unified",
+                unified_hash,
+                _build_unified,
+                depends_on=normalized_model_ids,
+            )
+            return compiled_model, table_connector_map
         except (SemanticModelError, ValueError) as exc:
             raise ExecutionValidationError(
                 f"Unified semantic model failed validation: {exc}"
             ) from exc
 
-    async def _build_federation_workflow_payload(
+    async def _build_federation_workflow(
         self,
         *,
         workspace_id: uuid.UUID,
         semantic_model: SemanticModel,
         source_semantic_model: SemanticModel,
         table_connector_map: Mapping[str, uuid.UUID],
-    ) -> dict[str, Any]:
-        from langbridge.federation.models import (
-            FederationWorkflow,
-            VirtualDataset,
-            VirtualTableBinding,
-        )
+    ) -> FederationWorkflow:
 
         workspace_id_value = str(workspace_id)
         semantic_model_id = str(uuid.uuid4())
@@ -629,16 +1014,14 @@ class SemanticQueryExecutionService:
                 name="Unified Semantic Dataset",
                 workspace_id=workspace_id_value,
                 tables={table_key: VirtualTableBinding.model_validate(binding) for table_key, binding in tables.items()},
-                relationships=[],
+                relationships=relationships,
             ),
             broadcast_threshold_bytes=settings.FEDERATION_BROADCAST_THRESHOLD_BYTES,
             partition_count=settings.FEDERATION_PARTITION_COUNT,
             max_stage_retries=settings.FEDERATION_STAGE_MAX_RETRIES,
             stage_parallelism=settings.FEDERATION_STAGE_PARALLELISM,
         )
-        payload = self._serialize_workflow_payload(workflow)
-        payload["dataset"]["relationships"] = relationships
-        return payload
+        return workflow
 
     async def _get_semantic_model_record(
         self,
@@ -711,6 +1094,27 @@ class SemanticQueryExecutionService:
         seen_keys.add(candidate)
         return candidate
 
+    def _compile_model_record(self, semantic_model_record: Any) -> CompiledSemanticModel:
+        """Return the compiled model for a record, reusing it while its content is unchanged."""
+        content_yaml = semantic_model_record.content_yaml
+        content_json = getattr(semantic_model_record, "content_json", None)
+        content_hash = semantic_model_content_hash(
+            content_yaml,
+            content_json if isinstance(content_json, (str, Mapping)) else None,
+        )
+
+        def _build() -> CompiledSemanticModel:
+            return CompiledSemanticModel.compile(
+                self.load_model_payload(content_yaml),
+                content_hash=content_hash,
+                payload=self._parse_model_payload_from_record(semantic_model_record),
+            )
+
+        model_id = getattr(semantic_model_record, "id", None)
+        if model_id is None:
+            return _build()
+        return get_compiled_semantic_model_cache().get_or_compile(model_id, content_hash, _build)
+
     @staticmethod
     def load_model_payload(content_yaml: str) -> SemanticModel:
         try:
@@ -792,3 +1196,11 @@ class SemanticQueryExecutionService:
             except Exception:
                 return None
         return None
+
+
+def _copy_result(result: Any) -> Any:
+    # Cached rows are shared between callers; each gets its own rows and response id.
+    response = result.response.model_copy(
+        update={"id": uuid.uuid4(), "data": [dict(row) for row in result.response.data]}
+    )
+    return type(result)(response=response, compiled_sql=result.compiled_sql)
@@ -0,0 +1,273 @@
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from langbridge.federation.models import DatasetFreshnessPolicy, FederationWorkflow
+from langbridge import telemetry
+from langbridge.runtime.scheduling import dataset_sync_cadence_to_seconds
+from langbridge.runtime.settings import runtime_settings as settings
+from langbridge.semantic.model import SemanticCacheConfig
+from langbridge.semantic.query import SemanticQuery
+
+_ABSOLUTE_DATE_RANGE = re.compile(r"^\s*(?:before|after|on)\s*:", re.IGNORECASE)
+_ISO_DATE = re.compile(r"^\s*\d{4}-\d{2}-\d{2}")
+_DATE_RANGE_OPERATORS = {"indaterange", "notindaterange"}
+
+
+@dataclass(frozen=True, slots=True)
+class SemanticResultCachePolicy:
+    """Where and for how long one semantic query's result may be cached."""
+
+    key: str
+    freshness: str
+    model_ids: frozenset[Hashable]
+    dataset_ids: frozenset[uuid.UUID]
+    ttl_s: float
+    stale_s: float
+
+
+@dataclass(slots=True)
+class SemanticResultCacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    invalidations: int = 0
+
+
+@dataclass(slots=True)
+class _ResultEntry:
+    value: Any
+    freshness: str
+    model_ids: frozenset[Hashable]
+    dataset_ids: frozenset[uuid.UUID]
+    stale_s: float
+    fresh_until: float
+    stale_until: float = field(default=0.0)
+
+
+class SemanticResultCache:
+    """
+    Process-wide LRU of semantic query results.
+
+    Entries are keyed by the workspace, model ids, model content hash and the
+    normalized query, and remember the freshness token (dataset revisions) they were
+    computed under. A lookup whose current token differs, a dataset sync touching one
+    of the entry's datasets, or an expired TTL makes the entry stale: it is still
+    returned for `stale_s` seconds, flagged so the caller can recompute it in the
+    background, and dropped after that. Model edits hash differently and are dropped
+    by `invalidate_model`.
+    """
+
+    def __init__(self, *, max_entries: int = 512) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, _ResultEntry] = OrderedDict()
+        self._revalidating: set[str] = set()
+        self._lock = threading.Lock()
+        self.stats = SemanticResultCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, policy: SemanticResultCachePolicy) -> tuple[Any, bool] | None:
+        """The cached value and whether it is stale, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(policy.key)
+            if entry is not None and entry.freshness != policy.freshness:
+                self._mark_stale(entry, now)
+                entry.freshness = policy.freshness
+            if entry is not None and entry.fresh_until <= now and entry.stale_until == 0.0:
+                entry.stale_until = entry.fresh_until + entry.stale_s
+            if entry is None or (entry.fresh_until <= now and entry.stale_until <= now):
+                if entry is not None:
+                    del self._entries[policy.key]
+                self.stats.misses += 1
+                result = None
+            else:
+                self._entries.move_to_end(policy.key)
+                stale = entry.fresh_until <= now
+                if stale:
+                    self.stats.stale_hits += 1
+                else:
+                    self.stats.hits += 1
+                result = (entry.value, stale)
+        telemetry.increment(
+            telemetry.CACHE_LOOKUPS,
+            labels={
+                "cache": "semantic_result",
+                "result": "miss" if result is None else ("stale" if result[1] else "hit"),
+            },
+        )
+        return result
+
+    def store(self, policy: SemanticResultCachePolicy, value: Any) -> None:
+        entry = _ResultEntry(
+            value=value,
+            freshness=policy.freshness,
+            model_ids=policy.model_ids,
+            dataset_ids=policy.dataset_ids,
+            stale_s=policy.stale_s,
+            fresh_until=time.monotonic() + policy.ttl_s,
+        )
+        with self._lock:
+            self._entries[policy.key] = entry
+            self._entries.move_to_end(policy.key)
+            self.stats.stores += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def begin_revalidation(self, key: str) -> bool:
+        """Claim the background recompute of a stale entry; False if one is running."""
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+
+    def end_revalidation(self, key: str) -> None:
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def invalidate_dataset(self, dataset_id: uuid.UUID) -> int:
+        """Mark every entry computed from `dataset_id` stale, e.g. after it synced."""
+        now = time.monotonic()
+        with self._lock:
+            affected = [entry for entry in self._entries.values() if dataset_id in entry.dataset_ids]
+            for entry in affected:
+                self._mark_stale(entry, now)
+            self.stats.invalidations += len(affected)
+        return len(affected)
+
+    def invalidate_model(self, model_id: Hashable) -> int:
+        """Drop every entry computed from `model_id`, including unified queries over it."""
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if model_id in entry.model_ids]
+            for key in stale:
+                del self._entries[key]
+            self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _mark_stale(entry: _ResultEntry, now: float) -> None:
+        if entry.fresh_until > now:
+            entry.fresh_until = now
+            entry.stale_until = now + entry.stale_s
+
+
+def semantic_result_cache_policy(
+    *,
+    workspace_id: uuid.UUID,
+    model_ids: Iterable[Hashable],
+    content_hash: str,
+    semantic_query: SemanticQuery,
+    workflow: FederationWorkflow,
+    config: SemanticCacheConfig | None = None,
+) -> SemanticResultCachePolicy | None:
+    """
+    The cache policy for a query, or None when its result must not be cached.
+
+    Results over live datasets (no revision to tell when their data changed) are only
+    cached when the model sets an explicit `cache.ttl`.
+    """
+    if not settings.SEMANTIC_RESULT_CACHE_ENABLED or (config is not None and not config.enabled):
+        return None
+    models = frozenset(model_ids)
+    freshness: list[str] = []
+    dataset_ids: set[uuid.UUID] = set()
+    revision_tracked = True
+    for table_key, binding in sorted(workflow.dataset.tables.items()):
+        descriptor = binding.dataset_descriptor
+        if descriptor is not None and descriptor.dataset_id is not None:
+            dataset_ids.add(descriptor.dataset_id)
+        descriptor_freshness = descriptor.freshness if descriptor is not None else None
+        if descriptor_freshness is not None and descriptor_freshness.policy == DatasetFreshnessPolicy.REVISION:
+            freshness.append(f"{table_key}={descriptor_freshness.freshness_key}")
+        else:
+            revision_tracked = False
+
+    ttl_s = _seconds(config.ttl if config is not None else None)
+    if ttl_s is None:
+        ttl_s = float(settings.SEMANTIC_RESULT_CACHE_TTL_SECONDS) if revision_tracked else 0.0
+    if ttl_s <= 0:
+        return None
+    stale_s = _seconds(config.stale_while_revalidate if config is not None else None)
+    if stale_s is None:
+        stale_s = float(settings.SEMANTIC_RESULT_CACHE_STALE_SECONDS)
+
+    payload: dict[str, Any] = {
+        "workspace_id": str(workspace_id),
+        "model_ids": sorted(str(model_id) for model_id in models),
+        "content_hash": content_hash,
+        "query": semantic_query.model_dump(mode="json", exclude_none=True),
+    }
+    if _has_relative_date_range(semantic_query):
+        # "today" and "last 7 days" move with the calendar.
+        payload["date"] = datetime.now(timezone.utc).date().isoformat()
+    key = hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+    return SemanticResultCachePolicy(
+        key=key,
+        freshness="|".join(freshness),
+        model_ids=models,
+        dataset_ids=frozenset(dataset_ids),
+        ttl_s=ttl_s,
+        stale_s=max(0.0, stale_s),
+    )
+
+
+def _has_relative_date_range(semantic_query: SemanticQuery) -> bool:
+    ranges: list[Any] = [time_dimension.date_range for time_dimension in semantic_query.time_dimensions]
+    for item in semantic_query.filters:
+        if item.operator.strip().lower() in _DATE_RANGE_OPERATORS:
+            ranges.extend(item.values or [])
+    return any(_is_relative(value) for value in ranges if value is not None)
+
+
+def _is_relative(value: Any) -> bool:
+    if isinstance(value, (list, tuple)):
+        return any(_is_relative(item) for item in value)
+    text = str(value)
+    return not (_ABSOLUTE_DATE_RANGE.match(text) or _ISO_DATE.match(text))
+
+
+def _seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    return float(dataset_sync_cadence_to_seconds(value))
+
+
+_cache = SemanticResultCache(max_entries=settings.SEMANTIC_RESULT_CACHE_MAX_ENTRIES)
+_cache_lock = threading.Lock()
+
+
+def configure_semantic_result_cache(cache: SemanticResultCache) -> None:
+    """Replace the process-wide semantic result cache."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def get_semantic_result_cache() -> SemanticResultCache:
+    return _cache
+
+
+__all__ = [
+    "SemanticResultCache",
+    "SemanticResultCachePolicy",
+    "SemanticResultCacheStats",
+    "configure_semantic_result_cache",
+    "get_semantic_result_cache",
+    "semantic_result_cache_policy",
+]
@@ -15,7 +15,7 @@ from sqlglot import exp
 from langbridge.connectors.base import ConnectorRuntimeType, get_connector_config_factory
 from langbridge.connectors.base.connector import ManagedVectorDB
 from langbridge.plugins.connectors import VectorDBConnectorFactory
-from langbridge.runtime.embeddings import EmbeddingProvider
+from langbridge.runtime.embeddings import EmbeddingCache, Embedder, get_embedding_cache
 from langbridge.runtime.execution.federated_query_tool import FederatedQueryTool
 from langbridge.runtime.models import (
     SemanticVectorIndexMetadata,
@@ -63,7 +63,8 @@ class SemanticVectorSearchService:
         dataset_provider: DatasetMetadataProvider | None = None,
         connector_provider: ConnectorMetadataProvider | None = None,
         credential_provider: CredentialProvider | None = None,
-        embedding_provider: EmbeddingProvider | None = None,
+        embedding_provider: Embedder | None = None,
+        embedding_cache: EmbeddingCache | None = None,
     ) -> None:
         self._dataset_repository = dataset_repository
         self._federated_query_tool = federated_query_tool
@@ -73,6 +74,7 @@ class SemanticVectorSearchService:
         self._connector_provider = connector_provider
         self._credential_provider = credential_provider
         self._embedding_provider = embedding_provider
+        self._embedding_cache = embedding_cache if embedding_cache is not None else get_embedding_cache()
         self._logger = logger
         self._vector_factory = VectorDBConnectorFactory()
         self._dataset_execution_resolver = DatasetExecutionResolver(
@@ -98,7 +100,7 @@ class SemanticVectorSearchService:
         self,
         *,
         workspace_id: uuid.UUID,
-        embedding_provider: EmbeddingProvider | None = None,
+        embedding_provider: Embedder | None = None,
         semantic_model_id: uuid.UUID | None = None,
         force: bool = False,
     ) -> list[SemanticVectorIndexMetadata]:
@@ -168,7 +170,7 @@ class SemanticVectorSearchService:
         workspace_id: uuid.UUID,
         semantic_model_id: uuid.UUID,
         queries: Sequence[str],
-        embedding_provider: EmbeddingProvider | None = None,
+        embedding_provider: Embedder | None = None,
         top_k: int = 5,
     ) -> list[SemanticVectorSearchHit]:
         embedder = embedding_provider or self._embedding_provider
@@ -194,7 +196,7 @@ class SemanticVectorSearchService:
         if not cleaned_queries:
             return []
 
-        embeddings = await embedder.embed(cleaned_queries)
+        embeddings = await self._embed(embedder, cleaned_queries)
         if not embeddings:
             return []
 
@@ -433,7 +435,7 @@ class SemanticVectorSearchService:
         workflow_dialect: str,
         dataset_key: str,
         dimension: Dimension,
-        embedding_provider: EmbeddingProvider,
+        embedding_provider: Embedder,
     ) -> SemanticVectorIndexMetadata:
         store = self._require_vector_index_store()
         in_progress = index_metadata.model_copy(
@@ -455,21 +457,31 @@ class SemanticVectorSearchService:
                 dimension=dimension,
                 max_values=getattr(dimension.vector, "max_values", None),
             )
-            embeddings = await embedding_provider.embed(distinct_values)
-            if embeddings and len(embeddings) != len(distinct_values):
-                raise ExecutionValidationError(
-                    "Embedding count mismatch while refreshing semantic vector index."
-                )
-
             vector_store = await self._resolve_vector_store(
                 workspace_id=workspace_id,
                 index_metadata=saved_state,
             )
-            await self._reset_vector_store(
+            embedding_model = getattr(embedding_provider, "embedding_model", None)
+            embedding_dimension = await self._update_vector_store(
                 vector_store=vector_store,
-                embeddings=embeddings,
+                index_metadata=saved_state,
                 values=distinct_values,
+                embedding_provider=embedding_provider,
+                embedding_model=embedding_model,
             )
+            if embedding_dimension is None:
+                embeddings = await self._embed(embedding_provider, distinct_values)
+                if embeddings and len(embeddings) != len(distinct_values):
+                    raise ExecutionValidationError(
+                        "Embedding count mismatch while refreshing semantic vector index."
+                    )
+                await self._reset_vector_store(
+                    vector_store=vector_store,
+                    embeddings=embeddings,
+                    values=distinct_values,
+                    embedding_model=embedding_model,
+                )
+                embedding_dimension = len(embeddings[0]) if embeddings else None
 
             refreshed_at = datetime.now(timezone.utc)
             return await store.save(
@@ -477,9 +489,7 @@ class SemanticVectorSearchService:
                     update={
                         "refresh_status": SemanticVectorIndexStatus.READY,
                         "indexed_value_count": len(distinct_values),
-                        "embedding_dimension": (
-                            len(embeddings[0]) if embeddings else None
-                        ),
+                        "embedding_dimension": embedding_dimension,
                         "last_refreshed_at": refreshed_at,
                         "last_refresh_error": None,
                         "updated_at": refreshed_at,
@@ -585,12 +595,78 @@ class SemanticVectorSearchService:
             query = query.limit(max_values)
         return query.sql(dialect=dialect)
 
+    async def _update_vector_store(
+        self,
+        *,
+        vector_store: ManagedVectorDB,
+        index_metadata: SemanticVectorIndexMetadata,
+        values: Sequence[str],
+        embedding_provider: Embedder,
+        embedding_model: str | None,
+    ) -> int | None:
+        """
+        Bring an existing index in line with `values`: embed and add new values, remove
+        values no longer present. Returns the embedding dimension, or None when the index
+        has to be rebuilt instead (never built, built by another embedding model, or a
+        store that cannot list its vectors).
+        """
+        if index_metadata.embedding_dimension is None:
+            return None
+        try:
+            indexed = await vector_store.list_vectors()
+        except NotImplementedError:
+            return None
+        if not indexed:
+            return None
+        ids_by_value: dict[str, int] = {}
+        stale_ids: list[int] = []
+        for vector_id, payload in indexed.items():
+            payload = payload if isinstance(payload, Mapping) else {}
+            if payload.get("embedding_model") != embedding_model:
+                return None
+            value = str(payload.get("value") or "")
+            if value in ids_by_value:
+                stale_ids.append(vector_id)
+            else:
+                ids_by_value[value] = vector_id
+
+        wanted = set(values)
+        stale_ids.extend(vector_id for value, vector_id in ids_by_value.items() if value not in wanted)
+        added = [value for value in values if value not in ids_by_value]
+        embeddings = await self._embed(embedding_provider, added)
+        if len(embeddings) != len(added):
+            raise ExecutionValidationError(
+                "Embedding count mismatch while refreshing semantic vector index."
+            )
+        if embeddings and len(embeddings[0]) != index_metadata.embedding_dimension:
+            return None
+
+        await vector_store.delete_vectors(stale_ids)
+        if embeddings:
+            await vector_store.upsert_vectors(
+                embeddings,
+                metadata=[{"value": value, "embedding_model": embedding_model} for value in added],
+            )
+        self._logger.debug(
+            "Semantic vector index %s refreshed incrementally (%s added, %s removed).",
+            index_metadata.id,
+            len(added),
+            len(stale_ids),
+        )
+        return index_metadata.embedding_dimension
+
+    async def _embed(self, embedding_provider: Embedder, texts: Sequence[str]) -> list[list[float]]:
+        if self._embedding_cache is None:
+            return await embedding_provider.embed(texts)
+        return await self._embedding_cache.embed(embedding_provider, texts)
+
     async def _reset_vector_store(
         self,
         *,
         vector_store: ManagedVectorDB,
         embeddings: Sequence[Sequence[float]],
         values: Sequence[str],
+        embedding_model: str | None,
     ) -> None:
         try:
             await vector_store.delete_index()
@@ -603,7 +679,7 @@ class SemanticVectorSearchService:
         await vector_store.create_index(len(embeddings[0]))
         await vector_store.upsert_vectors(
             embeddings,
-            metadata=[{"value": value} for value in values],
+            metadata=[{"value": value, "embedding_model": embedding_model} for value in values],
         )
 
     async def _resolve_vector_store(
@@ -25,6 +25,7 @@ from langbridge.runtime.utils.sql import (
     normalize_sql_dialect,
     render_sql_with_params,
     sanitize_sql_error_message,
+    strip_explain_analyze,
     transpile_sql,
 )
 from langbridge.connectors.base import (
@@ -32,7 +33,15 @@ from langbridge.connectors.base import (
     get_connector_config_factory,
 )
 from langbridge.connectors.base.config import ConnectorRuntimeType
+from langbridge.federation.cancellation import (
+    CancellationToken,
+    QueryCancelledError,
+    QueryDeadlineExceededError,
+    cancellation_scope,
+    current_cancellation,
+)
 from langbridge.federation.models import FederationWorkflow, VirtualDataset, VirtualTableBinding
+from langbridge import telemetry
 from langbridge.runtime.execution import FederatedQueryTool
 from langbridge.runtime.ports import (
     DatasetCatalogStore,
@@ -92,6 +101,12 @@ class SqlQueryService:
         runtime_job = job or self._build_transient_job(request)
         if runtime_job.started_at is None:
             runtime_job.started_at = datetime.now(timezone.utc)
+            if existing_job and runtime_job.created_at is not None:
+                telemetry.observe(
+                    telemetry.QUEUE_WAIT,
+                    max(0.0, (runtime_job.started_at - runtime_job.created_at).total_seconds()),
+                    labels={"queue": "sql_job"},
+                )
         runtime_job.status = "running"
         runtime_job.updated_at = datetime.now(timezone.utc)
 
@@ -103,6 +118,12 @@ class SqlQueryService:
         )
         if existing_job:
             return self._result_payload(runtime_job) if runtime_job.status == "succeeded" else {}
+        if runtime_job.status == "cancelled":
+            error = runtime_job.error_json if isinstance(runtime_job.error_json, dict) else {}
+            message = str(error.get("message") or "SQL execution was cancelled.")
+            if error.get("deadline_exceeded"):
+                raise QueryDeadlineExceededError(message)
+            raise QueryCancelledError(message)
         if runtime_job.status != "succeeded":
             message = None
             if isinstance(runtime_job.error_json, dict):
@@ -118,27 +139,46 @@ class SqlQueryService:
         create_sql_connector: CreateSqlConnector | None = None,
         resolve_connector_config: ResolveConnectorConfig | None = None,
     ) -> None:
-        try:
-            if request.execution_mode == "federated":
-                await self._execute_federated(job, request)
-            else:
-                await self._execute_single(
-                    job,
-                    request,
-                    create_sql_connector=create_sql_connector or self._create_sql_connector,
-                    resolve_connector_config=resolve_connector_config
-                    or self._resolve_connector_config,
-                )
-        except Exception as exc:
-            self._logger.exception("SQL job %s failed: %s", job.id, exc)
-            if job.status != "cancelled":
-                job.status = "failed"
+        with telemetry.timed(
+            "sql_query_service.execute_job",
+            histogram=telemetry.SQL_QUERY_DURATION,
+            labels={"execution_mode": request.execution_mode},
+            attributes={"job_id": str(job.id), "workspace_id": str(request.workspace_id)},
+        ) as span:
+            try:
+                if request.execution_mode == "federated":
+                    await self._execute_federated(job, request)
+                else:
+                    await self._execute_single(
+                        job,
+                        request,
+                        create_sql_connector=create_sql_connector or self._create_sql_connector,
+                        resolve_connector_config=resolve_connector_config
+                        or self._resolve_connector_config,
+                    )
+            except QueryCancelledError as exc:
+                self._logger.info("SQL job %s was cancelled: %s", job.id, exc)
+                job.status = "cancelled"
                 job.error_json = {
-                    "message": sanitize_sql_error_message(str(exc)),
+                    "message": str(exc) or "SQL execution was cancelled.",
                     "correlation_id": request.correlation_id,
+                    "deadline_exceeded": isinstance(exc, QueryDeadlineExceededError),
                 }
                 job.finished_at = datetime.now(timezone.utc)
                 job.updated_at = datetime.now(timezone.utc)
+            except Exception as exc:
+                self._logger.exception("SQL job %s failed: %s", job.id, exc)
+                if job.status != "cancelled":
+                    job.status = "failed"
+                    job.error_json = {
+                        "message": sanitize_sql_error_message(str(exc)),
+                        "correlation_id": request.correlation_id,
+                    }
+                    job.finished_at = datetime.now(timezone.utc)
+                    job.updated_at = datetime.now(timezone.utc)
+            if job.status != "succeeded":
+                span.set_status("error", job.status)
+            span.set_attribute("rows", job.row_count_preview)
 
         return None
 
@@ -152,6 +192,8 @@ class SqlQueryService:
     ) -> None:
         if request.connection_id is None:
             raise ExecutionValidationError("connection_id is required for single datasource SQL jobs.")
+        if request.analyze:
+            raise ExecutionValidationError("EXPLAIN ANALYZE is only supported for federated SQL execution.")
 
         connector_response = await self._get_connector_response(
             connection_id=request.connection_id,
@@ -203,11 +245,22 @@ class SqlQueryService:
             max_rows=request.enforced_limit,
             dialect=connector_sqlglot_dialect,
         )
-        result = await sql_connector.execute(
-            executable_sql,
-            params={},
-            max_rows=effective_limit,
-            timeout_s=request.enforced_timeout_seconds,
+        with telemetry.timed(
+            "sql_connector.execute",
+            histogram=telemetry.CONNECTOR_QUERY_DURATION,
+            labels={"source_kind": connector_type.value.lower()},
+            attributes={"connection_id": str(request.connection_id)},
+        ):
+            result = await sql_connector.execute(
+                executable_sql,
+                params={},
+                max_rows=effective_limit,
+                timeout_s=request.enforced_timeout_seconds,
+            )
+        telemetry.increment(
+            telemetry.CONNECTOR_ROWS,
+            len(result.rows),
+            labels={"source_kind": connector_type.value.lower()},
         )
 
         rows: list[dict[str, Any]] = []
@@ -262,6 +315,8 @@ class SqlQueryService:
 
         source_sqlglot_dialect = normalize_sql_dialect(request.query_dialect, default="tsql")
         rendered_query = render_sql_with_params(request.query, request.params)
+        rendered_query, explain_analyze = strip_explain_analyze(rendered_query)
+        analyze = request.analyze or explain_analyze
         enforce_read_only_sql(
             rendered_query,
             allow_dml=request.allow_dml,
@@ -302,6 +357,20 @@ class SqlQueryService:
             "workflow": workflow.model_dump(mode="json"),
         }
 
+        if analyze:
+            tool_payload["analyze"] = True
+            cancellation = self._federated_cancellation(request)
+            with cancellation_scope(cancellation):
+                analyzed = await cancellation.run(
+                    self._federated_query_tool.explain_federated_query(tool_payload)
+                )
+            self._store_federated_explain_analyze_result(
+                job=job,
+                analyze_payload=analyzed,
+                workflow=workflow,
+            )
+            return
+
         if request.explain:
             explain = await self._federated_query_tool.explain_federated_query(tool_payload)
             self._store_federated_explain_result(
@@ -314,7 +383,11 @@ class SqlQueryService:
             )
             return
 
-        execution = await self._federated_query_tool.execute_federated_query(tool_payload)
+        cancellation = self._federated_cancellation(request)
+        with cancellation_scope(cancellation):
+            execution = await cancellation.run(
+                self._federated_query_tool.execute_federated_query(tool_payload)
+            )
         rows = self._extract_execution_rows(execution)
         redacted_rows, redaction_applied = apply_result_redaction(
             rows=rows,
@@ -352,6 +425,13 @@ class SqlQueryService:
             now=now,
         )
 
+    @staticmethod
+    def _federated_cancellation(request: CreateSqlJobRequest) -> CancellationToken:
+        parent = current_cancellation()
+        if parent is not None:
+            return parent.child(timeout_s=request.enforced_timeout_seconds)
+        return CancellationToken.with_timeout(request.enforced_timeout_seconds)
+
     async def _store_explain_result(
         self,
         job: SqlJob,
@@ -966,3 +1046,36 @@ class SqlQueryService:
                 "plan": explain_payload,
             }
         }
+
+    def _store_federated_explain_analyze_result(
+        self,
+        *,
+        job: SqlJob,
+        analyze_payload: dict[str, Any],
+        workflow: FederationWorkflow,
+    ) -> None:
+        plan_text = analyze_payload.get("plan_text") if isinstance(analyze_payload, dict) else None
+        execution_meta = self._extract_execution_meta(analyze_payload)
+
+        now = datetime.now(timezone.utc)
+        job.status = "succeeded"
+        job.result_columns_json = [{"name": "QUERY PLAN", "type": "string"}]
+        job.result_rows_json = [{"QUERY PLAN": str(line)} for line in plan_text or []]
+        job.row_count_preview = len(job.result_rows_json)
+        job.total_rows_estimate = None
+        job.bytes_scanned = execution_meta["bytes_scanned"]
+        job.duration_ms = execution_meta["duration_ms"]
+        job.result_cursor = "0"
+        job.redaction_applied = False
+        job.error_json = None
+        job.finished_at = now
+        job.updated_at = now
+        job.stats_json = {
+            "explain": {
+                "mode": "federated",
+                "analyze": True,
+                "query_hash": job.query_hash,
+                "workflow": workflow.model_dump(mode="json"),
+                "plan": analyze_payload,
+            }
+        }
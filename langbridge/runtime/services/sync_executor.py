@@ -0,0 +1,210 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from langbridge import telemetry
+from langbridge.runtime.settings import runtime_settings as settings
+
+# Lower runs first. Requests made through the API outrank scheduled syncs.
+SYNC_PRIORITY_INTERACTIVE = 0
+SYNC_PRIORITY_SCHEDULED = 10
+
+
+@dataclass(slots=True)
+class _SyncRun:
+    key: str
+    workspace: str
+    priority: int
+    # (scope, limit) pairs, e.g. ("connector:<id>", 2); a run starts only when every
+    # scope has a free slot.
+    scopes: tuple[tuple[str, int], ...]
+    run: Callable[[], Awaitable[Any]]
+    future: "asyncio.Future[Any]"
+    sequence: int
+    enqueued_at: float
+
+
+class SyncExecutor:
+    """
+    Runs dataset syncs on a bounded worker pool.
+
+    At most `max_workers` syncs run at once, at most `max_per_connector` per connector
+    and `max_per_host` per source host, and one per dataset. Queued syncs start by
+    priority; among equal priorities the workspace served least recently goes first,
+    then submission order, so one workspace's backlog cannot starve another's. A
+    sync that cannot start because its connector or host is saturated does not block
+    syncs queued behind it. Submitting a key that is already queued or running joins
+    that run instead of starting another. Time spent queued is recorded in the
+    `langbridge_queue_wait_seconds` histogram with `queue="dataset_sync"`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        max_per_connector: int,
+        max_per_host: int,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._max_workers = max(1, int(max_workers))
+        self._max_per_connector = max(1, int(max_per_connector))
+        self._max_per_host = max(1, int(max_per_host))
+        self._logger = logger or logging.getLogger("langbridge.runtime.sync_executor")
+        self._queued: list[_SyncRun] = []
+        self._runs: dict[str, _SyncRun] = {}
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._scope_counts: dict[str, int] = {}
+        self._last_served: dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._dispatches = itertools.count(1)
+
+    @classmethod
+    def from_settings(cls) -> "SyncExecutor":
+        return cls(
+            max_workers=settings.SYNC_EXECUTOR_MAX_WORKERS,
+            max_per_connector=settings.SYNC_EXECUTOR_MAX_PER_CONNECTOR,
+            max_per_host=settings.SYNC_EXECUTOR_MAX_PER_HOST,
+        )
+
+    @property
+    def running_count(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def queued_count(self) -> int:
+        return len(self._queued)
+
+    async def run(
+        self,
+        *,
+        key: str,
+        run: Callable[[], Awaitable[Any]],
+        workspace: str,
+        connector: str,
+        host: str | None = None,
+        dataset: str | None = None,
+        priority: int = SYNC_PRIORITY_INTERACTIVE,
+    ) -> Any:
+        """Queue `run` (or join the run already queued under `key`) and wait for its result."""
+        future = self.submit(
+            key=key,
+            run=run,
+            workspace=workspace,
+            connector=connector,
+            host=host,
+            dataset=dataset,
+            priority=priority,
+        )
+        # Shielded so a cancelled caller does not cancel a run other callers joined.
+        return await asyncio.shield(future)
+
+    def submit(
+        self,
+        *,
+        key: str,
+        run: Callable[[], Awaitable[Any]],
+        workspace: str,
+        connector: str,
+        host: str | None = None,
+        dataset: str | None = None,
+        priority: int = SYNC_PRIORITY_INTERACTIVE,
+    ) -> "asyncio.Future[Any]":
+        existing = self._runs.get(key)
+        if existing is not None and not existing.future.done():
+            if priority < existing.priority:
+                existing.priority = priority
+            self._logger.debug("Sync '%s' is already queued or running; joining it.", key)
+            return existing.future
+        scopes = [(f"connector:{connector}", self._max_per_connector)]
+        if host:
+            scopes.append((f"host:{host.lower()}", self._max_per_host))
+        if dataset:
+            scopes.append((f"dataset:{dataset}", 1))
+        queued = _SyncRun(
+            key=key,
+            workspace=workspace,
+            priority=int(priority),
+            scopes=tuple(scopes),
+            run=run,
+            future=asyncio.get_running_loop().create_future(),
+            sequence=next(self._sequence),
+            enqueued_at=time.perf_counter(),
+        )
+        self._runs[key] = queued
+        self._queued.append(queued)
+        self._dispatch()
+        return queued.future
+
+    async def aclose(self) -> None:
+        for queued in self._queued:
+            queued.future.cancel()
+            self._runs.pop(queued.key, None)
+        self._queued.clear()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        while len(self._tasks) < self._max_workers:
+            eligible = [queued for queued in self._queued if self._has_capacity(queued)]
+            if not eligible:
+                return
+            chosen = min(
+                eligible,
+                key=lambda queued: (
+                    queued.priority,
+                    self._last_served.get(queued.workspace, 0),
+                    queued.sequence,
+                ),
+            )
+            self._queued.remove(chosen)
+            self._last_served[chosen.workspace] = next(self._dispatches)
+            for scope, _ in chosen.scopes:
+                self._scope_counts[scope] = self._scope_counts.get(scope, 0) + 1
+            telemetry.observe_since(telemetry.QUEUE_WAIT, chosen.enqueued_at, labels={"queue": "dataset_sync"})
+            self._tasks[chosen.key] = asyncio.create_task(
+                self._execute(chosen),
+                name=f"langbridge-sync:{chosen.key}",
+            )
+
+    def _has_capacity(self, queued: _SyncRun) -> bool:
+        return all(self._scope_counts.get(scope, 0) < limit for scope, limit in queued.scopes)
+
+    async def _execute(self, queued: _SyncRun) -> None:
+        try:
+            result = await queued.run()
+        except asyncio.CancelledError:
+            queued.future.cancel()
+            raise
+        except Exception as exc:
+            if not queued.future.done():
+                queued.future.set_exception(exc)
+            # Callers that joined and then went away never retrieve the error.
+            queued.future.exception()
+        else:
+            if not queued.future.done():
+                queued.future.set_result(result)
+        finally:
+            for scope, _ in queued.scopes:
+                remaining = self._scope_counts.get(scope, 0) - 1
+                if remaining > 0:
+                    self._scope_counts[scope] = remaining
+                else:
+                    self._scope_counts.pop(scope, None)
+            self._tasks.pop(queued.key, None)
+            if self._runs.get(queued.key) is queued:
+                self._runs.pop(queued.key, None)
+            self._dispatch()
+
+
+__all__ = [
+    "SYNC_PRIORITY_INTERACTIVE",
+    "SYNC_PRIORITY_SCHEDULED",
+    "SyncExecutor",
+]
@@ -39,6 +39,21 @@ class RuntimeSettings:
     SQL_FEDERATION_ENABLED: bool = _read_bool("SQL_FEDERATION_ENABLED", True)
     SQL_FEDERATION_MAX_ELIGIBLE_DATASETS: int = _read_int("SQL_FEDERATION_MAX_ELIGIBLE_DATASETS", 200)
     DATASET_FILE_LOCAL_DIR: str = os.getenv("DATASET_FILE_LOCAL_DIR", ".cache/datasets")
+    DATASET_SYNC_BATCH_ROWS: int = _read_int("DATASET_SYNC_BATCH_ROWS", 50_000)
+    DATASET_SYNC_SQL_PAGE_ROWS: int = _read_int("DATASET_SYNC_SQL_PAGE_ROWS", 50_000)
+    DATASET_SYNC_SQL_CHECKPOINT_ROWS: int = _read_int("DATASET_SYNC_SQL_CHECKPOINT_ROWS", 1_000_000)
+    DATASET_SYNC_SQL_MAX_CONCURRENCY: int = _read_int("DATASET_SYNC_SQL_MAX_CONCURRENCY", 1)
+    DATASET_SYNC_SQL_TIMEOUT_SECONDS: int = _read_int("DATASET_SYNC_SQL_TIMEOUT_SECONDS", 120)
+    DATASET_SYNC_CDC_BATCH_EVENTS: int = _read_int("DATASET_SYNC_CDC_BATCH_EVENTS", 10_000)
+    DATASET_SYNC_CDC_MAX_EVENTS: int = _read_int("DATASET_SYNC_CDC_MAX_EVENTS", 1_000_000)
+    DATASET_INGEST_FILE_BYTES: int = _read_int("DATASET_INGEST_FILE_BYTES", 256 * 1024 * 1024)
+    DATASET_TABLE_RETAIN_SNAPSHOTS: int = _read_int("DATASET_TABLE_RETAIN_SNAPSHOTS", 5)
+    DATASET_COMPACTION_INTERVAL_SECONDS: int = _read_int("DATASET_COMPACTION_INTERVAL_SECONDS", 900)
+    DATASET_COMPACTION_TARGET_ROWS: int = _read_int("DATASET_COMPACTION_TARGET_ROWS", 1_000_000)
+    SYNC_EXECUTOR_MAX_WORKERS: int = _read_int("SYNC_EXECUTOR_MAX_WORKERS", 4)
+    SYNC_EXECUTOR_MAX_PER_CONNECTOR: int = _read_int("SYNC_EXECUTOR_MAX_PER_CONNECTOR", 2)
+    SYNC_EXECUTOR_MAX_PER_HOST: int = _read_int("SYNC_EXECUTOR_MAX_PER_HOST", 2)
+    SYNC_SCHEDULE_JITTER_SECONDS: int = _read_int("SYNC_SCHEDULE_JITTER_SECONDS", 30)
     FEDERATION_ARTIFACT_DIR: str = os.getenv("FEDERATION_ARTIFACT_DIR", ".cache/federation")
     FEDERATION_BROADCAST_THRESHOLD_BYTES: int = _read_int(
         "FEDERATION_BROADCAST_THRESHOLD_BYTES",
@@ -47,6 +62,20 @@ class RuntimeSettings:
     FEDERATION_PARTITION_COUNT: int = _read_int("FEDERATION_PARTITION_COUNT", 8)
     FEDERATION_STAGE_MAX_RETRIES: int = _read_int("FEDERATION_STAGE_MAX_RETRIES", 4)
     FEDERATION_STAGE_PARALLELISM: int = _read_int("FEDERATION_STAGE_PARALLELISM", 4)
+    # Off by default: cached bodies include responses to authenticated requests.
+    API_HTTP_CACHE_ENABLED: bool = _read_bool("API_HTTP_CACHE_ENABLED", False)
+    API_HTTP_CACHE_DIR: str = os.getenv(
+        "API_HTTP_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "langbridge", "http"),
+    )
+    API_HTTP_CACHE_TTL_SECONDS: int = _read_int("API_HTTP_CACHE_TTL_SECONDS", 0)
+    API_HTTP_CACHE_MAX_BYTES: int = _read_int("API_HTTP_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+    EMBEDDING_CACHE_ENABLED: bool = _read_bool("EMBEDDING_CACHE_ENABLED", True)
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", ".cache/embeddings.sqlite3")
+    SEMANTIC_RESULT_CACHE_ENABLED: bool = _read_bool("SEMANTIC_RESULT_CACHE_ENABLED", True)
+    SEMANTIC_RESULT_CACHE_TTL_SECONDS: int = _read_int("SEMANTIC_RESULT_CACHE_TTL_SECONDS", 300)
+    SEMANTIC_RESULT_CACHE_STALE_SECONDS: int = _read_int("SEMANTIC_RESULT_CACHE_STALE_SECONDS", 0)
+    SEMANTIC_RESULT_CACHE_MAX_ENTRIES: int = _read_int("SEMANTIC_RESULT_CACHE_MAX_ENTRIES", 512)
 
 
 runtime_settings = RuntimeSettings()
@@ -28,6 +28,7 @@ from langbridge.runtime.utils.sql import (
     normalize_sql_dialect,
     render_sql_with_params,
     sanitize_sql_error_message,
+    strip_explain_analyze,
     transpile_sql,
 )
 from langbridge.runtime.utils.storage_uri import (
@@ -61,5 +62,6 @@ __all__ = [
     "resolve_local_storage_path",
     "sanitize_sql_error_message",
     "stable_payload_hash",
+    "strip_explain_analyze",
     "transpile_sql",
 ]
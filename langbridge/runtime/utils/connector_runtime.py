@@ -3,9 +3,15 @@ import json
 from typing import Any, Callable
 
 from langbridge.connectors.base.config import ConnectorCapabilities as PluginConnectorCapabilities
+from langbridge.connectors.base.http_cache import (
+    HttpResponseCache,
+    configure_http_response_cache,
+    get_http_response_cache,
+)
 from langbridge.plugins.connectors import ConnectorPlugin
 from langbridge.runtime.models import ConnectorCapabilities
 from langbridge.runtime.models import SecretReference
+from langbridge.runtime.settings import RuntimeSettings, runtime_settings
 
 SecretResolver = Callable[[SecretReference], str]
 
@@ -23,6 +29,26 @@ def parse_connector_payload(raw_config: Any) -> dict[str, Any]:
     return {}
 
 
+def configure_api_response_cache(settings: RuntimeSettings = runtime_settings) -> HttpResponseCache | None:
+    """Install the process-wide API response cache described by `settings`, reusing a matching one."""
+    if not settings.API_HTTP_CACHE_ENABLED:
+        configure_http_response_cache(None)
+        return None
+    current = get_http_response_cache()
+    ttl_s = float(max(0, settings.API_HTTP_CACHE_TTL_SECONDS))
+    max_bytes = max(0, settings.API_HTTP_CACHE_MAX_BYTES) or None
+    if (
+        current is not None
+        and str(current.base_dir) == str(settings.API_HTTP_CACHE_DIR)
+        and current.default_ttl_s == ttl_s
+        and current.max_bytes == max_bytes
+    ):
+        return current
+    cache = HttpResponseCache(settings.API_HTTP_CACHE_DIR, default_ttl_s=ttl_s, max_bytes=max_bytes)
+    configure_http_response_cache(cache)
+    return cache
+
+
 def build_connector_runtime_payload(
     *,
     config_json: Any,
@@ -11,6 +11,10 @@ from sqlglot import exp
 _PARAM_TEMPLATE_PATTERN = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\}\}")
 _PARAM_COLON_PATTERN = re.compile(r"(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)\b")
 _FIRST_TOKEN_PATTERN = re.compile(r"^\s*([a-zA-Z_]+)")
+_EXPLAIN_ANALYZE_PATTERN = re.compile(
+    r"^\s*explain\s+(?:analy[sz]e|\(\s*analy[sz]e(?:\s+(?:true|on|1))?\s*\))\s+",
+    re.IGNORECASE,
+)
 _ERROR_SECRET_PATTERN = re.compile(r"(?i)(password|pwd|secret|token)\s*=\s*([^;\s,]+)")
 _DIALECT_ALIASES = {
     "tsql": "tsql",
@@ -43,6 +47,14 @@ def render_sql_with_params(query: str, params: dict[str, Any]) -> str:
     return rendered
 
 
+def strip_explain_analyze(query: str) -> tuple[str, bool]:
+    """Split a leading `EXPLAIN ANALYZE` off the query, returning the inner query and whether it was present."""
+    match = _EXPLAIN_ANALYZE_PATTERN.match(query)
+    if match is None:
+        return query, False
+    return query[match.end():], True
+
+
 def normalize_sql_dialect(dialect: str | None, *, default: str = "tsql") -> str:
     if dialect is None:
         return default
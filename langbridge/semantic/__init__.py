@@ -8,6 +8,8 @@ from .model import (
     TableFilter,
     Relationship,
     Metric,
+    PreAggregation,
+    SemanticCacheConfig,
 )
 from .unified_query import (
     WorkspaceAwareQueryContext,
@@ -26,6 +28,8 @@ __all__ = [
     "TableFilter",
     "Relationship",
     "Metric",
+    "PreAggregation",
+    "SemanticCacheConfig",
     "WorkspaceAwareQueryContext",
     "UnifiedSourceModel",
     "apply_workspace_aware_context",
@@ -355,6 +355,95 @@ class Metric(BaseModel):
     expression: str
 
 
+_PRE_AGGREGATION_GRANULARITIES = ("second", "minute", "hour", "day", "week", "month", "quarter", "year")
+
+
+class PreAggregation(BaseModel):
+    """
+    A rollup of measures by dimensions (and optionally a time bucket) that the runtime
+    materializes ahead of queries and routes matching semantic queries to.
+    """
+
+    measures: List[str]
+    dimensions: List[str] = Field(default_factory=list)
+    time_dimension: Optional[str] = None
+    granularity: Optional[str] = None
+    # Time-bucket partitions of the materialized rollup; refreshes rebuild only the
+    # partitions from the last build onward. Without it every refresh is a full rebuild.
+    partition_granularity: Optional[Literal["day", "month", "year"]] = None
+    refresh_every: Optional[str] = None
+    # How far back each incremental refresh re-reads, for late-arriving rows (e.g. "7d").
+    update_window: Optional[str] = None
+    # Answer with the rollup up to its last build plus the source rows after it.
+    union_with_source: bool = False
+
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_shape(cls, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        normalized = dict(value)
+        for camel, snake in (
+            ("timeDimension", "time_dimension"),
+            ("partitionGranularity", "partition_granularity"),
+            ("refreshEvery", "refresh_every"),
+            ("updateWindow", "update_window"),
+            ("unionWithSource", "union_with_source"),
+        ):
+            if normalized.get(snake) is None and normalized.get(camel) is not None:
+                normalized[snake] = normalized[camel]
+        for key in ("granularity", "partition_granularity"):
+            if isinstance(normalized.get(key), str):
+                normalized[key] = normalized[key].strip().lower()
+        return normalized
+
+    @model_validator(mode="after")
+    def _validate_shape(self) -> "PreAggregation":
+        if not self.measures:
+            raise ValueError("Pre-aggregations require at least one measure.")
+        if bool(self.time_dimension) != bool(self.granularity):
+            raise ValueError("Pre-aggregations set time_dimension and granularity together.")
+        if self.granularity is not None and self.granularity not in _PRE_AGGREGATION_GRANULARITIES:
+            raise ValueError(f"Unsupported pre-aggregation granularity '{self.granularity}'.")
+        if self.partition_granularity is not None:
+            if self.granularity is None:
+                raise ValueError("Partitioned pre-aggregations require a time_dimension.")
+            # Week buckets straddle month and year boundaries.
+            if self.granularity == "week" or _PRE_AGGREGATION_GRANULARITIES.index(
+                self.granularity
+            ) > _PRE_AGGREGATION_GRANULARITIES.index(self.partition_granularity):
+                raise ValueError(
+                    f"Pre-aggregations at '{self.granularity}' granularity cannot be partitioned by "
+                    f"'{self.partition_granularity}'."
+                )
+        if self.union_with_source and self.time_dimension is None:
+            raise ValueError("union_with_source requires a time_dimension.")
+        return self
+
+
+class SemanticCacheConfig(BaseModel):
+    """How long the runtime reuses results of queries against this model."""
+
+    enabled: bool = True
+    # e.g. "5m". Without it only results over revision-tracked (synced) datasets are
+    # cached, for the runtime default.
+    ttl: Optional[str] = None
+    # How long past expiry (or a dataset sync) a result is still served while it is
+    # recomputed in the background.
+    stale_while_revalidate: Optional[str] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_shape(cls, value: Any) -> Any:
+        if isinstance(value, bool):
+            return {"enabled": value}
+        if isinstance(value, dict) and value.get("stale_while_revalidate") is None:
+            camel = value.get("staleWhileRevalidate")
+            if camel is not None:
+                return {**value, "stale_while_revalidate": camel}
+        return value
+
+
 class SemanticOrchestration(BaseModel):
     orchestration: str
     steps: Optional[List[Dict[str, Any]]] = None
@@ -370,6 +459,8 @@ class SemanticModel(BaseModel):
     datasets: Dict[str, Dataset] = Field(default_factory=dict)
     relationships: Optional[List[Relationship]] = None
     metrics: Optional[Dict[str, Metric]] = None
+    pre_aggregations: Optional[Dict[str, PreAggregation]] = None
+    cache: Optional[SemanticCacheConfig] = None
 
     @model_validator(mode="before")
     @classmethod
@@ -377,6 +468,8 @@ class SemanticModel(BaseModel):
         if not isinstance(value, dict):
             return value
         normalized = dict(value)
+        if normalized.get("pre_aggregations") is None and normalized.get("preAggregations") is not None:
+            normalized["pre_aggregations"] = normalized.get("preAggregations")
         if normalized.get("datasets") is None and isinstance(normalized.get("tables"), dict):
             normalized["datasets"] = normalized.get("tables")
         return normalized
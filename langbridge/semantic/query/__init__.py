@@ -1,10 +1,32 @@
+from .compiled_model import (
+    CompiledSemanticModel,
+    CompiledSemanticModelCache,
+    configure_compiled_semantic_model_cache,
+    get_compiled_semantic_model_cache,
+    semantic_model_content_hash,
+)
 from .engine import SemanticQueryEngine, SemanticQueryPlan
+from .pre_aggregations import (
+    PreAggregationMatch,
+    match_pre_aggregation,
+    pre_aggregation_columns,
+    pre_aggregation_query,
+)
 from .translator import TsqlSemanticTranslator
 from .query_model import SemanticQuery
 
 __all__ = [
+    "CompiledSemanticModel",
+    "CompiledSemanticModelCache",
+    "configure_compiled_semantic_model_cache",
+    "get_compiled_semantic_model_cache",
+    "semantic_model_content_hash",
     "SemanticQueryEngine",
     "SemanticQueryPlan",
+    "PreAggregationMatch",
+    "match_pre_aggregation",
+    "pre_aggregation_columns",
+    "pre_aggregation_query",
     "TsqlSemanticTranslator",
     "SemanticQuery",
 ]
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from langbridge.semantic.model import SemanticModel
+from .join_planner import JoinPlanner
+from .resolver import SemanticModelResolver
+
+DEFAULT_COMPILED_MODEL_CACHE_ENTRIES = 256
+
+
+def build_model_annotations(semantic_model: SemanticModel) -> list[dict[str, str]]:
+    annotations: list[dict[str, str]] = []
+    for dataset_key, dataset in semantic_model.datasets.items():
+        for column, name in dataset.get_annotations(dataset_key).items():
+            annotations.append({"column": column, "name": name})
+    return annotations
+
+
+def semantic_model_content_hash(*parts: str | Mapping[str, Any] | None) -> str:
+    """Stable digest of a model's source text and/or structured payload."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            encoded = b"\x00"
+        elif isinstance(part, str):
+            encoded = part.encode("utf-8")
+        else:
+            encoded = json.dumps(part, sort_keys=True, default=str).encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledSemanticModel:
+    """
+    A semantic model with everything query compilation derives from it built once.
+
+    Holds the parsed model, its member lookup maps (`resolver`), the relationship
+    graph with its join path index (`join_planner`) and the result annotations, plus
+    the raw document the model was parsed from when there is one. Instances are
+    shared across requests and must be treated as read-only.
+    """
+
+    model: SemanticModel
+    content_hash: str
+    resolver: SemanticModelResolver
+    join_planner: JoinPlanner
+    annotations: tuple[dict[str, str], ...]
+    payload: Mapping[str, Any] | None = None
+
+    @classmethod
+    def compile(
+        cls,
+        model: SemanticModel,
+        *,
+        content_hash: str | None = None,
+        payload: Mapping[str, Any] | None = None,
+    ) -> "CompiledSemanticModel":
+        return cls(
+            model=model,
+            content_hash=content_hash or "",
+            resolver=SemanticModelResolver(model),
+            join_planner=JoinPlanner(model.relationships),
+            annotations=tuple(build_model_annotations(model)),
+            payload=payload,
+        )
+
+
+@dataclass(slots=True)
+class CompiledModelCacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    compiled: CompiledSemanticModel
+    depends_on: frozenset[Hashable] = field(default_factory=frozenset)
+
+
+class CompiledSemanticModelCache:
+    """
+    Process-wide LRU of compiled semantic models keyed by `(model id, content hash)`.
+
+    A changed model hashes differently, so stale entries are never served; they age
+    out of the LRU or are dropped by `invalidate` when the model is updated or
+    deleted. Entries derived from other models (unified models) name them in
+    `depends_on` and are dropped with them.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_COMPILED_MODEL_CACHE_ENTRIES) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[tuple[Hashable, str], _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CompiledModelCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compile(
+        self,
+        model_id: Hashable,
+        content_hash: str,
+        build: Callable[[], CompiledSemanticModel],
+        *,
+        depends_on: Iterable[Hashable] = (),
+    ) -> CompiledSemanticModel:
+        key = (model_id, content_hash)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry.compiled
+            self.stats.misses += 1
+        # Compiled outside the lock; concurrent misses for one key build twice and
+        # the last writer wins, which is harmless because the results are equal.
+        compiled = build()
+        with self._lock:
+            self._entries[key] = _CacheEntry(compiled=compiled, depends_on=frozenset(depends_on))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def invalidate(self, model_id: Hashable) -> int:
+        """Drop every entry for `model_id` and every entry built from it."""
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if key[0] == model_id or model_id in entry.depends_on
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = CompiledSemanticModelCache()
+_cache_lock = threading.Lock()
+
+
+def configure_compiled_semantic_model_cache(cache: CompiledSemanticModelCache) -> None:
+    """Replace the process-wide compiled model cache."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def get_compiled_semantic_model_cache() -> CompiledSemanticModelCache:
+    return _cache
@@ -6,6 +6,7 @@ import sqlglot
 from sqlglot import exp
 
 from langbridge.semantic.model import SemanticModel
+from .compiled_model import CompiledSemanticModel, build_model_annotations
 from .query_model import SemanticQuery
 from .resolver import MetricRef, SemanticModelResolver
 from .translator import TsqlSemanticTranslator
@@ -18,6 +19,8 @@ class SemanticQueryPlan:
     sql: str
     annotations: List[dict[str, str]]
     metadata: List[dict[str, str]]
+    # The compiled tree `sql` was rendered from, for planners that take an AST.
+    expression: exp.Expression | None = None
 
 
 class SemanticQueryEngine:
@@ -31,37 +34,44 @@ class SemanticQueryEngine:
     def compile(
         self,
         semantic_query: SemanticQuery,
-        semantic_model: SemanticModel,
+        semantic_model: SemanticModel | CompiledSemanticModel,
         *,
         dialect: str,
         rewrite_expression: RewriteExpression | None = None,
     ) -> SemanticQueryPlan:
+        compiled = (
+            semantic_model
+            if isinstance(semantic_model, CompiledSemanticModel)
+            else CompiledSemanticModel.compile(semantic_model)
+        )
         tree = self._translator.translate(
             semantic_query,
-            semantic_model,
+            compiled,
             dialect=dialect,
         )
-        sql = self._transpile(tree, dialect=dialect, rewrite_expression=rewrite_expression)
+        if rewrite_expression:
+            tree = tree.transform(lambda node: rewrite_expression(node))
         return SemanticQueryPlan(
-            sql=sql,
-            annotations=self.build_annotations(semantic_model),
-            metadata=self.build_result_metadata(semantic_query, semantic_model),
+            sql=tree.sql(dialect=dialect),
+            annotations=[dict(annotation) for annotation in compiled.annotations],
+            metadata=self.build_result_metadata(semantic_query, compiled),
+            expression=tree,
         )
 
     @staticmethod
     def build_annotations(semantic_model: SemanticModel) -> List[dict[str, str]]:
-        annotations: List[dict[str, str]] = []
-        for dataset_key, dataset in semantic_model.datasets.items():
-            for column, name in dataset.get_annotations(dataset_key).items():
-                annotations.append({"column": column, "name": name})
-        return annotations
+        return build_model_annotations(semantic_model)
 
     def build_result_metadata(
         self,
         semantic_query: SemanticQuery,
-        semantic_model: SemanticModel,
+        semantic_model: SemanticModel | CompiledSemanticModel,
     ) -> List[dict[str, str]]:
-        resolver = SemanticModelResolver(semantic_model)
+        resolver = (
+            semantic_model.resolver
+            if isinstance(semantic_model, CompiledSemanticModel)
+            else SemanticModelResolver(semantic_model)
+        )
         metadata: List[dict[str, str]] = []
 
         for member in semantic_query.dimensions:
@@ -108,18 +118,6 @@ class SemanticQueryEngine:
     ) -> List[dict[str, Any]]:
         return [dict(zip(columns, row)) for row in rows]
 
-    @staticmethod
-    def _transpile(
-        tree: exp.Select,
-        *,
-        dialect: str,
-        rewrite_expression: RewriteExpression | None = None,
-    ) -> str:
-        if rewrite_expression:
-            rewritten = tree.transform(lambda node: rewrite_expression(node))
-            return rewritten.sql(dialect=dialect)
-        return tree.sql(dialect=dialect)
-
     @staticmethod
     def _alias_for_member(member: str) -> str:
         alias = member.replace(".", "__").replace(" ", "_")
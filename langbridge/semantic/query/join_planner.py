@@ -1,10 +1,34 @@
-from collections import deque
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from langbridge.semantic.errors import JoinPathError
 from langbridge.semantic.model import Relationship
 
+DEFAULT_JOIN_TREE_CACHE_ENTRIES = 1024
+
+
+def _fans_out(relationship: Relationship, left_dataset: str) -> bool:
+    """Whether joining across `relationship` from `left_dataset` can multiply its rows."""
+    if relationship.type == "many_to_many":
+        return True
+    if relationship.type == "one_to_many":
+        return left_dataset == relationship.source_dataset
+    if relationship.type == "many_to_one":
+        return left_dataset == relationship.target_dataset
+    # Join-kind relationships (inner/left/...) carry no cardinality.
+    return False
+
+
+def _climbs(relationship: Relationship, left_dataset: str) -> bool:
+    """Whether joining across `relationship` from `left_dataset` reaches the "one" side of a to-many relationship."""
+    if relationship.type == "many_to_one":
+        return left_dataset == relationship.source_dataset
+    if relationship.type == "one_to_many":
+        return left_dataset == relationship.target_dataset
+    return False
+
 
 @dataclass(frozen=True)
 class JoinStep:
@@ -20,60 +44,219 @@ class JoinStep:
     def right_table(self) -> str:
         return self.right_dataset
 
+    @property
+    def fans_out(self) -> bool:
+        return _fans_out(self.relationship, self.left_dataset)
+
+
+@dataclass(frozen=True)
+class JoinTree:
+    """
+    The joins connecting a base dataset to a set of required datasets.
+
+    `fan_out_datasets` are the datasets reached through a to-many join, whose rows
+    repeat the rows they were joined from. `chasm_trap` is set when two of those
+    joins hang off separate branches, or when one follows a to-one join (two facts
+    sharing a dimension), so measures on either side are multiplied by the other.
+    """
+
+    base_dataset: str
+    steps: Tuple[JoinStep, ...]
+    fan_out_datasets: FrozenSet[str]
+    chasm_trap: bool
+
 
 class JoinPlanner:
-    def __init__(self, relationships: Optional[Iterable[Relationship]]) -> None:
+    """
+    Plans joins over a semantic model's relationship graph.
+
+    Shortest paths between every pair of datasets are indexed once, on
+    construction; among equally short paths the one with the fewest fan-out joins
+    wins. Multi-dataset requests are connected by a Steiner tree approximation
+    that grows from the base dataset, each time attaching the required dataset
+    nearest to the tree so far. Trees are cached per `(base, required datasets)`.
+    Planners are built once per compiled model and shared across requests.
+    """
+
+    def __init__(
+        self,
+        relationships: Optional[Iterable[Relationship]],
+        *,
+        max_cached_trees: int = DEFAULT_JOIN_TREE_CACHE_ENTRIES,
+    ) -> None:
         self._relationships: List[Relationship] = list(relationships or [])
         self._adjacency: Dict[str, List[Tuple[str, Relationship]]] = {}
+        self._paths: Dict[Tuple[str, str], Tuple[Relationship, ...]] = {}
+        self._trees: OrderedDict[Tuple[str, FrozenSet[str]], JoinTree] = OrderedDict()
+        self._max_cached_trees = max(1, int(max_cached_trees))
+        self._lock = threading.Lock()
         self._build_graph()
+        self._build_path_index()
 
     def plan(self, base_dataset: str, required_datasets: Set[str]) -> List[JoinStep]:
         if not required_datasets:
             return []
+        return list(self.join_tree(base_dataset, required_datasets).steps)
 
-        joined: Set[str] = {base_dataset}
-        join_steps: List[JoinStep] = []
-
-        for target in sorted(required_datasets - {base_dataset}):
-            path = self._find_path(base_dataset, target)
-            for relationship in path:
-                left, right = relationship.source_dataset, relationship.target_dataset
-                if left in joined and right in joined:
-                    continue
-                if left in joined:
-                    join_steps.append(JoinStep(relationship=relationship, left_dataset=left, right_dataset=right))
-                    joined.add(right)
-                elif right in joined:
-                    join_steps.append(JoinStep(relationship=relationship, left_dataset=right, right_dataset=left))
-                    joined.add(left)
-                else:
-                    raise JoinPathError(
-                        f"Join path for '{target}' does not connect to joined tables."
-                    )
+    def join_tree(self, base_dataset: str, required_datasets: Iterable[str]) -> JoinTree:
+        key = (base_dataset, frozenset(required_datasets))
+        with self._lock:
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+                return tree
+        tree = self._build_join_tree(base_dataset, key[1])
+        with self._lock:
+            self._trees[key] = tree
+            while len(self._trees) > self._max_cached_trees:
+                self._trees.popitem(last=False)
+        return tree
 
-        return join_steps
+    def path(self, start: str, target: str) -> List[Relationship]:
+        if start == target:
+            return []
+        path = self._paths.get((start, target))
+        if path is None:
+            raise JoinPathError(f"No join path between '{start}' and '{target}'.")
+        return list(path)
 
     def _build_graph(self) -> None:
         for relationship in self._relationships:
             self._adjacency.setdefault(relationship.source_dataset, []).append((relationship.target_dataset, relationship))
             self._adjacency.setdefault(relationship.target_dataset, []).append((relationship.source_dataset, relationship))
 
-    def _find_path(self, start: str, target: str) -> List[Relationship]:
-        if start == target:
-            return []
+    def _build_path_index(self) -> None:
+        for start in self._adjacency:
+            for target, path in self._paths_from(start).items():
+                self._paths[(start, target)] = path
 
-        visited: Set[str] = {start}
-        queue: deque[Tuple[str, List[Relationship]]] = deque()
-        queue.append((start, []))
+    def _paths_from(self, start: str) -> Dict[str, Tuple[Relationship, ...]]:
+        # Breadth-first, so each dataset is first reached at its shortest distance;
+        # later predecessors at the same distance replace the path only when it
+        # crosses fewer fan-out joins.
+        depth: Dict[str, int] = {start: 0}
+        fan_outs: Dict[str, int] = {start: 0}
+        paths: Dict[str, Tuple[Relationship, ...]] = {start: ()}
+        queue: deque[str] = deque([start])
 
         while queue:
-            current, path = queue.popleft()
+            current = queue.popleft()
             for neighbor, relationship in self._adjacency.get(current, []):
-                if neighbor in visited:
+                candidate_fan_outs = fan_outs[current] + int(_fans_out(relationship, current))
+                if neighbor not in depth:
+                    depth[neighbor] = depth[current] + 1
+                    fan_outs[neighbor] = candidate_fan_outs
+                    paths[neighbor] = paths[current] + (relationship,)
+                    queue.append(neighbor)
+                elif depth[neighbor] == depth[current] + 1 and candidate_fan_outs < fan_outs[neighbor]:
+                    fan_outs[neighbor] = candidate_fan_outs
+                    paths[neighbor] = paths[current] + (relationship,)
+
+        paths.pop(start)
+        return paths
+
+    def _build_join_tree(self, base_dataset: str, required_datasets: FrozenSet[str]) -> JoinTree:
+        # Grow the tree one required dataset at a time, always attaching the one
+        # closest to any dataset already in it.
+        tree_nodes: List[str] = [base_dataset]
+        tree_edges: List[Relationship] = []
+        remaining = sorted(required_datasets - {base_dataset})
+        while remaining:
+            best: Optional[Tuple[int, str, str]] = None
+            for target in remaining:
+                for node in tree_nodes:
+                    path = self._paths.get((node, target))
+                    if path is not None and (best is None or len(path) < best[0]):
+                        best = (len(path), node, target)
+            if best is None:
+                raise JoinPathError(f"No join path between '{base_dataset}' and '{remaining[0]}'.")
+            _, node, target = best
+            current = node
+            for relationship in self._paths[(node, target)]:
+                following = (
+                    relationship.target_dataset
+                    if relationship.source_dataset == current
+                    else relationship.source_dataset
+                )
+                if following not in tree_nodes:
+                    tree_nodes.append(following)
+                    tree_edges.append(relationship)
+                current = following
+            remaining = [dataset for dataset in remaining if dataset not in tree_nodes]
+
+        steps = self._order_steps(base_dataset, required_datasets, tree_edges)
+        return JoinTree(
+            base_dataset=base_dataset,
+            steps=steps,
+            fan_out_datasets=frozenset(step.right_dataset for step in steps if step.fans_out),
+            chasm_trap=self._has_chasm_trap(steps),
+        )
+
+    @staticmethod
+    def _order_steps(
+        base_dataset: str,
+        required_datasets: FrozenSet[str],
+        edges: List[Relationship],
+    ) -> Tuple[JoinStep, ...]:
+        # Emit joins target by target, in name order, walking the tree from the base.
+        parent: Dict[str, JoinStep] = {}
+        reached: Set[str] = {base_dataset}
+        frontier: deque[str] = deque([base_dataset])
+        while frontier:
+            current = frontier.popleft()
+            for relationship in edges:
+                if relationship.source_dataset == current:
+                    neighbor = relationship.target_dataset
+                elif relationship.target_dataset == current:
+                    neighbor = relationship.source_dataset
+                else:
+                    continue
+                if neighbor in reached:
                     continue
-                if neighbor == target:
-                    return path + [relationship]
-                visited.add(neighbor)
-                queue.append((neighbor, path + [relationship]))
+                reached.add(neighbor)
+                parent[neighbor] = JoinStep(relationship=relationship, left_dataset=current, right_dataset=neighbor)
+                frontier.append(neighbor)
+
+        joined: Set[str] = {base_dataset}
+        steps: List[JoinStep] = []
+        for target in sorted(required_datasets - {base_dataset}):
+            branch: List[JoinStep] = []
+            current = target
+            while current not in joined:
+                step = parent[current]
+                branch.append(step)
+                current = step.left_dataset
+            for step in reversed(branch):
+                steps.append(step)
+                joined.add(step.right_dataset)
+        return tuple(steps)
+
+    @staticmethod
+    def _has_chasm_trap(steps: Tuple[JoinStep, ...]) -> bool:
+        parent = {step.right_dataset: step.left_dataset for step in steps}
+
+        def _ancestors(dataset: str) -> Set[str]:
+            found: Set[str] = set()
+            while dataset in parent:
+                dataset = parent[dataset]
+                found.add(dataset)
+            return found
+
+        steps_by_target = {step.right_dataset: step for step in steps}
+
+        def _climbs_before(dataset: str) -> bool:
+            while dataset in steps_by_target:
+                step = steps_by_target[dataset]
+                if _climbs(step.relationship, step.left_dataset):
+                    return True
+                dataset = step.left_dataset
+            return False
 
-        raise JoinPathError(f"No join path between '{start}' and '{target}'.")
+        fan_out_targets = [step.right_dataset for step in steps if step.fans_out]
+        if any(_climbs_before(steps_by_target[target].left_dataset) for target in fan_out_targets):
+            return True
+        for index, first in enumerate(fan_out_targets):
+            for second in fan_out_targets[index + 1:]:
+                if first not in _ancestors(second) and second not in _ancestors(first):
+                    return True
+        return False
@@ -0,0 +1,414 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langbridge.semantic.errors import SemanticModelError
+from langbridge.semantic.model import Dataset, Dimension, Measure, PreAggregation, SemanticModel
+
+from .compiled_model import CompiledSemanticModel
+from .engine import SemanticQueryEngine
+from .query_model import FilterItem, SemanticQuery, TimeDimension
+from .resolver import MeasureRef, MetricRef
+
+PRE_AGGREGATION_DATASET = "pre_aggregation"
+
+_GRANULARITY_RANK = {
+    "second": 0,
+    "minute": 1,
+    "hour": 2,
+    "day": 3,
+    "week": 4,
+    "month": 5,
+    "quarter": 6,
+    "year": 7,
+}
+_SUB_DAY_OR_DAY = {"second", "minute", "hour", "day"}
+# Buckets of the key granularity are unions of whole buckets of these granularities.
+_CALENDAR_ROLLUPS = {("month", "quarter"), ("month", "year"), ("quarter", "year")}
+# Measures whose partial aggregates combine with another aggregate.
+_REAGGREGATION = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DAY_ALIGNED_PRESETS = {
+    "today",
+    "yesterday",
+    "tomorrow",
+    "last 7 days",
+    "last 30 days",
+    "month to date",
+    "year to date",
+}
+_DAY_ALIGNED_RELATIVE = re.compile(r"^(?:(?:last|next) \d+ days?|(?:this|last|next) (?:week|month|quarter|year))$")
+_DAY_ALIGNED_OPERATOR = re.compile(r"^(?:before|on)\s*:\s*(\d{4}-\d{2}-\d{2})$", re.IGNORECASE)
+_DATE_FILTER_OPERATORS = {"indaterange", "notindaterange", "beforedate"}
+
+
+@dataclass(frozen=True)
+class PreAggregationColumns:
+    """Column names of a materialized rollup, as the semantic query that builds it returns them."""
+
+    dimensions: Dict[str, str]
+    time: Optional[str]
+    measures: Dict[str, str]
+
+    @property
+    def names(self) -> List[str]:
+        return [*self.dimensions.values(), *([self.time] if self.time else []), *self.measures.values()]
+
+
+@dataclass(frozen=True)
+class PreAggregationMatch:
+    """
+    How to answer a semantic query from a rollup.
+
+    `query` runs against `model`, a one-dataset semantic model over the rollup
+    (`PRE_AGGREGATION_DATASET`); its result columns are renamed with `columns` to
+    the ones the original query returns. `reaggregations` maps each output measure
+    column to the aggregate that combines partial results, and is empty when a
+    measure cannot be combined.
+    """
+
+    name: str
+    definition: PreAggregation
+    model: SemanticModel
+    query: SemanticQuery
+    columns: Dict[str, str]
+    reaggregations: Dict[str, str]
+    order: List[Tuple[str, str]]
+
+
+def measure_aggregation(measure: MeasureRef) -> str:
+    aggregation = (measure.aggregation or "").strip().lower()
+    if aggregation:
+        return aggregation
+    # Mirrors the translator's default.
+    return "sum" if (measure.data_type or "").lower() in {"integer", "decimal", "float", "number"} else "count"
+
+
+def pre_aggregation_query(
+    definition: PreAggregation,
+    *,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> SemanticQuery:
+    """The semantic query that materializes `definition`, optionally for `[since, until)`."""
+    time_dimensions: List[TimeDimension] = []
+    filters: List[FilterItem] = []
+    if definition.time_dimension:
+        time_dimensions.append(
+            TimeDimension(dimension=definition.time_dimension, granularity=definition.granularity)
+        )
+        if since is not None:
+            filters.append(
+                FilterItem(time_dimension=definition.time_dimension, operator="gte", values=[since.isoformat()])
+            )
+        if until is not None:
+            filters.append(
+                FilterItem(time_dimension=definition.time_dimension, operator="lt", values=[until.isoformat()])
+            )
+    return SemanticQuery(
+        measures=list(definition.measures),
+        dimensions=list(definition.dimensions),
+        time_dimensions=time_dimensions,
+        filters=filters,
+    )
+
+
+def pre_aggregation_columns(definition: PreAggregation, model: CompiledSemanticModel) -> PreAggregationColumns:
+    """Columns of the rollup, keyed by the canonical `dataset.member` they hold."""
+    resolver = model.resolver
+    metadata = SemanticQueryEngine().build_result_metadata(pre_aggregation_query(definition), model)
+    columns = iter(item["column"] for item in metadata)
+    dimensions = {_dimension_key(resolver, member): next(columns) for member in definition.dimensions}
+    time = next(columns) if definition.time_dimension else None
+    measures = {_measure_key(resolver, member): next(columns) for member in definition.measures}
+    return PreAggregationColumns(dimensions=dimensions, time=time, measures=measures)
+
+
+def match_pre_aggregation(
+    query: SemanticQuery,
+    model: CompiledSemanticModel,
+    *,
+    candidates: Optional[Sequence[str]] = None,
+) -> Optional[PreAggregationMatch]:
+    """
+    The rollup that can answer `query`, preferring the one with the fewest rows.
+
+    A rollup answers a query when it holds every requested measure and dimension,
+    every filter is on one of its dimensions, and the requested time granularity is
+    a union of its buckets. Date ranges and date filters are only served by rollups
+    bucketed by day or finer, and only when the range starts and ends on a day
+    boundary. Additive measures (sum, count, min, max) are re-aggregated to coarser
+    grains; other measures need the query to ask for exactly the rollup's grain.
+    """
+    definitions = model.model.pre_aggregations or {}
+    names = [name for name in (candidates if candidates is not None else definitions) if name in definitions]
+    ranked = sorted(
+        names,
+        key=lambda name: (
+            len(definitions[name].dimensions),
+            -_GRANULARITY_RANK.get(definitions[name].granularity or "year", 8),
+        ),
+    )
+    for name in ranked:
+        try:
+            match = _match(name, definitions[name], query, model)
+        except SemanticModelError:
+            match = None
+        if match is not None:
+            return match
+    return None
+
+
+def _match(
+    name: str,
+    definition: PreAggregation,
+    query: SemanticQuery,
+    model: CompiledSemanticModel,
+) -> Optional[PreAggregationMatch]:
+    if query.segments or query.timezone:
+        return None
+    resolver = model.resolver
+    columns = pre_aggregation_columns(definition, model)
+    time_key = _dimension_key(resolver, definition.time_dimension) if definition.time_dimension else None
+    rollup_dimensions: Dict[str, Dimension] = {}
+    rollup_measures: Dict[str, Measure] = {}
+    reaggregations: Dict[str, str] = {}
+
+    dimensions: List[str] = []
+    for member in query.dimensions:
+        column = columns.dimensions.get(_dimension_key(resolver, member))
+        if column is None:
+            return None
+        dimensions.append(f"{PRE_AGGREGATION_DATASET}.{column}")
+
+    time_dimensions: List[TimeDimension] = []
+    if len(query.time_dimensions) > 1:
+        return None
+    query_granularity: Optional[str] = None
+    for time_dimension in query.time_dimensions:
+        if time_key is None or _dimension_key(resolver, time_dimension.dimension) != time_key:
+            return None
+        query_granularity = time_dimension.granularity
+        if query_granularity is None or time_dimension.compare_date_range is not None:
+            return None
+        if not _rolls_up(definition.granularity or "", query_granularity):
+            return None
+        if time_dimension.date_range is not None and not _serves_date_range(definition, time_dimension.date_range):
+            return None
+        time_dimensions.append(
+            TimeDimension(
+                dimension=f"{PRE_AGGREGATION_DATASET}.{columns.time}",
+                granularity=query_granularity,
+                date_range=time_dimension.date_range,
+            )
+        )
+
+    exact_grain = (
+        sorted(_dimension_key(resolver, member) for member in query.dimensions) == sorted(columns.dimensions)
+        and query_granularity == definition.granularity
+    )
+    measures: List[str] = []
+    measure_columns: List[str] = []
+    for member in query.measures:
+        resolved = resolver.resolve_measure_or_metric(member)
+        if isinstance(resolved, MetricRef):
+            return None
+        column = columns.measures.get(f"{resolved.dataset}.{resolved.column}")
+        if column is None:
+            return None
+        reaggregation = _REAGGREGATION.get(measure_aggregation(resolved))
+        if reaggregation is None and not exact_grain:
+            return None
+        # At the rollup's own grain each group is a single row, so any aggregate reads it back.
+        rollup_measures[column] = Measure(name=column, type=resolved.data_type or "number", aggregation=reaggregation or "max")
+        if reaggregation is not None:
+            reaggregations[column] = reaggregation
+        measures.append(f"{PRE_AGGREGATION_DATASET}.{column}")
+        measure_columns.append(column)
+
+    filters: List[FilterItem] = []
+    for item in query.filters:
+        member = item.member or item.dimension or item.time_dimension
+        if not member or item.measure:
+            return None
+        key = _dimension_key(resolver, member)
+        if key == time_key:
+            if not _serves_date_filter(definition, item):
+                return None
+            column = columns.time
+        else:
+            column = columns.dimensions.get(key)
+        if column is None:
+            return None
+        filters.append(
+            FilterItem(
+                dimension=f"{PRE_AGGREGATION_DATASET}.{column}",
+                operator=item.operator,
+                values=item.values,
+            )
+        )
+
+    for key, column in columns.dimensions.items():
+        rollup_dimensions[column] = Dimension(name=column, type=resolver.resolve_dimension(key).data_type or "string")
+    if columns.time is not None and time_key is not None:
+        rollup_dimensions[columns.time] = Dimension(
+            name=columns.time,
+            type=resolver.resolve_dimension(time_key).data_type or "timestamp",
+        )
+    rollup_model = SemanticModel(
+        version="1.0",
+        name=f"{model.model.name or 'semantic_model'}__{name}",
+        datasets={
+            PRE_AGGREGATION_DATASET: Dataset(
+                relation_name=PRE_AGGREGATION_DATASET,
+                dimensions=list(rollup_dimensions.values()),
+                measures=list(rollup_measures.values()),
+            )
+        },
+    )
+    rollup_query = SemanticQuery(
+        measures=measures,
+        dimensions=dimensions,
+        time_dimensions=time_dimensions,
+        filters=filters,
+        limit=query.limit,
+        offset=query.offset,
+    )
+
+    engine = SemanticQueryEngine()
+    original = [item["column"] for item in engine.build_result_metadata(query, model)]
+    rewritten = [item["column"] for item in engine.build_result_metadata(rollup_query, rollup_model)]
+    outputs = dict(zip(original, rewritten))
+    order = _order_columns(query, model)
+    if order is None:
+        return None
+    rollup_query = rollup_query.model_copy(
+        update={"order": [{outputs[column]: direction} for column, direction in order] or None}
+    )
+    combinable = len(reaggregations) == len(measures)
+    return PreAggregationMatch(
+        name=name,
+        definition=definition,
+        model=rollup_model,
+        query=rollup_query,
+        columns=dict(zip(rewritten, original)),
+        reaggregations={
+            column: reaggregations[rollup_column]
+            for column, rollup_column in zip(original[len(original) - len(measures):], measure_columns)
+        }
+        if combinable
+        else {},
+        order=order,
+    )
+
+
+def _order_columns(query: SemanticQuery, model: CompiledSemanticModel) -> Optional[List[Tuple[str, str]]]:
+    """`(output column, direction)` for each order item, or None if one is not an output column."""
+    resolver = model.resolver
+    engine = SemanticQueryEngine()
+    metadata = engine.build_result_metadata(query, model)
+    by_member: Dict[str, str] = {}
+    for item, source in zip(metadata, _metadata_sources(query)):
+        by_member[item["column"]] = item["column"]
+        by_member[source] = item["column"]
+    for time_dimension, item in zip(query.time_dimensions, metadata[len(query.dimensions):]):
+        if time_dimension.granularity:
+            by_member[f"{item['source']}.{time_dimension.granularity}"] = item["column"]
+
+    ordered: List[Tuple[str, str]] = []
+    for member, direction in _order_items(query.order):
+        column = by_member.get(member)
+        if column is None:
+            for canonical in (_try_dimension_key(resolver, member), _try_measure_key(resolver, member)):
+                if canonical is not None and canonical in by_member:
+                    column = by_member[canonical]
+                    break
+        if column is None:
+            return None
+        ordered.append((column, direction))
+    return ordered
+
+
+def _metadata_sources(query: SemanticQuery) -> List[str]:
+    return [
+        *query.dimensions,
+        *(time_dimension.dimension for time_dimension in query.time_dimensions),
+        *query.measures,
+    ]
+
+
+def _order_items(order: Any) -> List[Tuple[str, str]]:
+    if order is None:
+        return []
+    entries: List[Tuple[Any, Any]] = []
+    if isinstance(order, dict):
+        entries.extend(order.items())
+    elif isinstance(order, list):
+        for entry in order:
+            if isinstance(entry, dict):
+                entries.extend(entry.items())
+            elif isinstance(entry, (list, tuple)) and len(entry) == 2:
+                entries.append((entry[0], entry[1]))
+    return [
+        (str(member), "desc" if str(direction or "asc").strip().lower() == "desc" else "asc")
+        for member, direction in entries
+    ]
+
+
+def _rolls_up(source: str, target: str) -> bool:
+    if source == target:
+        return True
+    if source in _SUB_DAY_OR_DAY and target in _GRANULARITY_RANK:
+        return _GRANULARITY_RANK[target] > _GRANULARITY_RANK[source]
+    return (source, target) in _CALENDAR_ROLLUPS
+
+
+def _serves_date_range(definition: PreAggregation, date_range: Any) -> bool:
+    if definition.granularity not in _SUB_DAY_OR_DAY:
+        return False
+    if isinstance(date_range, (list, tuple)):
+        return len(date_range) == 2 and all(isinstance(value, str) and _ISO_DATE.match(value.strip()) for value in date_range)
+    if isinstance(date_range, str):
+        normalized = re.sub(r"\s+", " ", re.sub(r"[_-]+", " ", date_range.strip().lower())).strip()
+        return (
+            normalized in _DAY_ALIGNED_PRESETS
+            or _DAY_ALIGNED_RELATIVE.match(normalized) is not None
+            or _DAY_ALIGNED_OPERATOR.match(date_range.strip()) is not None
+        )
+    return False
+
+
+def _serves_date_filter(definition: PreAggregation, item: FilterItem) -> bool:
+    operator = item.operator.strip().lower()
+    values = list(item.values or [])
+    if operator not in _DATE_FILTER_OPERATORS or not values:
+        return False
+    if operator == "beforedate":
+        return definition.granularity in _SUB_DAY_OR_DAY and all(_ISO_DATE.match(str(value).strip()) for value in values)
+    return _serves_date_range(definition, values[0] if len(values) == 1 else values)
+
+
+def _dimension_key(resolver: Any, member: str) -> str:
+    ref = resolver.resolve_dimension(member)
+    return f"{ref.dataset}.{ref.column}"
+
+
+def _measure_key(resolver: Any, member: str) -> str:
+    ref = resolver.resolve_measure(member)
+    return f"{ref.dataset}.{ref.column}"
+
+
+def _try_dimension_key(resolver: Any, member: str) -> Optional[str]:
+    try:
+        return _dimension_key(resolver, member)
+    except SemanticModelError:
+        return None
+
+
+def _try_measure_key(resolver: Any, member: str) -> Optional[str]:
+    try:
+        return _measure_key(resolver, member)
+    except SemanticModelError:
+        return None
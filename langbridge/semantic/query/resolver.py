@@ -158,7 +158,7 @@ class SemanticModelResolver:
         return None
 
     def _resolve_dimension(self, member: str) -> Tuple[str, Dimension]:
-        self._logger.info("Resolving dimension: %s in dimensions: %s", member, self._dimensions_by_key.keys())
+        self._logger.debug("Resolving dimension: %s in dimensions: %s", member, self._dimensions_by_key.keys())
         if "." in member:
             dimension = self._dimensions_by_key.get(member)
             if dimension is None:
@@ -183,7 +183,7 @@ class SemanticModelResolver:
         return dataset, dimension
 
     def _resolve_measure(self, member: str) -> Tuple[str, Measure]:
-        self._logger.info("Resolving measure: %s in measures: %s", member, self._measures_by_key.keys())
+        self._logger.debug("Resolving measure: %s in measures: %s", member, self._measures_by_key.keys())
         if "." in member:
             measure = self._measures_by_key.get(member)
             if measure is None:
@@ -208,7 +208,7 @@ class SemanticModelResolver:
         return dataset, measure
 
     def _resolve_filter(self, segment: str) -> Tuple[str, str, DatasetFilter]:
-        self._logger.info("Resolving filter: %s in filters: %s", segment, self._filters_by_key.keys())
+        self._logger.debug("Resolving filter: %s in filters: %s", segment, self._filters_by_key.keys())
         if "." in segment:
             dataset_filter = self._filters_by_key.get(segment)
             if dataset_filter is None:
@@ -7,7 +7,8 @@ import sqlglot
 from sqlglot import exp
 
 from langbridge.semantic.errors import SemanticModelError, SemanticQueryError
-from .join_planner import JoinPlanner
+from .compiled_model import CompiledSemanticModel
+from .join_planner import JoinTree
 from langbridge.semantic.model import SemanticModel
 from langbridge.semantic.loader import load_semantic_model
 from .query_model import FilterItem, SemanticQuery
@@ -44,7 +45,7 @@ class TsqlSemanticTranslator:
     def translate(
         self,
         query: SemanticQuery | Dict[str, Any],
-        model: SemanticModel,
+        model: SemanticModel | CompiledSemanticModel,
         dialect: str = "tsql",
     ) -> exp.Select:
         self._dialect = (dialect or "tsql").lower()
@@ -53,7 +54,9 @@ class TsqlSemanticTranslator:
         else:
             parsed = SemanticQuery.model_validate(query)
 
-        resolver = SemanticModelResolver(model)
+        compiled = model if isinstance(model, CompiledSemanticModel) else CompiledSemanticModel.compile(model)
+        model = compiled.model
+        resolver = compiled.resolver
         dimensions = [resolver.resolve_dimension(member) for member in parsed.dimensions]
         time_dimensions = [
             TimeDimensionRef(
@@ -99,7 +102,9 @@ class TsqlSemanticTranslator:
         if base_dataset not in required_datasets:
             required_datasets.add(base_dataset)
 
-        join_steps = JoinPlanner(model.relationships).plan(base_dataset, required_datasets)
+        join_tree = compiled.join_planner.join_tree(base_dataset, required_datasets)
+        self._check_multiplied_measures(resolver, join_tree, measures, metrics)
+        join_steps = list(join_tree.steps)
         alias_map = self._build_alias_map(base_dataset, join_steps)
 
         #TODO: implement ctes. Currently we just inline everything which works but can lead to duplicated expressions and subqueries. We can start by implementing CTEs for joined tables and then expand to more complex expressions if needed.
@@ -174,6 +179,24 @@ class TsqlSemanticTranslator:
 
         return required_datasets
 
+    @staticmethod
+    def _check_multiplied_measures(
+        resolver: SemanticModelResolver,
+        join_tree: JoinTree,
+        measures: Sequence[MeasureRef],
+        metrics: Sequence[MetricRef],
+    ) -> None:
+        # Across a chasm trap every aggregated row is repeated once per row of the
+        # other to-many branch, so no measure can be computed from the joined rows.
+        aggregated: Set[str] = {measure.dataset for measure in measures}
+        for metric in metrics:
+            aggregated.update(resolver.extract_datasets_from_expression(metric.expression))
+        if join_tree.chasm_trap and aggregated:
+            raise SemanticQueryError(
+                f"Measures on {', '.join(sorted(aggregated))} would be multiplied by the to-many joins to "
+                f"{', '.join(sorted(join_tree.fan_out_datasets))}; query each of them separately."
+            )
+
     def _choose_base_dataset(
         self,
         dimensions: Sequence[DimensionRef],
@@ -363,7 +386,7 @@ class TsqlSemanticTranslator:
             if alias:
                 clauses.append(
                     exp.Ordered(
-                        this=exp.Identifier(this=alias, quoted=True),
+                        this=exp.column(alias, quoted=True),
                         desc=item.direction == "DESC",
                     )
                 )
@@ -735,6 +758,10 @@ class TsqlSemanticTranslator:
             first, remainder = schema.split(".", 1)
             catalog = first or None
             schema = remainder
+        if catalog and not schema:
+            # `catalog.table` renders as a two-part name, which reads back as
+            # `schema.table`; build the tree that way so it plans without a re-parse.
+            catalog, schema = None, catalog
 
         return exp.table_(
             dataset.get_relation_name(dataset_key),
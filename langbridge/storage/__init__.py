@@ -0,0 +1,29 @@
+"""
+Local dataset storage shared by the runtime and the federation engine.
+
+Only depends on pyarrow, so federation can read dataset tables without
+importing the runtime.
+"""
+
+from langbridge.storage.dataset_table import (
+    DatasetTable,
+    DatasetTableConflictError,
+    PartitionSpec,
+    StatsPredicate,
+    TableSnapshot,
+    find_dataset_tables,
+    is_dataset_table,
+)
+from langbridge.storage.parquet_stream import StreamingParquetResult, StreamingParquetWriter
+
+__all__ = [
+    "DatasetTable",
+    "DatasetTableConflictError",
+    "PartitionSpec",
+    "StatsPredicate",
+    "StreamingParquetResult",
+    "StreamingParquetWriter",
+    "TableSnapshot",
+    "find_dataset_tables",
+    "is_dataset_table",
+]
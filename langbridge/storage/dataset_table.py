@@ -0,0 +1,941 @@
+import base64
+import json
+import os
+import re
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from langbridge.storage.parquet_stream import DEFAULT_BATCH_ROWS, conform_batch
+
+FORMAT_VERSION = 1
+DEFAULT_RETAIN_SNAPSHOTS = 5
+DEFAULT_TARGET_FILE_ROWS = 1_000_000
+
+_MANIFEST_DIR = "_manifest"
+_CURRENT_POINTER = "CURRENT"
+_DATA_DIR = "data"
+_DELETES_DIR = "deletes"
+_STAGING_DIR = "_staging"
+_MANIFEST_NAME = re.compile(r"^v(\d+)\.json$")
+_PARTITION_EXPRESSION = re.compile(r"^\s*(year|month|day)\s*\(\s*([^)]+?)\s*\)\s*$", re.IGNORECASE)
+# ISO-8601 prefix lengths for the time transforms; timestamps are cast to strings first.
+_TRANSFORM_PREFIX = {"year": 4, "month": 7, "day": 10}
+_NULL_PARTITION = "__null__"
+_DUCKDB_TYPES = {
+    "int8": "TINYINT",
+    "int16": "SMALLINT",
+    "int32": "INTEGER",
+    "int64": "BIGINT",
+    "uint8": "UTINYINT",
+    "uint16": "USMALLINT",
+    "uint32": "UINTEGER",
+    "uint64": "UBIGINT",
+    "halffloat": "FLOAT",
+    "float": "FLOAT",
+    "double": "DOUBLE",
+    "bool": "BOOLEAN",
+    "string": "VARCHAR",
+    "large_string": "VARCHAR",
+    "binary": "BLOB",
+    "large_binary": "BLOB",
+    "null": "VARCHAR",
+}
+# Type names as written by `str(pa.DataType)`, for manifests that predate the serialized schema.
+_ARROW_TYPE_NAMES = {
+    "int8": pa.int8(),
+    "int16": pa.int16(),
+    "int32": pa.int32(),
+    "int64": pa.int64(),
+    "uint8": pa.uint8(),
+    "uint16": pa.uint16(),
+    "uint32": pa.uint32(),
+    "uint64": pa.uint64(),
+    "halffloat": pa.float16(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "bool": pa.bool_(),
+    "string": pa.string(),
+    "large_string": pa.large_string(),
+    "binary": pa.binary(),
+    "large_binary": pa.large_binary(),
+    "null": pa.null(),
+    "date32[day]": pa.date32(),
+    "date64[ms]": pa.date64(),
+}
+_TIMESTAMP_TYPE_NAME = re.compile(r"^timestamp\[(s|ms|us|ns)(?:, tz=(.+))?\]$")
+_TIME_TYPE_NAME = re.compile(r"^time(32|64)\[(s|ms|us|ns)\]$")
+_DECIMAL_TYPE_NAME = re.compile(r"^decimal(128|256)\((\d+), (\d+)\)$")
+
+_table_locks: dict[str, threading.Lock] = {}
+_table_locks_guard = threading.Lock()
+
+
+class DatasetTableConflictError(RuntimeError):
+    """Raised when another writer committed the snapshot version this commit expected to create."""
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionSpec:
+    """Partitioning of data files by one column, either by value or by a time bucket."""
+
+    column: str
+    transform: str = "identity"
+
+    def __post_init__(self) -> None:
+        if not str(self.column or "").strip():
+            raise ValueError("Partition specs require a column.")
+        if self.transform not in {"identity", *_TRANSFORM_PREFIX}:
+            raise ValueError(f"Unsupported partition transform '{self.transform}'.")
+
+    @classmethod
+    def parse(cls, value: str | None) -> "PartitionSpec | None":
+        """Parse `column`, `year(column)`, `month(column)` or `day(column)`."""
+        text = str(value or "").strip()
+        if not text:
+            return None
+        match = _PARTITION_EXPRESSION.match(text)
+        if match is not None:
+            return cls(column=match.group(2), transform=match.group(1).lower())
+        return cls(column=text)
+
+    def partition_values(self, batch: pa.RecordBatch | pa.Table) -> pa.Array:
+        index = batch.schema.get_field_index(self.column)
+        if index < 0:
+            return pa.array([_NULL_PARTITION] * batch.num_rows, type=pa.string())
+        column = batch.column(index)
+        if isinstance(column, pa.ChunkedArray):
+            column = column.combine_chunks()
+        values = column.cast(pa.string())
+        if self.transform != "identity":
+            values = pc.utf8_slice_codeunits(values, 0, _TRANSFORM_PREFIX[self.transform])
+        return pc.fill_null(values, _NULL_PARTITION)
+
+    def to_json(self) -> dict[str, str]:
+        return {"column": self.column, "transform": self.transform}
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any] | None) -> "PartitionSpec | None":
+        if not payload:
+            return None
+        return cls(column=str(payload["column"]), transform=str(payload.get("transform") or "identity"))
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnStats:
+    min: Any = None
+    max: Any = None
+    null_count: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class DataFile:
+    path: str
+    row_count: int
+    size_bytes: int
+    partition: str | None = None
+    column_stats: dict[str, ColumnStats] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class DeleteFile:
+    """Positional deletes: `(file, pos)` rows naming data file rows superseded by later snapshots."""
+
+    path: str
+    # Deleted row count per referenced data file.
+    referenced_files: dict[str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class StatsPredicate:
+    """A `column <operator> value` comparison used to skip data files by their min/max stats."""
+
+    column: str
+    # One of "eq", "in", "gt", "gte", "lt", "lte". `value` is a list for "in".
+    operator: str
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class TableSnapshot:
+    snapshot_id: int
+    parent_snapshot_id: int | None
+    operation: str
+    created_at: str
+    schema: pa.Schema
+    partition_spec: PartitionSpec | None
+    primary_key: str | None
+    data_files: tuple[DataFile, ...]
+    delete_files: tuple[DeleteFile, ...]
+
+    @property
+    def row_count(self) -> int:
+        live = {data_file.path for data_file in self.data_files}
+        deleted = sum(
+            count
+            for delete_file in self.delete_files
+            for path, count in delete_file.referenced_files.items()
+            if path in live
+        )
+        return sum(data_file.row_count for data_file in self.data_files) - deleted
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(data_file.size_bytes for data_file in self.data_files)
+
+    def prune(self, predicates: Iterable[StatsPredicate]) -> tuple[DataFile, ...]:
+        """Data files whose column stats do not rule out every row for the conjunction of `predicates`."""
+        predicates = list(predicates)
+        if not predicates:
+            return self.data_files
+        return tuple(
+            data_file
+            for data_file in self.data_files
+            if all(_may_match(data_file, predicate) for predicate in predicates)
+        )
+
+
+class DatasetTable:
+    """
+    Append-only Parquet table: immutable data files plus versioned JSON manifests.
+
+    Every commit writes `_manifest/v<N>.json` holding the serialized Arrow schema and
+    listing the live data files (with row counts and per-column min/max/null stats)
+    and positional delete files, then moves
+    the `_manifest/CURRENT` pointer to it. Readers resolve the pointer once and read
+    that snapshot, so a concurrent append or compaction never changes what an
+    in-flight scan sees. Upserts append the new rows and a delete file naming the
+    positions they supersede instead of rewriting existing files; `compact` later folds
+    small files and their deletes into files of about `target_file_rows` rows.
+
+    Files only referenced by snapshots older than the last `retain_snapshots` are
+    removed after each commit. Commits are serialized per table within the process;
+    a second process committing the same version raises `DatasetTableConflictError`.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        partition_spec: PartitionSpec | None = None,
+        retain_snapshots: int = DEFAULT_RETAIN_SNAPSHOTS,
+    ) -> None:
+        self._root = Path(root)
+        self._partition_spec = partition_spec
+        self._retain_snapshots = max(1, int(retain_snapshots))
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def partition_spec(self) -> PartitionSpec | None:
+        return self._partition_spec
+
+    def exists(self) -> bool:
+        return (self._root / _MANIFEST_DIR / _CURRENT_POINTER).is_file()
+
+    def current_snapshot(self) -> TableSnapshot | None:
+        try:
+            manifest_name = (self._root / _MANIFEST_DIR / _CURRENT_POINTER).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+        return self._read_manifest(self._root / _MANIFEST_DIR / manifest_name)
+
+    def load_snapshot(self, snapshot_id: int) -> TableSnapshot:
+        return self._read_manifest(self._root / _MANIFEST_DIR / _manifest_name(snapshot_id))
+
+    def staging_path(self) -> Path:
+        """A fresh path for writers to stage a file before it is committed."""
+        return self._root / _STAGING_DIR / f"part-{uuid.uuid4().hex}.parquet"
+
+    def overwrite(
+        self,
+        staged: Path | Sequence[Path],
+        *,
+        schema: pa.Schema,
+        primary_key: str | None = None,
+    ) -> TableSnapshot:
+        """Replace the table contents with the staged file (or files, committed as one snapshot)."""
+        staged_files = [staged] if isinstance(staged, Path) else list(staged)
+        with self._lock():
+            base = self._adopt(self.current_snapshot())
+            data_files = [data_file for path in staged_files for data_file in self._add_data_files(path)]
+            return self._commit(
+                base=base,
+                operation="overwrite",
+                schema=schema,
+                primary_key=primary_key,
+                data_files=data_files,
+                delete_files=[],
+            )
+
+    def append(
+        self,
+        staged: Path,
+        *,
+        schema: pa.Schema,
+        primary_key: str | None = None,
+        replaced_identities: pa.Array | None = None,
+        identity: Callable[[pa.RecordBatch], pa.Array] | None = None,
+        identity_columns: Sequence[str] = (),
+        replaced_predicates: Iterable[StatsPredicate] = (),
+    ) -> TableSnapshot:
+        """
+        Append the staged file; with `replaced_identities`, also supersede live rows.
+
+        `identity` maps a batch holding `identity_columns` to one identity per row; live
+        rows whose identity is in `replaced_identities` are recorded in a new delete file.
+        Only the identity columns of existing files are read, and only of files whose
+        stats `replaced_predicates` (e.g. the replaced keys' range) do not rule out.
+        """
+        with self._lock():
+            base = self._adopt(self.current_snapshot())
+            delete_files = list(base.delete_files) if base is not None else []
+            if base is not None and identity is not None and replaced_identities is not None and len(replaced_identities):
+                delete_file = self._write_deletes(
+                    base,
+                    replaced_identities=replaced_identities,
+                    identity=identity,
+                    identity_columns=identity_columns,
+                    predicates=replaced_predicates,
+                )
+                if delete_file is not None:
+                    delete_files.append(delete_file)
+            data_files = [*(base.data_files if base is not None else ()), *self._add_data_files(staged)]
+            return self._commit(
+                base=base,
+                operation="append",
+                schema=schema,
+                primary_key=primary_key,
+                data_files=data_files,
+                delete_files=delete_files,
+            )
+
+    def compact(
+        self,
+        *,
+        target_file_rows: int = DEFAULT_TARGET_FILE_ROWS,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+    ) -> TableSnapshot | None:
+        """
+        Rewrite small files and files with deletes into files of about `target_file_rows`.
+
+        Files are only combined within a partition. The rewrite runs outside the commit
+        lock; it is discarded (returning None) if a concurrent commit removed an input
+        file or added deletes against one.
+        """
+        base = self._adopt(self.current_snapshot())
+        if base is None:
+            return None
+        deletes = self._deleted_positions(base)
+        groups: dict[str | None, list[DataFile]] = {}
+        for data_file in base.data_files:
+            if data_file.row_count < target_file_rows or data_file.path in deletes:
+                groups.setdefault(data_file.partition, []).append(data_file)
+        inputs = [
+            data_file
+            for group in groups.values()
+            if len(group) > 1 or any(data_file.path in deletes for data_file in group)
+            for data_file in group
+        ]
+        if not inputs:
+            return None
+
+        staged_paths: list[tuple[Path, str | None]] = []
+        try:
+            for partition, group in groups.items():
+                members = [data_file for data_file in group if data_file in inputs]
+                if members:
+                    staged_paths.extend(
+                        (path, partition)
+                        for path in self._rewrite(
+                            base,
+                            members,
+                            deletes=deletes,
+                            target_file_rows=target_file_rows,
+                            batch_rows=batch_rows,
+                        )
+                    )
+            with self._lock():
+                current = self.current_snapshot()
+                if current is None or not self._compaction_still_valid(base, current, inputs):
+                    return None
+                removed = {data_file.path for data_file in inputs}
+                added = [self._add_data_file(path, partition=partition) for path, partition in staged_paths]
+                staged_paths = []
+                return self._commit(
+                    base=current,
+                    operation="compact",
+                    schema=current.schema,
+                    primary_key=current.primary_key,
+                    data_files=[
+                        *(data_file for data_file in current.data_files if data_file.path not in removed),
+                        *added,
+                    ],
+                    delete_files=[
+                        delete_file
+                        for delete_file in current.delete_files
+                        if not set(delete_file.referenced_files) <= removed
+                    ],
+                )
+        finally:
+            for path, _ in staged_paths:
+                path.unlink(missing_ok=True)
+
+    def iter_batches(
+        self,
+        snapshot: TableSnapshot | None = None,
+        *,
+        columns: Sequence[str] | None = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        predicates: Iterable[StatsPredicate] = (),
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Live rows of `snapshot` (default: current), conformed to the snapshot schema.
+
+        Files ruled out by `predicates` are skipped; rows of the remaining files are not
+        filtered, so callers still apply the predicates themselves.
+        """
+        snapshot = snapshot or self.current_snapshot()
+        if snapshot is None:
+            return
+        schema = snapshot.schema
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns])
+        data_files = snapshot.prune(predicates)
+        deletes = self._deleted_positions(snapshot, paths={data_file.path for data_file in data_files})
+        for data_file in data_files:
+            for batch in self._live_batches(data_file, deletes=deletes.get(data_file.path), batch_rows=batch_rows):
+                yield conform_batch(batch, schema)
+
+    def read(self, snapshot: TableSnapshot | None = None, *, columns: Sequence[str] | None = None) -> pa.Table:
+        snapshot = snapshot or self.current_snapshot()
+        if snapshot is None:
+            return pa.table({})
+        schema = snapshot.schema if columns is None else pa.schema([snapshot.schema.field(name) for name in columns])
+        return pa.Table.from_batches(list(self.iter_batches(snapshot, columns=columns)), schema=schema)
+
+    def scan_sql(
+        self,
+        snapshot: TableSnapshot | None = None,
+        *,
+        predicates: Iterable[StatsPredicate] = (),
+    ) -> str:
+        """
+        A DuckDB relation over the live rows of `snapshot`, skipping files ruled out by `predicates`.
+
+        Columns are cast to the snapshot schema, so files written before a type widened
+        read the same as newer ones; deletes are applied with an anti-join on the file
+        name and row number. Partition directory names are not read back as columns:
+        for bucketed partitions they hold the bucket, not the value.
+        """
+        snapshot = snapshot or self.current_snapshot()
+        if snapshot is None:
+            raise FileNotFoundError(f"Dataset table '{self._root}' has no committed snapshot.")
+        data_files = snapshot.prune(predicates)
+        if not data_files:
+            projections = ", ".join(
+                f"CAST(NULL AS {_duckdb_type(item.type)}) AS {_quote(item.name)}" for item in snapshot.schema
+            )
+            return f"(SELECT {projections or 'NULL AS _empty'} WHERE false)"
+
+        present = {name for data_file in data_files for name in data_file.column_stats}
+        projections = ", ".join(
+            (
+                f"CAST(data.{_quote(item.name)} AS {_duckdb_type(item.type)}) AS {_quote(item.name)}"
+                if item.name in present
+                else f"CAST(NULL AS {_duckdb_type(item.type)}) AS {_quote(item.name)}"
+            )
+            for item in snapshot.schema
+        )
+        file_list = ", ".join(_literal(self._absolute(data_file.path)) for data_file in data_files)
+        live = {data_file.path for data_file in data_files}
+        delete_files = [
+            delete_file for delete_file in snapshot.delete_files if live.intersection(delete_file.referenced_files)
+        ]
+        if not delete_files:
+            return f"(SELECT {projections} FROM read_parquet([{file_list}], union_by_name=true, hive_partitioning=false) AS data)"
+        delete_list = ", ".join(_literal(self._absolute(delete_file.path)) for delete_file in delete_files)
+        root = _literal(self._root.resolve().as_posix() + "/")
+        return (
+            f"(SELECT {projections} FROM read_parquet([{file_list}], union_by_name=true, hive_partitioning=false, "
+            "filename=true, file_row_number=true) AS data "
+            f"ANTI JOIN (SELECT {root} || file AS filename, pos AS file_row_number "
+            f"FROM read_parquet([{delete_list}])) AS deletes USING (filename, file_row_number))"
+        )
+
+    # Commit internals -----------------------------------------------------------------
+
+    def _adopt(self, snapshot: TableSnapshot | None) -> TableSnapshot | None:
+        # A table opened without a spec (e.g. by compaction) keeps the committed one.
+        if self._partition_spec is None and snapshot is not None:
+            self._partition_spec = snapshot.partition_spec
+        return snapshot
+
+    def _lock(self) -> threading.Lock:
+        key = str(self._root.resolve())
+        with _table_locks_guard:
+            return _table_locks.setdefault(key, threading.Lock())
+
+    def _commit(
+        self,
+        *,
+        base: TableSnapshot | None,
+        operation: str,
+        schema: pa.Schema,
+        primary_key: str | None,
+        data_files: list[DataFile],
+        delete_files: list[DeleteFile],
+    ) -> TableSnapshot:
+        snapshot = TableSnapshot(
+            snapshot_id=(base.snapshot_id + 1) if base is not None else 1,
+            parent_snapshot_id=base.snapshot_id if base is not None else None,
+            operation=operation,
+            created_at=datetime.now(timezone.utc).isoformat(),
+            schema=schema,
+            partition_spec=self._partition_spec,
+            primary_key=primary_key,
+            data_files=tuple(data_files),
+            delete_files=tuple(delete_files),
+        )
+        manifest_dir = self._root / _MANIFEST_DIR
+        manifest_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = manifest_dir / _manifest_name(snapshot.snapshot_id)
+        try:
+            with open(manifest_path, "x", encoding="utf-8") as handle:
+                json.dump(_snapshot_to_json(snapshot), handle)
+        except FileExistsError as exc:
+            raise DatasetTableConflictError(
+                f"Dataset table '{self._root}' already has snapshot {snapshot.snapshot_id}."
+            ) from exc
+        pointer_path = manifest_dir / f".{_CURRENT_POINTER}.{uuid.uuid4().hex}.tmp"
+        pointer_path.write_text(manifest_path.name, encoding="utf-8")
+        os.replace(pointer_path, manifest_dir / _CURRENT_POINTER)
+        self._expire_snapshots(snapshot.snapshot_id)
+        return snapshot
+
+    def _expire_snapshots(self, current_id: int) -> None:
+        manifest_dir = self._root / _MANIFEST_DIR
+        retained: list[TableSnapshot] = []
+        for path in manifest_dir.iterdir():
+            match = _MANIFEST_NAME.match(path.name)
+            if match is None:
+                continue
+            if int(match.group(1)) > current_id - self._retain_snapshots:
+                retained.append(self._read_manifest(path))
+            else:
+                path.unlink(missing_ok=True)
+        referenced = {
+            path
+            for snapshot in retained
+            for path in (
+                *(data_file.path for data_file in snapshot.data_files),
+                *(delete_file.path for delete_file in snapshot.delete_files),
+            )
+        }
+        for directory in (_DATA_DIR, _DELETES_DIR):
+            base_dir = self._root / directory
+            if not base_dir.exists():
+                continue
+            for path in base_dir.rglob("*.parquet"):
+                if path.relative_to(self._root).as_posix() not in referenced:
+                    path.unlink(missing_ok=True)
+
+    def _add_data_files(self, staged: Path) -> list[DataFile]:
+        """Move (or, for partitioned tables, split) a staged file into `data/`."""
+        try:
+            if pq.ParquetFile(staged).metadata.num_rows == 0:
+                return []
+            if self._partition_spec is None:
+                return [self._add_data_file(staged, partition=None)]
+            return [
+                self._add_data_file(path, partition=partition)
+                for path, partition in self._split_by_partition(staged)
+            ]
+        finally:
+            staged.unlink(missing_ok=True)
+
+    def _add_data_file(self, staged: Path, *, partition: str | None) -> DataFile:
+        directory = self._root / _DATA_DIR
+        if partition is not None and self._partition_spec is not None:
+            directory = directory / f"{quote(self._partition_spec.column, safe='')}={quote(partition, safe='')}"
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / f"part-{uuid.uuid4().hex}.parquet"
+        os.replace(staged, target)
+        metadata = pq.ParquetFile(target).metadata
+        return DataFile(
+            path=target.relative_to(self._root).as_posix(),
+            row_count=metadata.num_rows,
+            size_bytes=target.stat().st_size,
+            partition=partition,
+            column_stats=_column_stats(metadata),
+        )
+
+    def _split_by_partition(self, staged: Path) -> list[tuple[Path, str]]:
+        assert self._partition_spec is not None
+        source = pq.ParquetFile(staged)
+        writers: dict[str, tuple[Path, pq.ParquetWriter]] = {}
+        try:
+            for batch in source.iter_batches():
+                values = self._partition_spec.partition_values(batch)
+                for value in pc.unique(values).to_pylist():
+                    if value not in writers:
+                        path = self.staging_path()
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        writers[value] = (path, pq.ParquetWriter(path, source.schema_arrow))
+                    writers[value][1].write_batch(batch.filter(pc.equal(values, value)))
+        except BaseException:
+            for path, writer in writers.values():
+                writer.close()
+                path.unlink(missing_ok=True)
+            raise
+        for _, writer in writers.values():
+            writer.close()
+        return [(path, value) for value, (path, _) in sorted(writers.items())]
+
+    def _write_deletes(
+        self,
+        base: TableSnapshot,
+        *,
+        replaced_identities: pa.Array,
+        identity: Callable[[pa.RecordBatch], pa.Array],
+        identity_columns: Sequence[str],
+        predicates: Iterable[StatsPredicate] = (),
+    ) -> DeleteFile | None:
+        candidates = base.prune(predicates)
+        already_deleted = self._deleted_positions(base, paths={data_file.path for data_file in candidates})
+        files: list[pa.Array] = []
+        positions: list[pa.Array] = []
+        referenced: dict[str, int] = {}
+        for data_file in candidates:
+            parquet_file = pq.ParquetFile(self._root / data_file.path)
+            available = [name for name in identity_columns if name in parquet_file.schema_arrow.names]
+            if not available:
+                continue
+            offset = 0
+            for batch in parquet_file.iter_batches(columns=available):
+                matches = pc.fill_null(pc.is_in(identity(batch), value_set=replaced_identities), False)
+                hits = pc.add(pc.indices_nonzero(matches), offset)
+                offset += batch.num_rows
+                previous = already_deleted.get(data_file.path)
+                if previous is not None:
+                    hits = hits.filter(pc.invert(pc.is_in(hits, value_set=previous)))
+                if len(hits):
+                    files.append(pa.array([data_file.path] * len(hits), type=pa.string()))
+                    positions.append(hits.cast(pa.int64()))
+                    referenced[data_file.path] = referenced.get(data_file.path, 0) + len(hits)
+        if not referenced:
+            return None
+        target = self._root / _DELETES_DIR / f"delete-{uuid.uuid4().hex}.parquet"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            pa.table({"file": pa.concat_arrays(files), "pos": pa.concat_arrays(positions)}),
+            target,
+        )
+        return DeleteFile(path=target.relative_to(self._root).as_posix(), referenced_files=referenced)
+
+    def _deleted_positions(self, snapshot: TableSnapshot, *, paths: set[str] | None = None) -> dict[str, pa.Array]:
+        """Deleted row positions per data file; with `paths`, only delete files referencing those are read."""
+        by_file: dict[str, list[pa.Array]] = {}
+        for delete_file in snapshot.delete_files:
+            referenced = [path for path in delete_file.referenced_files if paths is None or path in paths]
+            if not referenced:
+                continue
+            table = pq.read_table(self._root / delete_file.path)
+            for path in referenced:
+                by_file.setdefault(path, []).append(
+                    table.filter(pc.equal(table["file"], path))["pos"].combine_chunks()
+                )
+        return {path: pa.concat_arrays(arrays) for path, arrays in by_file.items()}
+
+    def _live_batches(
+        self,
+        data_file: DataFile,
+        *,
+        deletes: pa.Array | None,
+        batch_rows: int,
+    ) -> Iterator[pa.RecordBatch]:
+        offset = 0
+        for batch in pq.ParquetFile(self._root / data_file.path).iter_batches(batch_size=batch_rows):
+            positions = pa.array(range(offset, offset + batch.num_rows), type=pa.int64())
+            offset += batch.num_rows
+            if deletes is not None and len(deletes):
+                batch = batch.filter(pc.invert(pc.is_in(positions, value_set=deletes)))
+            if batch.num_rows:
+                yield batch
+
+    def _rewrite(
+        self,
+        base: TableSnapshot,
+        members: list[DataFile],
+        *,
+        deletes: dict[str, pa.Array],
+        target_file_rows: int,
+        batch_rows: int,
+    ) -> list[Path]:
+        written: list[Path] = []
+        writer: pq.ParquetWriter | None = None
+        rows_in_file = 0
+        try:
+            for data_file in members:
+                for batch in self._live_batches(data_file, deletes=deletes.get(data_file.path), batch_rows=batch_rows):
+                    batch = conform_batch(batch, base.schema)
+                    if writer is None or rows_in_file >= target_file_rows:
+                        if writer is not None:
+                            writer.close()
+                        written.append(self.staging_path())
+                        written[-1].parent.mkdir(parents=True, exist_ok=True)
+                        writer = pq.ParquetWriter(written[-1], base.schema)
+                        rows_in_file = 0
+                    writer.write_batch(batch, row_group_size=batch_rows)
+                    rows_in_file += batch.num_rows
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            for path in written:
+                path.unlink(missing_ok=True)
+            raise
+        if writer is not None:
+            writer.close()
+        return written
+
+    def _compaction_still_valid(
+        self,
+        base: TableSnapshot,
+        current: TableSnapshot,
+        inputs: list[DataFile],
+    ) -> bool:
+        live = {data_file.path for data_file in current.data_files}
+        if any(data_file.path not in live for data_file in inputs):
+            return False
+        inputs_paths = {data_file.path for data_file in inputs}
+        known = {delete_file.path for delete_file in base.delete_files}
+        return not any(
+            inputs_paths.intersection(delete_file.referenced_files)
+            for delete_file in current.delete_files
+            if delete_file.path not in known
+        )
+
+    def _read_manifest(self, path: Path) -> TableSnapshot:
+        return _snapshot_from_json(json.loads(path.read_text(encoding="utf-8")))
+
+    def _absolute(self, relative_path: str) -> str:
+        return (self._root.resolve() / relative_path).as_posix()
+
+
+def is_dataset_table(path: str | Path) -> bool:
+    return (Path(path) / _MANIFEST_DIR / _CURRENT_POINTER).is_file()
+
+
+def find_dataset_tables(root: str | Path, *, retain_snapshots: int = DEFAULT_RETAIN_SNAPSHOTS) -> list[DatasetTable]:
+    """Every committed table under `root`."""
+    base = Path(root)
+    if not base.exists():
+        return []
+    return [
+        DatasetTable(pointer.parent.parent, retain_snapshots=retain_snapshots)
+        for pointer in sorted(base.rglob(f"{_MANIFEST_DIR}/{_CURRENT_POINTER}"))
+    ]
+
+
+def _manifest_name(snapshot_id: int) -> str:
+    return f"v{snapshot_id:08d}.json"
+
+
+def _may_match(data_file: DataFile, predicate: StatsPredicate) -> bool:
+    stats = data_file.column_stats.get(predicate.column)
+    if stats is None:
+        # The file predates the column, so every value is null and no comparison matches.
+        return not data_file.column_stats
+    if stats.null_count is not None and stats.null_count >= data_file.row_count:
+        return False
+    if stats.min is None or stats.max is None:
+        return True
+    values = predicate.value if predicate.operator == "in" else [predicate.value]
+    try:
+        if predicate.operator in {"eq", "in"}:
+            return any(stats.min <= value <= stats.max for value in values)
+        if predicate.operator == "gt":
+            return stats.max > predicate.value
+        if predicate.operator == "gte":
+            return stats.max >= predicate.value
+        if predicate.operator == "lt":
+            return stats.min < predicate.value
+        if predicate.operator == "lte":
+            return stats.min <= predicate.value
+    except TypeError:
+        # Stats of a narrower type than the literal (e.g. ints before a widening to strings).
+        return True
+    return True
+
+
+def _column_stats(metadata: pq.FileMetaData) -> dict[str, ColumnStats]:
+    stats: dict[str, ColumnStats] = {}
+    for column_index in range(metadata.num_columns):
+        name = metadata.schema.column(column_index).name
+        minimum = maximum = None
+        null_count: int | None = 0
+        complete = metadata.num_row_groups > 0
+        for row_group_index in range(metadata.num_row_groups):
+            column = metadata.row_group(row_group_index).column(column_index)
+            statistics = column.statistics
+            if statistics is None:
+                complete = False
+                null_count = None
+                continue
+            if null_count is not None and statistics.has_null_count:
+                null_count += statistics.null_count
+            else:
+                null_count = None
+            if not statistics.has_min_max:
+                if column.num_values > (statistics.null_count if statistics.has_null_count else 0):
+                    complete = False
+                continue
+            low, high = _json_stat(statistics.min), _json_stat(statistics.max)
+            if low is None or high is None:
+                complete = False
+                continue
+            minimum = low if minimum is None or low < minimum else minimum
+            maximum = high if maximum is None or high > maximum else maximum
+        if not complete:
+            minimum = maximum = None
+        stats[name] = ColumnStats(min=minimum, max=maximum, null_count=null_count)
+    return stats
+
+
+def _json_stat(value: Any) -> Any:
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return None
+
+
+def _duckdb_type(arrow_type: pa.DataType) -> str:
+    if pa.types.is_dictionary(arrow_type):
+        return _duckdb_type(arrow_type.value_type)
+    if pa.types.is_date(arrow_type):
+        return "DATE"
+    if pa.types.is_timestamp(arrow_type):
+        if arrow_type.tz is not None:
+            return "TIMESTAMPTZ"
+        return "TIMESTAMP_NS" if arrow_type.unit == "ns" else "TIMESTAMP"
+    if pa.types.is_time(arrow_type):
+        return "TIME"
+    if pa.types.is_duration(arrow_type):
+        return "INTERVAL"
+    if pa.types.is_decimal(arrow_type):
+        # DuckDB decimals hold at most 38 digits.
+        return f"DECIMAL({arrow_type.precision}, {arrow_type.scale})" if arrow_type.precision <= 38 else "DOUBLE"
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return f"{_duckdb_type(arrow_type.value_type)}[]"
+    if pa.types.is_struct(arrow_type):
+        fields = ", ".join(f"{_quote(item.name)} {_duckdb_type(item.type)}" for item in arrow_type)
+        return f"STRUCT({fields})"
+    if pa.types.is_map(arrow_type):
+        return f"MAP({_duckdb_type(arrow_type.key_type)}, {_duckdb_type(arrow_type.item_type)})"
+    return _DUCKDB_TYPES.get(str(arrow_type), "VARCHAR")
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _snapshot_to_json(snapshot: TableSnapshot) -> dict[str, Any]:
+    return {
+        "format_version": FORMAT_VERSION,
+        "snapshot_id": snapshot.snapshot_id,
+        "parent_snapshot_id": snapshot.parent_snapshot_id,
+        "operation": snapshot.operation,
+        "created_at": snapshot.created_at,
+        "schema": [{"name": item.name, "type": str(item.type)} for item in snapshot.schema],
+        # `schema` is for readers of the manifest; this is the exact Arrow schema.
+        "arrow_schema": base64.b64encode(snapshot.schema.serialize().to_pybytes()).decode("ascii"),
+        "partition_spec": snapshot.partition_spec.to_json() if snapshot.partition_spec is not None else None,
+        "primary_key": snapshot.primary_key,
+        "data_files": [
+            {
+                "path": data_file.path,
+                "row_count": data_file.row_count,
+                "size_bytes": data_file.size_bytes,
+                "partition": data_file.partition,
+                "column_stats": {
+                    name: {"min": stats.min, "max": stats.max, "null_count": stats.null_count}
+                    for name, stats in data_file.column_stats.items()
+                },
+            }
+            for data_file in snapshot.data_files
+        ],
+        "delete_files": [
+            {"path": delete_file.path, "referenced_files": delete_file.referenced_files}
+            for delete_file in snapshot.delete_files
+        ],
+    }
+
+
+def _snapshot_from_json(payload: dict[str, Any]) -> TableSnapshot:
+    if int(payload.get("format_version") or 0) > FORMAT_VERSION:
+        raise ValueError(f"Unsupported dataset table format version {payload.get('format_version')}.")
+    return TableSnapshot(
+        snapshot_id=int(payload["snapshot_id"]),
+        parent_snapshot_id=payload.get("parent_snapshot_id"),
+        operation=str(payload.get("operation") or "append"),
+        created_at=str(payload.get("created_at") or ""),
+        schema=_schema_from_json(payload),
+        partition_spec=PartitionSpec.from_json(payload.get("partition_spec")),
+        primary_key=payload.get("primary_key"),
+        data_files=tuple(
+            DataFile(
+                path=item["path"],
+                row_count=int(item["row_count"]),
+                size_bytes=int(item.get("size_bytes") or 0),
+                partition=item.get("partition"),
+                column_stats={
+                    name: ColumnStats(min=stats.get("min"), max=stats.get("max"), null_count=stats.get("null_count"))
+                    for name, stats in (item.get("column_stats") or {}).items()
+                },
+            )
+            for item in payload.get("data_files") or []
+        ),
+        delete_files=tuple(
+            DeleteFile(
+                path=item["path"],
+                referenced_files={str(path): int(count) for path, count in (item.get("referenced_files") or {}).items()},
+            )
+            for item in payload.get("delete_files") or []
+        ),
+    )
+
+
+def _schema_from_json(payload: dict[str, Any]) -> pa.Schema:
+    encoded = payload.get("arrow_schema")
+    if encoded:
+        return pa.ipc.read_schema(pa.py_buffer(base64.b64decode(encoded)))
+    return pa.schema([(item["name"], _arrow_type(item["type"])) for item in payload.get("schema") or []])
+
+
+def _arrow_type(name: str) -> pa.DataType:
+    """Parse a scalar type name written by `str(pa.DataType)`; anything else reads as string."""
+    if name in _ARROW_TYPE_NAMES:
+        return _ARROW_TYPE_NAMES[name]
+    if match := _TIMESTAMP_TYPE_NAME.match(name):
+        return pa.timestamp(match.group(1), tz=match.group(2))
+    if match := _TIME_TYPE_NAME.match(name):
+        return pa.time32(match.group(2)) if match.group(1) == "32" else pa.time64(match.group(2))
+    if match := _DECIMAL_TYPE_NAME.match(name):
+        factory = pa.decimal128 if match.group(1) == "128" else pa.decimal256
+        return factory(int(match.group(2)), int(match.group(3)))
+    return pa.string()
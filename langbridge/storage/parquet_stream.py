@@ -0,0 +1,264 @@
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DEFAULT_BATCH_ROWS = 50_000
+
+
+@dataclass(frozen=True, slots=True)
+class StreamingParquetResult:
+    path: Path
+    schema: pa.Schema
+    row_count: int
+    bytes_written: int | None
+
+
+class StreamingParquetWriter:
+    """
+    Writes row dictionaries to Parquet in bounded batches.
+
+    Rows are buffered up to `batch_rows` and encoded column by column into one row
+    group. Column types follow the sync type rules: ints, floats (ints widened when
+    mixed), bools, and everything else as strings; columns are ordered by name. When
+    a later batch adds a column or widens a type, the row groups already written are
+    re-encoded batch by batch into a new staging file, so memory stays bounded by the
+    batch size rather than the table size. The target path is only replaced when
+    `close` succeeds; leaving the context without closing discards the staged file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        base_schema: pa.Schema | None = None,
+    ) -> None:
+        self._path = Path(path)
+        self._batch_rows = max(1, int(batch_rows))
+        self._base_schema = base_schema
+        self._categories: dict[str, set[str]] = {}
+        self._schema: pa.Schema | None = None
+        self._writer: pq.ParquetWriter | None = None
+        self._staging_path: Path | None = None
+        self._buffer: list[Mapping[str, Any]] = []
+        self._rows_written = 0
+        self._closed = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def batch_rows(self) -> int:
+        return self._batch_rows
+
+    @property
+    def row_count(self) -> int:
+        return self._rows_written + len(self._buffer)
+
+    def __enter__(self) -> "StreamingParquetWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if not self._closed:
+            self.abort()
+
+    def write_rows(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        for row in rows:
+            self._buffer.append(row)
+            if len(self._buffer) >= self._batch_rows:
+                self._flush()
+
+    def write_batch(self, batch: pa.RecordBatch | pa.Table) -> None:
+        """Append Arrow data, widening the file schema with the same rules as `write_rows`."""
+        self._flush()
+        if batch.num_rows == 0 and self._schema is not None:
+            return
+        categories = {column: set(values) for column, values in self._categories.items()}
+        for field in batch.schema:
+            categories.setdefault(field.name, set()).update(categories_for_type(field.type))
+        schema = schema_for_categories(categories)
+        self._categories = categories
+        if self._schema is None:
+            self._open(schema)
+        elif not schema.equals(self._schema):
+            self._evolve(schema)
+        assert self._writer is not None
+        if batch.num_rows == 0:
+            return
+        if isinstance(batch, pa.Table):
+            for chunk in batch.to_batches(max_chunksize=self._batch_rows):
+                self._writer.write_batch(conform_batch(chunk, schema), row_group_size=self._batch_rows)
+        else:
+            self._writer.write_batch(conform_batch(batch, schema), row_group_size=self._batch_rows)
+        self._rows_written += batch.num_rows
+
+    def close(self) -> StreamingParquetResult:
+        self._flush()
+        if self._writer is None:
+            self._open(self._base_schema if self._base_schema is not None else pa.schema([]))
+        assert self._writer is not None and self._staging_path is not None and self._schema is not None
+        self._writer.close()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._staging_path, self._path)
+        self._closed = True
+        return StreamingParquetResult(
+            path=self._path,
+            schema=self._schema,
+            row_count=self._rows_written,
+            bytes_written=self._path.stat().st_size if self._path.exists() else None,
+        )
+
+    def abort(self) -> None:
+        self._closed = True
+        self._buffer = []
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._staging_path is not None:
+            self._staging_path.unlink(missing_ok=True)
+            self._staging_path = None
+
+    def _flush(self) -> None:
+        rows, self._buffer = self._buffer, []
+        if not rows:
+            return
+        categories = {column: set(values) for column, values in self._categories.items()}
+        for row in rows:
+            for key, value in row.items():
+                column_categories = categories.setdefault(str(key), set())
+                category = value_category(value)
+                if category is not None:
+                    column_categories.add(category)
+
+        batch = _encode_batch(rows, categories)
+        self._categories = categories
+        if self._schema is None:
+            self._open(batch.schema)
+        elif not batch.schema.equals(self._schema):
+            self._evolve(batch.schema)
+        assert self._writer is not None
+        self._writer.write_batch(batch, row_group_size=self._batch_rows)
+        self._rows_written += batch.num_rows
+
+    def _open(self, schema: pa.Schema) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._staging_path = self._path.parent / f".{self._path.name}.{uuid.uuid4().hex}.tmp"
+        self._writer = pq.ParquetWriter(self._staging_path, schema)
+        self._schema = schema
+
+    def _evolve(self, schema: pa.Schema) -> None:
+        assert self._writer is not None and self._staging_path is not None
+        self._writer.close()
+        previous_path = self._staging_path
+        self._open(schema)
+        assert self._writer is not None
+        try:
+            for batch in pq.ParquetFile(previous_path).iter_batches(batch_size=self._batch_rows):
+                self._writer.write_batch(conform_batch(batch, schema), row_group_size=self._batch_rows)
+        finally:
+            previous_path.unlink(missing_ok=True)
+
+
+def value_category(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    return "string"
+
+
+def arrow_type_for_categories(categories: set[str]) -> pa.DataType:
+    if not categories:
+        return pa.null()
+    if categories <= {"int"}:
+        return pa.int64()
+    if categories <= {"int", "float"}:
+        return pa.float64()
+    if categories <= {"bool"}:
+        return pa.bool_()
+    return pa.string()
+
+
+def categories_for_type(arrow_type: pa.DataType) -> set[str]:
+    if pa.types.is_null(arrow_type):
+        return set()
+    if pa.types.is_integer(arrow_type):
+        return {"int"}
+    if pa.types.is_floating(arrow_type):
+        return {"float"}
+    if pa.types.is_boolean(arrow_type):
+        return {"bool"}
+    return {"string"}
+
+
+def schema_for_categories(categories: Mapping[str, set[str]]) -> pa.Schema:
+    return pa.schema([(column, arrow_type_for_categories(categories[column])) for column in sorted(categories)])
+
+
+def unify_schemas(*schemas: pa.Schema | None) -> pa.Schema:
+    """Combine schemas with the sync type rules: columns ordered by name, conflicting types widened."""
+    categories: dict[str, set[str]] = {}
+    for schema in schemas:
+        if schema is None:
+            continue
+        for field in schema:
+            categories.setdefault(field.name, set()).update(categories_for_type(field.type))
+    return schema_for_categories(categories)
+
+
+def _encode_batch(rows: list[Mapping[str, Any]], categories: dict[str, set[str]]) -> pa.RecordBatch:
+    while True:
+        columns = sorted(categories)
+        arrays: list[pa.Array] = []
+        for column in columns:
+            arrow_type = arrow_type_for_categories(categories[column])
+            try:
+                arrays.append(_encode_column([row.get(column) for row in rows], arrow_type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                # e.g. integers beyond int64: fall back to strings for this column.
+                categories[column].add("string")
+                break
+        else:
+            return pa.RecordBatch.from_arrays(arrays, names=columns)
+
+
+def _encode_column(values: list[Any], arrow_type: pa.DataType) -> pa.Array:
+    if pa.types.is_null(arrow_type):
+        return pa.nulls(len(values))
+    if pa.types.is_int64(arrow_type):
+        converted = [None if value is None else int(value) for value in values]
+    elif pa.types.is_float64(arrow_type):
+        converted = [None if value is None else float(value) for value in values]
+    elif pa.types.is_boolean(arrow_type):
+        converted = [None if value is None else bool(value) for value in values]
+    else:
+        converted = [None if value is None else str(value) for value in values]
+    return pa.array(converted, type=arrow_type)
+
+
+def conform_batch(batch: pa.RecordBatch, schema: pa.Schema) -> pa.RecordBatch:
+    """Reorder, null-fill and widen `batch` to `schema`; values widened to strings match `str(value)`."""
+    arrays: list[pa.Array] = []
+    for field in schema:
+        index = batch.schema.get_field_index(field.name)
+        if index < 0:
+            arrays.append(pa.nulls(batch.num_rows, type=field.type))
+            continue
+        column = batch.column(index)
+        if column.type.equals(field.type):
+            arrays.append(column)
+        elif pa.types.is_string(field.type):
+            arrays.append(_encode_column(column.to_pylist(), field.type))
+        else:
+            arrays.append(column.cast(field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
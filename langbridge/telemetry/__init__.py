@@ -0,0 +1,102 @@
+"""
+Tracing and metrics shared by the runtime, federation and connectors.
+
+The package depends on nothing else in langbridge, so any layer can record into it.
+
+Spans propagate through `contextvars`, so tasks and `asyncio.to_thread` calls
+started inside a span become its children. Metrics land in a process-local
+registry rendered by the runtime's `/metrics` endpoint; exporters additionally
+receive every span and measurement (OTLP in production, in-memory in tests).
+"""
+
+from langbridge.telemetry.exporters import (
+    InMemoryTelemetryExporter,
+    Measurement,
+    NoopTelemetryExporter,
+    OtlpTelemetryExporter,
+    TelemetryExporter,
+)
+from langbridge.telemetry.instrumentation import (
+    BACKGROUND_TASK_DURATION,
+    BUILTIN_INSTRUMENTS,
+    CACHE_LOOKUPS,
+    HTTP_CACHE_BYTES_SAVED,
+    DATASET_FILES_SCANNED,
+    CONNECTOR_QUERY_DURATION,
+    CONNECTOR_ROWS,
+    EMBEDDING_DURATION,
+    EMBEDDING_TEXTS,
+    FEDERATED_QUERY_DURATION,
+    FEDERATION_STAGE_DURATION,
+    HTTP_REQUEST_DURATION,
+    LLM_CALL_DURATION,
+    ODBC_QUERY_DURATION,
+    QUEUE_WAIT,
+    SQL_QUERY_DURATION,
+    SYNC_JOB_DURATION,
+    SYNC_REPLICATION_LAG,
+    InstrumentSpec,
+    Telemetry,
+    configure_telemetry,
+    get_telemetry,
+    increment,
+    observe,
+    observe_since,
+    span,
+    timed,
+    use_telemetry,
+)
+from langbridge.telemetry.metrics import (
+    DEFAULT_DURATION_BUCKETS,
+    Counter,
+    Histogram,
+    HistogramSnapshot,
+    MetricRegistry,
+)
+from langbridge.telemetry.prometheus import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from langbridge.telemetry.tracing import Span, current_span
+
+__all__ = [
+    "BACKGROUND_TASK_DURATION",
+    "BUILTIN_INSTRUMENTS",
+    "CACHE_LOOKUPS",
+    "HTTP_CACHE_BYTES_SAVED",
+    "DATASET_FILES_SCANNED",
+    "CONNECTOR_QUERY_DURATION",
+    "CONNECTOR_ROWS",
+    "Counter",
+    "DEFAULT_DURATION_BUCKETS",
+    "EMBEDDING_DURATION",
+    "EMBEDDING_TEXTS",
+    "FEDERATED_QUERY_DURATION",
+    "FEDERATION_STAGE_DURATION",
+    "HTTP_REQUEST_DURATION",
+    "Histogram",
+    "HistogramSnapshot",
+    "InMemoryTelemetryExporter",
+    "InstrumentSpec",
+    "LLM_CALL_DURATION",
+    "Measurement",
+    "MetricRegistry",
+    "NoopTelemetryExporter",
+    "ODBC_QUERY_DURATION",
+    "OtlpTelemetryExporter",
+    "PROMETHEUS_CONTENT_TYPE",
+    "QUEUE_WAIT",
+    "SQL_QUERY_DURATION",
+    "SYNC_JOB_DURATION",
+    "SYNC_REPLICATION_LAG",
+    "Span",
+    "Telemetry",
+    "TelemetryExporter",
+    "configure_telemetry",
+    "current_span",
+    "get_telemetry",
+    "increment",
+    "observe",
+    "observe_since",
+    "render_prometheus",
+    "span",
+    "timed",
+    "use_telemetry",
+]
@@ -0,0 +1,149 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from langbridge.telemetry.metrics import Histogram, Instrument, InstrumentKind
+from langbridge.telemetry.tracing import Span
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    name: str
+    kind: InstrumentKind
+    value: float
+    labels: dict[str, str]
+
+
+class TelemetryExporter:
+    """Receives span lifecycle events and metric measurements from `Telemetry`."""
+
+    def on_span_start(self, span: Span) -> None:
+        return None
+
+    def on_span_end(self, span: Span) -> None:
+        return None
+
+    def on_measurement(self, instrument: Instrument, value: float, labels: Mapping[str, str]) -> None:
+        return None
+
+    def shutdown(self) -> None:
+        return None
+
+
+class NoopTelemetryExporter(TelemetryExporter):
+    """Discards spans and measurements. Metrics still reach the registry behind `/metrics`."""
+
+
+class InMemoryTelemetryExporter(TelemetryExporter):
+    """Keeps finished spans and every measurement in memory, for tests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+        self._measurements: list[Measurement] = []
+
+    def on_span_end(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def on_measurement(self, instrument: Instrument, value: float, labels: Mapping[str, str]) -> None:
+        with self._lock:
+            self._measurements.append(
+                Measurement(name=instrument.name, kind=instrument.kind, value=value, labels=dict(labels))
+            )
+
+    def finished_spans(self, name: str | None = None) -> list[Span]:
+        with self._lock:
+            return [span for span in self._spans if name is None or span.name == name]
+
+    def measurements(self, name: str | None = None) -> list[Measurement]:
+        with self._lock:
+            return [item for item in self._measurements if name is None or item.name == name]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._measurements.clear()
+
+
+class OtlpTelemetryExporter(TelemetryExporter):
+    """
+    Mirrors spans and measurements onto the OpenTelemetry API.
+
+    By default the global tracer and meter providers are used, so whatever
+    `langbridge.runtime.logger.setup_logging` configured (OTLP over gRPC or HTTP)
+    ships runtime spans and metrics alongside logs. Root runtime spans nest under
+    the active OpenTelemetry span, e.g. the FastAPI request span.
+    """
+
+    def __init__(
+        self,
+        *,
+        tracer_provider: Any | None = None,
+        meter_provider: Any | None = None,
+        instrumentation_name: str = "langbridge.runtime",
+    ) -> None:
+        from opentelemetry import metrics, trace
+        from opentelemetry.trace import Status, StatusCode
+
+        self._trace_api = trace
+        self._status_type = Status
+        self._error_code = StatusCode.ERROR
+        self._tracer = (tracer_provider or trace.get_tracer_provider()).get_tracer(instrumentation_name)
+        self._meter = (meter_provider or metrics.get_meter_provider()).get_meter(instrumentation_name)
+        self._lock = threading.Lock()
+        self._open_spans: dict[str, Any] = {}
+        self._instruments: dict[str, Any] = {}
+
+    def on_span_start(self, span: Span) -> None:
+        with self._lock:
+            parent = self._open_spans.get(span.parent_span_id) if span.parent_span_id else None
+        context = self._trace_api.set_span_in_context(parent) if parent is not None else None
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            attributes=dict(span.attributes),
+            start_time=span.start_time_ns,
+        )
+        with self._lock:
+            self._open_spans[span.span_id] = otel_span
+
+    def on_span_end(self, span: Span) -> None:
+        with self._lock:
+            otel_span = self._open_spans.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        otel_span.set_attributes(dict(span.attributes))
+        if span.status == "error":
+            otel_span.set_status(self._status_type(self._error_code, span.status_message))
+        otel_span.end(end_time=span.end_time_ns)
+
+    def on_measurement(self, instrument: Instrument, value: float, labels: Mapping[str, str]) -> None:
+        otel_instrument = self._instruments.get(instrument.name)
+        if otel_instrument is None:
+            otel_instrument = self._create_instrument(instrument)
+        if isinstance(instrument, Histogram):
+            otel_instrument.record(value, attributes=dict(labels))
+        else:
+            otel_instrument.add(value, attributes=dict(labels))
+
+    def _create_instrument(self, instrument: Instrument) -> Any:
+        with self._lock:
+            existing = self._instruments.get(instrument.name)
+            if existing is not None:
+                return existing
+            if isinstance(instrument, Histogram):
+                created = self._meter.create_histogram(
+                    instrument.name,
+                    unit=instrument.unit,
+                    description=instrument.description,
+                    explicit_bucket_boundaries_advisory=list(instrument.buckets),
+                )
+            else:
+                created = self._meter.create_counter(
+                    instrument.name,
+                    unit=instrument.unit,
+                    description=instrument.description,
+                )
+            self._instruments[instrument.name] = created
+            return created
@@ -0,0 +1,203 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping
+
+from langbridge.telemetry.exporters import NoopTelemetryExporter, TelemetryExporter
+from langbridge.telemetry.metrics import InstrumentKind, MetricRegistry
+from langbridge.telemetry.tracing import _CURRENT_SPAN, Span, new_child_span
+
+HTTP_REQUEST_DURATION = "langbridge_http_request_duration_seconds"
+SQL_QUERY_DURATION = "langbridge_sql_query_duration_seconds"
+FEDERATED_QUERY_DURATION = "langbridge_federated_query_duration_seconds"
+FEDERATION_STAGE_DURATION = "langbridge_federation_stage_duration_seconds"
+CONNECTOR_QUERY_DURATION = "langbridge_connector_query_duration_seconds"
+CONNECTOR_ROWS = "langbridge_connector_rows_total"
+CACHE_LOOKUPS = "langbridge_cache_lookups_total"
+HTTP_CACHE_BYTES_SAVED = "langbridge_http_cache_bytes_saved_total"
+DATASET_FILES_SCANNED = "langbridge_dataset_files_scanned_total"
+QUEUE_WAIT = "langbridge_queue_wait_seconds"
+ODBC_QUERY_DURATION = "langbridge_odbc_query_duration_seconds"
+EMBEDDING_DURATION = "langbridge_embedding_duration_seconds"
+EMBEDDING_TEXTS = "langbridge_embedding_texts_total"
+LLM_CALL_DURATION = "langbridge_llm_call_duration_seconds"
+SYNC_JOB_DURATION = "langbridge_sync_job_duration_seconds"
+SYNC_REPLICATION_LAG = "langbridge_sync_replication_lag_seconds"
+BACKGROUND_TASK_DURATION = "langbridge_background_task_duration_seconds"
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentSpec:
+    name: str
+    kind: InstrumentKind
+    description: str
+    unit: str = "s"
+
+
+BUILTIN_INSTRUMENTS: tuple[InstrumentSpec, ...] = (
+    InstrumentSpec(HTTP_REQUEST_DURATION, "histogram", "Runtime HTTP API request latency by route."),
+    InstrumentSpec(SQL_QUERY_DURATION, "histogram", "SqlQueryService job execution latency."),
+    InstrumentSpec(FEDERATED_QUERY_DURATION, "histogram", "FederatedQueryTool call latency by operation."),
+    InstrumentSpec(FEDERATION_STAGE_DURATION, "histogram", "Federated stage execution latency by stage type."),
+    InstrumentSpec(CONNECTOR_QUERY_DURATION, "histogram", "Remote source query latency by source kind."),
+    InstrumentSpec(CONNECTOR_ROWS, "counter", "Rows returned by remote source queries.", unit="1"),
+    InstrumentSpec(CACHE_LOOKUPS, "counter", "Cache lookups by cache and result (hit or miss).", unit="1"),
+    InstrumentSpec(
+        HTTP_CACHE_BYTES_SAVED,
+        "counter",
+        "Response bytes served from the API HTTP cache instead of the network.",
+        unit="By",
+    ),
+    InstrumentSpec(
+        DATASET_FILES_SCANNED,
+        "counter",
+        "Dataset table data files scanned or pruned by column stats.",
+        unit="1",
+    ),
+    InstrumentSpec(QUEUE_WAIT, "histogram", "Time work spent queued before it started, by queue."),
+    InstrumentSpec(ODBC_QUERY_DURATION, "histogram", "ODBC gateway query latency by query kind."),
+    InstrumentSpec(EMBEDDING_DURATION, "histogram", "Embedding request latency by provider and operation."),
+    InstrumentSpec(EMBEDDING_TEXTS, "counter", "Texts sent to embedding providers.", unit="1"),
+    InstrumentSpec(LLM_CALL_DURATION, "histogram", "LLM provider call latency by provider and operation."),
+    InstrumentSpec(SYNC_JOB_DURATION, "histogram", "Dataset sync latency by sync mode."),
+    InstrumentSpec(
+        SYNC_REPLICATION_LAG,
+        "histogram",
+        "How far CDC syncs trail the source change log after each batch, by connector type.",
+    ),
+    InstrumentSpec(BACKGROUND_TASK_DURATION, "histogram", "Background task latency by task."),
+)
+
+
+class Telemetry:
+    """Span and metric entry point shared by the runtime, federation and connectors."""
+
+    def __init__(
+        self,
+        *,
+        exporter: TelemetryExporter | None = None,
+        registry: MetricRegistry | None = None,
+    ) -> None:
+        self.exporter = exporter or NoopTelemetryExporter()
+        self.registry = registry or MetricRegistry()
+        for spec in BUILTIN_INSTRUMENTS:
+            if spec.kind == "counter":
+                self.registry.counter(spec.name, description=spec.description, unit=spec.unit)
+            else:
+                self.registry.histogram(spec.name, description=spec.description, unit=spec.unit)
+
+    @contextmanager
+    def span(self, name: str, *, attributes: Mapping[str, Any] | None = None) -> Iterator[Span]:
+        """Open a span as a child of the calling task's current span."""
+        span = new_child_span(name, attributes=attributes)
+        token = _CURRENT_SPAN.set(span)
+        self.exporter.on_span_start(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            span.end()
+            self.exporter.on_span_end(span)
+
+    @contextmanager
+    def timed(
+        self,
+        name: str,
+        *,
+        histogram: str,
+        labels: Mapping[str, Any] | None = None,
+        attributes: Mapping[str, Any] | None = None,
+    ) -> Iterator[Span]:
+        """Open a span and record its duration in `histogram`, labelled with its outcome."""
+        with self.span(name, attributes={**(labels or {}), **(attributes or {})}) as span:
+            outcome = "error"
+            try:
+                yield span
+                if span.status != "error":
+                    outcome = "ok"
+            finally:
+                self.observe(histogram, span.duration_s, labels={**(labels or {}), "status": outcome})
+
+    def increment(self, name: str, value: float = 1.0, *, labels: Mapping[str, Any] | None = None) -> None:
+        counter = self.registry.counter(name)
+        normalized = _normalize_labels(labels)
+        counter.add(value, labels=normalized)
+        self.exporter.on_measurement(counter, value, normalized)
+
+    def observe(self, name: str, value: float, *, labels: Mapping[str, Any] | None = None) -> None:
+        histogram = self.registry.histogram(name)
+        normalized = _normalize_labels(labels)
+        histogram.observe(value, labels=normalized)
+        self.exporter.on_measurement(histogram, value, normalized)
+
+    def observe_since(self, name: str, started: float, *, labels: Mapping[str, Any] | None = None) -> None:
+        """Record `time.perf_counter() - started` into a histogram."""
+        self.observe(name, max(0.0, time.perf_counter() - started), labels=labels)
+
+
+_telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    return _telemetry
+
+
+def configure_telemetry(
+    *,
+    exporter: TelemetryExporter | None = None,
+    registry: MetricRegistry | None = None,
+) -> Telemetry:
+    """Replace the process-wide telemetry. The current registry is kept unless one is supplied."""
+    global _telemetry
+    previous = _telemetry
+    _telemetry = Telemetry(exporter=exporter, registry=registry or previous.registry)
+    if previous.exporter is not _telemetry.exporter:
+        previous.exporter.shutdown()
+    return _telemetry
+
+
+@contextmanager
+def use_telemetry(telemetry: Telemetry) -> Iterator[Telemetry]:
+    """Temporarily install `telemetry` as the process-wide instance (for tests)."""
+    global _telemetry
+    previous = _telemetry
+    _telemetry = telemetry
+    try:
+        yield telemetry
+    finally:
+        _telemetry = previous
+
+
+def span(name: str, *, attributes: Mapping[str, Any] | None = None):
+    return _telemetry.span(name, attributes=attributes)
+
+
+def timed(
+    name: str,
+    *,
+    histogram: str,
+    labels: Mapping[str, Any] | None = None,
+    attributes: Mapping[str, Any] | None = None,
+):
+    return _telemetry.timed(name, histogram=histogram, labels=labels, attributes=attributes)
+
+
+def increment(name: str, value: float = 1.0, *, labels: Mapping[str, Any] | None = None) -> None:
+    _telemetry.increment(name, value, labels=labels)
+
+
+def observe(name: str, value: float, *, labels: Mapping[str, Any] | None = None) -> None:
+    _telemetry.observe(name, value, labels=labels)
+
+
+def observe_since(name: str, started: float, *, labels: Mapping[str, Any] | None = None) -> None:
+    _telemetry.observe_since(name, started, labels=labels)
+
+
+def _normalize_labels(labels: Mapping[str, Any] | None) -> dict[str, str]:
+    if not labels:
+        return {}
+    return {str(key): "" if value is None else str(value) for key, value in labels.items()}
@@ -0,0 +1,178 @@
+import re
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import ClassVar, Literal, Mapping, Sequence
+
+InstrumentKind = Literal["counter", "histogram"]
+LabelSet = tuple[tuple[str, str], ...]
+
+DEFAULT_DURATION_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+_METRIC_NAME_PATTERN = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+
+
+def label_set(labels: Mapping[str, object] | None) -> LabelSet:
+    if not labels:
+        return ()
+    return tuple(sorted((str(key), "" if value is None else str(value)) for key, value in labels.items()))
+
+
+class Instrument:
+    kind: ClassVar[InstrumentKind]
+
+    def __init__(self, name: str, *, description: str = "", unit: str = "") -> None:
+        if not _METRIC_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid metric name '{name}'.")
+        self.name = name
+        self.description = description
+        self.unit = unit
+        self._lock = threading.Lock()
+
+
+class Counter(Instrument):
+    """Monotonic sum per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, *, description: str = "", unit: str = "") -> None:
+        super().__init__(name, description=description, unit=unit)
+        self._values: dict[LabelSet, float] = {}
+
+    def add(self, value: float = 1.0, *, labels: Mapping[str, object] | None = None) -> None:
+        if value < 0:
+            raise ValueError(f"Counter '{self.name}' cannot be decremented.")
+        key = label_set(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def value(self, *, labels: Mapping[str, object] | None = None) -> float:
+        with self._lock:
+            return self._values.get(label_set(labels), 0.0)
+
+    def samples(self) -> list[tuple[LabelSet, float]]:
+        with self._lock:
+            return sorted(self._values.items())
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    buckets: tuple[float, ...]
+    bucket_counts: tuple[int, ...]
+    sum: float
+    count: int
+
+    @property
+    def cumulative_counts(self) -> tuple[int, ...]:
+        """Counts per `le` bound, ending with the implicit +Inf bucket."""
+        running = 0
+        cumulative: list[int] = []
+        for count in self.bucket_counts:
+            running += count
+            cumulative.append(running)
+        return tuple(cumulative)
+
+
+class Histogram(Instrument):
+    """Fixed-bucket distribution per label set, Prometheus `le` semantics."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        description: str = "",
+        unit: str = "",
+        buckets: Sequence[float] | None = None,
+    ) -> None:
+        super().__init__(name, description=description, unit=unit)
+        self.buckets = tuple(sorted(set(float(bound) for bound in (buckets or DEFAULT_DURATION_BUCKETS))))
+        self._states: dict[LabelSet, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *, labels: Mapping[str, object] | None = None) -> None:
+        key = label_set(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = ([0] * (len(self.buckets) + 1), [0.0])
+                self._states[key] = state
+            state[0][index] += 1
+            state[1][0] += value
+
+    def snapshot(self, *, labels: Mapping[str, object] | None = None) -> HistogramSnapshot | None:
+        with self._lock:
+            state = self._states.get(label_set(labels))
+            return None if state is None else self._snapshot(state)
+
+    def samples(self) -> list[tuple[LabelSet, HistogramSnapshot]]:
+        with self._lock:
+            return [(key, self._snapshot(state)) for key, state in sorted(self._states.items())]
+
+    def _snapshot(self, state: tuple[list[int], list[float]]) -> HistogramSnapshot:
+        counts, total = state
+        return HistogramSnapshot(
+            buckets=self.buckets,
+            bucket_counts=tuple(counts),
+            sum=total[0],
+            count=sum(counts),
+        )
+
+
+class MetricRegistry:
+    """Process-local store of named instruments; the source for `/metrics`."""
+
+    def __init__(self) -> None:
+        self._instruments: dict[str, Instrument] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, *, description: str = "", unit: str = "") -> Counter:
+        return self._get_or_create(Counter, name, description=description, unit=unit)
+
+    def histogram(
+        self,
+        name: str,
+        *,
+        description: str = "",
+        unit: str = "",
+        buckets: Sequence[float] | None = None,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, description=description, unit=unit, buckets=buckets)
+
+    def get(self, name: str) -> Instrument | None:
+        return self._instruments.get(name)
+
+    def instruments(self) -> list[Instrument]:
+        with self._lock:
+            return [self._instruments[name] for name in sorted(self._instruments)]
+
+    def _get_or_create(self, instrument_type: type, name: str, **kwargs) -> Counter | Histogram:
+        existing = self._instruments.get(name)
+        if existing is None:
+            with self._lock:
+                existing = self._instruments.get(name)
+                if existing is None:
+                    existing = instrument_type(name, **kwargs)
+                    self._instruments[name] = existing
+        if not isinstance(existing, instrument_type):
+            raise ValueError(f"Metric '{name}' is already registered as a {existing.kind}.")
+        return existing
@@ -0,0 +1,49 @@
+import math
+
+from langbridge.telemetry.metrics import Counter, Histogram, LabelSet, MetricRegistry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_prometheus(registry: MetricRegistry) -> str:
+    """Render every instrument in the Prometheus text exposition format (0.0.4)."""
+    lines: list[str] = []
+    for instrument in registry.instruments():
+        if instrument.description:
+            lines.append(f"# HELP {instrument.name} {_escape_help(instrument.description)}")
+        lines.append(f"# TYPE {instrument.name} {instrument.kind}")
+        if isinstance(instrument, Counter):
+            for labels, value in instrument.samples():
+                lines.append(f"{instrument.name}{_format_labels(labels)} {_format_value(value)}")
+        elif isinstance(instrument, Histogram):
+            for labels, snapshot in instrument.samples():
+                bounds = [_format_value(bound) for bound in snapshot.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, snapshot.cumulative_counts):
+                    bucket_labels = labels + (("le", bound),)
+                    lines.append(f"{instrument.name}_bucket{_format_labels(bucket_labels)} {count}")
+                lines.append(f"{instrument.name}_sum{_format_labels(labels)} {_format_value(snapshot.sum)}")
+                lines.append(f"{instrument.name}_count{_format_labels(labels)} {snapshot.count}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels)
+    return "{" + rendered + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
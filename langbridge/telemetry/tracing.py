@@ -0,0 +1,85 @@
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal, Mapping
+
+SpanStatus = Literal["unset", "ok", "error"]
+SpanAttributeValue = str | bool | int | float
+
+_CURRENT_SPAN: ContextVar["Span | None"] = ContextVar("langbridge_current_span", default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed unit of work. Spans opened inside another span's scope become its children."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None = None
+    attributes: dict[str, SpanAttributeValue] = field(default_factory=dict)
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int | None = None
+    status: SpanStatus = "unset"
+    status_message: str | None = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    _duration_s: float | None = field(default=None, repr=False)
+
+    @property
+    def is_recording(self) -> bool:
+        return self.end_time_ns is None
+
+    @property
+    def duration_s(self) -> float:
+        if self._duration_s is not None:
+            return self._duration_s
+        return time.perf_counter() - self._started
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is None:
+            return
+        self.attributes[key] = _coerce_attribute(value)
+
+    def set_attributes(self, attributes: Mapping[str, Any] | None) -> None:
+        for key, value in (attributes or {}).items():
+            self.set_attribute(key, value)
+
+    def set_status(self, status: SpanStatus, message: str | None = None) -> None:
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.set_status("error", str(exc) or type(exc).__name__)
+        self.attributes["exception.type"] = type(exc).__name__
+
+    def end(self) -> None:
+        if not self.is_recording:
+            return
+        self._duration_s = time.perf_counter() - self._started
+        self.end_time_ns = self.start_time_ns + int(self._duration_s * 1_000_000_000)
+        if self.status == "unset":
+            self.status = "ok"
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span of the calling task, if any."""
+    return _CURRENT_SPAN.get()
+
+
+def new_child_span(name: str, *, attributes: Mapping[str, Any] | None = None) -> Span:
+    parent = _CURRENT_SPAN.get()
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent is not None else os.urandom(16).hex(),
+        span_id=os.urandom(8).hex(),
+        parent_span_id=parent.span_id if parent is not None else None,
+    )
+    span.set_attributes(attributes)
+    return span
+
+
+def _coerce_attribute(value: Any) -> SpanAttributeValue:
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
@@ -16,6 +16,7 @@ PYTHON_BOUNDARY_ROOTS = [
     REPO_ROOT / "langbridge-connectors",
     REPO_ROOT / "tests",
     REPO_ROOT / "scripts",
+    REPO_ROOT / "benchmarks",
 ]
 FORBIDDEN_PATHS = [
     REPO_ROOT / "apps" / "worker",
@@ -28,6 +29,12 @@ FORBIDDEN_IMPORT_PREFIXES = (
     "langbridge_cloud_api",
     "langbridge_cloud_worker",
 )
+# Lower layers the runtime builds on must not import it back.
+LAYERED_IMPORT_RULES = {
+    REPO_ROOT / "langbridge" / "federation": ("langbridge.runtime",),
+    REPO_ROOT / "langbridge" / "storage": ("langbridge.runtime", "langbridge.federation"),
+    REPO_ROOT / "langbridge" / "telemetry": ("langbridge.runtime", "langbridge.federation"),
+}
 
 
 def _is_forbidden(module_name: str | None) -> bool:
@@ -45,6 +52,12 @@ def _is_forbidden_runtime_import(module_name: str | None) -> bool:
     )
 
 
+def _has_prefix(module_name: str | None, prefixes: tuple[str, ...]) -> bool:
+    if module_name is None:
+        return False
+    return any(module_name == prefix or module_name.startswith(f"{prefix}.") for prefix in prefixes)
+
+
 def _iter_python_files(root: Path) -> list[Path]:
     if not root.exists():
         return []
@@ -83,6 +96,18 @@ def main() -> int:
                     if _is_forbidden_runtime_import(node.module):
                         violations.append((path, node.lineno, node.module or ""))
 
+    for root, prefixes in LAYERED_IMPORT_RULES.items():
+        for path in _iter_python_files(root):
+            tree = ast.parse(path.read_text(encoding="utf-8-sig"), filename=str(path))
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        if _has_prefix(alias.name, prefixes):
+                            violations.append((path, node.lineno, alias.name))
+                elif isinstance(node, ast.ImportFrom):
+                    if _has_prefix(node.module, prefixes):
+                        violations.append((path, node.lineno, node.module or ""))
+
     if not violations and not missing_path_violations:
         print("runtime boundary check passed")
         return 0
@@ -42,9 +42,14 @@ def _ensure_opentelemetry_stub() -> None:
         def add_span_processor(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
             return None
 
+    class _MeterProvider:
+        def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+            pass
+
     opentelemetry = types.ModuleType("opentelemetry")
     opentelemetry._logs = types.SimpleNamespace(set_logger_provider=lambda *_args, **_kwargs: None)
     opentelemetry.trace = types.SimpleNamespace(set_tracer_provider=lambda *_args, **_kwargs: None)
+    opentelemetry.metrics = types.SimpleNamespace(set_meter_provider=lambda *_args, **_kwargs: None)
 
     modules = {
         "opentelemetry": opentelemetry,
@@ -53,28 +58,36 @@ def _ensure_opentelemetry_stub() -> None:
         "opentelemetry.exporter.otlp.proto": types.ModuleType("opentelemetry.exporter.otlp.proto"),
         "opentelemetry.exporter.otlp.proto.grpc": types.ModuleType("opentelemetry.exporter.otlp.proto.grpc"),
         "opentelemetry.exporter.otlp.proto.grpc._log_exporter": types.ModuleType("opentelemetry.exporter.otlp.proto.grpc._log_exporter"),
+        "opentelemetry.exporter.otlp.proto.grpc.metric_exporter": types.ModuleType("opentelemetry.exporter.otlp.proto.grpc.metric_exporter"),
         "opentelemetry.exporter.otlp.proto.grpc.trace_exporter": types.ModuleType("opentelemetry.exporter.otlp.proto.grpc.trace_exporter"),
         "opentelemetry.exporter.otlp.proto.http": types.ModuleType("opentelemetry.exporter.otlp.proto.http"),
         "opentelemetry.exporter.otlp.proto.http._log_exporter": types.ModuleType("opentelemetry.exporter.otlp.proto.http._log_exporter"),
+        "opentelemetry.exporter.otlp.proto.http.metric_exporter": types.ModuleType("opentelemetry.exporter.otlp.proto.http.metric_exporter"),
         "opentelemetry.exporter.otlp.proto.http.trace_exporter": types.ModuleType("opentelemetry.exporter.otlp.proto.http.trace_exporter"),
         "opentelemetry.instrumentation": types.ModuleType("opentelemetry.instrumentation"),
         "opentelemetry.instrumentation.logging": types.ModuleType("opentelemetry.instrumentation.logging"),
         "opentelemetry.sdk": types.ModuleType("opentelemetry.sdk"),
         "opentelemetry.sdk._logs": types.ModuleType("opentelemetry.sdk._logs"),
         "opentelemetry.sdk._logs.export": types.ModuleType("opentelemetry.sdk._logs.export"),
+        "opentelemetry.sdk.metrics": types.ModuleType("opentelemetry.sdk.metrics"),
+        "opentelemetry.sdk.metrics.export": types.ModuleType("opentelemetry.sdk.metrics.export"),
         "opentelemetry.sdk.resources": types.ModuleType("opentelemetry.sdk.resources"),
         "opentelemetry.sdk.trace": types.ModuleType("opentelemetry.sdk.trace"),
         "opentelemetry.sdk.trace.export": types.ModuleType("opentelemetry.sdk.trace.export"),
     }
 
     modules["opentelemetry.exporter.otlp.proto.grpc._log_exporter"].OTLPLogExporter = _NoopExporter
+    modules["opentelemetry.exporter.otlp.proto.grpc.metric_exporter"].OTLPMetricExporter = _NoopExporter
     modules["opentelemetry.exporter.otlp.proto.grpc.trace_exporter"].OTLPSpanExporter = _NoopExporter
     modules["opentelemetry.exporter.otlp.proto.http._log_exporter"].OTLPLogExporter = _NoopExporter
+    modules["opentelemetry.exporter.otlp.proto.http.metric_exporter"].OTLPMetricExporter = _NoopExporter
     modules["opentelemetry.exporter.otlp.proto.http.trace_exporter"].OTLPSpanExporter = _NoopExporter
     modules["opentelemetry.instrumentation.logging"].LoggingInstrumentor = _NoopInstrumentor
     modules["opentelemetry.sdk._logs"].LoggerProvider = _LoggerProvider
     modules["opentelemetry.sdk._logs"].LoggingHandler = _LoggingHandler
     modules["opentelemetry.sdk._logs.export"].BatchLogRecordProcessor = _NoopProcessor
+    modules["opentelemetry.sdk.metrics"].MeterProvider = _MeterProvider
+    modules["opentelemetry.sdk.metrics.export"].PeriodicExportingMetricReader = _NoopProcessor
     modules["opentelemetry.sdk.resources"].Resource = _Resource
     modules["opentelemetry.sdk.trace"].TracerProvider = _TracerProvider
     modules["opentelemetry.sdk.trace.export"].BatchSpanProcessor = _NoopProcessor
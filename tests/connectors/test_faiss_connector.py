@@ -1,7 +1,9 @@
 import asyncio
+import json
 import pathlib
 import sys
 
+import numpy as np
 import pytest
 
 pytest.importorskip("faiss")
@@ -60,3 +62,85 @@ def test_faiss_connector_enforces_dimension(tmp_path):
             await connector.upsert_vectors([[1.0, 0.0, 0.5]], metadata=[None])
 
     asyncio.run(_run())
+
+
+def test_faiss_connector_snapshots_logged_changes_and_replays_the_rest(tmp_path):
+    async def _run() -> None:
+        config = FaissConnectorConfig(location=str(tmp_path), snapshot_every=4)
+        connector = FaissConnector(config=config)
+        ids = await connector.upsert_vectors(
+            [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+            metadata=[{"value": "a"}, {"value": "b"}, {"value": "c"}],
+        )
+        await connector.delete_vectors([ids[0]])
+        assert list(tmp_path.glob("index.*.faiss"))
+
+        # Logged after the snapshot: one more vector and a delete of a snapshotted one.
+        await connector.upsert_vectors([[0.9, 0.1]], metadata=[{"value": "d"}])
+        await connector.delete_vectors([ids[1]])
+
+        restored = FaissConnector(config=config)
+        assert await restored.list_vectors() == {3: {"value": "c"}, 4: {"value": "d"}}
+        matches = await restored.search([0.0, 1.0], top_k=3)
+        assert [match["id"] for match in matches] == [3, 4]
+        assert await restored.upsert_vectors([[0.0, 1.0]]) == [5]
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize("index_type", ["hnsw", "ivf_flat", "ivf_pq"])
+def test_faiss_connector_builds_approximate_indexes(tmp_path, index_type):
+    async def _run() -> None:
+        config = FaissConnectorConfig(
+            location=str(tmp_path),
+            index_type=index_type,
+            nlist=4,
+            nprobe=4,
+            pq_m=4,
+            train_min_vectors=200,
+            snapshot_every=100,
+        )
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(400, 8)).astype("float32")
+        connector = FaissConnector(config=config)
+        ids = await connector.upsert_vectors(vectors.tolist(), metadata=[{"row": row} for row in range(400)])
+        await connector.delete_vectors(ids[:50])
+
+        restored = FaissConnector(config=config)
+        await restored.test_connection()
+        assert restored._main_kind == index_type
+        # Approximate indexes need not rank the query vector itself first (PQ is lossy),
+        # but it should be among the nearest few for almost every live row.
+        matches = await restored.search(vectors[123].tolist(), top_k=10)
+        assert {"row": 123} in [match["metadata"] for match in matches]
+        queried = range(50, 400, 7)
+        found = 0
+        for row in queried:
+            matches = await restored.search(vectors[row].tolist(), top_k=10)
+            found += {"row": row} in [match["metadata"] for match in matches]
+        assert found / len(queried) >= 0.9
+        matches = await restored.search(vectors[10].tolist(), top_k=5)
+        assert all(match["id"] not in ids[:50] for match in matches)
+
+    asyncio.run(_run())
+
+
+def test_faiss_connector_migrates_json_metadata_indexes(tmp_path):
+    import faiss
+
+    index = faiss.IndexIDMap(faiss.IndexFlatIP(2))
+    index.add_with_ids(np.asarray([[1.0, 0.0], [0.0, 1.0]], dtype="float32"), np.asarray([1, 2], dtype="int64"))
+    faiss.write_index(index, str(tmp_path / "index.faiss"))
+    (tmp_path / "index.faiss.meta.json").write_text(
+        json.dumps({"dimension": 2, "next_id": 3, "metadata": {"1": {"value": "a"}, "2": {"value": "b"}}}),
+        encoding="utf-8",
+    )
+
+    async def _run() -> None:
+        connector = FaissConnector(config=FaissConnectorConfig(location=str(tmp_path)))
+        matches = await connector.search([0.0, 1.0], top_k=1)
+        assert matches[0]["metadata"] == {"value": "b"}
+        assert await connector.upsert_vectors([[1.0, 1.0]]) == [3]
+        assert not (tmp_path / "index.faiss.meta.json").exists()
+
+    asyncio.run(_run())
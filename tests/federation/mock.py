@@ -1,6 +1,7 @@
 ﻿
 import time
 
+import duckdb
 import pyarrow as pa
 
 from langbridge.federation.connectors.base import RemoteExecutionResult, RemoteSource, SourceCapabilities
@@ -26,7 +27,7 @@ class MockArrowRemoteSource(RemoteSource):
     def dialect(self) -> str:
         return self._dialect
 
-    async def execute(self, subplan: SourceSubplan) -> RemoteExecutionResult:
+    async def execute(self, subplan: SourceSubplan, *, cancellation=None) -> RemoteExecutionResult:
         stage_start = time.perf_counter()
         table = self._tables.get(subplan.table_key)
         if table is None:
@@ -53,3 +54,27 @@ class MockArrowRemoteSource(RemoteSource):
         row_count = float(table.num_rows)
         avg_bytes = float(table.nbytes / max(table.num_rows, 1))
         return TableStatistics(row_count_estimate=row_count, bytes_per_row=avg_bytes)
+
+
+class DuckDbArrowRemoteSource(MockArrowRemoteSource):
+    """Mock source that runs the pushed-down subplan SQL over its tables, recording every statement."""
+
+    def __init__(self, *, source_id: str, tables: dict[str, pa.Table], schema: str = "public") -> None:
+        super().__init__(source_id=source_id, tables=tables, dialect="duckdb")
+        self._schema = schema
+        self.executed_sql: list[str] = []
+
+    async def execute(self, subplan: SourceSubplan, *, cancellation=None) -> RemoteExecutionResult:
+        stage_start = time.perf_counter()
+        self.executed_sql.append(subplan.sql or "")
+        connection = duckdb.connect(database=":memory:")
+        try:
+            connection.execute(f"CREATE SCHEMA IF NOT EXISTS {self._schema}")
+            for table_key, table in self._tables.items():
+                connection.register(f"{table_key}_arrow", table)
+                connection.execute(f"CREATE TABLE {self._schema}.{table_key} AS SELECT * FROM {table_key}_arrow")
+            table = connection.execute(subplan.sql).arrow()
+        finally:
+            connection.close()
+        elapsed = int((time.perf_counter() - stage_start) * 1000)
+        return RemoteExecutionResult(table=table, elapsed_ms=elapsed)
@@ -15,8 +15,10 @@ from langbridge.federation.models import (
     VirtualDataset,
     VirtualTableBinding,
 )
+from langbridge.federation.planner import CompiledQuery, FederatedPlanner
 from langbridge.runtime.execution.federated_query_tool import FederatedQueryTool
 from langbridge.runtime.services.semantic_query_execution_service import SemanticQueryExecutionService
+from langbridge.semantic.query import SemanticQuery, SemanticQueryEngine
 
 from tests.helpers.federation_harness import FederationHarness
 from tests.helpers.semantic_harness import SemanticHarness
@@ -93,6 +95,48 @@ def test_cross_source_smq_plan_matches_three_dataset_split_golden() -> None:
     assert actual == harness.expected_plan("three_dataset_split")
 
 
+def test_precompiled_smq_plans_like_the_semantic_query_it_came_from() -> None:
+    harness = FederationHarness()
+    model = harness.semantic.load_unified_model_fixture("commerce_marketing_unified")
+    source_dialects = {"src_commerce": "postgres", "src_marketing": "snowflake"}
+    workflow = harness.build_workflow_for_model(
+        model=model,
+        source_by_dataset={
+            "Commerce__orders": "src_commerce",
+            "Commerce__customers": "src_commerce",
+            "Marketing__campaigns": "src_marketing",
+        },
+        stats_by_dataset={
+            "Commerce__orders": TableStatistics(row_count_estimate=4, bytes_per_row=64),
+            "Commerce__customers": TableStatistics(row_count_estimate=3, bytes_per_row=64),
+            "Marketing__campaigns": TableStatistics(row_count_estimate=3, bytes_per_row=48),
+        },
+        workspace_id="ws-unified",
+        workflow_id="wf-unified",
+    )
+    plan = SemanticQueryEngine().compile(
+        SemanticQuery.model_validate(
+            harness.load_query_fixture("three_dataset_revenue_and_spend").model_dump(by_alias=True, exclude_none=True)
+        ),
+        model,
+        dialect="postgres",
+    )
+
+    output = FederatedPlanner().plan_compiled(
+        query=CompiledQuery(sql=plan.sql, expression=plan.expression),
+        dialect="postgres",
+        workflow=workflow,
+        source_dialects=source_dialects,
+    )
+
+    actual = harness.normalize_planning_output(
+        output=output,
+        input_dialect="postgres",
+        source_dialects=source_dialects,
+    )
+    assert actual == harness.expected_plan("three_dataset_split")
+
+
 def test_cross_source_smq_plan_matches_four_dataset_filtered_split_golden() -> None:
     harness = FederationHarness()
     model = harness.semantic.load_unified_model_fixture("commerce_marketing_support_unified")
@@ -472,10 +516,11 @@ async def test_runtime_semantic_query_service_path_builds_dataset_backed_workflo
         dialect="postgres",
     )
     assert len(tool.calls) == 1
+    assert tool.calls[0]["compiled_query"].sql == result.compiled_sql
     workflow = tool.calls[0]["workflow"]
-    assert sorted(workflow["dataset"]["tables"]) == ["customers", "orders"]
-    assert workflow["dataset"]["tables"]["orders"]["table"] == "orders"
-    assert workflow["dataset"]["tables"]["customers"]["schema_name"] == "analytics"
+    assert sorted(workflow.dataset.tables) == ["customers", "orders"]
+    assert workflow.dataset.tables["orders"].table == "orders"
+    assert workflow.dataset.tables["customers"].schema_name == "analytics"
 
 
 @pytest.mark.anyio
@@ -0,0 +1,183 @@
+"""Change data capture against locally started PostgreSQL and MySQL server processes."""
+
+import os
+import shutil
+import socket
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from langbridge.connectors.base.change_capture import ChangeCaptureTable, ChangeOperation
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _wait_for_port(port: int, *, timeout_s: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"Server on port {port} did not start.")
+
+
+@pytest.fixture
+def postgres_port(tmp_path: Path):
+    initdb, pg_ctl = shutil.which("initdb"), shutil.which("pg_ctl")
+    if initdb is None or pg_ctl is None:
+        pytest.skip("PostgreSQL server binaries (initdb, pg_ctl) are not installed.")
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        pytest.skip("PostgreSQL refuses to run as root.")
+    data_dir = tmp_path / "postgres"
+    port = _free_port()
+    subprocess.run([initdb, "-D", str(data_dir), "-U", "postgres", "--auth=trust"], check=True, capture_output=True)
+    subprocess.run(
+        [
+            pg_ctl,
+            "-D",
+            str(data_dir),
+            "-l",
+            str(tmp_path / "postgres.log"),
+            "-o",
+            f"-p {port} -k {tmp_path} -c listen_addresses=127.0.0.1 -c wal_level=logical",
+            "-w",
+            "start",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    try:
+        yield port
+    finally:
+        subprocess.run([pg_ctl, "-D", str(data_dir), "-m", "immediate", "stop"], capture_output=True)
+
+
+@pytest.fixture
+def mysql_port(tmp_path: Path):
+    mysqld = shutil.which("mysqld")
+    if mysqld is None:
+        pytest.skip("mysqld is not installed.")
+    pytest.importorskip("pymysql")
+    pytest.importorskip("pymysqlreplication")
+    data_dir = tmp_path / "mysql"
+    port = _free_port()
+    base_args = [mysqld, "--no-defaults", f"--datadir={data_dir}", "--user=root"]
+    subprocess.run([*base_args, "--initialize-insecure"], check=True, capture_output=True)
+    process = subprocess.Popen(
+        [
+            *base_args,
+            f"--port={port}",
+            "--bind-address=127.0.0.1",
+            f"--socket={tmp_path / 'mysql.sock'}",
+            "--log-bin=binlog",
+            "--server-id=1",
+            "--binlog-format=ROW",
+            "--binlog-row-image=FULL",
+            "--binlog-row-metadata=FULL",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_port(port)
+        yield port
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+@pytest.mark.anyio
+async def test_postgres_change_capture_reads_and_acknowledges_row_changes(postgres_port: int) -> None:
+    psycopg = pytest.importorskip("psycopg")
+    from langbridge.connectors.builtin.postgres.config import PostgresConnectorConfig
+    from langbridge.connectors.builtin.postgres.connector import PostgresConnector
+
+    dsn = f"host=127.0.0.1 port={postgres_port} dbname=postgres user=postgres"
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute("CREATE TABLE orders (id integer PRIMARY KEY, amount double precision)")
+        conn.execute("INSERT INTO orders VALUES (1, 10), (2, 20)")
+
+    connector = PostgresConnector(
+        PostgresConnectorConfig(host="127.0.0.1", port=postgres_port, database="postgres", user="postgres", password="")
+    )
+    tables = [ChangeCaptureTable(schema="public", name="orders")]
+    position = await connector.start_change_capture(slot="langbridge_test", tables=tables)
+
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute("INSERT INTO orders VALUES (3, 30)")
+        conn.execute("UPDATE orders SET amount = 25 WHERE id = 2")
+        conn.execute("DELETE FROM orders WHERE id = 1")
+
+    batch = await connector.read_changes(slot="langbridge_test", tables=tables, position=position, max_events=100)
+
+    assert [(event.operation, event.row) for event in batch.events] == [
+        (ChangeOperation.INSERT, {"id": 3, "amount": 30.0}),
+        (ChangeOperation.UPDATE, {"id": 2, "amount": 25.0}),
+        (ChangeOperation.DELETE, {"id": 1}),
+    ]
+    assert batch.position != position
+    assert batch.has_more is False
+
+    await connector.acknowledge_changes(slot="langbridge_test", position=batch.position)
+    drained = await connector.read_changes(
+        slot="langbridge_test", tables=tables, position=batch.position, max_events=100
+    )
+    assert drained.events == []
+    assert drained.position == batch.position
+    # A restarted capture resumes from the acknowledged position.
+    assert await connector.start_change_capture(slot="langbridge_test", tables=tables) == batch.position
+
+
+@pytest.mark.anyio
+async def test_mysql_change_capture_reads_binlog_row_changes(mysql_port: int) -> None:
+    import pymysql
+
+    from langbridge.connectors.builtin.mysql.config import MySQLConnectorConfig
+    from langbridge.connectors.builtin.mysql.connector import MySqlConnector
+
+    admin = pymysql.connect(host="127.0.0.1", port=mysql_port, user="root", autocommit=True)
+    try:
+        with admin.cursor() as cursor:
+            cursor.execute("CREATE DATABASE shop")
+            cursor.execute("CREATE TABLE shop.orders (id INT PRIMARY KEY, amount DOUBLE) ENGINE=InnoDB")
+            cursor.execute("INSERT INTO shop.orders VALUES (1, 10), (2, 20)")
+
+        connector = MySqlConnector(
+            MySQLConnectorConfig(host="127.0.0.1", port=mysql_port, database="shop", user="root", password="")
+        )
+        tables = [ChangeCaptureTable(schema="shop", name="orders")]
+        position = await connector.start_change_capture(slot="langbridge_test", tables=tables)
+
+        with admin.cursor() as cursor:
+            cursor.execute("INSERT INTO shop.orders VALUES (3, 30)")
+            cursor.execute("UPDATE shop.orders SET amount = 25 WHERE id = 2")
+            cursor.execute("DELETE FROM shop.orders WHERE id = 1")
+    finally:
+        admin.close()
+
+    batch = await connector.read_changes(slot="langbridge_test", tables=tables, position=position, max_events=100)
+
+    assert [(event.operation, event.row) for event in batch.events] == [
+        (ChangeOperation.INSERT, {"id": 3, "amount": 30.0}),
+        (ChangeOperation.UPDATE, {"id": 2, "amount": 25.0}),
+        (ChangeOperation.DELETE, {"id": 1, "amount": 10.0}),
+    ]
+    assert batch.position != position
+    drained = await connector.read_changes(
+        slot="langbridge_test", tables=tables, position=batch.position, max_events=100
+    )
+    assert drained.events == []
+    assert drained.position == batch.position
@@ -278,12 +278,12 @@ async def test_runtime_unified_semantic_query_path_builds_multi_model_workflow()
     assert "Marketing__campaigns__spend" in result.compiled_sql
     assert len(tool.calls) == 1
     workflow = tool.calls[0]["workflow"]
-    assert sorted(workflow["dataset"]["tables"]) == [
+    assert sorted(workflow.dataset.tables) == [
         "Commerce__customers",
         "Commerce__orders",
         "Marketing__campaigns",
     ]
-    assert [relationship["name"] for relationship in workflow["dataset"]["relationships"]] == [
+    assert [relationship.name for relationship in workflow.dataset.relationships] == [
         "Commerce__orders_to_customers",
         "commerce_to_marketing",
     ]
@@ -0,0 +1,90 @@
+import json
+import sqlite3
+
+import duckdb
+import pyarrow.parquet as pq
+
+from benchmarks.compare import compare_reports, compare_samples, mann_whitney_greater
+from benchmarks.fixtures import build_fixtures, fingerprint_tables, generate_tables
+from benchmarks.harness import Benchmark, BenchmarkCase, BenchmarkContext, build_report, run_benchmarks
+
+
+def test_fixture_generation_is_deterministic_per_seed() -> None:
+    first = generate_tables(scale=0.01, seed=7)
+    second = generate_tables(scale=0.01, seed=7)
+    other = generate_tables(scale=0.01, seed=8)
+
+    assert fingerprint_tables(first) == fingerprint_tables(second)
+    assert fingerprint_tables(first) != fingerprint_tables(other)
+    assert set(first) == {"nation", "customer", "orders", "lineitem", "date_dim", "store_sales"}
+
+
+def test_build_fixtures_writes_every_format_and_reuses_manifest(tmp_path) -> None:
+    fixtures = build_fixtures(tmp_path, scale=0.01, seed=7)
+    orders_rows = fixtures.row_counts["orders"]
+
+    sqlite_connection = sqlite3.connect(fixtures.sqlite_path)
+    try:
+        assert sqlite_connection.execute("SELECT COUNT(*) FROM orders").fetchone()[0] == orders_rows
+    finally:
+        sqlite_connection.close()
+    duckdb_connection = duckdb.connect(str(fixtures.duckdb_path), read_only=True)
+    try:
+        assert duckdb_connection.execute("SELECT COUNT(*) FROM lineitem").fetchone()[0] == (
+            fixtures.row_counts["lineitem"]
+        )
+    finally:
+        duckdb_connection.close()
+    assert pq.read_table(fixtures.parquet_path("orders")).num_rows == orders_rows
+    assert fixtures.csv_path("customer").read_text(encoding="utf-8").startswith("c_custkey,")
+
+    fixtures.parquet_path("orders").unlink()
+    reused = build_fixtures(tmp_path, scale=0.01, seed=7)
+    assert reused.fingerprint == fixtures.fingerprint
+    assert not reused.parquet_path("orders").exists()
+
+
+def test_mann_whitney_exact_and_normal_tails() -> None:
+    slower = [2.0, 2.1, 2.2, 2.3, 2.4]
+    faster = [1.0, 1.1, 1.2, 1.3, 1.4]
+
+    assert mann_whitney_greater(slower, faster) == 1 / 252
+    assert mann_whitney_greater(faster, slower) == 1.0
+    assert mann_whitney_greater([1.0] * 20, [1.0] * 20) >= 0.5
+
+
+def test_compare_flags_only_significant_slowdowns_above_threshold() -> None:
+    baseline = [1.00, 1.01, 0.99, 1.02, 0.98, 1.00, 1.01, 0.99]
+
+    regression = compare_samples("slow", baseline, [value * 1.3 for value in baseline])
+    tiny_shift = compare_samples("tiny", baseline, [value * 1.02 for value in baseline])
+    improvement = compare_samples("fast", baseline, [value * 0.7 for value in baseline])
+
+    assert regression.status == "regression"
+    assert tiny_shift.status == "unchanged"
+    assert improvement.status == "improvement"
+
+
+def test_run_benchmarks_produces_comparable_report(tmp_path) -> None:
+    fixtures = build_fixtures(tmp_path / "fixtures", scale=0.01, seed=7)
+    calls: list[str] = []
+
+    async def _async_run() -> None:
+        calls.append("async")
+
+    def _setup(context: BenchmarkContext) -> BenchmarkCase:
+        return BenchmarkCase(run=_async_run, teardown=lambda: calls.append("teardown"))
+
+    results = run_benchmarks(
+        [Benchmark(name="demo.async", kind="micro", description="demo", setup=_setup, inner_loops=2)],
+        context=BenchmarkContext(fixtures=fixtures, work_dir=tmp_path),
+        repeat=3,
+        warmup=1,
+    )
+    report = json.loads(json.dumps(build_report(results, fixtures=fixtures, repeat=3, warmup=1)))
+
+    assert calls.count("async") == 8
+    assert calls[-1] == "teardown"
+    assert len(report["benchmarks"]["demo.async"]["samples"]) == 3
+    assert report["fixtures"]["fingerprint"] == fixtures.fingerprint
+    assert [item.status for item in compare_reports(report, report)] == ["unchanged"]
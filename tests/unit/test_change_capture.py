@@ -0,0 +1,114 @@
+import struct
+from datetime import date, datetime, timezone
+
+import pytest
+
+from langbridge.connectors.base.change_capture import ChangeCaptureTable, ChangeOperation
+from langbridge.connectors.base.errors import ConnectorError
+from langbridge.connectors.builtin.mysql.binlog import (
+    binlog_server_id,
+    check_binlog_settings,
+    format_binlog_position,
+    parse_binlog_position,
+)
+from langbridge.connectors.builtin.postgres.pgoutput import PgOutputDecoder, format_lsn, parse_lsn
+
+_ORDERS = 16384
+
+
+def _text(value: str | None) -> bytes:
+    if value is None:
+        return b"n"
+    encoded = value.encode("utf-8")
+    return b"t" + struct.pack("!i", len(encoded)) + encoded
+
+
+def _tuple(*values: bytes) -> bytes:
+    return struct.pack("!h", len(values)) + b"".join(values)
+
+
+def _relation() -> bytes:
+    columns = [("id", 23), ("amount", 701), ("paid", 16), ("ordered_on", 1082), ("note", 25)]
+    body = b"".join(
+        struct.pack("!b", 1) + name.encode() + b"\x00" + struct.pack("!ii", oid, -1) for name, oid in columns
+    )
+    return (
+        b"R"
+        + struct.pack("!i", _ORDERS)
+        + b"public\x00orders\x00d"
+        + struct.pack("!h", len(columns))
+        + body
+    )
+
+
+def test_pgoutput_decoder_turns_messages_into_typed_change_events() -> None:
+    decoder = PgOutputDecoder()
+    committed_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    committed_micros = int((committed_at - datetime(2000, 1, 1, tzinfo=timezone.utc)).total_seconds() * 1_000_000)
+    messages = [
+        b"B" + struct.pack("!qqi", 0x2000, committed_micros, 7),
+        _relation(),
+        b"I" + struct.pack("!i", _ORDERS) + b"N"
+        + _tuple(_text("1"), _text("9.5"), _text("t"), _text("2026-02-28"), _text(None)),
+        b"U" + struct.pack("!i", _ORDERS) + b"O"
+        + _tuple(_text("1"), _text("9.5"), _text("t"), _text("2026-02-28"), _text(None))
+        + b"N"
+        + _tuple(_text("1"), _text("12.25"), _text("f"), _text("2026-02-28"), b"u"),
+        b"U" + struct.pack("!i", _ORDERS) + b"K"
+        + _tuple(_text("1"), _text(None), _text(None), _text(None), _text(None))
+        + b"N"
+        + _tuple(_text("1"), _text("13"), _text("f"), _text("2026-02-28"), b"u"),
+        b"D" + struct.pack("!i", _ORDERS) + b"K" + _tuple(_text("2"), _text(None), _text(None), _text(None), _text(None)),
+        b"T" + struct.pack("!i", 1) + struct.pack("!b", 0) + struct.pack("!i", _ORDERS),
+        b"C" + struct.pack("!b", 0) + struct.pack("!qqq", 0x2000, 0x2040, committed_micros),
+    ]
+
+    events = [event for message in messages for event in decoder.decode(message, lsn="0/2000")]
+
+    assert [event.operation for event in events] == [
+        ChangeOperation.INSERT,
+        ChangeOperation.UPDATE,
+        ChangeOperation.UPDATE,
+        ChangeOperation.DELETE,
+        ChangeOperation.TRUNCATE,
+    ]
+    assert {event.table for event in events} == {ChangeCaptureTable(schema="public", name="orders")}
+    assert events[0].row == {"id": 1, "amount": 9.5, "paid": True, "ordered_on": date(2026, 2, 28), "note": None}
+    # The unchanged TOASTed `note` value is not sent: a full old row image supplies it...
+    assert events[1].row == {
+        "id": 1,
+        "amount": 12.25,
+        "paid": False,
+        "ordered_on": date(2026, 2, 28),
+        "note": None,
+    }
+    assert events[1].unchanged == frozenset()
+    # ...and without one it is reported as unchanged for the applier to fill in.
+    assert events[2].row == {"id": 1, "amount": 13.0, "paid": False, "ordered_on": date(2026, 2, 28)}
+    assert events[2].unchanged == {"note"}
+    assert events[3].row == {"id": 2}
+    assert events[0].committed_at == committed_at
+    assert format_lsn(decoder.commit_end_lsn) == "0/2040"
+
+
+def test_pgoutput_decoder_rejects_changes_before_their_relation() -> None:
+    with pytest.raises(ValueError, match="unknown relation"):
+        PgOutputDecoder().decode(b"I" + struct.pack("!i", _ORDERS) + b"N" + _tuple(_text("1")), lsn="0/1")
+
+
+def test_change_positions_round_trip() -> None:
+    assert parse_lsn("16/B374D848") == (0x16 << 32) + 0xB374D848
+    assert format_lsn(parse_lsn("16/B374D848")) == "16/B374D848"
+    assert parse_binlog_position(format_binlog_position("binlog.000003", 157)) == ("binlog.000003", 157)
+    with pytest.raises(ValueError):
+        parse_binlog_position("binlog.000003")
+    assert binlog_server_id("langbridge_a") == binlog_server_id("langbridge_a") != binlog_server_id("langbridge_b")
+
+
+def test_binlog_settings_check_requires_full_row_metadata() -> None:
+    check_binlog_settings({"binlog_format": "ROW", "binlog_row_image": "full", "binlog_row_metadata": "FULL"})
+    with pytest.raises(ConnectorError, match="binlog_row_metadata=MINIMAL"):
+        check_binlog_settings({"binlog_format": "ROW", "binlog_row_image": "FULL", "binlog_row_metadata": "MINIMAL"})
+    # Servers before 8.0.14 do not have the variable at all.
+    with pytest.raises(ConnectorError, match="binlog_row_metadata=unset"):
+        check_binlog_settings({"binlog_format": "ROW", "binlog_row_image": "FULL"})
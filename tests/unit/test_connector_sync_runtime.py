@@ -1,11 +1,20 @@
+import asyncio
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import duckdb
 import pyarrow.parquet as pq
 import pytest
 
+from langbridge.connectors.base.change_capture import (
+    ChangeBatch,
+    ChangeCaptureTable,
+    ChangeDataCaptureConnector,
+    ChangeEvent,
+    ChangeOperation,
+)
 from langbridge.connectors.base.config import ConnectorRuntimeType
 from langbridge.connectors.base.connector import ApiExtractResult, ApiResource, QueryResult
 from langbridge.connectors.base.metadata import ColumnMetadata
@@ -31,6 +40,7 @@ from langbridge.runtime.persistence.db.dataset import (
 from langbridge.runtime.persistence.db.lineage import LineageEdgeRecord
 from langbridge.runtime.services.dataset_sync_service import ConnectorSyncRuntime
 from langbridge.runtime.settings import runtime_settings
+from langbridge.storage.dataset_table import DatasetTable
 from langbridge.runtime.utils.lineage import stable_payload_hash
 
 
@@ -289,6 +299,116 @@ class _SqlQueueConnector:
         return list(self._columns)
 
 
+class _DuckDbSqlConnector:
+    """Runs sync queries against an in-memory DuckDB database."""
+
+    SQLGLOT_DIALECT = "duckdb"
+
+    def __init__(self, setup_sql: str, *, primary_key: str | None = None, fail_on_call: int | None = None) -> None:
+        self._connection = duckdb.connect()
+        self._connection.execute(setup_sql)
+        self._primary_key = primary_key
+        self._fail_on_call = fail_on_call
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def test_connection(self) -> None:
+        return None
+
+    async def execute(
+        self,
+        sql: str,
+        *,
+        params: dict[str, Any],
+        max_rows: int | None,
+        timeout_s: int | None,
+    ) -> QueryResult:
+        self.calls.append(sql)
+        if self._fail_on_call == len(self.calls):
+            raise RuntimeError("connection reset")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            cursor = self._connection.execute(sql)
+            rows = [list(row) for row in cursor.fetchall()]
+            columns = [description[0] for description in cursor.description]
+        finally:
+            self.in_flight -= 1
+        return QueryResult(columns=columns, rows=rows, rowcount=len(rows), elapsed_ms=0, sql=sql)
+
+    async def fetch_columns(self, schema: str, table: str) -> list[ColumnMetadata]:
+        if self._primary_key is None:
+            return []
+        return [ColumnMetadata(name=self._primary_key, data_type="integer", is_primary_key=True)]
+
+
+class _DuckDbChangeCaptureConnector(_DuckDbSqlConnector, ChangeDataCaptureConnector):
+    """DuckDB-backed connector whose change log is a queue of prepared batches."""
+
+    def __init__(self, setup_sql: str, *, primary_key: str, batches: list[ChangeBatch]) -> None:
+        super().__init__(setup_sql, primary_key=primary_key)
+        self.batches = list(batches)
+        self.started: list[tuple[str, list[ChangeCaptureTable]]] = []
+        self.reads: list[tuple[str, int]] = []
+        self.acknowledged: list[str] = []
+
+    async def start_change_capture(self, *, slot: str, tables: list[ChangeCaptureTable]) -> str:
+        self.started.append((slot, list(tables)))
+        return "0/10"
+
+    async def read_changes(
+        self,
+        *,
+        slot: str,
+        tables: list[ChangeCaptureTable],
+        position: str,
+        max_events: int,
+    ) -> ChangeBatch:
+        self.reads.append((position, max_events))
+        return self.batches.pop(0) if self.batches else ChangeBatch(position=position, lag_seconds=0.0)
+
+    async def acknowledge_changes(self, *, slot: str, position: str) -> None:
+        self.acknowledged.append(position)
+
+
+def _change(
+    operation: ChangeOperation,
+    row: dict[str, Any],
+    position: str,
+    *,
+    unchanged: frozenset[str] = frozenset(),
+) -> ChangeEvent:
+    return ChangeEvent(
+        operation=operation,
+        table=ChangeCaptureTable(schema=None, name="orders"),
+        row=row,
+        position=position,
+        unchanged=unchanged,
+    )
+
+
+@pytest.fixture
+def sql_sync_settings():
+    names = (
+        "DATASET_SYNC_SQL_PAGE_ROWS",
+        "DATASET_SYNC_SQL_CHECKPOINT_ROWS",
+        "DATASET_SYNC_SQL_MAX_CONCURRENCY",
+        "DATASET_SYNC_CDC_BATCH_EVENTS",
+    )
+    originals = {name: getattr(runtime_settings, name) for name in names}
+
+    def _apply(**values: int) -> None:
+        for name, value in values.items():
+            object.__setattr__(runtime_settings, name, value)
+
+    try:
+        yield _apply
+    finally:
+        _apply(**originals)
+
+
 def _build_runtime() -> tuple[
     ConnectorSyncRuntime,
     _FakeConnectorSyncStateRepository,
@@ -456,13 +576,12 @@ def _parquet_rows(
     connection_id: uuid.UUID,
     dataset_name: str,
 ) -> list[dict[str, Any]]:
-    path = runtime._dataset_parquet_path(
+    path = runtime._dataset_table_path(
         workspace_id=workspace_id,
         connection_id=connection_id,
         dataset_name=dataset_name,
     )
-    table = pq.read_table(path)
-    return table.to_pylist()
+    return DatasetTable(path).read().to_pylist()
 
 
 @pytest.mark.anyio
@@ -779,6 +898,152 @@ async def test_connector_sync_runtime_incremental_second_sync_only_upserts_new_r
     assert by_id[3]["updated_at"] == "2026-03-02T01:00:00Z"
 
 
+@pytest.mark.anyio
+async def test_connector_sync_runtime_incremental_merge_dedupes_delta_and_widens_types(
+    dataset_storage_dir: Path,
+) -> None:
+    runtime, _, dataset_repository, _, _ = _build_runtime()
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Shopify",
+        connector_type=ConnectorRuntimeType.SHOPIFY,
+    )
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.SHOPIFY,
+        name="shopify_orders",
+        sync_source={"resource": "orders"},
+    )
+    dataset_repository.add(dataset)
+    resource = _resource()
+
+    for records in (
+        [{"id": index, "amount": index * 10} for index in range(1, 6)],
+        [
+            {"id": 2, "amount": 21},
+            {"id": 6, "amount": "n/a"},
+            {"id": None, "amount": 0},
+            {"id": 2, "amount": 22},
+        ],
+    ):
+        connector = _ApiQueueConnector(resource, ApiExtractResult(resource="orders", records=records))
+        _wire_api_runtime(runtime, connector=connector, resource=resource)
+        await runtime.sync_dataset(
+            workspace_id=workspace_id,
+            actor_id=actor_id,
+            connector_record=connector_record,
+            dataset=dataset_repository.items[dataset.id],
+            sync_mode=SYNC_MODE_INCREMENTAL,
+        )
+
+    rows = _parquet_rows(
+        runtime,
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        dataset_name=dataset.name,
+    )
+    assert sorted(rows, key=lambda row: (row["id"] is None, row["id"] or 0)) == [
+        {"amount": "10", "id": 1},
+        {"amount": "22", "id": 2},
+        {"amount": "30", "id": 3},
+        {"amount": "40", "id": 4},
+        {"amount": "50", "id": 5},
+        {"amount": "n/a", "id": 6},
+        {"amount": "0", "id": None},
+    ]
+    assert dataset_repository.items[dataset.id].row_count_estimate == 7
+
+
+@pytest.mark.anyio
+async def test_connector_sync_runtime_incremental_merge_streams_the_staged_delta(
+    dataset_storage_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runtime, _, dataset_repository, _, _ = _build_runtime()
+    original_batch_rows = runtime_settings.DATASET_SYNC_BATCH_ROWS
+    object.__setattr__(runtime_settings, "DATASET_SYNC_BATCH_ROWS", 2)
+    whole_reads: list[str] = []
+    read_table = pq.read_table
+
+    def _recording_read_table(source: Any, *args: Any, **kwargs: Any) -> Any:
+        whole_reads.append(str(source))
+        return read_table(source, *args, **kwargs)
+
+    monkeypatch.setattr(pq, "read_table", _recording_read_table)
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Shopify",
+        connector_type=ConnectorRuntimeType.SHOPIFY,
+    )
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.SHOPIFY,
+        name="shopify_orders",
+        sync_source={"resource": "orders"},
+    )
+    dataset_repository.add(dataset)
+    resource = _resource()
+
+    try:
+        for records in (
+            [{"id": index, "amount": index * 10} for index in range(1, 4)],
+            # Duplicate keys span the delta's read batches.
+            [
+                {"id": 2, "amount": 21},
+                {"id": 4, "amount": 40},
+                {"id": 2, "amount": 22},
+                {"id": 5, "amount": 50},
+                {"id": 4, "amount": 41},
+            ],
+        ):
+            connector = _ApiQueueConnector(resource, ApiExtractResult(resource="orders", records=records))
+            _wire_api_runtime(runtime, connector=connector, resource=resource)
+            await runtime.sync_dataset(
+                workspace_id=workspace_id,
+                actor_id=actor_id,
+                connector_record=connector_record,
+                dataset=dataset_repository.items[dataset.id],
+                sync_mode=SYNC_MODE_INCREMENTAL,
+            )
+    finally:
+        object.__setattr__(runtime_settings, "DATASET_SYNC_BATCH_ROWS", original_batch_rows)
+
+    assert not [path for path in whole_reads if "_staging" in path]
+    rows = _parquet_rows(
+        runtime,
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        dataset_name=dataset.name,
+    )
+    assert sorted(rows, key=lambda row: row["id"]) == [
+        {"amount": 10, "id": 1},
+        {"amount": 22, "id": 2},
+        {"amount": 30, "id": 3},
+        {"amount": 41, "id": 4},
+        {"amount": 50, "id": 5},
+    ]
+    table_path = runtime._dataset_table_path(
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        dataset_name=dataset.name,
+    )
+    assert not any((table_path / "_staging").iterdir())
+
+
 @pytest.mark.anyio
 async def test_connector_sync_runtime_falls_back_to_full_refresh_for_non_incremental_resources(
     dataset_storage_dir: Path,
@@ -859,6 +1124,91 @@ async def test_connector_sync_runtime_falls_back_to_full_refresh_for_non_increme
     assert second_connector.calls[0]["since"] is None
 
 
+@pytest.mark.anyio
+async def test_connector_sync_runtime_streams_pages_into_bounded_row_groups(
+    dataset_storage_dir: Path,
+) -> None:
+    runtime, state_repository, dataset_repository, _, _ = _build_runtime()
+    original_batch_rows = runtime_settings.DATASET_SYNC_BATCH_ROWS
+    object.__setattr__(runtime_settings, "DATASET_SYNC_BATCH_ROWS", 2)
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Analytics",
+        connector_type=ConnectorRuntimeType.GOOGLE_ANALYTICS,
+    )
+    resource = _resource(name="sessions", incremental_cursor_field=None, supports_incremental=False)
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.GOOGLE_ANALYTICS,
+        name="ga_sessions",
+        sync_source={"resource": "sessions"},
+        strategy=SYNC_MODE_FULL_REFRESH,
+    )
+    dataset_repository.add(dataset)
+    connector = _ApiQueueConnector(
+        resource,
+        ApiExtractResult(
+            resource="sessions",
+            records=[{"id": "a", "sessions": 12}, {"id": "b", "sessions": 6}, {"id": "c", "sessions": 1}],
+            next_cursor="page-2",
+        ),
+        ApiExtractResult(
+            resource="sessions",
+            # Later pages widen `sessions` to float and introduce a new column.
+            records=[{"id": "d", "sessions": 2.5, "bounce_rate": 0.4}],
+        ),
+    )
+    _wire_api_runtime(runtime, connector=connector, resource=resource)
+
+    try:
+        await runtime.sync_dataset(
+            workspace_id=workspace_id,
+            actor_id=actor_id,
+            connector_record=connector_record,
+            dataset=dataset,
+            sync_mode=SYNC_MODE_FULL_REFRESH,
+        )
+    finally:
+        object.__setattr__(runtime_settings, "DATASET_SYNC_BATCH_ROWS", original_batch_rows)
+
+    table_path = runtime._dataset_table_path(
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        dataset_name=dataset.name,
+    )
+    snapshot = DatasetTable(table_path).current_snapshot()
+    assert snapshot is not None and len(snapshot.data_files) == 1
+    path = table_path / snapshot.data_files[0].path
+    parquet_file = pq.ParquetFile(path)
+    row_groups = [parquet_file.metadata.row_group(index).num_rows for index in range(parquet_file.num_row_groups)]
+    assert row_groups == [2, 2]
+    assert parquet_file.schema_arrow.names == ["bounce_rate", "id", "sessions"]
+    assert str(parquet_file.schema_arrow.field("sessions").type) == "double"
+    assert parquet_file.read().to_pylist() == [
+        {"bounce_rate": None, "id": "a", "sessions": 12.0},
+        {"bounce_rate": None, "id": "b", "sessions": 6.0},
+        {"bounce_rate": None, "id": "c", "sessions": 1.0},
+        {"bounce_rate": 0.4, "id": "d", "sessions": 2.5},
+    ]
+    assert sorted(item.name for item in path.parent.iterdir()) == [path.name]
+    assert not any((table_path / "_staging").iterdir())
+    state = await state_repository.get_for_resource(
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        resource_name="resource:sessions",
+    )
+    assert state is not None
+    assert state.records_synced == 4
+    assert dataset_repository.items[dataset.id].row_count_estimate == 4
+
+
 @pytest.mark.anyio
 async def test_connector_sync_runtime_failure_does_not_advance_checkpoint_state(
     dataset_storage_dir: Path,
@@ -979,7 +1329,9 @@ async def test_connector_sync_runtime_materializes_sql_table_source(
         resource_name="table:orders",
     )
 
-    assert connector.calls[0]["sql"] == "SELECT * FROM orders"
+    assert connector.calls[0]["sql"] == (
+        "SELECT * FROM (SELECT * FROM orders) AS langbridge_sync_source ORDER BY id LIMIT 50000"
+    )
     assert summary["source_key"] == "table:orders"
     assert summary["source"] == {"table": "orders"}
     assert summary["records_synced"] == 2
@@ -1082,3 +1434,446 @@ async def test_connector_sync_runtime_materializes_sql_query_source_with_cursor_
         dataset_name=dataset.name,
     )
     assert rows == [{"id": 3, "updated_at": "2026-03-02T01:00:00Z", "total_amount": 33.0}]
+
+
+@pytest.mark.anyio
+async def test_connector_sync_runtime_pages_sql_source_and_resumes_from_checkpoint(
+    dataset_storage_dir: Path,
+    sql_sync_settings,
+) -> None:
+    sql_sync_settings(DATASET_SYNC_SQL_PAGE_ROWS=2, DATASET_SYNC_SQL_CHECKPOINT_ROWS=2)
+    runtime, state_repository, dataset_repository, _, _ = _build_runtime()
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Sales warehouse",
+        connector_type=ConnectorRuntimeType.POSTGRES,
+    )
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.POSTGRES,
+        name="orders_snapshot",
+        sync_source={"table": "orders"},
+        strategy=SYNC_MODE_FULL_REFRESH,
+    )
+    dataset_repository.add(dataset)
+    setup_sql = "CREATE TABLE orders AS SELECT range AS id, range * 1.5 AS amount FROM range(1, 8)"
+
+    failing = _DuckDbSqlConnector(setup_sql, primary_key="id", fail_on_call=3)
+    _wire_sql_runtime(runtime, connector=failing)
+    with pytest.raises(RuntimeError, match="connection reset"):
+        await runtime.sync_dataset(
+            workspace_id=workspace_id,
+            actor_id=actor_id,
+            connector_record=connector_record,
+            dataset=dataset,
+            sync_mode=SYNC_MODE_FULL_REFRESH,
+        )
+    state = await state_repository.get_for_resource(
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        resource_name="table:orders",
+    )
+    assert state is not None
+    await runtime.mark_failed(state=state, error_message="connection reset")
+    checkpoint = state.state["sql_checkpoint"]
+    assert len(checkpoint["parts"]) == 2
+    assert checkpoint["ranges"] == [
+        {"lower": None, "upper": None, "after": 4, "cursor": None, "done": False, "nulls": False}
+    ]
+    assert failing.calls[1].endswith("WHERE id > 2 ORDER BY id LIMIT 2")
+
+    resuming = _DuckDbSqlConnector(setup_sql, primary_key="id")
+    _wire_sql_runtime(runtime, connector=resuming)
+    summary = await runtime.sync_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connector_record=connector_record,
+        dataset=dataset_repository.items[dataset.id],
+        sync_mode=SYNC_MODE_FULL_REFRESH,
+    )
+
+    assert resuming.calls == [
+        "SELECT * FROM (SELECT * FROM orders) AS langbridge_sync_source WHERE id > 4 ORDER BY id LIMIT 2",
+        "SELECT * FROM (SELECT * FROM orders) AS langbridge_sync_source WHERE id > 6 ORDER BY id LIMIT 2",
+    ]
+    assert summary["records_synced"] == 7
+    assert state.state["resumed"] is True
+    assert "sql_checkpoint" not in state.state
+    rows = _parquet_rows(runtime, workspace_id=workspace_id, connection_id=connection_id, dataset_name=dataset.name)
+    assert sorted(row["id"] for row in rows) == list(range(1, 8))
+    staging = dataset_storage_dir.rglob("_staging/*")
+    assert [path for path in staging if path.is_file()] == []
+
+
+@pytest.mark.anyio
+async def test_connector_sync_runtime_reads_sql_key_ranges_concurrently(
+    dataset_storage_dir: Path,
+    sql_sync_settings,
+) -> None:
+    sql_sync_settings(DATASET_SYNC_SQL_PAGE_ROWS=2, DATASET_SYNC_SQL_MAX_CONCURRENCY=2)
+    runtime, state_repository, dataset_repository, _, _ = _build_runtime()
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Sales warehouse",
+        connector_type=ConnectorRuntimeType.POSTGRES,
+    )
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.POSTGRES,
+        name="orders_snapshot",
+        sync_source={"table": "orders"},
+        strategy=SYNC_MODE_FULL_REFRESH,
+    )
+    dataset_repository.add(dataset)
+    connector = _DuckDbSqlConnector(
+        "CREATE TABLE orders AS SELECT range AS id FROM range(1, 11)",
+        primary_key="id",
+    )
+    _wire_sql_runtime(runtime, connector=connector)
+
+    summary = await runtime.sync_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connector_record=connector_record,
+        dataset=dataset,
+        sync_mode=SYNC_MODE_FULL_REFRESH,
+    )
+
+    assert connector.calls[0].startswith("SELECT MIN(id) AS lower_key, MAX(id) AS upper_key")
+    assert any("WHERE id < 6 ORDER BY id" in sql for sql in connector.calls)
+    assert any("WHERE id >= 6 ORDER BY id" in sql for sql in connector.calls)
+    assert connector.max_in_flight == 2
+    assert summary["records_synced"] == 10
+    rows = _parquet_rows(runtime, workspace_id=workspace_id, connection_id=connection_id, dataset_name=dataset.name)
+    assert sorted(row["id"] for row in rows) == list(range(1, 11))
+
+
+@pytest.mark.anyio
+async def test_connector_sync_runtime_keeps_tied_and_null_cursor_rows_when_paging(
+    dataset_storage_dir: Path,
+    sql_sync_settings,
+) -> None:
+    sql_sync_settings(DATASET_SYNC_SQL_PAGE_ROWS=2)
+    runtime, state_repository, dataset_repository, _, _ = _build_runtime()
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Events warehouse",
+        connector_type=ConnectorRuntimeType.POSTGRES,
+    )
+    source_sql = "SELECT * FROM events"
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.POSTGRES,
+        name="events_snapshot",
+        sync_source={"sql": source_sql},
+        strategy=SYNC_MODE_FULL_REFRESH,
+        cursor_field="bucket",
+    )
+    dataset_repository.add(dataset)
+    connector = _DuckDbSqlConnector(
+        "CREATE TABLE events AS SELECT * FROM (VALUES "
+        "(1, 10), (2, 10), (3, 10), (4, 20), (5, 20), (6, 30), (7, NULL)) AS t(event_id, bucket)"
+    )
+    _wire_sql_runtime(runtime, connector=connector)
+
+    summary = await runtime.sync_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connector_record=connector_record,
+        dataset=dataset,
+        sync_mode=SYNC_MODE_FULL_REFRESH,
+    )
+
+    assert any(sql.endswith("WHERE bucket = 10") for sql in connector.calls)
+    assert any(sql.endswith("WHERE bucket IS NULL") for sql in connector.calls)
+    assert summary["records_synced"] == 7
+    rows = _parquet_rows(runtime, workspace_id=workspace_id, connection_id=connection_id, dataset_name=dataset.name)
+    assert sorted(row["event_id"] for row in rows) == list(range(1, 8))
+
+
+@pytest.mark.anyio
+async def test_connector_sync_runtime_snapshots_then_applies_change_log(
+    dataset_storage_dir: Path,
+    sql_sync_settings,
+) -> None:
+    sql_sync_settings(DATASET_SYNC_CDC_BATCH_EVENTS=2)
+    runtime, state_repository, dataset_repository, revision_repository, _ = _build_runtime()
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Sales warehouse",
+        connector_type=ConnectorRuntimeType.POSTGRES,
+    )
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.POSTGRES,
+        name="orders_replica",
+        sync_source={"table": "orders"},
+        strategy="CDC",
+    )
+    dataset_repository.add(dataset)
+    connector = _DuckDbChangeCaptureConnector(
+        "CREATE TABLE orders AS SELECT range AS id, CAST(range * 10 AS DOUBLE) AS amount FROM range(1, 4)",
+        primary_key="id",
+        batches=[
+            ChangeBatch(
+                events=[
+                    _change(ChangeOperation.INSERT, {"id": 4, "amount": 40.0}, "0/18"),
+                    _change(ChangeOperation.UPDATE, {"id": 2, "amount": 25.0}, "0/18"),
+                ],
+                position="0/20",
+                has_more=True,
+                lag_seconds=3.0,
+            ),
+            ChangeBatch(
+                events=[
+                    _change(ChangeOperation.DELETE, {"id": 1}, "0/28"),
+                    _change(ChangeOperation.UPDATE, {"id": 4, "amount": 45.0}, "0/28"),
+                ],
+                position="0/30",
+                lag_seconds=0.0,
+                lag_bytes=0,
+            ),
+        ],
+    )
+    _wire_sql_runtime(runtime, connector=connector)
+
+    summary = await runtime.sync_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connector_record=connector_record,
+        dataset=dataset,
+        sync_mode=SYNC_MODE_INCREMENTAL,
+    )
+
+    slot = f"langbridge_{dataset.id.hex[:24]}"
+    assert connector.started == [(slot, [ChangeCaptureTable(schema=None, name="orders")])]
+    assert connector.reads == [("0/10", 2), ("0/20", 2)]
+    assert connector.acknowledged == ["0/20", "0/30"]
+    rows = _parquet_rows(runtime, workspace_id=workspace_id, connection_id=connection_id, dataset_name=dataset.name)
+    assert sorted((row["id"], row["amount"]) for row in rows) == [(2, 25.0), (3, 30.0), (4, 45.0)]
+    state = await state_repository.get_for_resource(
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        resource_name="table:orders",
+    )
+    assert state is not None
+    assert state.last_cursor == "0/30"
+    assert state.state["cdc"] == {
+        "slot": slot,
+        "position": "0/30",
+        "lag_seconds": 0.0,
+        "lag_bytes": 0,
+        "snapshot_rows": 3,
+        "inserts": 1,
+        "updates": 2,
+        "deletes": 1,
+        "truncates": 0,
+    }
+    assert state.state["row_count"] == 3
+    assert summary["records_synced"] == 7
+    assert revision_repository.by_dataset[dataset.id][-1].change_summary.startswith("CDC sync updated dataset")
+
+    # The next sync continues from the stored position without a new snapshot.
+    connector.batches = [
+        ChangeBatch(
+            events=[_change(ChangeOperation.INSERT, {"id": 5, "amount": 50.0}, "0/38")],
+            position="0/40",
+        )
+    ]
+    await runtime.sync_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connector_record=connector_record,
+        dataset=dataset_repository.items[dataset.id],
+        sync_mode=SYNC_MODE_INCREMENTAL,
+    )
+
+    assert len(connector.started) == 1
+    assert connector.reads[-1] == ("0/30", 2)
+    assert state.last_cursor == "0/40"
+    assert state.state["cdc"]["snapshot_rows"] is None
+    rows = _parquet_rows(runtime, workspace_id=workspace_id, connection_id=connection_id, dataset_name=dataset.name)
+    assert sorted(row["id"] for row in rows) == [2, 3, 4, 5]
+
+
+@pytest.mark.anyio
+async def test_connector_sync_runtime_keeps_unchanged_columns_left_out_of_updates(
+    dataset_storage_dir: Path,
+) -> None:
+    runtime, _, dataset_repository, _, _ = _build_runtime()
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Sales warehouse",
+        connector_type=ConnectorRuntimeType.POSTGRES,
+    )
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.POSTGRES,
+        name="orders_replica",
+        sync_source={"table": "orders"},
+        strategy="CDC",
+    )
+    dataset_repository.add(dataset)
+    note = {"note"}
+    connector = _DuckDbChangeCaptureConnector(
+        "CREATE TABLE orders AS "
+        "SELECT range AS id, CAST(range * 10 AS DOUBLE) AS amount, 'long note ' || range AS note FROM range(1, 4)",
+        primary_key="id",
+        batches=[
+            ChangeBatch(
+                events=[
+                    # Postgres leaves unchanged TOASTed values out of an update's new row.
+                    _change(ChangeOperation.UPDATE, {"id": 2, "amount": 25.0}, "0/18", unchanged=frozenset(note)),
+                    _change(ChangeOperation.INSERT, {"id": 4, "amount": 40.0, "note": "fresh"}, "0/18"),
+                    _change(ChangeOperation.UPDATE, {"id": 4, "amount": 45.0}, "0/20", unchanged=frozenset(note)),
+                ],
+                position="0/20",
+            ),
+        ],
+    )
+    _wire_sql_runtime(runtime, connector=connector)
+
+    await runtime.sync_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connector_record=connector_record,
+        dataset=dataset,
+        sync_mode=SYNC_MODE_INCREMENTAL,
+    )
+
+    rows = _parquet_rows(runtime, workspace_id=workspace_id, connection_id=connection_id, dataset_name=dataset.name)
+    assert sorted((row["id"], row["amount"], row["note"]) for row in rows) == [
+        (1, 10.0, "long note 1"),
+        (2, 25.0, "long note 2"),
+        (3, 30.0, "long note 3"),
+        (4, 45.0, "fresh"),
+    ]
+
+    # Without a stored row to take the value from, the update is refused rather than nulled.
+    connector.batches = [
+        ChangeBatch(
+            events=[_change(ChangeOperation.UPDATE, {"id": 9, "amount": 90.0}, "0/28", unchanged=frozenset(note))],
+            position="0/30",
+        )
+    ]
+    with pytest.raises(ValueError, match="REPLICA IDENTITY FULL"):
+        await runtime.sync_dataset(
+            workspace_id=workspace_id,
+            actor_id=actor_id,
+            connector_record=connector_record,
+            dataset=dataset_repository.items[dataset.id],
+            sync_mode=SYNC_MODE_INCREMENTAL,
+        )
+    assert connector.acknowledged[-1] == "0/20"
+
+
+@pytest.mark.anyio
+async def test_connector_sync_runtime_resnapshots_after_truncate_in_change_log(
+    dataset_storage_dir: Path,
+) -> None:
+    runtime, state_repository, dataset_repository, _, _ = _build_runtime()
+
+    workspace_id = uuid.uuid4()
+    actor_id = uuid.uuid4()
+    connection_id = uuid.uuid4()
+    connector_record = _connector_record(
+        connection_id=connection_id,
+        workspace_id=workspace_id,
+        name="Sales warehouse",
+        connector_type=ConnectorRuntimeType.MYSQL,
+    )
+    dataset = _declared_synced_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connection_id=connection_id,
+        connector_type=ConnectorRuntimeType.MYSQL,
+        name="orders_replica",
+        sync_source={"table": "shop.orders"},
+        strategy="CDC",
+    )
+    dataset_repository.add(dataset)
+    connector = _DuckDbChangeCaptureConnector(
+        "CREATE SCHEMA shop; CREATE TABLE shop.orders AS SELECT range AS id FROM range(1, 4)",
+        primary_key="id",
+        batches=[],
+    )
+    _wire_sql_runtime(runtime, connector=connector)
+    await runtime.sync_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connector_record=connector_record,
+        dataset=dataset,
+        sync_mode=SYNC_MODE_INCREMENTAL,
+    )
+
+    connector._connection.execute("DELETE FROM shop.orders; INSERT INTO shop.orders VALUES (7), (8)")
+    connector.batches = [
+        ChangeBatch(
+            events=[
+                ChangeEvent(
+                    operation=ChangeOperation.TRUNCATE,
+                    table=ChangeCaptureTable(schema="shop", name="orders"),
+                    row={},
+                    position="binlog.000002:120",
+                ),
+                _change(ChangeOperation.INSERT, {"id": 7}, "binlog.000002:400"),
+            ],
+            position="binlog.000002:500",
+        )
+    ]
+    await runtime.sync_dataset(
+        workspace_id=workspace_id,
+        actor_id=actor_id,
+        connector_record=connector_record,
+        dataset=dataset_repository.items[dataset.id],
+        sync_mode=SYNC_MODE_INCREMENTAL,
+    )
+
+    state = await state_repository.get_for_resource(
+        workspace_id=workspace_id,
+        connection_id=connection_id,
+        resource_name="table:shop.orders",
+    )
+    assert state is not None
+    assert connector.started[0][1] == [ChangeCaptureTable(schema="shop", name="orders")]
+    assert len(connector.started) == 1
+    assert connector.acknowledged[-1] == "binlog.000002:500"
+    assert state.last_cursor == "binlog.000002:500"
+    assert state.state["cdc"]["truncates"] == 1
+    rows = _parquet_rows(runtime, workspace_id=workspace_id, connection_id=connection_id, dataset_name=dataset.name)
+    assert sorted(row["id"] for row in rows) == [7, 8]
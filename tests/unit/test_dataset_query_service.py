@@ -3,18 +3,31 @@ import asyncio
 import enum
 import sys
 import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
 from langbridge.connectors.base.config import ConnectorFamily
+from langbridge.runtime.execution.federated_query_tool import FederatedQueryTool
 from langbridge.runtime.models import (
     ConnectorMetadata,
     CreateDatasetBulkCreateJobRequest,
+    CreateDatasetProfileJobRequest,
+    DatasetColumnMetadata,
+    DatasetMetadata,
     LifecycleState,
     ManagementMode,
 )
+from langbridge.runtime.models.metadata import (
+    DatasetMaterializationMode,
+    DatasetSourceKind,
+    DatasetStatus,
+    DatasetStorageKind,
+    DatasetType,
+)
 from langbridge.runtime.providers import MemoryConnectorProvider
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -26,6 +39,12 @@ from langbridge.runtime.persistence.db.job import JobStatus  # noqa: E402
 from langbridge.runtime.services.dataset_query_service import (  # noqa: E402
     DatasetQueryService,
 )
+from langbridge.runtime.services.dataset_profiling import (  # noqa: E402
+    ProfileColumn,
+    build_profile_distribution_plan,
+    build_profile_summary_sql,
+    profile_table_sample,
+)
 from langbridge.runtime.services.errors import ExecutionValidationError  # noqa: E402
 
 
@@ -180,3 +199,312 @@ def test_create_table_dataset_from_selection_requires_connector_metadata() -> No
                 columns=request.selections[0].columns,
             )
         )
+
+
+def _parquet_profile_service(tmp_path: Path, table) -> tuple[DatasetQueryService, DatasetMetadata, list]:
+    import pyarrow.parquet as pq
+
+    storage_path = tmp_path / "orders.parquet"
+    pq.write_table(table, storage_path)
+    now = datetime.now(timezone.utc)
+    dataset = DatasetMetadata(
+        id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+        name="orders",
+        sql_alias="orders",
+        tags=[],
+        dataset_type=DatasetType.FILE,
+        materialization_mode=DatasetMaterializationMode.LIVE,
+        source_kind=DatasetSourceKind.FILE,
+        storage_kind=DatasetStorageKind.PARQUET,
+        dialect="duckdb",
+        table_name="orders",
+        storage_uri=storage_path.as_uri(),
+        source={"storage_uri": storage_path.as_uri()},
+        file_config={"format": "parquet"},
+        status=DatasetStatus.PUBLISHED,
+        columns=[],
+        created_at=now,
+        updated_at=now,
+        management_mode=ManagementMode.CONFIG_MANAGED,
+        lifecycle_state=LifecycleState.ACTIVE,
+    )
+    dataset_repository = _DatasetRepository()
+    dataset_repository.add(dataset)
+
+    async def _get_for_workspace(*, dataset_id, workspace_id):
+        return dataset_repository.items.get(dataset_id)
+
+    dataset_repository.get_for_workspace = _get_for_workspace
+    column_repository = _DatasetColumnRepository()
+    for position, field in enumerate(table.schema):
+        column_repository.add(
+            DatasetColumnMetadata(
+                id=uuid.uuid4(),
+                dataset_id=dataset.id,
+                name=field.name,
+                data_type=str(field.type),
+                ordinal_position=position,
+            )
+        )
+    tool = _CountingFederatedQueryTool(connector_provider=MemoryConnectorProvider({}))
+    service = DatasetQueryService(
+        dataset_repository=dataset_repository,
+        dataset_column_repository=column_repository,
+        dataset_policy_repository=_DatasetPolicyRepository(),
+        federated_query_tool=tool,
+    )
+    return service, dataset, tool.queries
+
+
+class _CountingFederatedQueryTool(FederatedQueryTool):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.queries: list[str] = []
+
+    async def execute_federated_query(self, query_payload):
+        self.queries.append(query_payload["query"])
+        return await super().execute_federated_query(query_payload)
+
+
+def test_profile_computes_every_column_in_two_queries(tmp_path: Path) -> None:
+    import pyarrow as pa
+
+    row_count = 1000
+    table = pa.table(
+        {
+            "id": list(range(row_count)),
+            "status": [None if i % 10 == 0 else ["open", "closed", "void"][i % 3] for i in range(row_count)],
+            "amount": [float(i % 100) for i in range(row_count)],
+            "paid": [i % 2 == 0 for i in range(row_count)],
+            "c4": [i % 7 for i in range(row_count)],
+            "c5": [f"sku-{i % 13}" for i in range(row_count)],
+            "c6": [i % 4 for i in range(row_count)],
+        }
+    )
+    service, dataset, queries = _parquet_profile_service(tmp_path, table)
+    request = CreateDatasetProfileJobRequest(
+        dataset_id=dataset.id,
+        workspace_id=dataset.workspace_id,
+        actor_id=uuid.uuid4(),
+    )
+
+    result = asyncio.run(service._run_profile(request))
+
+    # One summary query and one grouped query, however many columns there are.
+    assert len(queries) == 2
+    assert result["row_count_estimate"] == row_count
+    assert result["sampled"] is False
+    assert result["distinct_counts"] == {
+        "id": 1000, "status": 3, "amount": 100, "paid": 2, "c4": 7, "c5": 13, "c6": 4
+    }
+    assert result["null_rates"]["status"] == pytest.approx(0.1)
+    profiles = {profile["name"]: profile for profile in result["columns"]}
+    assert profiles["status"]["min"] == "closed"
+    assert profiles["status"]["max"] == "void"
+    assert profiles["status"]["avg_length"] == pytest.approx(4.667, abs=1e-3)
+    assert [item["value"] for item in profiles["status"]["top_values"]] == ["closed", "open", "void"]
+    assert profiles["paid"]["top_values"] == [{"value": False, "count": 500}, {"value": True, "count": 500}]
+    # Unique columns get a histogram but no top values.
+    assert "top_values" not in profiles["id"]
+    assert [bucket["count"] for bucket in profiles["id"]["histogram"]] == [100] * 10
+    assert profiles["id"]["histogram"][0]["lower"] == 0.0
+    assert profiles["id"]["histogram"][-1]["upper"] == 999.0
+    assert dataset.row_count_estimate == row_count
+
+
+def test_profile_sampling_scales_counts_and_reports_error_bounds(tmp_path: Path) -> None:
+    import pyarrow as pa
+
+    row_count = 20_000
+    table = pa.table({"status": [None if i % 4 == 0 else "open" for i in range(row_count)]})
+    service, dataset, queries = _parquet_profile_service(tmp_path, table)
+    request = CreateDatasetProfileJobRequest(
+        dataset_id=dataset.id,
+        workspace_id=dataset.workspace_id,
+        actor_id=uuid.uuid4(),
+        sample_percent=25,
+    )
+
+    result = asyncio.run(service._run_profile(request))
+
+    assert "TABLESAMPLE" in queries[0]
+    assert result["sampled"] is True
+    assert result["sampled_rows"] < row_count
+    margin = result["row_count_margin"]
+    assert margin > 0
+    assert abs(result["row_count_estimate"] - row_count) <= 2 * margin
+    status = result["columns"][0]
+    assert abs(status["null_rate"] - 0.25) <= 2 * status["null_rate_margin"]
+
+
+def test_profile_queries_follow_the_source_dialect() -> None:
+    columns = [
+        ProfileColumn(name="status", data_type="text", kind="string"),
+        ProfileColumn(name="amount", data_type="numeric", kind="numeric"),
+        ProfileColumn(name="email", data_type="text", kind="string", reveal_values=False),
+    ]
+    summary_sql = build_profile_summary_sql(
+        table_key="orders",
+        columns=columns,
+        filters=[],
+        sample=profile_table_sample(dialect="postgres", sample_percent=10),
+        dialect="postgres",
+    )
+    assert "TABLESAMPLE BERNOULLI (10)" in summary_sql
+    assert 'COUNT(DISTINCT "status")' in summary_sql
+    # Redacted columns are counted but their values are never selected.
+    assert 'MIN("email")' not in summary_sql
+    assert profile_table_sample(dialect="mysql", sample_percent=10) is None
+
+    summary = {"c0_distinct": 3, "c0_non_null": 90, "c1_distinct": 500, "c1_min": 0, "c1_max": 50, "c2_distinct": 4}
+    plan = build_profile_distribution_plan(
+        table_key="orders", columns=columns, summary=summary, filters=[], sample_percent=None, dialect="postgres"
+    )
+    assert plan is not None and plan.dialect == "postgres"
+    assert "GROUPING SETS" in plan.sql
+    assert plan.top_k_columns == {0: "status", 1: "amount"}
+    assert plan.histogram_columns == {1: (0.0, 50.0)}
+    # MySQL has no GROUPING SETS, so the grouped query runs locally in DuckDB.
+    mysql_plan = build_profile_distribution_plan(
+        table_key="orders", columns=columns, summary=summary, filters=[], sample_percent=None, dialect="mysql"
+    )
+    assert mysql_plan is not None and mysql_plan.dialect == "duckdb"
+
+
+def _run_csv_ingest(
+    tmp_path: Path,
+    files: dict[str, str],
+    *,
+    file_config: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], DatasetMetadata, "_DatasetColumnRepository"]:
+    from langbridge.runtime.models import CreateDatasetCsvIngestJobRequest
+    from langbridge.runtime.settings import runtime_settings
+
+    upload_dir = tmp_path / "upload"
+    upload_dir.mkdir()
+    for name, content in files.items():
+        (upload_dir / name).write_text(content, encoding="utf-8")
+    now = datetime.now(timezone.utc)
+    dataset = DatasetMetadata(
+        id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+        name="orders",
+        sql_alias="orders",
+        tags=[],
+        dataset_type=DatasetType.FILE,
+        materialization_mode=DatasetMaterializationMode.LIVE,
+        source_kind=DatasetSourceKind.FILE,
+        storage_kind=DatasetStorageKind.CSV,
+        dialect="duckdb",
+        table_name="orders",
+        storage_uri=(upload_dir / "*.csv").as_posix(),
+        source={"storage_uri": (upload_dir / "*.csv").as_posix()},
+        file_config={"format": "csv", **(file_config or {})},
+        status=DatasetStatus.PUBLISHED,
+        columns=[],
+        created_at=now,
+        updated_at=now,
+        management_mode=ManagementMode.CONFIG_MANAGED,
+        lifecycle_state=LifecycleState.ACTIVE,
+    )
+    dataset_repository = _DatasetRepository()
+    dataset_repository.add(dataset)
+
+    async def _get_for_workspace(*, dataset_id, workspace_id):
+        return dataset_repository.items.get(dataset_id)
+
+    dataset_repository.get_for_workspace = _get_for_workspace
+    column_repository = _DatasetColumnRepository()
+    service = DatasetQueryService(
+        dataset_repository=dataset_repository,
+        dataset_column_repository=column_repository,
+        dataset_policy_repository=_DatasetPolicyRepository(),
+    )
+
+    original_dataset_dir = runtime_settings.DATASET_FILE_LOCAL_DIR
+    object.__setattr__(runtime_settings, "DATASET_FILE_LOCAL_DIR", str(tmp_path / "datasets"))
+    try:
+        result = asyncio.run(
+            service._run_csv_ingest(
+                CreateDatasetCsvIngestJobRequest(
+                    dataset_id=dataset.id,
+                    workspace_id=dataset.workspace_id,
+                    actor_id=uuid.uuid4(),
+                )
+            )
+        )
+    finally:
+        object.__setattr__(runtime_settings, "DATASET_FILE_LOCAL_DIR", original_dataset_dir)
+    return result, dataset, column_repository
+
+
+def test_csv_ingest_converts_files_in_one_pass_into_a_partitioned_table(tmp_path: Path) -> None:
+    import duckdb
+
+    from langbridge.storage.dataset_table import DatasetTable
+
+    result, dataset, column_repository = _run_csv_ingest(
+        tmp_path,
+        {
+            "part-1.csv": "id,region,amount\n1,eu,10.5\n2,us,\n3,eu,7.25\n",
+            "part-2.csv": "id,region,amount\n4,apac,1.0\n5,us,99.0\n",
+        },
+        file_config={"partition_by": "region"},
+    )
+
+    assert result["row_count_estimate"] == 5
+    assert result["column_count"] == 3
+    assert result["file_count"] == 3
+    assert result["column_stats"]["id"] == {"null_count": 0, "min": 1, "max": 5}
+    assert result["column_stats"]["amount"] == {"null_count": 1, "min": 1.0, "max": 99.0}
+    assert [(column.name, column.data_type) for column in column_repository.items] == [
+        ("id", "BIGINT"),
+        ("region", "VARCHAR"),
+        ("amount", "DOUBLE"),
+    ]
+
+    table = DatasetTable(tmp_path / "datasets" / "parquet" / str(dataset.workspace_id) / str(dataset.id))
+    assert dataset.storage_uri == table.root.resolve().as_uri()
+    snapshot = table.current_snapshot()
+    assert snapshot is not None
+    assert sorted(data_file.partition for data_file in snapshot.data_files) == ["apac", "eu", "us"]
+    assert not any((table.root / "_staging").glob("*"))
+    rows = duckdb.connect().execute(f"SELECT id FROM {table.scan_sql()} ORDER BY id").fetchall()
+    assert rows == [(1,), (2,), (3,), (4,), (5,)]
+
+
+def test_csv_ingest_keeps_temporal_column_types(tmp_path: Path) -> None:
+    import duckdb
+
+    from langbridge.storage.dataset_table import DatasetTable
+
+    result, dataset, column_repository = _run_csv_ingest(
+        tmp_path,
+        {
+            "orders.csv": (
+                "id,ordered_on,shipped_at\n"
+                "1,2026-02-27,2026-02-28 09:30:00\n"
+                "2,2026-03-01,2026-03-02 17:05:00\n"
+            ),
+        },
+    )
+
+    assert [(column.name, column.data_type) for column in column_repository.items] == [
+        ("id", "BIGINT"),
+        ("ordered_on", "DATE"),
+        ("shipped_at", "TIMESTAMP"),
+    ]
+    # A fresh handle reads the schema back from the manifest.
+    table = DatasetTable(tmp_path / "datasets" / "parquet" / str(dataset.workspace_id) / str(dataset.id))
+    connection = duckdb.connect()
+    described = connection.execute(f"DESCRIBE SELECT * FROM {table.scan_sql()}").fetchall()
+    assert [(row[0], row[1]) for row in described] == [
+        ("id", "BIGINT"),
+        ("ordered_on", "DATE"),
+        ("shipped_at", "TIMESTAMP"),
+    ]
+    rows = connection.execute(
+        f"SELECT id, shipped_at - ordered_on FROM {table.scan_sql()} WHERE ordered_on >= DATE '2026-03-01'"
+    ).fetchall()
+    assert [(row[0], str(row[1])) for row in rows] == [(2, "1 day, 17:05:00")]
@@ -0,0 +1,227 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+from langbridge.runtime.hosting.background import (
+    BackgroundTaskSchedule,
+    RuntimeBackgroundTaskManager,
+    build_dataset_compaction_default_task,
+)
+from langbridge.storage.dataset_table import DatasetTable, PartitionSpec, StatsPredicate
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _stage(table: DatasetTable, rows: list[dict]) -> Path:
+    path = table.staging_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.Table.from_pylist(rows), path)
+    return path
+
+
+def _upsert(table: DatasetTable, rows: list[dict], schema: pa.Schema, *, key_range: bool = False):
+    staged = _stage(table, rows)
+    identities = pa.array([str(row["id"]) for row in rows], type=pa.string())
+    keys = [row["id"] for row in rows]
+    return table.append(
+        staged,
+        schema=schema,
+        primary_key="id",
+        replaced_identities=identities,
+        identity=lambda batch: batch.column(batch.schema.get_field_index("id")).cast(pa.string()),
+        identity_columns=["id"],
+        replaced_predicates=(
+            [StatsPredicate("id", "gte", min(keys)), StatsPredicate("id", "lte", max(keys))] if key_range else ()
+        ),
+    )
+
+
+def _duckdb_rows(table: DatasetTable, snapshot=None, predicates=()) -> list[tuple]:
+    connection = duckdb.connect()
+    try:
+        return connection.execute(
+            f"SELECT * FROM {table.scan_sql(snapshot, predicates=predicates)} ORDER BY id"
+        ).fetchall()
+    finally:
+        connection.close()
+
+
+_SCHEMA = pa.schema([("amount", pa.float64()), ("id", pa.int64())])
+
+
+def test_upserts_append_files_and_deletes_without_rewriting_existing_data(tmp_path) -> None:
+    table = DatasetTable(tmp_path / "orders")
+    first = table.overwrite(
+        _stage(table, [{"amount": float(index), "id": index} for index in range(4)]),
+        schema=_SCHEMA,
+    )
+    original_file = tmp_path / "orders" / first.data_files[0].path
+    original_mtime = original_file.stat().st_mtime_ns
+
+    second = _upsert(table, [{"amount": 10.0, "id": 1}, {"amount": 40.0, "id": 4}], _SCHEMA)
+
+    assert [data_file.path for data_file in second.data_files][0] == first.data_files[0].path
+    assert original_file.stat().st_mtime_ns == original_mtime
+    assert len(second.delete_files) == 1
+    assert second.row_count == 5
+    expected = [(0.0, 0), (10.0, 1), (2.0, 2), (3.0, 3), (40.0, 4)]
+    assert _duckdb_rows(table) == expected
+    assert sorted(table.read().to_pylist(), key=lambda row: row["id"]) == [
+        {"amount": amount, "id": identity} for amount, identity in expected
+    ]
+    # The previous snapshot stays readable and unchanged.
+    assert _duckdb_rows(table, table.load_snapshot(first.snapshot_id)) == [
+        (float(index), index) for index in range(4)
+    ]
+
+
+def test_upserts_only_read_files_whose_key_range_may_hold_replaced_keys(tmp_path, monkeypatch) -> None:
+    table = DatasetTable(tmp_path / "orders")
+    table.overwrite(_stage(table, [{"amount": 0.0, "id": index} for index in range(10)]), schema=_SCHEMA)
+    _upsert(table, [{"amount": 0.0, "id": index} for index in range(10, 20)], _SCHEMA)
+    # A delete file against the second data file only.
+    snapshot = _upsert(table, [{"amount": 1.0, "id": 15}], _SCHEMA, key_range=True)
+    first_file, second_file = snapshot.data_files[0].path, snapshot.data_files[1].path
+    assert [list(delete_file.referenced_files) for delete_file in snapshot.delete_files] == [[second_file]]
+
+    opened: list[str] = []
+    parquet_file, read_table = pq.ParquetFile, pq.read_table
+
+    def _parquet_file(source, *args, **kwargs):
+        opened.append(Path(source).relative_to(table.root).as_posix())
+        return parquet_file(source, *args, **kwargs)
+
+    def _read_table(source, *args, **kwargs):
+        opened.append(Path(source).relative_to(table.root).as_posix())
+        return read_table(source, *args, **kwargs)
+
+    monkeypatch.setattr(pq, "ParquetFile", _parquet_file)
+    monkeypatch.setattr(pq, "read_table", _read_table)
+    _upsert(table, [{"amount": 2.0, "id": 3}], _SCHEMA, key_range=True)
+    monkeypatch.undo()
+
+    # Neither the second data file nor its delete file is read to merge key 3.
+    existing = {first_file, second_file, *(delete_file.path for delete_file in snapshot.delete_files)}
+    assert [path for path in opened if path in existing] == [first_file]
+    assert [row[1] for row in _duckdb_rows(table)] == list(range(20))
+    assert [row[0] for row in _duckdb_rows(table) if row[1] in (3, 15)] == [2.0, 1.0]
+
+
+def test_manifests_keep_the_exact_arrow_schema(tmp_path) -> None:
+    schema = pa.schema(
+        [
+            ("id", pa.int32()),
+            ("ordered_on", pa.date32()),
+            ("shipped_at", pa.timestamp("us", tz="UTC")),
+            ("price", pa.decimal128(10, 2)),
+        ]
+    )
+    table = DatasetTable(tmp_path / "orders")
+    path = table.staging_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(
+        pa.Table.from_pylist(
+            [{"id": 1, "ordered_on": date(2026, 3, 1), "shipped_at": datetime(2026, 3, 2), "price": Decimal("9.99")}],
+            schema=schema,
+        ),
+        path,
+    )
+    table.overwrite(path, schema=schema)
+
+    assert DatasetTable(tmp_path / "orders").current_snapshot().schema == schema
+    connection = duckdb.connect()
+    described = connection.execute(f"DESCRIBE SELECT * FROM {table.scan_sql()}").fetchall()
+    assert [row[1] for row in described] == ["INTEGER", "DATE", "TIMESTAMP WITH TIME ZONE", "DECIMAL(10,2)"]
+
+    # Manifests written before the serialized schema still read their type names back.
+    manifest = next((tmp_path / "orders" / "_manifest").glob("v*.json"))
+    payload = json.loads(manifest.read_text(encoding="utf-8"))
+    del payload["arrow_schema"]
+    manifest.write_text(json.dumps(payload), encoding="utf-8")
+    assert DatasetTable(tmp_path / "orders").current_snapshot().schema == schema
+
+
+def test_partitioned_tables_prune_files_by_column_stats(tmp_path) -> None:
+    table = DatasetTable(tmp_path / "events", partition_spec=PartitionSpec.parse("month(created_at)"))
+    schema = pa.schema([("created_at", pa.string()), ("id", pa.int64())])
+    rows = [
+        {"created_at": f"2025-{month:02d}-{day:02d}T00:00:00", "id": month * 100 + day}
+        for month in (1, 2, 3)
+        for day in (1, 15)
+    ]
+    snapshot = table.overwrite(_stage(table, rows), schema=schema)
+
+    assert sorted(data_file.partition for data_file in snapshot.data_files) == ["2025-01", "2025-02", "2025-03"]
+    assert all(data_file.path.startswith("data/created_at=") for data_file in snapshot.data_files)
+    predicates = [StatsPredicate(column="created_at", operator="gte", value="2025-02-10")]
+    assert len(snapshot.prune(predicates)) == 2
+    assert len(snapshot.prune([StatsPredicate(column="id", operator="in", value=[101, 301])])) == 2
+    assert len(snapshot.prune([StatsPredicate(column="id", operator="gt", value=1000)])) == 0
+    assert [row[1] for row in _duckdb_rows(table, predicates=predicates)] == [201, 215, 301, 315]
+    assert _duckdb_rows(table, predicates=[StatsPredicate(column="id", operator="gt", value=1000)]) == []
+
+
+def test_compaction_folds_small_files_and_deletes_and_expires_old_snapshots(tmp_path) -> None:
+    table = DatasetTable(tmp_path / "orders", retain_snapshots=2)
+    table.overwrite(_stage(table, [{"amount": 1.0, "id": 1}]), schema=_SCHEMA)
+    for identity in range(2, 6):
+        table.append(_stage(table, [{"amount": float(identity), "id": identity}]), schema=_SCHEMA)
+    upserted = _upsert(table, [{"amount": 30.0, "id": 3}], _SCHEMA)
+    expected = table.read().to_pylist()
+    assert len(upserted.data_files) == 6
+
+    compacted = table.compact(target_file_rows=100)
+
+    assert compacted is not None and compacted.operation == "compact"
+    assert len(compacted.data_files) == 1
+    assert compacted.delete_files == ()
+    assert compacted.row_count == 5
+    assert sorted(table.read().to_pylist(), key=lambda row: row["id"]) == sorted(
+        expected, key=lambda row: row["id"]
+    )
+    data_dir = tmp_path / "orders" / "data"
+    live = {data_file.path for data_file in (*compacted.data_files, *upserted.data_files)}
+    assert {path.relative_to(tmp_path / "orders").as_posix() for path in data_dir.rglob("*.parquet")} == live
+    assert sorted(path.name for path in (tmp_path / "orders" / "_manifest").glob("v*.json")) == [
+        "v00000006.json",
+        "v00000007.json",
+    ]
+    assert table.compact(target_file_rows=100) is None
+
+
+@pytest.mark.anyio
+async def test_compaction_background_task_compacts_every_table_under_root(tmp_path) -> None:
+    for name in ("orders", "customers"):
+        table = DatasetTable(tmp_path / "api-connectors" / name)
+        table.overwrite(_stage(table, [{"amount": 1.0, "id": 1}]), schema=_SCHEMA)
+        table.append(_stage(table, [{"amount": 2.0, "id": 2}]), schema=_SCHEMA)
+
+    manager = RuntimeBackgroundTaskManager(runtime_host=object())  # type: ignore[arg-type]
+    manager.register_default_task(
+        build_dataset_compaction_default_task(
+            schedule=BackgroundTaskSchedule.interval(seconds=60),
+            root=tmp_path,
+            target_file_rows=100,
+        )
+    )
+
+    compacted = await manager.start_task(
+        name="dataset-compaction-now",
+        handler=manager.default_tasks[0].handler,
+    )
+
+    assert compacted == 2
+    for name in ("orders", "customers"):
+        snapshot = DatasetTable(tmp_path / "api-connectors" / name).current_snapshot()
+        assert snapshot is not None and len(snapshot.data_files) == 1
+        assert pc.sum(DatasetTable(tmp_path / "api-connectors" / name).read()["id"]).as_py() == 3
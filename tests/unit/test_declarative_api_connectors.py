@@ -5,6 +5,11 @@ from pathlib import Path
 import httpx
 import pytest
 
+from langbridge.connectors.base.connector import ApiFilterPredicate, ApiResourceQuery
+from langbridge.connectors.base.http_pool import RateLimitPolicy
+from langbridge.federation.connectors import ApiConnectorRemoteSource
+from langbridge.federation.models import SourceSubplan, VirtualTableBinding
+
 CONNECTOR_SRC_DIRS = [
     Path(__file__).resolve().parents[2]
     / "langbridge-connectors"
@@ -334,3 +339,134 @@ async def test_declarative_asana_connector_uses_workspace_base_url_and_response_
     assert len(requests) == 2
     assert result.records[0]["email"] == "ada@example.com"
     assert result.next_cursor == "offset-2"
+
+
+@pytest.mark.anyio
+async def test_declarative_offset_connector_lists_remaining_pages_when_total_is_known() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/ex/jira/cloud-123/rest/api/3/project/search"
+        return httpx.Response(
+            200,
+            json={
+                "values": [{"id": "10000"}, {"id": "10001"}],
+                "isLast": False,
+                "total": 5,
+            },
+        )
+
+    connector = JiraDeclarativeApiConnector(
+        JiraDeclarativeConnectorConfig(cloud_id="cloud-123", access_token="jira-token"),
+        transport=httpx.MockTransport(handler),
+    )
+
+    first_page = await connector.extract_resource("projects", limit=2)
+    later_page = await connector.extract_resource("projects", cursor="2", limit=2)
+
+    assert first_page.next_cursor == "2"
+    assert first_page.remaining_cursors == ["2", "4"]
+    assert later_page.remaining_cursors is None
+
+
+def test_declarative_manifest_rate_limit_configures_connector_client_limits() -> None:
+    connector = ShopifyDeclarativeApiConnector(
+        ShopifyDeclarativeConnectorConfig(
+            shop_domain="acme.myshopify.com",
+            access_token="shpat_test",
+        ),
+    )
+
+    assert connector._rate_limit == RateLimitPolicy(requests_per_second=2, burst=40, max_concurrency=2)
+
+
+@pytest.mark.anyio
+async def test_declarative_shopify_pushdown_sends_filters_fields_and_keeps_them_off_page_info_pages() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        assert request.url.path == "/admin/api/2025-01/customers.json"
+        if "page_info" in request.url.params:
+            return httpx.Response(
+                200,
+                json={"customers": [{"id": 102, "email": "grace@example.com", "updated_at": "2024-12-01T00:00:00Z"}]},
+            )
+        return httpx.Response(
+            200,
+            json={"customers": [{"id": 101, "email": "ada@example.com", "updated_at": "2025-02-01T00:00:00Z"}]},
+            headers={
+                "Link": '<https://acme.myshopify.com/admin/api/2025-01/customers.json?page_info=cursor-2>; rel="next"'
+            },
+        )
+
+    connector = ShopifyDeclarativeApiConnector(
+        ShopifyDeclarativeConnectorConfig(shop_domain="acme.myshopify.com", access_token="shpat_test"),
+        transport=httpx.MockTransport(handler),
+    )
+    source = ApiConnectorRemoteSource(
+        source_id="shopify",
+        connector=connector,
+        bindings=[
+            VirtualTableBinding(
+                table_key="customers",
+                source_id="shopify",
+                table="customers",
+                metadata={"api_resource": "customers"},
+            )
+        ],
+    )
+
+    result = await source.execute(
+        SourceSubplan(
+            stage_id="scan_c",
+            source_id="shopify",
+            alias="c",
+            table_key="customers",
+            sql=(
+                "SELECT c.email FROM customers AS c "
+                "WHERE c.updated_at > '2025-01-01T00:00:00Z' AND c.id IN (101, 102) AND c.email <> ''"
+            ),
+        )
+    )
+
+    first, second = (request.url.params for request in requests)
+    assert first["updated_at_min"] == "2025-01-01T00:00:00Z"
+    assert first["ids"] == "101,102"
+    assert first["fields"] == "id,updated_at,email"
+    assert dict(second) == {"limit": "100", "fields": "id,updated_at,email", "page_info": "cursor-2"}
+    # Pushed filters only narrow the fetch; DuckDB still applies the full predicate.
+    assert result.table.to_pylist() == [{"email": "ada@example.com"}]
+
+
+@pytest.mark.anyio
+async def test_declarative_github_pushdown_plans_supported_sorts_and_filters_only() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"id": 1, "updated_at": "2025-02-01T00:00:00Z"}])
+
+    connector = GitHubDeclarativeApiConnector(
+        GitHubDeclarativeConnectorConfig(access_token="ghp_test"),
+        transport=httpx.MockTransport(handler),
+    )
+    requested = ApiResourceQuery(
+        filters=[
+            ApiFilterPredicate(field="updated_at", operator="gt", value="2025-01-01T00:00:00Z"),
+            ApiFilterPredicate(field="title", operator="eq", value="Bug"),
+        ],
+        order_by="updated_at",
+        descending=True,
+        limit=5,
+    )
+
+    planned = connector.plan_resource_query("issues", requested)
+    unsorted = connector.plan_resource_query("issues", ApiResourceQuery(order_by="title", limit=5))
+    await connector.extract_resource("issues", query=planned)
+
+    assert planned is not None and [item.field for item in planned.filters] == ["updated_at"]
+    assert (planned.order_by, planned.descending, planned.fields) == ("updated_at", True, None)
+    assert unsorted is not None and unsorted.order_by is None
+    params = requests[0].url.params
+    assert params["since"] == "2025-01-01T00:00:00Z"
+    assert (params["sort"], params["direction"], params["per_page"]) == ("updated", "desc", "5")
+    assert "title" not in params
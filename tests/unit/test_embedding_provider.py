@@ -0,0 +1,163 @@
+import asyncio
+
+import httpx
+import openai
+
+from langbridge import telemetry
+from langbridge.runtime.embeddings import EmbeddingCache, EmbeddingProvider, LocalEmbeddingProvider
+from langbridge.runtime.models import LLMProvider
+from langbridge.telemetry import InMemoryTelemetryExporter, MetricRegistry, Telemetry, use_telemetry
+
+
+def test_local_embedding_provider_coalesces_concurrent_requests() -> None:
+    async def _run() -> None:
+        provider = LocalEmbeddingProvider(dimension=8, max_batch_tokens=12)
+
+        first, second, third = await asyncio.gather(
+            provider.embed(["france", "germany"]),
+            provider.embed(["germany", "  spain "]),
+            provider.embed(["a much longer description of a region"]),
+        )
+
+        # One window, identical texts sent once, the long text cut into its own batch.
+        assert provider.batches == [
+            ["france", "germany", "spain"],
+            ["a much longer description of a region"],
+        ]
+        assert first[1] == second[0] == provider.vector("germany")
+        assert second[1] == provider.vector("spain")
+        assert len(third[0]) == 8
+        assert await provider.embed(["france"]) == [first[0]]
+
+    asyncio.run(_run())
+
+
+class _EmbeddingsEndpoint:
+    def __init__(self, failures: int, status_code: int = 429) -> None:
+        self.failures = failures
+        self.status_code = status_code
+        self.inputs: list[list[str]] = []
+
+    async def create(self, *, model: str, input: list[str]):
+        self.inputs.append(list(input))
+        if self.failures:
+            self.failures -= 1
+            response = httpx.Response(
+                self.status_code,
+                headers={"Retry-After": "0"},
+                request=httpx.Request("POST", "https://api.openai.com/v1/embeddings"),
+            )
+            if self.status_code == 429:
+                raise openai.RateLimitError("rate limited", response=response, body=None)
+            raise openai.InternalServerError("server error", response=response, body=None)
+        return type("Response", (), {"data": [type("Item", (), {"embedding": [float(len(text))]}) for text in input]})
+
+
+def test_embedding_provider_retries_rate_limited_batches(monkeypatch) -> None:
+    endpoint = _EmbeddingsEndpoint(failures=2)
+    monkeypatch.setattr(
+        EmbeddingProvider,
+        "_build_client",
+        lambda self: type("Client", (), {"embeddings": endpoint})(),
+    )
+    provider = EmbeddingProvider(
+        provider=LLMProvider.OPENAI,
+        api_key="secret",
+        model_name="gpt-4.1",
+        configuration={"embedding_batch_size": 2},
+    )
+
+    vectors = asyncio.run(provider.embed(["a", "bb", "ccc"]))
+
+    assert vectors == [[1.0], [2.0], [3.0]]
+    # Two batches of at most two texts, two 429s retried after their Retry-After.
+    assert len(endpoint.inputs) == 4
+    assert {tuple(batch) for batch in endpoint.inputs} == {("a", "bb"), ("ccc",)}
+
+
+def test_embedding_provider_retries_server_errors(monkeypatch) -> None:
+    endpoint = _EmbeddingsEndpoint(failures=1, status_code=500)
+    monkeypatch.setattr(
+        EmbeddingProvider,
+        "_build_client",
+        lambda self: type("Client", (), {"embeddings": endpoint})(),
+    )
+    provider = EmbeddingProvider(
+        provider=LLMProvider.OPENAI,
+        api_key="secret",
+        model_name="gpt-4.1",
+        configuration={},
+    )
+
+    vectors = asyncio.run(provider.embed(["a", "bb"]))
+
+    assert vectors == [[1.0], [2.0]]
+    # The 500 is retried although embedding requests are POSTs.
+    assert endpoint.inputs == [["a", "bb"], ["a", "bb"]]
+
+
+def test_embedding_cache_separates_providers_endpoints_and_dimensions(tmp_path, monkeypatch) -> None:
+    requests: list[dict] = []
+
+    class _Endpoint:
+        async def create(self, *, model: str, input: list[str], **options):
+            requests.append({"model": model, **options})
+            size = options.get("dimensions", 3)
+            return type("Response", (), {"data": [type("Item", (), {"embedding": [1.0] * size}) for _ in input]})
+
+    monkeypatch.setattr(
+        EmbeddingProvider,
+        "_build_client",
+        lambda self: type("Client", (), {"embeddings": _Endpoint()})(),
+    )
+
+    def _provider(provider: LLMProvider, **configuration) -> EmbeddingProvider:
+        return EmbeddingProvider(
+            provider=provider,
+            api_key="secret",
+            model_name="gpt-4.1",
+            configuration={"embedding_model": "text-embedding-3-small", **configuration},
+        )
+
+    providers = [
+        _provider(LLMProvider.OPENAI),
+        _provider(LLMProvider.OPENAI, embedding_dimensions=2),
+        _provider(LLMProvider.AZURE, api_base="https://east.example.test"),
+        _provider(LLMProvider.AZURE, api_base="https://west.example.test/"),
+        _provider(LLMProvider.OPENAI),
+    ]
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite3")
+
+    async def _run() -> list[list[list[float]]]:
+        return [await cache.embed(provider, ["france"]) for provider in providers]
+
+    vectors = asyncio.run(_run())
+
+    # Same model name and text, but only the repeated OpenAI provider is served from the cache.
+    assert len(requests) == 4
+    assert requests[1] == {"model": "text-embedding-3-small", "dimensions": 2}
+    assert [len(vector[0]) for vector in vectors] == [3, 2, 3, 3, 3]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 4)
+
+
+def test_embedding_provider_records_duration_with_the_orchestrator_label_set(monkeypatch) -> None:
+    endpoint = _EmbeddingsEndpoint(failures=0)
+    monkeypatch.setattr(
+        EmbeddingProvider,
+        "_build_client",
+        lambda self: type("Client", (), {"embeddings": endpoint})(),
+    )
+    provider = EmbeddingProvider(
+        provider=LLMProvider.OPENAI,
+        api_key="secret",
+        model_name="gpt-4.1",
+        configuration={},
+    )
+    exporter = InMemoryTelemetryExporter()
+
+    with use_telemetry(Telemetry(exporter=exporter, registry=MetricRegistry())):
+        asyncio.run(provider.embed(["a"]))
+
+    assert [item.labels for item in exporter.measurements(telemetry.EMBEDDING_DURATION)] == [
+        {"provider": "openai", "operation": "create_embeddings", "status": "ok"}
+    ]
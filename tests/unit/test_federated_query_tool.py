@@ -1,4 +1,5 @@
 
+import asyncio
 import uuid
 
 import pytest
@@ -54,6 +55,56 @@ class _FakeApiConnector:
         )
 
 
+class _PagedApiConnector:
+    """Serves `records` in pages of `page_size`, addressed by offset cursors."""
+
+    def __init__(self, records: list[dict[str, object]], *, page_size: int, announce_pages: bool) -> None:
+        self._records = records
+        self._page_size = page_size
+        self._announce_pages = announce_pages
+        self.cursors: list[str | None] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def extract_resource(
+        self,
+        resource_name: str,
+        *,
+        since: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> ApiExtractResult:
+        self.cursors.append(cursor)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        offset = int(cursor or 0)
+        next_offset = offset + self._page_size
+        return ApiExtractResult(
+            resource=resource_name,
+            records=self._records[offset:next_offset],
+            next_cursor=str(next_offset) if next_offset < len(self._records) else None,
+            remaining_cursors=(
+                [str(item) for item in range(self._page_size, len(self._records), self._page_size)]
+                if self._announce_pages and cursor is None
+                else None
+            ),
+        )
+
+
+def _api_binding(resource: str) -> VirtualTableBinding:
+    return VirtualTableBinding(
+        table_key=resource,
+        source_id="api_source",
+        connector_id=uuid.uuid4(),
+        table=resource,
+        metadata={"api_resource": resource},
+    )
+
+
 class StubStorageConnector(StorageConnector):
     def __init__(self) -> None:
         super().__init__(config=BaseConnectorConfig())
@@ -492,3 +543,136 @@ async def test_api_connector_remote_source_executes_query_in_duckdb() -> None:
 
     assert result.table.to_pylist() == [{"email": "ada@example.com", "amount": 42.0}]
     assert sorted(connector.calls) == ["customers", "orders"]
+
+
+@pytest.mark.anyio
+async def test_api_connector_remote_source_fetches_only_referenced_bindings() -> None:
+    connector = _FakeApiConnector(
+        {
+            "customers": [{"id": "cus_001", "email": "ada@example.com"}],
+            "orders": [{"id": "ord_001", "customer_id": "cus_001", "amount": 42.0}],
+            "invoices": [{"id": "in_001"}],
+        }
+    )
+    source = ApiConnectorRemoteSource(
+        source_id="api_source",
+        connector=connector,
+        bindings=[_api_binding("customers"), _api_binding("orders"), _api_binding("invoices")],
+    )
+
+    result = await source.execute(
+        SourceSubplan(
+            stage_id="scan_o",
+            source_id="api_source",
+            alias="o",
+            table_key="orders",
+            sql='SELECT o.amount FROM "orders" AS o',
+        )
+    )
+
+    assert result.table.to_pylist() == [{"amount": 42.0}]
+    assert connector.calls == ["orders"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("announce_pages", [False, True])
+async def test_api_connector_remote_source_reads_every_page(announce_pages: bool) -> None:
+    records = [{"id": f"ord_{index:03d}", "amount": float(index)} for index in range(10)]
+    connector = _PagedApiConnector(records, page_size=2, announce_pages=announce_pages)
+    source = ApiConnectorRemoteSource(
+        source_id="api_source",
+        connector=connector,
+        bindings=[_api_binding("orders")],
+        max_concurrent_pages=2,
+    )
+
+    result = await source.execute(
+        SourceSubplan(
+            stage_id="scan_o",
+            source_id="api_source",
+            alias="o",
+            table_key="orders",
+            sql='SELECT COUNT(*) AS order_count, SUM(amount) AS total FROM "orders"',
+        )
+    )
+
+    assert result.table.to_pylist() == [{"order_count": 10, "total": 45.0}]
+    assert sorted(connector.cursors, key=lambda cursor: int(cursor or 0)) == [None, "2", "4", "6", "8"]
+    # Announced pages are fetched concurrently, bounded by max_concurrent_pages; cursors are followed one by one.
+    assert connector.max_in_flight == (2 if announce_pages else 1)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("sql", "expected_cursors"),
+    [
+        ('SELECT id FROM "orders" LIMIT 3', [None, "2"]),
+        # The connector cannot sort by amount, so every page is needed to find the top rows.
+        ('SELECT id FROM "orders" ORDER BY amount DESC LIMIT 3', [None, "2", "4", "6", "8"]),
+        ('SELECT COUNT(*) AS order_count FROM "orders" LIMIT 3', [None, "2", "4", "6", "8"]),
+    ],
+)
+async def test_api_connector_remote_source_stops_paging_only_at_a_safe_limit(
+    sql: str,
+    expected_cursors: list[str | None],
+) -> None:
+    records = [{"id": f"ord_{index:03d}", "amount": float(index)} for index in range(10)]
+    connector = _PagedApiConnector(records, page_size=2, announce_pages=True)
+    source = ApiConnectorRemoteSource(
+        source_id="api_source",
+        connector=connector,
+        bindings=[_api_binding("orders")],
+    )
+
+    result = await source.execute(
+        SourceSubplan(stage_id="scan_o", source_id="api_source", alias="o", table_key="orders", sql=sql)
+    )
+
+    assert sorted(connector.cursors, key=lambda cursor: int(cursor or 0)) == expected_cursors
+    assert result.table.num_rows in {1, 3}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(("announce_pages", "expected_rows"), [(True, 10.0), (False, 20.0)])
+async def test_api_connector_remote_source_estimates_stats_from_the_first_page(
+    announce_pages: bool,
+    expected_rows: float,
+) -> None:
+    records = [{"id": f"ord_{index:03d}", "amount": float(index)} for index in range(10)]
+    connector = _PagedApiConnector(records, page_size=2, announce_pages=announce_pages)
+    source = ApiConnectorRemoteSource(
+        source_id="api_source",
+        connector=connector,
+        bindings=[_api_binding("orders")],
+    )
+
+    stats = await source.estimate_table_stats(_api_binding("orders"))
+
+    # Announced pages give the exact page count; a next-page link only says there is more.
+    assert connector.cursors == [None]
+    assert stats.row_count_estimate == expected_rows
+
+
+@pytest.mark.anyio
+async def test_api_connector_remote_source_reads_its_own_binding_under_an_unknown_name() -> None:
+    records = [{"id": f"ord_{index:03d}", "amount": float(index)} for index in range(10)]
+    connector = _PagedApiConnector(records, page_size=2, announce_pages=True)
+    source = ApiConnectorRemoteSource(
+        source_id="api_source",
+        connector=connector,
+        bindings=[_api_binding("orders")],
+    )
+
+    result = await source.execute(
+        SourceSubplan(
+            stage_id="scan_o",
+            source_id="api_source",
+            alias="o",
+            table_key="orders",
+            sql='SELECT id FROM "shop"."orders" LIMIT 3',
+        )
+    )
+
+    assert result.table.num_rows == 3
+    # The limit is still pushed down, so paging stops after the rows it needs.
+    assert sorted(connector.cursors, key=lambda cursor: int(cursor or 0)) == [None, "2"]
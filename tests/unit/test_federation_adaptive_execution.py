@@ -0,0 +1,202 @@
+import uuid
+
+import pyarrow as pa
+import pytest
+
+from langbridge.federation.executor import ArtifactStore
+from langbridge.federation.models import (
+    FederationWorkflow,
+    JoinStrategy,
+    TableStatistics,
+    VirtualDataset,
+    VirtualTableBinding,
+)
+from langbridge.federation.service import FederatedQueryService
+from tests.federation.mock import DuckDbArrowRemoteSource
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _orders() -> pa.Table:
+    return pa.table(
+        {
+            "order_id": list(range(1, 13)),
+            "customer_id": [1, 2, 3, 4, 1, 2, 3, 4, 1, 2, 3, 4],
+            "amount": [10.0] * 12,
+        }
+    )
+
+
+def _customers() -> pa.Table:
+    return pa.table({"customer_id": [1, 2, 3, 4], "region": ["EU", "US", "EU", "APAC"]})
+
+
+def _service(
+    tmp_path,
+    *,
+    orders_stats: TableStatistics | None = None,
+    customers_stats: TableStatistics | None = None,
+    adaptive_execution: bool = True,
+) -> tuple[FederatedQueryService, str, DuckDbArrowRemoteSource, DuckDbArrowRemoteSource]:
+    workspace_id = str(uuid.uuid4())
+    workflow = FederationWorkflow(
+        id="wf-adaptive",
+        workspace_id=workspace_id,
+        adaptive_execution=adaptive_execution,
+        dataset=VirtualDataset(
+            id="ds-adaptive",
+            name="adaptive",
+            workspace_id=workspace_id,
+            tables={
+                "orders": VirtualTableBinding(
+                    table_key="orders",
+                    source_id="src_orders",
+                    schema="public",
+                    table="orders",
+                    stats=orders_stats,
+                ),
+                "customers": VirtualTableBinding(
+                    table_key="customers",
+                    source_id="src_customers",
+                    schema="public",
+                    table="customers",
+                    stats=customers_stats,
+                ),
+            },
+        ),
+    )
+    orders_source = DuckDbArrowRemoteSource(source_id="src_orders", tables={"orders": _orders()})
+    customers_source = DuckDbArrowRemoteSource(source_id="src_customers", tables={"customers": _customers()})
+    service = FederatedQueryService(artifact_store=ArtifactStore(base_dir=str(tmp_path / "artifacts")))
+    service.register_workspace(
+        workspace_id=workspace_id,
+        workflow=workflow,
+        sources={"src_orders": orders_source, "src_customers": customers_source},
+    )
+    return service, workspace_id, orders_source, customers_source
+
+
+@pytest.mark.anyio
+async def test_small_build_scan_injects_dynamic_filter_into_deferred_probe_scan(tmp_path) -> None:
+    service, workspace_id, orders_source, _ = _service(
+        tmp_path,
+        orders_stats=TableStatistics(row_count_estimate=5_000_000.0, bytes_per_row=64.0),
+        customers_stats=TableStatistics(row_count_estimate=4.0, bytes_per_row=32.0),
+    )
+
+    analyzed = await service.explain_analyze(
+        query=(
+            "SELECT c.region, SUM(o.amount) AS revenue FROM public.orders AS o "
+            "JOIN public.customers AS c ON o.customer_id = c.customer_id "
+            "WHERE c.region = 'EU' GROUP BY c.region"
+        ),
+        dialect="duckdb",
+        workspace_id=workspace_id,
+    )
+
+    stages = {stage.stage_id: stage for stage in analyzed.physical_plan.stages}
+    assert stages["scan_o"].dependencies == ["scan_c"]
+    assert stages["scan_o"].metadata["dynamic_filters"] == ["o.customer_id IN (1, 3)"]
+    assert orders_source.executed_sql == [stages["scan_o"].subplan.sql]
+    assert "IN (1, 3)" in orders_source.executed_sql[0]
+    assert any("Dynamic filter: o.customer_id IN (1, 3)" in line for line in analyzed.plan_text)
+    metrics = {metric.stage_id: metric for metric in analyzed.execution.stage_metrics}
+    assert metrics["scan_o"].rows == 6
+
+    handle = await service.execute(
+        query=(
+            "SELECT c.region, SUM(o.amount) AS revenue FROM public.orders AS o "
+            "JOIN public.customers AS c ON o.customer_id = c.customer_id "
+            "WHERE c.region = 'EU' GROUP BY c.region"
+        ),
+        dialect="duckdb",
+        workspace_id=workspace_id,
+    )
+    result = await service.fetch_arrow(handle)
+    assert result.to_pylist() == [{"region": "EU", "revenue": 60.0}]
+
+
+@pytest.mark.anyio
+async def test_actual_cardinalities_replan_join_strategy_and_feed_stats_store(tmp_path) -> None:
+    service, workspace_id, _, _ = _service(tmp_path)
+    query = (
+        "SELECT o.order_id, c.region FROM public.orders AS o "
+        "JOIN public.customers AS c ON o.customer_id = c.customer_id WHERE o.amount > 5"
+    )
+
+    planned = await service.explain(query=query, dialect="duckdb", workspace_id=workspace_id)
+    assert planned.physical_plan.join_strategies == {"o->c": JoinStrategy.PARTITIONED_HASH}
+
+    analyzed = await service.explain_analyze(query=query, dialect="duckdb", workspace_id=workspace_id)
+    assert analyzed.physical_plan.join_strategies == {"o->c": JoinStrategy.BROADCAST}
+    local_stage = next(stage for stage in analyzed.physical_plan.stages if stage.stage_id == "local_compute_final")
+    assert local_stage.metadata["replanned_from_actuals"] is True
+    assert local_stage.metadata["join_strategies"] == {"o->c": "broadcast"}
+
+    stats_store = service._planner.stats_store
+    filtered_scan = stats_store.get_scan(
+        workspace_id=workspace_id,
+        table_key="orders",
+        pushed_filters=["o.amount > 5"],
+    )
+    assert filtered_scan is not None and filtered_scan.row_count_estimate == 12.0
+    # The orders scan was filtered, so only the unfiltered customers scan sizes its table.
+    assert stats_store.get(workspace_id=workspace_id, table_key="orders") is None
+    assert stats_store.get(workspace_id=workspace_id, table_key="customers").row_count_estimate == 4.0
+
+    replanned = await service.explain(query=query, dialect="duckdb", workspace_id=workspace_id)
+    estimates = {stage.stage_id: stage.subplan.estimated_rows for stage in replanned.physical_plan.stages if stage.subplan}
+    assert estimates == {"scan_o": 12.0, "scan_c": 4.0}
+    assert replanned.physical_plan.join_strategies == {"o->c": JoinStrategy.BROADCAST}
+
+
+@pytest.mark.anyio
+async def test_preserved_side_of_left_join_is_never_dynamically_filtered(tmp_path) -> None:
+    service, workspace_id, _, customers_source = _service(
+        tmp_path,
+        orders_stats=TableStatistics(row_count_estimate=2.0, bytes_per_row=32.0),
+        customers_stats=TableStatistics(row_count_estimate=5_000_000.0, bytes_per_row=64.0),
+    )
+
+    handle = await service.execute(
+        query=(
+            "SELECT c.customer_id, o.order_id FROM public.customers AS c "
+            "LEFT JOIN public.orders AS o ON c.customer_id = o.customer_id AND o.order_id < 3 "
+            "ORDER BY c.customer_id"
+        ),
+        dialect="duckdb",
+        workspace_id=workspace_id,
+    )
+
+    assert all(" IN " not in sql for sql in customers_source.executed_sql)
+    result = await service.fetch_arrow(handle)
+    assert result.to_pylist() == [
+        {"customer_id": 1, "order_id": 1},
+        {"customer_id": 2, "order_id": 2},
+        {"customer_id": 3, "order_id": None},
+        {"customer_id": 4, "order_id": None},
+    ]
+
+
+@pytest.mark.anyio
+async def test_adaptive_execution_can_be_disabled_per_workflow(tmp_path) -> None:
+    service, workspace_id, orders_source, _ = _service(
+        tmp_path,
+        orders_stats=TableStatistics(row_count_estimate=5_000_000.0, bytes_per_row=64.0),
+        customers_stats=TableStatistics(row_count_estimate=4.0, bytes_per_row=32.0),
+        adaptive_execution=False,
+    )
+
+    analyzed = await service.explain_analyze(
+        query="SELECT o.order_id FROM public.orders AS o JOIN public.customers AS c ON o.customer_id = c.customer_id",
+        dialect="duckdb",
+        workspace_id=workspace_id,
+    )
+
+    stages = {stage.stage_id: stage for stage in analyzed.physical_plan.stages}
+    assert stages["scan_o"].dependencies == []
+    assert "dynamic_filters" not in stages["scan_o"].metadata
+    assert all(" IN " not in sql for sql in orders_source.executed_sql)
@@ -54,7 +54,7 @@ class CountingRemoteSource(RemoteSource):
     def dialect(self) -> str:
         return self._dialect
 
-    async def execute(self, subplan: SourceSubplan) -> RemoteExecutionResult:
+    async def execute(self, subplan: SourceSubplan, *, cancellation=None) -> RemoteExecutionResult:
         self.execute_count += 1
         table = self._tables.get(subplan.table_key)
         if table is None:
@@ -0,0 +1,161 @@
+import asyncio
+import time
+import uuid
+
+import duckdb
+import pyarrow as pa
+import pytest
+
+from langbridge.federation import (
+    CancellationToken,
+    QueryCancelledError,
+    QueryDeadlineExceededError,
+    cancellation_scope,
+)
+from langbridge.federation.connectors.base import (
+    RemoteExecutionResult,
+    RemoteSource,
+    SourceCapabilities,
+    execute_duckdb_arrow,
+)
+from langbridge.federation.executor import ArtifactStore
+from langbridge.federation.models import FederationWorkflow, VirtualDataset, VirtualTableBinding
+from langbridge.federation.models.plans import SourceSubplan
+from langbridge.federation.models.virtual_dataset import TableStatistics
+from langbridge.federation.service import FederatedQueryService
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class SlowRemoteSource(RemoteSource):
+    def __init__(self, *, source_id: str, delay_s: float) -> None:
+        self.source_id = source_id
+        self._delay_s = delay_s
+        self.started = asyncio.Event()
+        self.interrupted = False
+
+    def capabilities(self) -> SourceCapabilities:
+        return SourceCapabilities(pushdown_join=False)
+
+    def dialect(self) -> str:
+        return "duckdb"
+
+    async def execute(
+        self,
+        subplan: SourceSubplan,
+        *,
+        cancellation: CancellationToken | None = None,
+    ) -> RemoteExecutionResult:
+        self.started.set()
+        try:
+            await asyncio.sleep(self._delay_s)
+        except asyncio.CancelledError:
+            self.interrupted = True
+            raise
+        return RemoteExecutionResult(table=pa.table({"id": [1]}), elapsed_ms=0)
+
+    async def estimate_table_stats(self, binding: VirtualTableBinding) -> TableStatistics:
+        return TableStatistics(row_count_estimate=1.0, bytes_per_row=8.0)
+
+
+def _service(tmp_path, source: RemoteSource) -> tuple[FederatedQueryService, str]:
+    workspace_id = str(uuid.uuid4())
+    workflow = FederationWorkflow(
+        id="wf-cancel",
+        workspace_id=workspace_id,
+        dataset=VirtualDataset(
+            id="ds-cancel",
+            name="cancel",
+            workspace_id=workspace_id,
+            tables={
+                "orders": VirtualTableBinding(
+                    table_key="orders",
+                    source_id=source.source_id,
+                    table="orders",
+                )
+            },
+        ),
+    )
+    service = FederatedQueryService(artifact_store=ArtifactStore(base_dir=str(tmp_path / "artifacts")))
+    service.register_workspace(
+        workspace_id=workspace_id,
+        workflow=workflow,
+        sources={source.source_id: source},
+    )
+    return service, workspace_id
+
+
+@pytest.mark.anyio
+async def test_federated_execute_stops_remote_stage_when_token_is_cancelled(tmp_path) -> None:
+    source = SlowRemoteSource(source_id="slow_orders", delay_s=30.0)
+    service, workspace_id = _service(tmp_path, source)
+    token = CancellationToken()
+
+    async def _cancel_when_started() -> None:
+        await source.started.wait()
+        token.cancel("stop")
+
+    canceller = asyncio.create_task(_cancel_when_started())
+    started = time.monotonic()
+    with pytest.raises(QueryCancelledError, match="stop"):
+        await service.execute(
+            query="SELECT id FROM orders",
+            dialect="duckdb",
+            workspace_id=workspace_id,
+            cancellation=token,
+        )
+    await canceller
+
+    assert time.monotonic() - started < 5.0
+    assert source.interrupted is True
+
+
+@pytest.mark.anyio
+async def test_federated_execute_uses_ambient_deadline(tmp_path) -> None:
+    source = SlowRemoteSource(source_id="slow_orders", delay_s=30.0)
+    service, workspace_id = _service(tmp_path, source)
+
+    with cancellation_scope(CancellationToken.with_timeout(0.2)):
+        with pytest.raises(QueryDeadlineExceededError):
+            await service.execute(
+                query="SELECT id FROM orders",
+                dialect="duckdb",
+                workspace_id=workspace_id,
+            )
+
+    assert source.interrupted is True
+
+
+@pytest.mark.anyio
+async def test_execute_duckdb_arrow_interrupts_running_query() -> None:
+    connection = duckdb.connect(database=":memory:")
+    token = CancellationToken.with_timeout(0.2)
+    started = time.monotonic()
+    try:
+        with pytest.raises(QueryDeadlineExceededError):
+            await execute_duckdb_arrow(
+                connection,
+                "SELECT COUNT(*) FROM range(100000000000) a",
+                cancellation=token,
+            )
+    finally:
+        connection.close()
+
+    assert time.monotonic() - started < 5.0
+
+
+def test_child_token_follows_parent_cancellation_and_tighter_deadline() -> None:
+    parent = CancellationToken.with_timeout(60)
+    child = parent.child(timeout_s=1)
+
+    assert child.deadline is not None and parent.deadline is not None
+    assert child.deadline < parent.deadline
+
+    parent.cancel("client went away")
+
+    assert child.cancelled is True
+    with pytest.raises(QueryCancelledError, match="client went away"):
+        child.raise_if_cancelled()
@@ -0,0 +1,103 @@
+import uuid
+
+import pyarrow as pa
+import pytest
+
+from langbridge.federation.executor import ArtifactStore
+from langbridge.federation.models import FederationWorkflow, VirtualDataset, VirtualTableBinding
+from langbridge.federation.models.plans import StageType
+from langbridge.federation.service import FederatedQueryService
+from tests.federation.mock import MockArrowRemoteSource
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _service(tmp_path) -> tuple[FederatedQueryService, str]:
+    workspace_id = str(uuid.uuid4())
+    workflow = FederationWorkflow(
+        id="wf-analyze",
+        workspace_id=workspace_id,
+        dataset=VirtualDataset(
+            id="ds-analyze",
+            name="analyze",
+            workspace_id=workspace_id,
+            tables={
+                "orders": VirtualTableBinding(
+                    table_key="orders",
+                    source_id="src_orders",
+                    schema="public",
+                    table="orders",
+                ),
+                "customers": VirtualTableBinding(
+                    table_key="customers",
+                    source_id="src_customers",
+                    schema="public",
+                    table="customers",
+                ),
+            },
+        ),
+    )
+    orders = pa.table({"id": [1, 2, 3], "customer_id": [10, 11, 12], "amount": [100, 200, 300]})
+    customers = pa.table({"id": [10, 11, 13], "name": ["Acme", "Globex", "Umbrella"]})
+    service = FederatedQueryService(artifact_store=ArtifactStore(base_dir=str(tmp_path / "artifacts")))
+    service.register_workspace(
+        workspace_id=workspace_id,
+        workflow=workflow,
+        sources={
+            "src_orders": MockArrowRemoteSource(source_id="src_orders", tables={"orders": orders}),
+            "src_customers": MockArrowRemoteSource(source_id="src_customers", tables={"customers": customers}),
+        },
+    )
+    return service, workspace_id
+
+
+@pytest.mark.anyio
+async def test_explain_analyze_reports_per_stage_profile(tmp_path) -> None:
+    service, workspace_id = _service(tmp_path)
+
+    analyzed = await service.explain_analyze(
+        query=(
+            "SELECT o.id, c.name "
+            "FROM public.orders o "
+            "JOIN public.customers c ON o.customer_id = c.id"
+        ),
+        dialect="postgres",
+        workspace_id=workspace_id,
+    )
+
+    stage_types = {stage.stage_id: stage.stage_type for stage in analyzed.physical_plan.stages}
+    metrics = {metric.stage_id: metric for metric in analyzed.execution.stage_metrics}
+    assert set(metrics) == set(stage_types)
+
+    for stage_id, metric in metrics.items():
+        if stage_types[stage_id] != StageType.LOCAL_COMPUTE:
+            assert metric.estimated_rows is not None
+            assert "remote_execute" in metric.phases_ms
+            assert "artifact_write" in metric.phases_ms
+
+    final = metrics[analyzed.physical_plan.result_stage_id]
+    assert final.rows == 2
+    assert final.rows_in == 6
+    assert "local_compute" in final.phases_ms
+    assert final.engine_profile is not None
+    assert final.engine_profile["children"]
+
+    assert analyzed.plan_text[0].startswith(f"Federated plan {analyzed.physical_plan.plan_id}")
+    assert any("DuckDB: latency=" in line for line in analyzed.plan_text)
+    assert any("(actual time=" in line for line in analyzed.plan_text)
+
+
+@pytest.mark.anyio
+async def test_explain_analyze_skips_engine_profile_for_plain_execution(tmp_path) -> None:
+    service, workspace_id = _service(tmp_path)
+
+    handle = await service.execute(
+        query="SELECT o.id FROM public.orders o JOIN public.customers c ON o.customer_id = c.id",
+        dialect="postgres",
+        workspace_id=workspace_id,
+    )
+
+    assert all(metric.engine_profile is None for metric in handle.execution.stage_metrics)
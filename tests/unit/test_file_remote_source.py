@@ -1,11 +1,14 @@
 
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from langbridge.federation.connectors.file import DuckDbFileRemoteSource
 from langbridge.federation.models.plans import SourceSubplan
 from langbridge.federation.models.virtual_dataset import VirtualTableBinding
+from langbridge.storage.dataset_table import DatasetTable, PartitionSpec
 
 
 @pytest.fixture
@@ -52,3 +55,43 @@ async def test_file_remote_source_executes_schema_qualified_query(tmp_path) -> N
         {"entity_1__SOURCE": "google"},
         {"entity_1__SOURCE": "meta"},
     ]
+
+
+@pytest.mark.anyio
+async def test_file_remote_source_reads_dataset_table_snapshot_and_prunes_files(tmp_path) -> None:
+    table = DatasetTable(tmp_path / "orders", partition_spec=PartitionSpec.parse("region"))
+    staged = table.staging_path()
+    staged.parent.mkdir(parents=True)
+    pq.write_table(
+        pa.table({"amount": [10, 20, 30, 40], "id": [1, 2, 3, 4], "region": ["eu", "eu", "us", "us"]}),
+        staged,
+    )
+    table.overwrite(staged, schema=pq.read_schema(staged))
+    binding = VirtualTableBinding(
+        table_key="orders",
+        source_id="file_source_orders",
+        connector_id=None,
+        table="orders",
+        metadata={
+            "source_kind": "file",
+            "storage_uri": table.root.resolve().as_uri(),
+            "file_format": "parquet",
+        },
+    )
+    source = DuckDbFileRemoteSource(source_id="file_source_orders", bindings=[binding])
+    sql = "SELECT SUM(amount) AS \"total\" FROM \"orders\" AS t0 WHERE t0.region = 'us'"
+
+    result = await source.execute(
+        SourceSubplan(
+            stage_id="stage_1",
+            source_id="file_source_orders",
+            alias="t0",
+            table_key="orders",
+            sql=sql,
+        )
+    )
+    stats = await source.estimate_table_stats(binding)
+
+    assert result.table.to_pylist() == [{"total": 70}]
+    assert len(table.current_snapshot().prune(source._stats_predicates(sql, binding))) == 1
+    assert stats.row_count_estimate == 4.0
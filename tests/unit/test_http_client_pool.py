@@ -0,0 +1,165 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any
+
+import httpx
+import pytest
+
+from langbridge.connectors.base.connector import ApiExtractResult
+from langbridge.connectors.base.errors import ConnectorError
+from langbridge.connectors.base.http import HttpApiConnector
+from langbridge.connectors.base.http_pool import (
+    HttpClientPool,
+    RateLimitPolicy,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _ExampleConnector(HttpApiConnector):
+    async def test_connection(self) -> None:
+        await self._request_json("GET", "/ping")
+
+    async def extract_resource(self, resource_name: str, **kwargs: Any) -> ApiExtractResult:
+        payload, _ = await self._request_json("GET", f"/{resource_name}")
+        return ApiExtractResult(resource=resource_name, status="success", records=payload["items"])
+
+    def _base_url(self) -> str:
+        return "https://api.example.test"
+
+
+_FAST_RETRY = RetryPolicy(max_attempts=4, backoff_base_s=0.001, backoff_max_s=0.005)
+
+
+@pytest.mark.anyio
+async def test_rate_limited_response_is_retried_after_retry_after_delay() -> None:
+    calls: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.05"}, json={"message": "slow down"})
+        if len(calls) == 2:
+            return httpx.Response(503, json={"message": "unavailable"})
+        return httpx.Response(200, json={"items": [{"id": 1}]})
+
+    connector = _ExampleConnector(
+        config=None,
+        transport=httpx.MockTransport(handler),
+        retry_policy=_FAST_RETRY,
+        client_pool=HttpClientPool(),
+    )
+
+    result = await connector.extract_resource("customers")
+
+    assert result.records == [{"id": 1}]
+    assert len(calls) == 3
+    assert calls[1] - calls[0] >= 0.045
+
+
+@pytest.mark.anyio
+async def test_server_errors_are_not_retried_for_non_idempotent_requests() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(502, json={"message": "bad gateway"})
+
+    connector = _ExampleConnector(
+        config=None,
+        transport=httpx.MockTransport(handler),
+        retry_policy=_FAST_RETRY,
+        client_pool=HttpClientPool(),
+    )
+
+    with pytest.raises(ConnectorError, match="bad gateway"):
+        await connector._request("POST", "/records", json_payload={"id": 1})
+    with pytest.raises(ConnectorError, match="bad gateway"):
+        await connector._request("GET", "/records")
+
+    assert calls == ["POST", "GET", "GET", "GET", "GET"]
+
+
+@pytest.mark.anyio
+async def test_pool_reuses_one_client_per_origin() -> None:
+    pool = HttpClientPool()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"items": []}))
+    connector = _ExampleConnector(config=None, transport=transport, client_pool=pool)
+
+    await connector.extract_resource("customers")
+    client = pool.async_client("https://api.example.test/customers", transport=transport)
+    await connector.extract_resource("invoices")
+
+    assert not client.is_closed
+    assert pool.async_client("https://API.example.test/other", transport=transport) is client
+    assert pool.async_client("https://other.example.test/", transport=transport) is not client
+    await pool.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.anyio
+async def test_token_bucket_and_concurrency_limits_are_shared_per_host() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"items": []})
+
+    pool = HttpClientPool()
+    transport = httpx.MockTransport(handler)
+    connectors = [
+        _ExampleConnector(
+            config=None,
+            transport=transport,
+            client_pool=pool,
+            rate_limit=RateLimitPolicy(requests_per_second=50, burst=2, max_concurrency=2),
+        )
+        for _ in range(2)
+    ]
+
+    started = time.monotonic()
+    await asyncio.gather(*(connectors[index % 2].extract_resource("customers") for index in range(8)))
+    elapsed = time.monotonic() - started
+
+    # Two requests fit the burst; the remaining six wait for tokens refilled at 50/s.
+    assert elapsed >= 0.11
+    assert max_in_flight <= 2
+
+
+def test_retry_after_accepts_seconds_and_http_dates() -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert parse_retry_after("2") == 2.0
+    assert 25.0 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_async_clients_are_closed_when_their_event_loop_shuts_down() -> None:
+    pool = HttpClientPool()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"items": []}))
+
+    async def _request() -> httpx.AsyncClient:
+        response = await pool.request("GET", "https://api.example.test/customers", transport=transport)
+        assert response.status_code == 200
+        return pool.async_client("https://api.example.test/customers", transport=transport)
+
+    first = asyncio.run(_request())
+    second = asyncio.run(_request())
+
+    assert first.is_closed
+    assert second.is_closed
+    assert second is not first
+    assert len(pool._async_clients) == 0
@@ -0,0 +1,170 @@
+import os
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from langbridge.connectors.base.connector import ApiExtractResult
+from langbridge.connectors.base.http import HttpApiConnector
+from langbridge.connectors.base import http_cache
+from langbridge.connectors.base.http_cache import HttpResponseCache
+from langbridge.connectors.base.http_pool import HttpClientPool
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _ExampleConnector(HttpApiConnector):
+    def __init__(self, *args: Any, token: str = "secret", **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._token = token
+
+    async def test_connection(self) -> None:
+        await self._request_json("GET", "/ping")
+
+    async def extract_resource(self, resource_name: str, **kwargs: Any) -> ApiExtractResult:
+        payload, _ = await self._request_json("GET", f"/{resource_name}", params={"limit": 100})
+        return ApiExtractResult(resource=resource_name, status="success", records=payload["items"])
+
+    def _base_url(self) -> str:
+        return "https://api.example.test"
+
+    def _default_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self._token}"}
+
+
+def _connector(handler, cache: HttpResponseCache, **kwargs: Any) -> _ExampleConnector:
+    return _ExampleConnector(
+        config=None,
+        transport=httpx.MockTransport(handler),
+        client_pool=HttpClientPool(),
+        response_cache=cache,
+        **kwargs,
+    )
+
+
+@pytest.mark.anyio
+async def test_unchanged_resources_are_revalidated_and_served_from_disk(tmp_path) -> None:
+    seen: list[dict[str, str | None]] = []
+    body = b'{"items": [{"id": 1}, {"id": 2}]}'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(
+            {
+                "if_none_match": request.headers.get("If-None-Match"),
+                "if_modified_since": request.headers.get("If-Modified-Since"),
+            }
+        )
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT", "Content-Type": "application/json"},
+            content=body,
+        )
+
+    cache = HttpResponseCache(tmp_path / "http")
+    first = await _connector(handler, cache).extract_resource("customers")
+    # A fresh cache instance over the same directory proves the entry was persisted.
+    reopened = HttpResponseCache(tmp_path / "http")
+    second = await _connector(handler, reopened).extract_resource("customers")
+
+    assert first.records == second.records == [{"id": 1}, {"id": 2}]
+    assert seen == [
+        {"if_none_match": None, "if_modified_since": None},
+        {"if_none_match": '"v1"', "if_modified_since": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    ]
+    assert (cache.stats.misses, cache.stats.stores) == (1, 1)
+    assert (reopened.stats.revalidated, reopened.stats.bytes_saved) == (1, len(body))
+
+
+@pytest.mark.anyio
+async def test_responses_without_validators_use_ttl_freshness(tmp_path) -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"items": [{"id": calls}]})
+
+    uncached = HttpResponseCache(tmp_path / "no-ttl")
+    connector = _connector(handler, uncached)
+    await connector.extract_resource("customers")
+    await connector.extract_resource("customers")
+    assert calls == 2
+    assert uncached.stats.stores == 0
+
+    ttl_cache = HttpResponseCache(tmp_path / "ttl", default_ttl_s=300)
+    connector = _connector(handler, ttl_cache)
+    first = await connector.extract_resource("customers")
+    second = await connector.extract_resource("customers")
+
+    assert calls == 3
+    assert first.records == second.records == [{"id": 3}]
+    assert ttl_cache.stats.hits == 1
+    assert ttl_cache.stats.bytes_saved > 0
+
+
+@pytest.mark.anyio
+async def test_cache_entries_are_isolated_by_credentials_and_honor_no_store(tmp_path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        headers = {"Cache-Control": "no-store"} if request.url.path == "/private" else {"Cache-Control": "max-age=60"}
+        return httpx.Response(200, headers=headers, json={"items": [{"token": token}]})
+
+    cache = HttpResponseCache(tmp_path / "http")
+    alice = await _connector(handler, cache, token="alice").extract_resource("customers")
+    bob = await _connector(handler, cache, token="bob").extract_resource("customers")
+    await _connector(handler, cache, token="alice").extract_resource("private")
+
+    assert alice.records == [{"token": "alice"}]
+    assert bob.records == [{"token": "bob"}]
+    assert cache.stats.stores == 2
+    assert cache.stats.hits == 0
+
+
+async def _store(cache: HttpResponseCache, path: str, *, headers: dict[str, str]) -> str:
+    url = f"https://api.example.test{path}"
+    fingerprint = HttpResponseCache.fingerprint("GET", url)
+    response = httpx.Response(200, headers=headers, content=b"x" * 1000, request=httpx.Request("GET", url))
+    assert await cache.store(fingerprint, response) is not None
+    return fingerprint
+
+
+@pytest.mark.anyio
+async def test_cache_evicts_least_recently_used_entries_over_the_size_cap(tmp_path) -> None:
+    cache = HttpResponseCache(tmp_path / "http", max_bytes=4000)
+    fresh = {"Cache-Control": "max-age=60"}
+    keys: dict[str, str] = {}
+    for index, path in enumerate(("/a", "/b", "/c"), start=1):
+        keys[path] = await _store(cache, path, headers=fresh)
+        meta_path = tmp_path / "http" / keys[path][:2] / f"{keys[path]}.json"
+        os.utime(meta_path, (index * 1000, index * 1000))
+    # Reading `/a` makes `/b` the least recently used entry.
+    assert await cache.lookup(keys["/a"]) is not None
+
+    keys["/d"] = await _store(cache, "/d", headers=fresh)
+
+    assert await cache.lookup(keys["/b"]) is None
+    assert [await cache.lookup(keys[path]) is not None for path in ("/a", "/c", "/d")] == [True, True, True]
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.anyio
+async def test_reopened_cache_sweeps_expired_entries_without_validators(tmp_path, monkeypatch) -> None:
+    cache = HttpResponseCache(tmp_path / "http", max_bytes=1_000_000)
+    ttl_key = await _store(cache, "/ttl", headers={"Cache-Control": "max-age=60"})
+    etag_key = await _store(cache, "/etag", headers={"Cache-Control": "max-age=60", "ETag": '"v1"'})
+
+    later = time.time() + 120
+    monkeypatch.setattr(http_cache.time, "time", lambda: later)
+    reopened = HttpResponseCache(tmp_path / "http", max_bytes=1_000_000)
+    await _store(reopened, "/new", headers={"Cache-Control": "max-age=60"})
+
+    # The expired `/ttl` entry can never be served again; `/etag` can still be revalidated.
+    assert await reopened.lookup(ttl_key) is None
+    assert await reopened.lookup(etag_key) is not None
+    assert reopened.stats.evictions == 1
@@ -1347,6 +1347,36 @@ def test_configured_local_runtime_keeps_connector_sync_resources_for_discovery(t
         assert datasets == []
 
 
+def test_configured_local_runtime_reports_failed_resources_alongside_synced_ones(tmp_path: Path) -> None:
+    with mock_stripe_api() as api_base_url, runtime_storage_dirs(tmp_path):
+        config_path = write_sync_runtime_config(
+            tmp_path,
+            api_base_url=api_base_url,
+            declared_synced_datasets=[
+                {"name": "billing_customers", "resource": "customers"},
+                # The mock API does not serve charges, so this resource's sync fails.
+                {"name": "billing_charges", "resource": "charges"},
+            ],
+        )
+        runtime = build_configured_local_runtime(config_path=config_path)
+
+        result = asyncio.run(
+            runtime.sync_connector_resources(connector_name="billing_demo", resources=["customers", "charges"])
+        )
+
+        assert result["status"] == "failed"
+        assert [summary["resource_name"] for summary in result["resources"]] == ["customers"]
+        assert result["resources"][0]["records_synced"] == 2
+        assert result["errors"] == [
+            {
+                "resource_name": "charges",
+                "dataset_id": str(runtime._datasets["billing_charges"].id),
+                "error": "not found",
+            }
+        ]
+        assert result["summary"].endswith("1 failed: 'charges' (not found).")
+
+
 def test_configured_local_runtime_syncs_declared_synced_dataset_from_dataset_surface(tmp_path: Path) -> None:
     with mock_stripe_api() as api_base_url, runtime_storage_dirs(tmp_path):
         config_path = write_sync_runtime_config(
@@ -1621,6 +1651,7 @@ def test_saas_connector_example_configs_build_runtime_connectors(
                 "supports_live_datasets": True,
                 "supports_synced_datasets": True,
                 "supports_incremental_sync": True,
+                "supports_change_data_capture": False,
                 "supports_query_pushdown": False,
                 "supports_preview": False,
                 "supports_federated_execution": True,
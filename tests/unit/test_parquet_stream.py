@@ -0,0 +1,39 @@
+import pyarrow.parquet as pq
+import pytest
+
+from langbridge.storage.parquet_stream import StreamingParquetWriter
+
+
+def test_writer_reencodes_written_batches_when_types_widen(tmp_path) -> None:
+    path = tmp_path / "out.parquet"
+
+    with StreamingParquetWriter(path, batch_rows=2) as writer:
+        writer.write_rows([{"id": 1, "flag": True}, {"id": 2, "flag": None}])
+        writer.write_rows([{"id": "3", "flag": False}, {"id": 2**70, "extra": None}])
+        result = writer.close()
+
+    table = pq.read_table(path)
+    assert result.row_count == 4
+    assert result.schema.equals(table.schema)
+    assert [(field.name, str(field.type)) for field in table.schema] == [
+        ("extra", "null"),
+        ("flag", "bool"),
+        ("id", "string"),
+    ]
+    assert table.column("id").to_pylist() == ["1", "2", "3", str(2**70)]
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["out.parquet"]
+
+
+def test_writer_leaves_target_untouched_when_aborted(tmp_path) -> None:
+    path = tmp_path / "out.parquet"
+    with StreamingParquetWriter(path, batch_rows=1) as writer:
+        writer.write_rows([{"id": 1}])
+        writer.close()
+
+    with pytest.raises(RuntimeError):
+        with StreamingParquetWriter(path, batch_rows=1) as writer:
+            writer.write_rows([{"id": 2}, {"id": 3}])
+            raise RuntimeError("source failed")
+
+    assert pq.read_table(path).to_pylist() == [{"id": 1}]
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["out.parquet"]
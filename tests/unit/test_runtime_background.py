@@ -17,6 +17,7 @@ from langbridge.runtime.hosting import (
 )
 from langbridge.runtime.hosting.auth import RuntimeAuthConfig, RuntimeAuthMode
 from langbridge.runtime.services.runtime_host import RuntimeHost, RuntimeProviders, RuntimeServices
+from langbridge.runtime.services.sync_executor import SYNC_PRIORITY_SCHEDULED
 
 
 @pytest.fixture
@@ -236,11 +237,13 @@ def test_runtime_api_app_skips_semantic_vector_refresh_task_when_service_cannot_
 
 def test_dataset_sync_cadence_builds_interval_schedule() -> None:
     assert background_task_schedule_from_dataset_cadence("5m") == (
-        BackgroundTaskSchedule.interval(seconds=300)
+        BackgroundTaskSchedule.interval(seconds=300, jitter_seconds=30)
     )
     assert background_task_schedule_from_dataset_cadence("1D") == (
-        BackgroundTaskSchedule.interval(seconds=86400)
+        BackgroundTaskSchedule.interval(seconds=86400, jitter_seconds=30)
     )
+    # Jitter is capped at a tenth of the interval.
+    assert background_task_schedule_from_dataset_cadence("1m").jitter_seconds == 6
 
 
 def test_dataset_sync_cadence_rejects_invalid_values() -> None:
@@ -271,5 +274,6 @@ async def test_dataset_sync_default_task_uses_runtime_host_dataset_sync() -> Non
             "dataset_ref": "dataset-123",
             "sync_mode": "INCREMENTAL",
             "force_full_refresh": False,
+            "priority": SYNC_PRIORITY_SCHEDULED,
         }
     ]
@@ -936,6 +936,27 @@ def test_runtime_host_api_lifespan_closes_runtime_host(tmp_path: Path) -> None:
     assert controller.closed is True
 
 
+def test_runtime_host_api_serves_prometheus_metrics(tmp_path: Path) -> None:
+    runtime = _build_runtime(tmp_path)
+    client = TestClient(_create_runtime_app(runtime))
+
+    federated_sql = client.post(
+        "/api/runtime/v1/sql/query",
+        json={"query": "SELECT country, SUM(net_revenue) AS net_sales FROM shopify_orders GROUP BY country"},
+    )
+    assert federated_sql.status_code == 200
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE langbridge_sql_query_duration_seconds histogram" in body
+    assert 'langbridge_sql_query_duration_seconds_count{execution_mode="federated",status="ok"}' in body
+    assert "langbridge_federation_stage_duration_seconds_bucket{" in body
+    assert 'route="/api/runtime/v1/sql/query"' in body
+
+
 def test_runtime_host_api_exposes_connector_type_config_schema(tmp_path: Path) -> None:
     runtime = _build_runtime(tmp_path)
     client = TestClient(_create_runtime_app(runtime))
@@ -1132,7 +1153,7 @@ def test_runtime_host_api_registers_dataset_owned_sync_background_tasks(tmp_path
                 for task in manager.default_tasks
                 if task.name == "dataset-sync:billing_customers"
             )
-            assert task.schedule == BackgroundTaskSchedule.interval(seconds=300)
+            assert task.schedule == BackgroundTaskSchedule.interval(seconds=300, jitter_seconds=30)
             assert task.run_on_startup is False
             assert task.description == (
                 "Sync dataset 'billing_customers' from its dataset-owned sync contract."
@@ -171,3 +171,52 @@ def _run_psycopg_queries(port: int) -> tuple[list[tuple[Any, ...]], list[tuple[A
             cursor.execute("select id, total from public.orders")
             rows = cursor.fetchall()
     return show_rows, rows
+
+
+class _BlockingRuntimeHost(_FakeRuntimeHost):
+    def with_context(self, context: RuntimeContext) -> "_BlockingRuntimeHost":
+        return _BlockingRuntimeHost(context=context, calls=self.calls)
+
+    async def execute_sql(self, *, request) -> dict[str, Any]:
+        await asyncio.sleep(30)
+        return await super().execute_sql(request=request)
+
+
+@pytest.mark.anyio
+async def test_runtime_odbc_endpoint_honours_psycopg_cancel_requests() -> None:
+    host = _BlockingRuntimeHost(
+        context=RuntimeContext.build(
+            workspace_id=uuid.uuid4(),
+            actor_id=uuid.uuid4(),
+        )
+    )
+    endpoint = RuntimeOdbcEndpoint(
+        runtime_host=host,
+        auth_config=RuntimeAuthConfig(mode=RuntimeAuthMode.none),
+        config=RuntimeOdbcEndpointConfig(host="127.0.0.1", port=0),
+    )
+    await endpoint.start()
+    try:
+        port = endpoint.bound_port
+        assert port is not None
+        conn = await psycopg.AsyncConnection.connect(
+            host="127.0.0.1",
+            port=port,
+            dbname="langbridge",
+            user="runtime",
+            autocommit=True,
+        )
+        async with conn:
+            async with conn.cursor() as cursor:
+                query = asyncio.create_task(cursor.execute("select id, total from public.orders"))
+                await asyncio.sleep(0.2)
+                await conn.cancel_safe(timeout=5.0)
+                with pytest.raises(psycopg.errors.QueryCanceled):
+                    await asyncio.wait_for(query, timeout=5.0)
+            async with conn.cursor() as cursor:
+                await cursor.execute("show search_path")
+                follow_up_rows = await cursor.fetchall()
+    finally:
+        await endpoint.close()
+
+    assert follow_up_rows == [("public",)]
@@ -0,0 +1,157 @@
+import asyncio
+import uuid
+
+import pyarrow as pa
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from langbridge.federation.executor import ArtifactStore
+from langbridge.federation.models import FederationWorkflow, VirtualDataset, VirtualTableBinding
+from langbridge.federation.service import FederatedQueryService
+from langbridge import telemetry
+from langbridge.telemetry import (
+    InMemoryTelemetryExporter,
+    MetricRegistry,
+    OtlpTelemetryExporter,
+    Telemetry,
+    render_prometheus,
+    use_telemetry,
+)
+from tests.federation.mock import MockArrowRemoteSource
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def exporter():
+    in_memory = InMemoryTelemetryExporter()
+    with use_telemetry(Telemetry(exporter=in_memory, registry=MetricRegistry())):
+        yield in_memory
+
+
+@pytest.mark.anyio
+async def test_spans_propagate_parent_through_tasks_and_threads(exporter) -> None:
+    def _threaded() -> None:
+        with telemetry.span("thread.child"):
+            pass
+
+    async def _task(index: int) -> None:
+        with telemetry.span("task.child", attributes={"index": index}):
+            await asyncio.sleep(0)
+
+    with telemetry.span("root") as root:
+        await asyncio.gather(_task(1), _task(2))
+        await asyncio.to_thread(_threaded)
+
+    assert telemetry.current_span() is None
+    children = exporter.finished_spans("task.child") + exporter.finished_spans("thread.child")
+    assert len(children) == 3
+    assert {child.parent_span_id for child in children} == {root.span_id}
+    assert {child.trace_id for child in children} == {root.trace_id}
+    assert root.status == "ok"
+
+
+def test_timed_records_outcome_and_renders_prometheus(exporter) -> None:
+    with telemetry.timed("ok.op", histogram=telemetry.SQL_QUERY_DURATION, labels={"execution_mode": "single"}):
+        pass
+    with pytest.raises(RuntimeError):
+        with telemetry.timed("bad.op", histogram=telemetry.SQL_QUERY_DURATION, labels={"execution_mode": "single"}):
+            raise RuntimeError("boom")
+    telemetry.increment(telemetry.CACHE_LOOKUPS, labels={"cache": "demo", "result": "hit"})
+    telemetry.observe(telemetry.QUEUE_WAIT, 0.003, labels={"queue": "demo"})
+
+    [failed] = exporter.finished_spans("bad.op")
+    assert failed.status == "error"
+    assert failed.status_message == "boom"
+    assert [item.labels["status"] for item in exporter.measurements(telemetry.SQL_QUERY_DURATION)] == ["ok", "error"]
+
+    body = render_prometheus(telemetry.get_telemetry().registry)
+    assert "# TYPE langbridge_cache_lookups_total counter" in body
+    assert 'langbridge_cache_lookups_total{cache="demo",result="hit"} 1.0' in body
+    assert 'langbridge_queue_wait_seconds_bucket{queue="demo",le="0.0025"} 0' in body
+    assert 'langbridge_queue_wait_seconds_bucket{queue="demo",le="0.005"} 1' in body
+    assert 'langbridge_queue_wait_seconds_bucket{queue="demo",le="+Inf"} 1' in body
+    assert 'langbridge_sql_query_duration_seconds_count{execution_mode="single",status="error"} 1' in body
+
+
+@pytest.mark.anyio
+async def test_federated_execution_emits_stage_connector_and_cache_telemetry(exporter, tmp_path) -> None:
+    workspace_id = str(uuid.uuid4())
+    workflow = FederationWorkflow(
+        id="wf-telemetry",
+        workspace_id=workspace_id,
+        dataset=VirtualDataset(
+            id="ds-telemetry",
+            name="telemetry",
+            workspace_id=workspace_id,
+            tables={
+                "orders": VirtualTableBinding(
+                    table_key="orders",
+                    source_id="src_orders",
+                    schema="public",
+                    table="orders",
+                ),
+            },
+        ),
+    )
+    service = FederatedQueryService(artifact_store=ArtifactStore(base_dir=str(tmp_path / "artifacts")))
+    service.register_workspace(
+        workspace_id=workspace_id,
+        workflow=workflow,
+        sources={
+            "src_orders": MockArrowRemoteSource(
+                source_id="src_orders",
+                tables={"orders": pa.table({"id": [1, 2, 3], "amount": [10, 20, 30]})},
+            ),
+        },
+    )
+
+    with telemetry.span("request") as request_span:
+        await service.execute(
+            query="SELECT id FROM public.orders WHERE amount > 10",
+            dialect="postgres",
+            workspace_id=workspace_id,
+        )
+
+    stage_spans = exporter.finished_spans("federation.stage")
+    [connector_span] = exporter.finished_spans("federation.remote_source.execute")
+    assert stage_spans
+    assert {stage_span.trace_id for stage_span in stage_spans} == {request_span.trace_id}
+    assert connector_span.parent_span_id in {stage_span.span_id for stage_span in stage_spans}
+    assert connector_span.attributes["source_kind"] == "MockArrowRemoteSource"
+    assert {item.labels["result"] for item in exporter.measurements(telemetry.CACHE_LOOKUPS)} == {"miss"}
+    assert exporter.measurements(telemetry.QUEUE_WAIT)
+    registry = telemetry.get_telemetry().registry
+    assert registry.counter(telemetry.CONNECTOR_ROWS).value(labels={"source_kind": "MockArrowRemoteSource"}) == 3
+
+
+def test_otlp_exporter_bridges_span_hierarchy_and_metrics() -> None:
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    metric_reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(metric_readers=[metric_reader])
+    otlp = OtlpTelemetryExporter(tracer_provider=tracer_provider, meter_provider=meter_provider)
+
+    with use_telemetry(Telemetry(exporter=otlp, registry=MetricRegistry())):
+        with telemetry.span("parent"):
+            with telemetry.timed("child", histogram=telemetry.CONNECTOR_QUERY_DURATION, labels={"source_kind": "sql"}):
+                pass
+
+    finished = {item.name: item for item in span_exporter.get_finished_spans()}
+    assert finished["child"].parent.span_id == finished["parent"].context.span_id
+    assert finished["child"].attributes["source_kind"] == "sql"
+    metric_names = {
+        metric.name
+        for resource_metrics in metric_reader.get_metrics_data().resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+    assert telemetry.CONNECTOR_QUERY_DURATION in metric_names
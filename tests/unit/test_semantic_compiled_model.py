@@ -0,0 +1,91 @@
+import uuid
+
+from langbridge.semantic.model import Dimension, Measure, Relationship, SemanticModel, Table
+from langbridge.semantic.query import (
+    CompiledSemanticModel,
+    CompiledSemanticModelCache,
+    SemanticQuery,
+    SemanticQueryEngine,
+    semantic_model_content_hash,
+)
+
+
+def _model(measure_name: str = "amount") -> SemanticModel:
+    return SemanticModel(
+        version="1.0",
+        tables={
+            "orders": Table(
+                schema="public",
+                name="orders",
+                dimensions=[Dimension(name="customer_id", type="integer")],
+                measures=[Measure(name=measure_name, type="number", aggregation="sum")],
+            ),
+            "customers": Table(
+                schema="public",
+                name="customers",
+                dimensions=[
+                    Dimension(name="id", type="integer", primary_key=True),
+                    Dimension(name="region", type="string"),
+                ],
+            ),
+        },
+        relationships=[
+            Relationship(
+                name="orders_customers",
+                source_dataset="orders",
+                source_field="customer_id",
+                target_dataset="customers",
+                target_field="id",
+                type="inner",
+            )
+        ],
+    )
+
+
+def test_compiled_model_compiles_the_same_sql_as_the_raw_model() -> None:
+    model = _model()
+    compiled = CompiledSemanticModel.compile(model, content_hash=semantic_model_content_hash(model.yml_dump()))
+    query = SemanticQuery(measures=["orders.amount"], dimensions=["customers.region"])
+    engine = SemanticQueryEngine()
+
+    from_raw = engine.compile(query, model, dialect="postgres")
+    from_compiled = engine.compile(query, compiled, dialect="postgres")
+    again = engine.compile(query, compiled, dialect="postgres")
+
+    assert from_compiled == from_raw == again
+    # Returned annotations are copies; the shared compiled model is left untouched.
+    from_compiled.annotations.clear()
+    assert engine.compile(query, compiled, dialect="postgres").annotations == from_raw.annotations
+
+
+def test_compiled_model_cache_keys_on_content_and_invalidates_dependents() -> None:
+    cache = CompiledSemanticModelCache(max_entries=3)
+    model_id = uuid.uuid4()
+    builds: list[str] = []
+
+    def _compile(model: SemanticModel) -> CompiledSemanticModel:
+        content_hash = semantic_model_content_hash(model.yml_dump())
+        builds.append(content_hash)
+        return CompiledSemanticModel.compile(model, content_hash=content_hash)
+
+    original, changed = _model(), _model("total")
+    original_hash = semantic_model_content_hash(original.yml_dump())
+    changed_hash = semantic_model_content_hash(changed.yml_dump())
+
+    first = cache.get_or_compile(model_id, original_hash, lambda: _compile(original))
+    assert cache.get_or_compile(model_id, original_hash, lambda: _compile(original)) is first
+    updated = cache.get_or_compile(model_id, changed_hash, lambda: _compile(changed))
+    assert updated is not first
+    assert builds == [original_hash, changed_hash]
+    cache.get_or_compile("unified", "u1", lambda: first, depends_on=[model_id])
+    cache.get_or_compile("unified", "u2", lambda: first, depends_on=[uuid.uuid4()])
+    assert len(cache) == 3
+
+    assert cache.invalidate(model_id) == 2
+    assert len(cache) == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 4
+
+    for index in range(4):
+        cache.get_or_compile("other", str(index), lambda: first)
+    assert len(cache) == 3
@@ -0,0 +1,115 @@
+import pytest
+
+from langbridge.semantic.errors import JoinPathError, SemanticQueryError
+from langbridge.semantic.model import Dimension, Measure, Relationship, SemanticModel, Table
+from langbridge.semantic.query import SemanticQuery, SemanticQueryEngine
+from langbridge.semantic.query.join_planner import JoinPlanner
+
+
+def _relationship(source: str, target: str, type: str = "inner") -> Relationship:
+    return Relationship(
+        name=f"{source}_{target}",
+        source_dataset=source,
+        source_field=f"{target}_id",
+        target_dataset=target,
+        target_field="id",
+        type=type,
+    )
+
+
+def test_join_planner_connects_required_datasets_with_the_smaller_tree() -> None:
+    # Two three-hop routes leave the base; the targets are also joined to each other.
+    planner = JoinPlanner(
+        [
+            _relationship("a", "p"),
+            _relationship("p", "q"),
+            _relationship("q", "t1"),
+            _relationship("a", "r"),
+            _relationship("r", "s"),
+            _relationship("s", "t2"),
+            _relationship("t1", "t2"),
+        ]
+    )
+
+    steps = planner.plan("a", {"a", "t1", "t2"})
+
+    assert [(step.left_dataset, step.right_dataset) for step in steps] == [
+        ("a", "p"),
+        ("p", "q"),
+        ("q", "t1"),
+        ("t1", "t2"),
+    ]
+    assert [relationship.name for relationship in planner.path("t2", "a")] == ["s_t2", "r_s", "a_r"]
+    with pytest.raises(JoinPathError):
+        planner.path("a", "unknown")
+
+
+def test_join_planner_annotates_fan_out_and_chasm_traps_and_caches_trees() -> None:
+    planner = JoinPlanner(
+        [
+            _relationship("orders", "customers", type="many_to_one"),
+            _relationship("returns", "customers", type="many_to_one"),
+            _relationship("customers", "regions", type="many_to_one"),
+        ]
+    )
+
+    chasm = planner.join_tree("customers", {"orders", "returns"})
+    assert chasm.fan_out_datasets == frozenset({"orders", "returns"})
+    assert chasm.chasm_trap is True
+    # One fact climbing to the shared dimension and down to the other is the same trap.
+    assert planner.join_tree("orders", {"orders", "returns"}).chasm_trap is True
+
+    lookup = planner.join_tree("orders", {"orders", "customers", "regions"})
+    assert lookup.fan_out_datasets == frozenset()
+    assert lookup.chasm_trap is False
+
+    assert planner.join_tree("customers", {"returns", "orders"}) is chasm
+
+
+def test_semantic_query_engine_rejects_measures_across_a_chasm_trap() -> None:
+    def _fact(name: str) -> Table:
+        return Table(
+            schema="public",
+            name=name,
+            dimensions=[Dimension(name="customers_id", type="integer")],
+            measures=[Measure(name="amount", type="number", aggregation="sum")],
+        )
+
+    model = SemanticModel(
+        version="1.0",
+        tables={
+            "orders": _fact("orders"),
+            "returns": _fact("returns"),
+            "customers": Table(
+                schema="public",
+                name="customers",
+                dimensions=[
+                    Dimension(name="id", type="integer", primary_key=True),
+                    Dimension(name="region", type="string"),
+                ],
+            ),
+        },
+        relationships=[
+            _relationship("orders", "customers", type="many_to_one"),
+            _relationship("returns", "customers", type="many_to_one"),
+        ],
+    )
+    engine = SemanticQueryEngine()
+
+    with pytest.raises(SemanticQueryError, match="returns"):
+        engine.compile(
+            SemanticQuery(measures=["orders.amount", "returns.amount"], dimensions=["customers.region"]),
+            model,
+            dialect="postgres",
+        )
+    # Each fact on its own, or without measures, joins safely.
+    assert "SUM" in engine.compile(
+        SemanticQuery(measures=["orders.amount"], dimensions=["customers.region"]),
+        model,
+        dialect="postgres",
+    ).sql
+    engine.compile(
+        SemanticQuery(dimensions=["orders.customers_id", "returns.customers_id"]),
+        model,
+        dialect="postgres",
+    )
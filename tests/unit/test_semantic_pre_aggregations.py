@@ -0,0 +1,110 @@
+from langbridge.semantic.loader import load_semantic_model
+from langbridge.semantic.query import (
+    CompiledSemanticModel,
+    SemanticQuery,
+    SemanticQueryEngine,
+    match_pre_aggregation,
+)
+
+
+def _compiled_model() -> CompiledSemanticModel:
+    return CompiledSemanticModel.compile(
+        load_semantic_model(
+            {
+                "version": "1.0",
+                "datasets": {
+                    "orders": {
+                        "relation_name": "orders",
+                        "dimensions": [
+                            {"name": "region", "type": "string"},
+                            {"name": "channel", "type": "string"},
+                            {"name": "created_at", "type": "timestamp"},
+                        ],
+                        "measures": [
+                            {"name": "revenue", "type": "decimal", "aggregation": "sum"},
+                            {"name": "avg_ticket", "expression": "revenue", "type": "decimal", "aggregation": "avg"},
+                        ],
+                    }
+                },
+                "preAggregations": {
+                    "daily": {
+                        "measures": ["orders.revenue", "orders.avg_ticket"],
+                        "dimensions": ["orders.region"],
+                        "timeDimension": "orders.created_at",
+                        "granularity": "day",
+                    },
+                    "monthly": {
+                        "measures": ["orders.revenue"],
+                        "timeDimension": "orders.created_at",
+                        "granularity": "month",
+                    },
+                },
+            }
+        )
+    )
+
+
+def test_match_pre_aggregation_rewrites_coarser_queries_onto_the_smallest_rollup() -> None:
+    model = _compiled_model()
+    query = SemanticQuery.model_validate(
+        {
+            "measures": ["orders.revenue"],
+            "dimensions": ["region"],
+            "timeDimensions": [
+                {"dimension": "orders.created_at", "granularity": "month", "dateRange": ["2026-01-01", "2026-03-31"]}
+            ],
+            "filters": [{"member": "orders.region", "operator": "equals", "values": ["EU"]}],
+            "order": [{"orders.revenue": "desc"}],
+        }
+    )
+
+    match = match_pre_aggregation(query, model)
+
+    assert match is not None and match.name == "daily"
+    assert match.columns == {
+        "pre_aggregation__orders__region": "orders__region",
+        "pre_aggregation__orders__created_at_day_month": "orders__created_at_month",
+        "pre_aggregation__orders__revenue": "orders__revenue",
+    }
+    assert match.reaggregations == {"orders__revenue": "sum"}
+    sql = SemanticQueryEngine().compile(match.query, match.model, dialect="duckdb").sql
+    assert "FROM pre_aggregation" in sql
+    assert 'SUM(t0."orders__revenue")' in sql
+    assert "DATE_TRUNC('MONTH'" in sql
+
+    # Without the region the monthly rollup has fewer rows and wins.
+    yearly = query.model_copy(
+        update={
+            "dimensions": [],
+            "filters": [],
+            "order": None,
+            "time_dimensions": [query.time_dimensions[0].model_copy(update={"granularity": "year", "date_range": None})],
+        }
+    )
+    assert match_pre_aggregation(yearly, model).name == "monthly"
+
+
+def test_match_pre_aggregation_rejects_what_a_rollup_cannot_answer() -> None:
+    model = _compiled_model()
+    by_region = {
+        "measures": ["orders.revenue"],
+        "dimensions": ["orders.region"],
+        "timeDimensions": [{"dimension": "orders.created_at", "granularity": "day"}],
+    }
+
+    # Averages only read back at the rollup's own grain.
+    exact = SemanticQuery.model_validate({**by_region, "measures": ["orders.avg_ticket"]})
+    assert match_pre_aggregation(exact, model).reaggregations == {}
+    coarser = SemanticQuery.model_validate(
+        {**by_region, "measures": ["orders.avg_ticket"], "timeDimensions": [{"dimension": "orders.created_at", "granularity": "month"}]}
+    )
+    assert match_pre_aggregation(coarser, model) is None
+
+    for query in (
+        {**by_region, "dimensions": ["orders.channel"]},
+        {**by_region, "filters": [{"member": "orders.channel", "operator": "equals", "values": ["web"]}]},
+        {**by_region, "timeDimensions": [{"dimension": "orders.created_at", "granularity": "hour"}]},
+        {**by_region, "timeDimensions": [{"dimension": "orders.created_at", "granularity": "day", "dateRange": "after:2026-01-01"}]},
+        {**by_region, "segments": ["orders.recent"]},
+    ):
+        assert match_pre_aggregation(SemanticQuery.model_validate(query), model) is None
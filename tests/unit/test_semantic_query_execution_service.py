@@ -443,11 +443,379 @@ async def test_execute_unified_query_resolves_dataset_backed_tables_per_table()
 
     assert result.response.data == [{"orders__id": 1}]
     workflow = tool.calls[0]["workflow"]
-    orders_binding = workflow["dataset"]["tables"]["Inventory__orders"]
-    inventory_binding = workflow["dataset"]["tables"]["Inventory__inventory"]
-    assert orders_binding["metadata"]["source_kind"] == "file"
-    assert inventory_binding["connector_id"] == str(warehouse_connector_id)
+    orders_binding = workflow.dataset.tables["Inventory__orders"]
+    inventory_binding = workflow.dataset.tables["Inventory__inventory"]
+    assert orders_binding.metadata["source_kind"] == "file"
+    assert inventory_binding.connector_id == warehouse_connector_id
 
 
 
 
+
+
+@pytest.mark.anyio
+async def test_execute_unified_query_reuses_compiled_models_until_content_changes(monkeypatch) -> None:
+    pytest.importorskip("pyarrow")
+    from langbridge.runtime.services import semantic_query_execution_service as service_module
+    from langbridge.semantic.query import (
+        CompiledSemanticModelCache,
+        configure_compiled_semantic_model_cache,
+        get_compiled_semantic_model_cache,
+    )
+
+    workspace_id = uuid.uuid4()
+    model_id = uuid.uuid4()
+    connector_id = uuid.uuid4()
+    dataset_id = uuid.uuid4()
+
+    def _source_model(dimension: str) -> SemanticModel:
+        return SemanticModel(
+            version="1.0",
+            tables={
+                "orders": Table(
+                    dataset_id=str(dataset_id),
+                    schema="public",
+                    name="orders",
+                    dimensions=[Dimension(name=dimension, type="integer", primary_key=True)],
+                )
+            },
+        )
+
+    record = _ModelRecord(
+        id=model_id,
+        name="Orders",
+        content_yaml=_source_model("id").yml_dump(),
+        connector_id=connector_id,
+    )
+    service = SemanticQueryExecutionService(
+        dataset_repository=_FakeDatasetRepository(
+            {
+                dataset_id: _dataset_stub(
+                    dataset_id=dataset_id,
+                    workspace_id=workspace_id,
+                    connection_id=connector_id,
+                    name="orders_table",
+                    dataset_type="TABLE",
+                    source_kind="database",
+                    connector_kind="postgres",
+                    storage_kind="table",
+                    dialect="postgres",
+                    schema_name="public",
+                    table_name="orders",
+                    storage_uri=None,
+                    file_config_json=None,
+                )
+            }
+        ),
+        federated_query_tool=_FakeFederatedQueryTool(rows=[]),
+        logger=logging.getLogger(__name__),
+        semantic_model_provider=_FakeSemanticModelProvider({model_id: record}),
+    )
+    unified_builds = 0
+    original_build = service_module.build_unified_semantic_model
+
+    def _counting_build(**kwargs):
+        nonlocal unified_builds
+        unified_builds += 1
+        return original_build(**kwargs)
+
+    monkeypatch.setattr(service_module, "build_unified_semantic_model", _counting_build)
+    previous_cache = get_compiled_semantic_model_cache()
+    cache = CompiledSemanticModelCache()
+    configure_compiled_semantic_model_cache(cache)
+    try:
+        async def _query(dimension: str) -> str:
+            result = await service.execute_unified_query(
+                workspace_id=workspace_id,
+                semantic_query=SemanticQuery(dimensions=[f"Orders__orders.{dimension}"], limit=10),
+                semantic_model_ids=[model_id],
+            )
+            return result.compiled_sql
+
+        first_sql = await _query("id")
+        assert await _query("id") == first_sql
+        assert unified_builds == 1
+        # Source model, unified model and its workspace-bound execution model.
+        assert len(cache) == 3
+        assert cache.stats.hits == 3
+
+        record.content_yaml = _source_model("order_id").yml_dump()
+        assert "order_id" in await _query("order_id")
+        assert unified_builds == 2
+
+        assert cache.invalidate(model_id) == 6
+        assert len(cache) == 0
+    finally:
+        configure_compiled_semantic_model_cache(previous_cache)
+
+
+class _RoutingFederatedQueryTool:
+    """Answers the rollup build and source queries with canned rows."""
+
+    def __init__(self, *, build_rows: list[dict[str, Any]], source_rows: list[dict[str, Any]]) -> None:
+        self._build_rows = build_rows
+        self._source_rows = source_rows
+        self.calls: list[dict[str, Any]] = []
+
+    async def execute_federated_query(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self.calls.append(payload)
+        return {"rows": self._build_rows if len(self.calls) == 1 else self._source_rows}
+
+
+def _pre_aggregation_service(
+    tmp_path,
+    *,
+    pre_aggregation: dict[str, Any],
+    tool: _RoutingFederatedQueryTool,
+) -> tuple[SemanticQueryExecutionService, uuid.UUID, uuid.UUID]:
+    from langbridge.runtime.services.semantic_pre_aggregations import PreAggregationStore
+
+    workspace_id = uuid.uuid4()
+    model_id = uuid.uuid4()
+    connector_id = uuid.uuid4()
+    dataset_id = uuid.uuid4()
+    source_model = SemanticModel.model_validate(
+        {
+            "version": "1.0",
+            "datasets": {
+                "orders": {
+                    "dataset_id": str(dataset_id),
+                    "schema_name": "public",
+                    "relation_name": "orders",
+                    "dimensions": [
+                        {"name": "region", "type": "string"},
+                        {"name": "created_at", "type": "timestamp"},
+                    ],
+                    "measures": [{"name": "revenue", "type": "decimal", "aggregation": "sum"}],
+                }
+            },
+            "pre_aggregations": {"daily_revenue": pre_aggregation},
+        }
+    )
+    service = SemanticQueryExecutionService(
+        dataset_repository=_FakeDatasetRepository(
+            {
+                dataset_id: _dataset_stub(
+                    dataset_id=dataset_id,
+                    workspace_id=workspace_id,
+                    connection_id=connector_id,
+                    name="orders_table",
+                    dataset_type="TABLE",
+                    source_kind="database",
+                    connector_kind="postgres",
+                    storage_kind="table",
+                    dialect="postgres",
+                    schema_name="public",
+                    table_name="orders",
+                    storage_uri=None,
+                    file_config_json=None,
+                )
+            }
+        ),
+        federated_query_tool=tool,
+        logger=logging.getLogger(__name__),
+        semantic_model_provider=_FakeSemanticModelProvider(
+            {model_id: _ModelRecord(id=model_id, content_yaml=source_model.yml_dump())}
+        ),
+        pre_aggregation_store=PreAggregationStore(tmp_path),
+    )
+    return service, workspace_id, model_id
+
+
+@pytest.mark.anyio
+async def test_execute_standard_query_rolls_up_a_matching_pre_aggregation(tmp_path) -> None:
+    pytest.importorskip("duckdb")
+    tool = _RoutingFederatedQueryTool(
+        build_rows=[
+            {"orders__region": "EU", "orders__created_at_day": datetime(2026, 1, 5), "orders__revenue": 10.0},
+            {"orders__region": "EU", "orders__created_at_day": datetime(2026, 1, 9), "orders__revenue": 5.0},
+            {"orders__region": "US", "orders__created_at_day": datetime(2026, 2, 1), "orders__revenue": 7.0},
+        ],
+        source_rows=[{"orders__region": "EU", "orders__revenue": 1.0}],
+    )
+    service, workspace_id, model_id = _pre_aggregation_service(
+        tmp_path,
+        pre_aggregation={
+            "measures": ["orders.revenue"],
+            "dimensions": ["orders.region"],
+            "timeDimension": "orders.created_at",
+            "granularity": "day",
+            "partitionGranularity": "month",
+        },
+        tool=tool,
+    )
+
+    refreshed = await service.refresh_pre_aggregations(workspace_id=workspace_id, semantic_model_id=model_id)
+    assert [(item["name"], item["status"], item["rows"]) for item in refreshed] == [("daily_revenue", "refreshed", 3)]
+    assert "orders__created_at_day" in tool.calls[0]["query"]
+
+    result = await service.execute_standard_query(
+        workspace_id=workspace_id,
+        semantic_model_id=model_id,
+        semantic_query=SemanticQuery.model_validate(
+            {
+                "measures": ["orders.revenue"],
+                "dimensions": ["orders.region"],
+                "timeDimensions": [
+                    {"dimension": "orders.created_at", "granularity": "month", "dateRange": ["2026-01-01", "2026-12-31"]}
+                ],
+                "order": [{"orders.revenue": "desc"}],
+            }
+        ),
+    )
+
+    assert len(tool.calls) == 1
+    assert [
+        (row["orders__region"], row["orders__created_at_month"].month, row["orders__revenue"])
+        for row in result.response.data
+    ] == [("EU", 1, 15.0), ("US", 2, 7.0)]
+    assert [item["column"] for item in result.response.metadata] == [
+        "orders__region",
+        "orders__created_at_month",
+        "orders__revenue",
+    ]
+
+    # A dimension the rollup does not hold goes to the source.
+    await service.execute_standard_query(
+        workspace_id=workspace_id,
+        semantic_model_id=model_id,
+        semantic_query=SemanticQuery(measures=["orders.revenue"], dimensions=["orders.created_at"]),
+    )
+    assert len(tool.calls) == 2
+    # Without refresh_every every refresh is due; partitioned rollups rebuild from their last build.
+    refreshed = await service.refresh_pre_aggregations(workspace_id=workspace_id, semantic_model_id=model_id)
+    assert refreshed[0]["incremental"] is True
+
+
+@pytest.mark.anyio
+async def test_execute_standard_query_unions_rollup_with_newer_source_rows(tmp_path) -> None:
+    pytest.importorskip("duckdb")
+    tool = _RoutingFederatedQueryTool(
+        build_rows=[
+            {"orders__region": "EU", "orders__created_at_day": datetime(2026, 1, 5), "orders__revenue": 10.0},
+            {"orders__region": "US", "orders__created_at_day": datetime(2026, 1, 6), "orders__revenue": 4.0},
+        ],
+        source_rows=[
+            {"orders__region": "EU", "orders__revenue": 2.5},
+            {"orders__region": "APAC", "orders__revenue": 1.0},
+        ],
+    )
+    service, workspace_id, model_id = _pre_aggregation_service(
+        tmp_path,
+        pre_aggregation={
+            "measures": ["orders.revenue"],
+            "dimensions": ["orders.region"],
+            "timeDimension": "orders.created_at",
+            "granularity": "day",
+            "unionWithSource": True,
+        },
+        tool=tool,
+    )
+    await service.refresh_pre_aggregations(workspace_id=workspace_id, semantic_model_id=model_id)
+
+    result = await service.execute_standard_query(
+        workspace_id=workspace_id,
+        semantic_model_id=model_id,
+        semantic_query=SemanticQuery.model_validate(
+            {"measures": ["orders.revenue"], "dimensions": ["orders.region"], "order": {"orders.region": "asc"}}
+        ),
+    )
+
+    assert result.response.data == [
+        {"orders__region": "APAC", "orders__revenue": 1.0},
+        {"orders__region": "EU", "orders__revenue": 12.5},
+        {"orders__region": "US", "orders__revenue": 4.0},
+    ]
+    source_sql = tool.calls[1]["query"]
+    assert ">=" in source_sql and "created_at" in source_sql
+
+
+@pytest.mark.anyio
+async def test_execute_standard_query_serves_repeats_from_the_result_cache() -> None:
+    import asyncio
+
+    from langbridge.runtime.services import semantic_result_cache
+
+    workspace_id = uuid.uuid4()
+    model_id = uuid.uuid4()
+    dataset_id = uuid.uuid4()
+    source_model = SemanticModel.model_validate(
+        {
+            "version": "1.0",
+            "datasets": {
+                "orders": {
+                    "dataset_id": str(dataset_id),
+                    "schema_name": "public",
+                    "relation_name": "orders",
+                    "dimensions": [{"name": "region", "type": "string"}],
+                    "measures": [{"name": "revenue", "type": "decimal", "aggregation": "sum"}],
+                }
+            },
+            "cache": {"ttl": "5m", "staleWhileRevalidate": "1m"},
+        }
+    )
+    tool = _FakeFederatedQueryTool(rows=[{"orders__region": "EU", "orders__revenue": 10.0}])
+    service = SemanticQueryExecutionService(
+        dataset_repository=_FakeDatasetRepository(
+            {
+                dataset_id: _dataset_stub(
+                    dataset_id=dataset_id,
+                    workspace_id=workspace_id,
+                    connection_id=uuid.uuid4(),
+                    name="orders_table",
+                    dataset_type="TABLE",
+                    source_kind="database",
+                    connector_kind="postgres",
+                    storage_kind="table",
+                    dialect="postgres",
+                    schema_name="public",
+                    table_name="orders",
+                    storage_uri=None,
+                    file_config_json=None,
+                )
+            }
+        ),
+        federated_query_tool=tool,
+        logger=logging.getLogger(__name__),
+        semantic_model_provider=_FakeSemanticModelProvider(
+            {model_id: _ModelRecord(id=model_id, content_yaml=source_model.yml_dump())}
+        ),
+    )
+    cache = semantic_result_cache.SemanticResultCache()
+    previous = semantic_result_cache.get_semantic_result_cache()
+    semantic_result_cache.configure_semantic_result_cache(cache)
+
+    async def _query() -> Any:
+        return await service.execute_standard_query(
+            workspace_id=workspace_id,
+            semantic_model_id=model_id,
+            semantic_query=SemanticQuery.model_validate(
+                {"measures": ["orders.revenue"], "dimensions": ["orders.region"]}
+            ),
+        )
+
+    try:
+        first = await _query()
+        second = await _query()
+        assert len(tool.calls) == 1
+        assert second.response.data == first.response.data
+        assert second.response.id != first.response.id
+        second.response.data[0]["orders__revenue"] = 0.0
+        assert (await _query()).response.data[0]["orders__revenue"] == 10.0
+
+        # A dataset sync leaves the entry servable while it is recomputed in the background.
+        assert cache.invalidate_dataset(dataset_id) == 1
+        tool._rows = [{"orders__region": "EU", "orders__revenue": 12.0}]
+        stale = await _query()
+        assert stale.response.data[0]["orders__revenue"] == 10.0
+        await asyncio.gather(*service._revalidations)
+        assert len(tool.calls) == 2
+        assert (await _query()).response.data[0]["orders__revenue"] == 12.0
+        assert (cache.stats.hits, cache.stats.stale_hits) == (3, 1)
+
+        # Editing the model drops its entries outright.
+        assert cache.invalidate_model(model_id) == 1
+        await _query()
+        assert len(tool.calls) == 3
+    finally:
+        semantic_result_cache.configure_semantic_result_cache(previous)
@@ -303,3 +303,90 @@ def test_semantic_vector_explicit_connector_path_resolves_connector_scoped_store
         assert vector_store.config.api_key == "secret-qdrant-key"
 
     asyncio.run(_run())
+
+
+def test_semantic_vector_refresh_embeds_only_changed_values(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("faiss")
+    from langbridge.runtime.embeddings import EmbeddingCache
+
+    async def _run() -> None:
+        workspace_id = uuid.uuid4()
+        semantic_model_id = uuid.uuid4()
+        model_provider = MemorySemanticModelProvider(
+            {
+                (workspace_id, semantic_model_id): SemanticModelMetadata(
+                    id=semantic_model_id,
+                    workspace_id=workspace_id,
+                    name="orders_semantic",
+                    content_yaml=_semantic_model_yaml(
+                        "        vector:\n"
+                        "          enabled: true\n"
+                        "          store:\n"
+                        "            type: managed_faiss\n"
+                    ),
+                    management_mode=ManagementMode.RUNTIME_MANAGED,
+                    lifecycle_state=LifecycleState.ACTIVE,
+                )
+            }
+        )
+        index_store = MemorySemanticVectorIndexProvider({})
+        federated_query_tool = RecordingFederatedQueryTool([{"value": "France"}, {"value": "Germany"}])
+        embedder = StubEmbeddingProvider(
+            {"France": [1.0, 0.0], "Germany": [0.0, 1.0], "Spain": [0.6, 0.8], "Spanish": [0.6, 0.8]}
+        )
+        embedder.embedding_model = "stub-embedding"
+        cache = EmbeddingCache(tmp_path / "embeddings.sqlite3")
+        service = SemanticVectorSearchService(
+            dataset_repository=None,
+            federated_query_tool=federated_query_tool,
+            logger=logging.getLogger("semantic-vector-tests"),
+            semantic_model_provider=model_provider,
+            semantic_vector_index_store=index_store,
+            embedding_cache=cache,
+        )
+
+        async def _build_semantic_workflow(**kwargs):
+            _ = kwargs
+            return DummyWorkflow(), "postgres"
+
+        stores: dict[str, FaissConnector] = {}
+
+        async def _create_managed_instance(kwargs, logger=None):
+            _ = logger
+            return stores.setdefault(
+                kwargs["index_name"],
+                FaissConnector(config=FaissConnectorConfig(location=str(tmp_path / kwargs["index_name"]))),
+            )
+
+        monkeypatch.setattr(service._dataset_execution_resolver, "build_semantic_workflow", _build_semantic_workflow)
+        monkeypatch.setattr(FaissConnector, "create_managed_instance", staticmethod(_create_managed_instance))
+
+        await service.refresh_workspace(workspace_id=workspace_id, embedding_provider=embedder)
+        federated_query_tool._rows = [{"value": "France"}, {"value": "Spain"}]
+        refreshed = await service.refresh_workspace(
+            workspace_id=workspace_id,
+            embedding_provider=embedder,
+            force=True,
+        )
+
+        assert embedder.calls == [["France", "Germany"], ["Spain"]]
+        assert refreshed[0].indexed_value_count == 2
+        (vector_store,) = stores.values()
+        assert sorted(item["value"] for item in (await vector_store.list_vectors()).values()) == [
+            "France",
+            "Spain",
+        ]
+        hits = await service.search(
+            workspace_id=workspace_id,
+            semantic_model_id=semantic_model_id,
+            queries=["Spanish"],
+            embedding_provider=embedder,
+        )
+        assert hits[0].matched_value == "Spain"
+        assert hits[0].score == pytest.approx(1.0)
+
+        # Another index (or workspace) asking for the same strings reuses their vectors.
+        assert await cache.embed(embedder, ["Germany", "Spain"]) == [[0.0, 1.0], pytest.approx([0.6, 0.8])]
+        assert embedder.calls[-1] == ["Spanish"]
+
+    asyncio.run(_run())
@@ -7,6 +7,7 @@ from langbridge.runtime.utils.sql import (
     enforce_read_only_sql,
     normalize_sql_dialect,
     render_sql_with_params,
+    strip_explain_analyze,
     transpile_sql,
 )
 
@@ -74,3 +75,8 @@ def test_transpile_sql_converts_tsql_top_to_postgres_limit() -> None:
 def test_normalize_sql_dialect_maps_sqlserver_aliases() -> None:
     assert normalize_sql_dialect("sqlserver") == "tsql"
     assert normalize_sql_dialect("mssql") == "tsql"
+
+
+def test_strip_explain_analyze_returns_inner_query() -> None:
+    assert strip_explain_analyze("explain  analyze\nSELECT 1") == ("SELECT 1", True)
+    assert strip_explain_analyze("EXPLAIN SELECT 1") == ("EXPLAIN SELECT 1", False)
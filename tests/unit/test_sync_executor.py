@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from langbridge.runtime.services.sync_executor import (
+    SYNC_PRIORITY_INTERACTIVE,
+    SYNC_PRIORITY_SCHEDULED,
+    SyncExecutor,
+)
+from langbridge.telemetry import (
+    QUEUE_WAIT,
+    InMemoryTelemetryExporter,
+    MetricRegistry,
+    Telemetry,
+    use_telemetry,
+)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class _Gate:
+    """Sync body that records its start and blocks until released."""
+
+    def __init__(self, name: str, started: list[str]) -> None:
+        self.name = name
+        self._started = started
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self._started.append(self.name)
+        await self.release.wait()
+        return self.name
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_sync_executor_caps_concurrency_per_connector_and_host() -> None:
+    executor = SyncExecutor(max_workers=4, max_per_connector=1, max_per_host=2)
+    started: list[str] = []
+    gates = {name: _Gate(name, started) for name in ("a1", "a2", "b1", "c1")}
+
+    futures = [
+        executor.submit(key="a1", run=gates["a1"], workspace="w", connector="a", host="db.internal"),
+        executor.submit(key="a2", run=gates["a2"], workspace="w", connector="a", host="db.internal"),
+        executor.submit(key="b1", run=gates["b1"], workspace="w", connector="b", host="DB.internal"),
+        executor.submit(key="c1", run=gates["c1"], workspace="w", connector="c", host="db.internal"),
+    ]
+    await _settle()
+
+    # a2 waits for connector `a`; c1 waits for the host, which a1 and b1 already use.
+    assert started == ["a1", "b1"]
+    assert executor.running_count == 2
+    assert executor.queued_count == 2
+
+    gates["a1"].release.set()
+    await _settle()
+    assert started == ["a1", "b1", "a2"]
+
+    for gate in gates.values():
+        gate.release.set()
+    assert await asyncio.gather(*futures) == ["a1", "a2", "b1", "c1"]
+    assert executor.running_count == 0
+
+
+@pytest.mark.anyio
+async def test_sync_executor_orders_by_priority_then_fairly_across_workspaces() -> None:
+    executor = SyncExecutor(max_workers=1, max_per_connector=10, max_per_host=10)
+    started: list[str] = []
+    blocker = _Gate("blocker", started)
+    executor.submit(key="blocker", run=blocker, workspace="w1", connector="x")
+    await _settle()
+
+    order = [
+        ("w1-a", "w1", SYNC_PRIORITY_SCHEDULED),
+        ("w1-b", "w1", SYNC_PRIORITY_SCHEDULED),
+        ("w1-c", "w1", SYNC_PRIORITY_SCHEDULED),
+        ("w2-a", "w2", SYNC_PRIORITY_SCHEDULED),
+        ("w3-a", "w3", SYNC_PRIORITY_INTERACTIVE),
+    ]
+    gates = {name: _Gate(name, started) for name, _, _ in order}
+    futures = [
+        executor.submit(key=name, run=gates[name], workspace=workspace, connector="x", priority=priority)
+        for name, workspace, priority in order
+    ]
+    for gate in gates.values():
+        gate.release.set()
+    blocker.release.set()
+    await asyncio.gather(*futures)
+
+    # Interactive work first; then w2, which has not been served, ahead of w1's backlog.
+    assert started == ["blocker", "w3-a", "w2-a", "w1-a", "w1-b", "w1-c"]
+
+
+@pytest.mark.anyio
+async def test_sync_executor_joins_overlapping_runs_for_the_same_key() -> None:
+    executor = SyncExecutor(max_workers=2, max_per_connector=2, max_per_host=2)
+    calls = 0
+    release = asyncio.Event()
+
+    async def _sync() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"rows": 3}
+
+    first = asyncio.create_task(executor.run(key="ds:INCREMENTAL", run=_sync, workspace="w", connector="c"))
+    second = asyncio.create_task(executor.run(key="ds:INCREMENTAL", run=_sync, workspace="w", connector="c"))
+    await _settle()
+    release.set()
+
+    assert await first == await second == {"rows": 3}
+    assert calls == 1
+
+    # A finished key can run again.
+    assert await executor.run(key="ds:INCREMENTAL", run=_sync, workspace="w", connector="c") == {"rows": 3}
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_sync_executor_surfaces_failures_and_records_queue_wait() -> None:
+    executor = SyncExecutor(max_workers=1, max_per_connector=1, max_per_host=1)
+    exporter = InMemoryTelemetryExporter()
+
+    async def _fail() -> None:
+        raise RuntimeError("source unavailable")
+
+    with use_telemetry(Telemetry(exporter=exporter, registry=MetricRegistry())):
+        with pytest.raises(RuntimeError, match="source unavailable"):
+            await executor.run(key="ds", run=_fail, workspace="w", connector="c", dataset="ds")
+
+    waits = exporter.measurements(QUEUE_WAIT)
+    assert [measurement.labels for measurement in waits] == [{"queue": "dataset_sync"}]
+    assert executor.running_count == 0